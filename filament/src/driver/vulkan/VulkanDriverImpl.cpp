@@ -160,6 +160,7 @@ void createVirtualDevice(VulkanContext& context) {
     VkResult result = vkCreateDevice(context.physicalDevice, &deviceCreateInfo, VKALLOC,
             &context.device);
     ASSERT_POSTCONDITION(result == VK_SUCCESS, "vkCreateDevice error.");
+    bluevk::bindDevice(context.device);
     vkGetDeviceQueue(context.device, context.graphicsQueueFamilyIndex, 0,
             &context.graphicsQueue);
     VkCommandPoolCreateInfo createInfo = {};
@@ -16,6 +16,11 @@
 
 # This script generates C++ and ASM code that will dynamically bind
 # OpenGL functions at runtime
+#
+# With --lazy, bind() does not look up any function. Instead, each function
+# initially points to a lazy proxy, which looks the function up on its first
+# call, replaces the pointer and jumps to the function. Only the functions
+# actually used are looked up.
 
 # TODO: This script has rudimentary support for multiple GL APIs
 
@@ -165,7 +170,7 @@ void unbind%(gl_suffix)s();
         file.write(content)
         file.write(footer)
 
-def generateProxies(api, functions, output_dir, platforms):
+def generateProxies(api, functions, output_dir, platforms, lazy):
     suffix = api['suffix']
 
     header = '''/*
@@ -251,18 +256,160 @@ extrn __blue_gl%(suffix)s_%(function)s: qword
 ''',
     }
 
+    # The lazy proxy of a function passes the index of the function to a common resolver, which
+    # saves the argument registers, calls __blue_gl<suffix>_resolve() (see BlueGL.cpp), restores
+    # the registers and jumps to the function that it returns.
+    lazyResolver = {
+        'Linux': '''
+.type __blue_gl%(suffix)s_lazy, %%function
+__blue_gl%(suffix)s_lazy:
+    push %%rdi
+    push %%rsi
+    push %%rdx
+    push %%rcx
+    push %%r8
+    push %%r9
+    push %%rax
+    sub $128, %%rsp
+    movdqu %%xmm0, 0(%%rsp)
+    movdqu %%xmm1, 16(%%rsp)
+    movdqu %%xmm2, 32(%%rsp)
+    movdqu %%xmm3, 48(%%rsp)
+    movdqu %%xmm4, 64(%%rsp)
+    movdqu %%xmm5, 80(%%rsp)
+    movdqu %%xmm6, 96(%%rsp)
+    movdqu %%xmm7, 112(%%rsp)
+    mov %%r11d, %%edi
+    call __blue_gl%(suffix)s_resolve@PLT
+    mov %%rax, %%r11
+    movdqu 0(%%rsp), %%xmm0
+    movdqu 16(%%rsp), %%xmm1
+    movdqu 32(%%rsp), %%xmm2
+    movdqu 48(%%rsp), %%xmm3
+    movdqu 64(%%rsp), %%xmm4
+    movdqu 80(%%rsp), %%xmm5
+    movdqu 96(%%rsp), %%xmm6
+    movdqu 112(%%rsp), %%xmm7
+    add $128, %%rsp
+    pop %%rax
+    pop %%r9
+    pop %%r8
+    pop %%rcx
+    pop %%rdx
+    pop %%rsi
+    pop %%rdi
+    jmp *%%r11
+''',
+        'Darwin': '''
+.private_extern ___blue_gl%(suffix)s_lazy
+___blue_gl%(suffix)s_lazy:
+    push %%rdi
+    push %%rsi
+    push %%rdx
+    push %%rcx
+    push %%r8
+    push %%r9
+    push %%rax
+    sub $128, %%rsp
+    movdqu %%xmm0, 0(%%rsp)
+    movdqu %%xmm1, 16(%%rsp)
+    movdqu %%xmm2, 32(%%rsp)
+    movdqu %%xmm3, 48(%%rsp)
+    movdqu %%xmm4, 64(%%rsp)
+    movdqu %%xmm5, 80(%%rsp)
+    movdqu %%xmm6, 96(%%rsp)
+    movdqu %%xmm7, 112(%%rsp)
+    mov %%r11d, %%edi
+    call ___blue_gl%(suffix)s_resolve
+    mov %%rax, %%r11
+    movdqu 0(%%rsp), %%xmm0
+    movdqu 16(%%rsp), %%xmm1
+    movdqu 32(%%rsp), %%xmm2
+    movdqu 48(%%rsp), %%xmm3
+    movdqu 64(%%rsp), %%xmm4
+    movdqu 80(%%rsp), %%xmm5
+    movdqu 96(%%rsp), %%xmm6
+    movdqu 112(%%rsp), %%xmm7
+    add $128, %%rsp
+    pop %%rax
+    pop %%r9
+    pop %%r8
+    pop %%rcx
+    pop %%rdx
+    pop %%rsi
+    pop %%rdi
+    jmp *%%r11
+''',
+        'Windows': '''
+extrn __blue_gl%(suffix)s_resolve: proc
+
+__blue_gl%(suffix)s_lazy proc
+    push rcx
+    push rdx
+    push r8
+    push r9
+    sub rsp, 104
+    movdqu xmmword ptr [rsp + 32], xmm0
+    movdqu xmmword ptr [rsp + 48], xmm1
+    movdqu xmmword ptr [rsp + 64], xmm2
+    movdqu xmmword ptr [rsp + 80], xmm3
+    mov ecx, r11d
+    call __blue_gl%(suffix)s_resolve
+    mov r11, rax
+    movdqu xmm0, xmmword ptr [rsp + 32]
+    movdqu xmm1, xmmword ptr [rsp + 48]
+    movdqu xmm2, xmmword ptr [rsp + 64]
+    movdqu xmm3, xmmword ptr [rsp + 80]
+    add rsp, 104
+    pop r9
+    pop r8
+    pop rdx
+    pop rcx
+    jmp r11
+__blue_gl%(suffix)s_lazy endp
+''',
+    }
+
+    lazyCode = {
+        'Linux': '''
+.global __blue_gl%(suffix)s_%(function)s_lazy
+.hidden __blue_gl%(suffix)s_%(function)s_lazy
+.type __blue_gl%(suffix)s_%(function)s_lazy, %%function
+__blue_gl%(suffix)s_%(function)s_lazy:
+    mov $%(index)d, %%r11d
+    jmp __blue_gl%(suffix)s_lazy
+''',
+        'Darwin': '''
+.private_extern ___blue_gl%(suffix)s_%(function)s_lazy
+___blue_gl%(suffix)s_%(function)s_lazy:
+    mov $%(index)d, %%r11d
+    jmp ___blue_gl%(suffix)s_lazy
+''',
+        'Windows': '''
+__blue_gl%(suffix)s_%(function)s_lazy proc
+    mov r11d, %(index)d
+    jmp __blue_gl%(suffix)s_lazy
+__blue_gl%(suffix)s_%(function)s_lazy endp
+''',
+    }
+
     for platform in platforms:
         src_file = os.path.join(output_dir, 'BlueGL%s%sImpl.S' % (suffix, platform))
         print 'Generating proxy %s...' % src_file
 
         with open(src_file, 'w') as file:
             file.write(osSpecificHeader[platform])
-            for function in functions:
+            if lazy:
+                file.write(lazyResolver[platform] % {'suffix': suffix})
+            for index, function in enumerate(functions):
                 file.write(code[platform] % {'function': function, 'suffix': suffix})
+                if lazy:
+                    file.write(lazyCode[platform] % {
+                        'function': function, 'suffix': suffix, 'index': index})
             file.write(osSpecificFooter[platform])
 
 
-def generateSource(api, functions, output_dir):
+def generateSource(api, functions, output_dir, lazy):
     suffix = api['suffix'] if api['suffix'] != 'Core' else ''
     gl_suffix = '_gl_' + suffix.lower() if len(suffix) > 0 else ''
     src_file = os.path.join(output_dir, 'private_BlueGL%s.h' % suffix)
@@ -303,29 +450,44 @@ static uint32_t g_library_refcount = 0;
 
 struct {
     void** api_call;
-    const char* api_name;
-} g_gl%s_stubs[] = {
-''' % (suffix)
+    const char* api_name;%(lazy_member)s
+} g_gl%(suffix)s_stubs[] = {
+''' % {
+    'suffix':      suffix,
+    'lazy_member': '\n    void* lazy_call;' if lazy else ''
+}
 
     functions_footer = '''};
 '''
 
     with open(src_file, 'w') as file:
         file.write(header)
+        file.write('#define BLUEGL_LAZY_BINDING %d\n\n' % lazy)
         file.write("extern \"C\" {\n")
         for function in functions:
-            file.write('void* __blue_gl%s_%s;\n' % (api['suffix'], function))
+            if lazy:
+                file.write('void __blue_gl%(suffix)s_%(function)s_lazy();\n'
+                        'void* __blue_gl%(suffix)s_%(function)s = '
+                        '(void*) &__blue_gl%(suffix)s_%(function)s_lazy;\n' % {
+                            'suffix': api['suffix'], 'function': function})
+            else:
+                file.write('void* __blue_gl%s_%s;\n' % (api['suffix'], function))
         file.write("}\n")
         file.write(struct_header)
         for function in functions:
-            file.write('    { &__blue_gl%s_%s, "%s" },\n' % (api['suffix'], function, function))
+            if lazy:
+                file.write('    { &__blue_gl%(suffix)s_%(function)s, "%(function)s", '
+                        '(void*) &__blue_gl%(suffix)s_%(function)s_lazy },\n' % {
+                            'suffix': api['suffix'], 'function': function})
+            else:
+                file.write('    { &__blue_gl%s_%s, "%s" },\n' % (api['suffix'], function, function))
         file.write(functions_footer)
 
         file.write("size_t %s%sNumFunctions = %d;" % ("blue", api['suffix'], len(functions)))
         file.write("\n} // namespace bluegl")
 
 
-def generateApis(apis, include_dir, output_dir):
+def generateApis(apis, include_dir, output_dir, lazy):
     platforms = ['Linux', 'Darwin', 'Windows']
 
     for api in apis:
@@ -339,8 +501,8 @@ def generateApis(apis, include_dir, output_dir):
         print 'Found %s functions' % len(functions)
 
         generateHeader(api, functions, include_dir, output_dir)
-        generateProxies(api, functions, output_dir, platforms)
-        generateSource(api, functions, output_dir)
+        generateProxies(api, functions, output_dir, platforms, lazy)
+        generateSource(api, functions, output_dir, lazy)
 
 if __name__ == '__main__':
     gl_apis = [
@@ -377,6 +539,8 @@ if __name__ == '__main__':
             help='List known APIs')
     parser.add_argument('--api', type=str, metavar='API', nargs="*",
             choices=[ 'gl', 'legacy' ], help='Generate only specific API')
+    parser.add_argument('--lazy', action='store_true',
+            help='Look up each function on its first call rather than in bind()')
 
     args = parser.parse_args()
 
@@ -390,4 +554,4 @@ if __name__ == '__main__':
     selected_apis = args.api if args.api else ['gl']
 
     apis = [api for api in gl_apis if api['api'] in selected_apis]
-    generateApis(apis, include_dir, output_dir)
+    generateApis(apis, include_dir, output_dir, args.lazy)
@@ -34,18 +34,37 @@ static void undefined() {
 #endif
 }
 
+#if BLUEGL_LAZY_BINDING
+// Called by the lazy proxy of a function on its first call. Binds the function and returns it.
+extern "C" void* __blue_glCore_resolve(unsigned int index) {
+    std::lock_guard<std::mutex> lock(g_library_mutex);
+    if (g_library_refcount == 0) {
+        // not bound yet, or unbound: leave the lazy proxy in place
+        return (void*)&undefined;
+    }
+    void* call = loadFunction(g_gl_stubs[index].api_name);
+    if (call == nullptr) {
+        call = (void*)&undefined;
+    }
+    *g_gl_stubs[index].api_call = call;
+    return call;
+}
+#endif
+
 int bind() {
     std::lock_guard<std::mutex> lock(g_library_mutex);
     g_library_refcount++;
 
     if (g_library_refcount == 1) {
         if (initBinder()) {
+#if !BLUEGL_LAZY_BINDING
             for (unsigned int i = 0; i < blueCoreNumFunctions; i++) {
                 *g_gl_stubs[i].api_call = loadFunction(g_gl_stubs[i].api_name);
                 if (*g_gl_stubs[i].api_call == nullptr) {
                     *g_gl_stubs[i].api_call = (void*)&undefined;
                 }
             }
+#endif
             return 0;
         } else {
             std::cerr << "Could not init binder." << std::endl;
@@ -67,8 +86,12 @@ void unbind() {
     if (refcount == 1) {
         shutdownBinder();
 
-        for (unsigned int i = 0; i < 2574; i++) {
+        for (unsigned int i = 0; i < blueCoreNumFunctions; i++) {
+#if BLUEGL_LAZY_BINDING
+            *g_gl_stubs[i].api_call = g_gl_stubs[i].lazy_call;
+#else
             *g_gl_stubs[i].api_call = nullptr;
+#endif
         }
     }
 }
@@ -19,6 +19,8 @@
  * DO NOT EDIT
  **********************************************************************************************/
 
+#define BLUEGL_LAZY_BINDING 0
+
 extern "C" {
 void* __blue_glCore_glMultiDrawArraysIndirectBindlessCountNV;
 void* __blue_glCore_glCopyTexImage1D;
@@ -16,11 +16,16 @@
 
 """
 Generates C++ code that binds Vulkan entry points at run time and provides enum-to-string
-conversion operators. By default this fetches the latest vk.xml from github; note that
-the XML needs to be consistent with the Vulkan headers that live in bluevk/include/vulkan.
+conversion operators, along with string-to-enum lookups. By default this fetches the latest vk.xml
+from github; note that the XML needs to be consistent with the Vulkan headers that live in
+bluevk/include/vulkan.
 If the XML file is inconsistent with the checked-in header files, compile errors can result
 such as missing enumeration values, or "type not found" errors.
 
+With --profile, only the functions of the features and extensions listed in the given file are
+emitted (see filament-profile.txt). With --lazy in addition, the other functions are emitted too, but
+they are not looked up when binding: each of them points to a stub that binds it on its first call.
+
 TODO: To reduce globals and conditional branching, it would be nice if BlueVK were to implement
 actual functions rather than declaring function pointers, similar to BlueGL. However this may be
 tricky because Instance-specific fuctions must be loaded via vkGetInstanceProcAddr, not dlsym.
@@ -35,7 +40,7 @@ from collections import OrderedDict
 from collections import namedtuple
 from datetime import datetime
 
-VkFunction = namedtuple('VkFunction', ['name', 'type', 'group'])
+VkFunction = namedtuple('VkFunction', ['name', 'type', 'group', 'returns', 'params', 'lazy'])
 
 VK_XML_URL = "https://raw.githubusercontent.com/KhronosGroup/Vulkan-Docs/master/xml/vk.xml"
 
@@ -90,7 +95,12 @@ namespace bluevk {
 
     void bindInstance(VkInstance instance);
 
-}; // namespace bluevk
+    // Reloads the device functions through vkGetDeviceProcAddr, which bypasses the dispatch
+    // trampolines of the loader. Must be called after bindInstance, with the device that all
+    // subsequent device function calls refer to.
+    void bindDevice(VkDevice device);
+%(DEVICE_DISPATCH_DECL)s
+} // namespace bluevk
 
 %(FUNCTION_POINTERS)s
 
@@ -99,17 +109,29 @@ namespace bluevk {
 %(ENUM_DECLS)s
 #endif
 
+namespace bluevk {
+
+    // Looks up an enumerant by name, such as "VK_FORMAT_R8G8B8A8_UNORM". Flags can also be given as
+    // several names separated by '|'. Returns false if a name is unknown. Unlike the operator<< of
+    // the enums, these are available in release builds too, to parse configuration.
+%(PARSE_DECLS)s
+
+} // namespace bluevk
+
 #endif // TNT_FILAMENT_BLUEVK_H
 '''
 
 CPP_FILE_TEMPLATE = COPYRIGHT_HEADER + '''
 #include <bluevk/BlueVK.h>
 
+#include <string>
+
 static void loadLoaderFunctions(void* context, PFN_vkVoidFunction (*loadcb)(void*, const char*));
 static void loadInstanceFunctions(void* context, PFN_vkVoidFunction (*loadcb)(void*, const char*));
 static void loadDeviceFunctions(void* context, PFN_vkVoidFunction (*loadcb)(void*, const char*));
 static PFN_vkVoidFunction vkGetInstanceProcAddrWrapper(void* context, const char* name);
 static PFN_vkVoidFunction vkGetDeviceProcAddrWrapper(void* context, const char* name);
+static void resetLazyFunctions();
 
 using std::string;
 
@@ -131,11 +153,24 @@ bool bluevk::initialize() {
     return true;
 }
 
+// The handles that lazily bound functions are resolved with.
+static VkInstance sInstance = VK_NULL_HANDLE;
+static VkDevice sDevice = VK_NULL_HANDLE;
+
 void bluevk::bindInstance(VkInstance instance) {
+    sInstance = instance;
+    sDevice = VK_NULL_HANDLE;
     loadInstanceFunctions(instance, vkGetInstanceProcAddrWrapper);
     loadDeviceFunctions(instance, vkGetInstanceProcAddrWrapper);
+    resetLazyFunctions();
 }
 
+void bluevk::bindDevice(VkDevice device) {
+    sDevice = device;
+    loadDeviceFunctions(device, vkGetDeviceProcAddrWrapper);
+    resetLazyFunctions();
+}
+%(DEVICE_DISPATCH_DEF)s
 static PFN_vkVoidFunction vkGetInstanceProcAddrWrapper(void* context, const char* name) {
     return vkGetInstanceProcAddr((VkInstance) context, name);
 }
@@ -155,14 +190,139 @@ static void loadInstanceFunctions(void* context, PFN_vkVoidFunction (*loadcb)(vo
 static void loadDeviceFunctions(void* context, PFN_vkVoidFunction (*loadcb)(void*, const char*)) {
 %(DEVICE_FUNCTIONS)s
 }
+%(LAZY_STUBS)s
+// Points the lazily bound functions back to their stubs, so that they are resolved again with the
+// newly bound handles.
+static void resetLazyFunctions() {
+%(LAZY_FUNCTIONS)s
+}
 
 %(FUNCTION_POINTERS)s
 
+#include <algorithm>
+
+#include <stdlib.h>
+#include <string.h>
+
 #if !defined(NDEBUG)
 #include <utils/Log.h>
+#endif
+
 %(ENUM_DEFS)s
+
+'''
+
+ENUM_TABLES_TEMPLATE = '''namespace {
+
+// The names of all the enumerants, pooled in a single string.
+const char sEnumNames[] =
+%(ENUM_NAMES)s;
+
+struct EnumEntry {
+    uint32_t value;
+    uint32_t name; // offset in sEnumNames
+};
+
+// The enumerants of a type, sorted by value, and their indices sorted by name.
+struct EnumTable {
+    const EnumEntry* entries;
+    const uint16_t* names;
+    uint32_t count;
+};
+
+// Compares a null-terminated name with a name of the given length.
+int compareName(const char* name, const char* other, size_t length) {
+    int result = strncmp(name, other, length);
+    return result ? result : (unsigned char) name[length];
+}
+
+const EnumEntry* findName(const EnumTable& table, const char* name, size_t length) {
+    const uint16_t* end = table.names + table.count;
+    const uint16_t* index = std::lower_bound(table.names, end, name,
+            [&](uint16_t index, const char* name) {
+                return compareName(sEnumNames + table.entries[index].name, name, length) < 0;
+            });
+    if (index == end || compareName(sEnumNames + table.entries[*index].name, name, length)) {
+        return nullptr;
+    }
+    return table.entries + *index;
+}
+
+#if !defined(NDEBUG)
+const EnumEntry* findValue(const EnumTable& table, uint32_t value) {
+    const EnumEntry* end = table.entries + table.count;
+    const EnumEntry* entry = std::lower_bound(table.entries, end, value,
+            [](const EnumEntry& entry, uint32_t value) { return entry.value < value; });
+    return entry != end && entry->value == value ? entry : nullptr;
+}
+
+void printEnum(utils::io::ostream& out, const EnumTable& table, uint32_t value) {
+    const EnumEntry* entry = findValue(table, value);
+    out << (entry ? sEnumNames + entry->name : "UNKNOWN");
+}
+
+// Prints the names of the bits of the flags, separated by " | ", unless the flags have a name.
+void printFlags(utils::io::ostream& out, const EnumTable& table, uint32_t value) {
+    const EnumEntry* entry = findValue(table, value);
+    if (entry || !value) {
+        out << (entry ? sEnumNames + entry->name : "0");
+        return;
+    }
+    const char* separator = "";
+    for (uint32_t bits = value; bits; bits &= bits - 1) {
+        const uint32_t bit = bits & (~bits + 1);
+        out << separator;
+        entry = findValue(table, bit);
+        if (entry) {
+            out << sEnumNames + entry->name;
+        } else {
+            out << "0x" << utils::io::hex << bit << utils::io::dec;
+        }
+        separator = " | ";
+    }
+}
 #endif
 
+bool parseValue(const EnumTable& table, const char* name, uint32_t* value) {
+    const EnumEntry* entry = findName(table, name, strlen(name));
+    if (entry) {
+        *value = entry->value;
+    }
+    return entry != nullptr;
+}
+
+// Parses names or numbers separated by '|', as printed by printFlags.
+bool parseFlags(const EnumTable& table, const char* name, uint32_t* value) {
+    uint32_t result = 0;
+    for (const char* token = name; ; ++token) {
+        token += strspn(token, " ");
+        size_t length = strcspn(token, "|");
+        while (length && token[length - 1] == ' ') {
+            --length;
+        }
+        const EnumEntry* entry = findName(table, token, length);
+        if (entry) {
+            result |= entry->value;
+        } else {
+            char* end;
+            const unsigned long bits = length ? strtoul(token, &end, 0) : 0;
+            if (!length || end != token + length) {
+                return false;
+            }
+            result |= (uint32_t) bits;
+        }
+        token += strcspn(token, "|");
+        if (!*token) {
+            break;
+        }
+    }
+    *value = result;
+    return true;
+}
+
+%(TABLES)s
+
+} // anonymous namespace
 '''
 
 def isAncestor(types, name, base):
@@ -256,13 +416,12 @@ def consumeXML(spec):
             for val in enums:
                 # Skip over comments
                 if val.tag != 'enum': continue
-                value = '0x0'
+                value = 0
                 if val.get('value'):
                     value = int(val.get('value'), 16)
                 elif val.get('bitpos'):
                     value = 1 << int(val.get('bitpos'))
-                value = '0x%08x' % value
-                print '\t' + value + ' ' + val.get('name')
+                print '\t' + '0x%08x' % value + ' ' + val.get('name')
                 flag_vals[name].append((val.get('name'), value))
             continue
 
@@ -274,7 +433,7 @@ def consumeXML(spec):
             # Skip over intermingled single-bit flags
             if not val.get('value'): continue
             print '\t' + val.get('value') + ' ' + val.get('name')
-            enum_vals[name].append(val.get('name'))
+            enum_vals[name].append((val.get('name'), int(val.get('value'), 0)))
 
     # Finally, build the VkFunction objects.
     function_groups = OrderedDict()
@@ -290,6 +449,8 @@ def consumeXML(spec):
                 type = ''
             if name == 'vkGetDeviceProcAddr':
                 type = 'VkInstance'
+            # vkGetInstanceProcAddr has no type: it is bound by initialize(), not loaded.
+            ftype = ''
             if isAncestor(types, type, 'VkDevice'):
                 ftype = 'device'
                 print ' (D)'
@@ -299,20 +460,104 @@ def consumeXML(spec):
             elif type != '':
                 ftype = 'loader'
                 print ' (L)'
-            function_group[name] = VkFunction(name = name, type = ftype, group = group)
+            proto = ' '.join(''.join(cmd.find('proto').itertext()).split())
+            params = [(' '.join(''.join(param.itertext()).split()), param.findtext('name'))
+                    for param in cmd.findall('param')]
+            function_group[name] = VkFunction(name = name, type = ftype, group = group,
+                    returns = proto.rsplit(' ', 1)[0], params = params, lazy = False)
     return function_groups, enum_vals, flag_vals
 
-def produceHeader(function_groups, enum_vals, flag_vals, output_dir):
+def readProfile(path):
+    """
+    Reads the names of the features and extensions listed in a profile file, one per line.
+    Everything after a '#' is a comment.
+    """
+    names = set()
+    with open(path, 'r') as file:
+        for line in file:
+            names.update(line.split('#', 1)[0].split())
+    return names
+
+def isGroupEnabled(group, names):
+    """
+    Returns true if the condition of a function group, such as "VK_KHR_surface" or
+    "(VK_KHR_device_group && VK_KHR_surface) || VK_KHR_swapchain", holds when only the given
+    features and extensions are available.
+    """
+    for term in group.split(' || '):
+        if all(name in names for name in term.strip('()').split(' && ')):
+            return True
+    return False
+
+def applyProfile(function_groups, names, lazy):
+    """
+    Removes the function groups that the profile does not enable, or with lazy, keeps them but
+    marks their functions as lazily bound.
+    """
+    result = OrderedDict()
+    for (group, functions) in function_groups.items():
+        if isGroupEnabled(group, names):
+            result[group] = functions
+        elif lazy:
+            result[group] = OrderedDict((name, fn._replace(lazy = bool(fn.type)))
+                    for (name, fn) in functions.items())
+    print '\nProfile enables {} of {} groups'.format(
+        sum(1 for group in function_groups if isGroupEnabled(group, names)), len(function_groups))
+    return result
+
+LAZY_RESOLVER = '''
+// Lazily bound functions initially point to a stub, which resolves the function on its first call,
+// replaces the function pointer and forwards the call.
+static PFN_vkVoidFunction resolveLazyFunction(const char* name, bool device) {
+    if (device && sDevice) {
+        return vkGetDeviceProcAddr(sDevice, name);
+    }
+    return vkGetInstanceProcAddr(sInstance, name);
+}
+'''
+
+LAZY_STUB_TEMPLATE = '''static VKAPI_ATTR %(returns)s VKAPI_CALL %(name)sLazy(%(params)s) {
+    %(name)s = (PFN_%(name)s) resolveLazyFunction("%(name)s", %(device)s);
+    return %(name)s(%(args)s);
+}'''
+
+DEVICE_DISPATCH_DECL_TEMPLATE = '''
+    // The device functions of a single device. Calling through a dispatch table rather than through
+    // the global function pointers allows several devices to be used at once.
+    struct DeviceDispatch {
+%(FUNCTION_POINTERS)s
+    };
+
+    void loadDeviceDispatch(VkDevice device, DeviceDispatch* dispatch);
+'''
+
+DEVICE_DISPATCH_DEF_TEMPLATE = '''
+void bluevk::loadDeviceDispatch(VkDevice device, DeviceDispatch* dispatch) {
+%(DEVICE_FUNCTIONS)s
+}
+'''
+
+def deviceFunctionGroups(function_groups):
+    """
+    Yields the preprocessor expression and the device functions of each group that has any.
+    """
+    for (group, functions) in function_groups.items():
+        device_functions = [fn for fn in functions.values() if fn.type == 'device']
+        if not device_functions:
+            continue
+        preproc_expr = re.sub(r'(VK_[A-Za-z_0-9]+)', r'defined(\1)', group)
+        yield preproc_expr, device_functions
+
+def produceHeader(function_groups, enum_vals, flag_vals, output_dir, dispatch):
     fullpath = os.path.join(output_dir, 'bluevk/BlueVK.h')
     print '\nProducing header %s...' % fullpath
     enum_decls = []
+    parse_decls = []
     decls = []
-    for (enum_name, vals) in enum_vals.items():
+    for (enum_name, vals) in enum_vals.items() + flag_vals.items():
         enum_decls.append('utils::io::ostream& operator<<(utils::io::ostream& out, ' +
             'const {}& value);'.format(enum_name))
-    for (flag_name, vals) in flag_vals.items():
-        enum_decls.append('utils::io::ostream& operator<<(utils::io::ostream& out, ' +
-            'const {}& value);'.format(flag_name))
+        parse_decls.append('    bool parseEnum(const char* name, {}* value);'.format(enum_name))
     for (group, functions) in function_groups.items():
         if not len(functions):
             continue
@@ -321,40 +566,88 @@ def produceHeader(function_groups, enum_vals, flag_vals, output_dir):
         for (name, fn) in functions.items():
             decls.append("extern PFN_%(name)s %(name)s;" % {'name': fn.name})
         decls.append('#endif // ' + preproc_expr)
+    dispatch_decl = ''
+    if dispatch:
+        members = []
+        for (preproc_expr, functions) in deviceFunctionGroups(function_groups):
+            members.append('#if ' + preproc_expr)
+            for fn in functions:
+                members.append("        PFN_%(name)s %(name)s;" % {'name': fn.name})
+            members.append('#endif // ' + preproc_expr)
+        dispatch_decl = DEVICE_DISPATCH_DECL_TEMPLATE % {'FUNCTION_POINTERS': '\n'.join(members)}
     with open(fullpath, 'w') as file:
         file.write(HEADER_FILE_TEMPLATE % {
+            'DEVICE_DISPATCH_DECL': dispatch_decl,
             'ENUM_DECLS': '\n'.join(enum_decls),
+            'PARSE_DECLS': '\n'.join(parse_decls),
             'FUNCTION_POINTERS': '\n'.join(decls)})
 
-def produceCpp(function_groups, enum_vals, flag_vals, output_dir):
+def produceEnumDefs(enum_vals, flag_vals):
+    """
+    Produces the operator<< and parseEnum definitions. Rather than one switch per type, each type has
+    a table of (value, name) pairs sorted by value, which the two lookups binary search. The names
+    live in a single string; a table entry holds the offset of its name. The operator<< are debug
+    only, but the tables and parseEnum are always compiled in.
+    """
+    names = OrderedDict()
+    offset = 0
+    tables = []
+    print_defs = []
+    parse_defs = []
+    for (enum_name, vals) in enum_vals.items() + flag_vals.items():
+        for (name, value) in vals:
+            if name not in names:
+                names[name] = offset
+                offset += len(name) + 1
+        # Sort by unsigned value, since the lookup does. Aliases follow the first name of a value.
+        entries = sorted(((value & 0xffffffff, names[name], name) for (name, value) in vals),
+                key=lambda entry: entry[0])
+        table = 's' + enum_name
+        if entries:
+            tables.append('const EnumEntry {}Entries[] = {{'.format(table))
+            tables.extend('    {{ 0x{:08x}, {} }},'.format(value, offset)
+                    for (value, offset, name) in entries)
+            tables.append('};')
+            by_name = sorted(range(len(entries)), key=lambda index: entries[index][2])
+            tables.append('const uint16_t {}Names[] = {{ {} }};'.format(table,
+                    ', '.join(str(index) for index in by_name)))
+            tables.append('const EnumTable {0} = {{ {0}Entries, {0}Names, {1} }};'.format(
+                    table, len(entries)))
+        else:
+            tables.append('const EnumTable {} = {{ nullptr, nullptr, 0 }};'.format(table))
+
+        flags = enum_name in flag_vals
+        print_defs.append('utils::io::ostream& operator<<(utils::io::ostream& out, ' +
+            'const {}& value) {{'.format(enum_name))
+        print_defs.append('    {}(out, {}, (uint32_t) value);'.format(
+                'printFlags' if flags else 'printEnum', table))
+        print_defs.append('    return out;')
+        print_defs.append('}')
+        parse_defs.append('bool bluevk::parseEnum(const char* name, {}* value) {{'.format(enum_name))
+        parse_defs.append('    uint32_t result;')
+        parse_defs.append('    if (!{}({}, name, &result)) {{'.format(
+                'parseFlags' if flags else 'parseValue', table))
+        parse_defs.append('        return false;')
+        parse_defs.append('    }')
+        parse_defs.append('    *value = ({}) result;'.format(enum_name))
+        parse_defs.append('    return true;')
+        parse_defs.append('}')
+
+    pool = '\n'.join('    "{}\\0"'.format(name) for name in names) if names else '    ""'
+    return ENUM_TABLES_TEMPLATE % {
+        'ENUM_NAMES': pool,
+        'TABLES': '\n'.join(tables)} + '\n' + '\n'.join(parse_defs) + \
+        '\n\n#if !defined(NDEBUG)\n' + '\n'.join(print_defs) + '\n#endif'
+
+def produceCpp(function_groups, enum_vals, flag_vals, output_dir, dispatch):
     fullpath = os.path.join(output_dir, 'BlueVK.cpp')
     print '\nProducing source %s...' % fullpath
-    enum_defs = []
     loader_functions = []
     instance_functions = []
     device_functions = []
     function_pointers = []
-    for (enum_name, vals) in enum_vals.items():
-        enum_defs.append('utils::io::ostream& operator<<(utils::io::ostream& out, ' +
-            'const {}& value) {{'.format(enum_name))
-        enum_defs.append('    switch (value) {')
-        for val in vals:
-            enum_defs.append('        case {0}: out << "{0}"; break;'.format(val))
-        # Always include a "default" to catch aliases (such as MAX_ENUM) and eliminate warnings.
-        enum_defs.append('        default: out << "UNKNOWN"; break;')
-        enum_defs.append('    }')
-        enum_defs.append('    return out;')
-        enum_defs.append('}')
-    for (flag_name, vals) in flag_vals.items():
-        enum_defs.append('utils::io::ostream& operator<<(utils::io::ostream& out, ' +
-            'const {}& value) {{'.format(flag_name))
-        enum_defs.append('    switch (value) {')
-        for val in vals:
-            enum_defs.append('        case {1}: out << "{0}"; break;'.format(*val))
-        enum_defs.append('        default: out << "UNKNOWN_FLAGS"; break;')
-        enum_defs.append('    }')
-        enum_defs.append('    return out;')
-        enum_defs.append('}')
+    lazy_stubs = []
+    lazy_functions = []
     for (group, functions) in function_groups.items():
         if not len(functions):
             continue
@@ -364,6 +657,8 @@ def produceCpp(function_groups, enum_vals, flag_vals, output_dir):
         has_device = False
         has_loader = False
         for (name, fn) in functions.items():
+            if fn.lazy:
+                continue
             if fn.type == 'instance':
                 has_instance = True
             elif fn.type == 'device':
@@ -379,7 +674,27 @@ def produceCpp(function_groups, enum_vals, flag_vals, output_dir):
         if has_loader:
             loader_functions.append('#if ' + preproc_expr)
 
+        lazy = [fn for fn in functions.values() if fn.lazy]
+        if lazy:
+            lazy_stubs.append('#if ' + preproc_expr)
+            lazy_functions.append('#if ' + preproc_expr)
+        for fn in lazy:
+            lazy_stubs.append(LAZY_STUB_TEMPLATE % {
+                'name': fn.name,
+                'returns': fn.returns,
+                'params': ', '.join(decl for (decl, arg) in fn.params),
+                'args': ', '.join(arg for (decl, arg) in fn.params),
+                'device': 'true' if fn.type == 'device' else 'false'})
+            lazy_functions.append('    %(name)s = %(name)sLazy;' % {'name': fn.name})
+        if lazy:
+            lazy_stubs.append('#endif // ' + preproc_expr)
+            lazy_functions.append('#endif // ' + preproc_expr)
+
         for (name, fn) in functions.items():
+            if fn.lazy:
+                function_pointers.append("PFN_%(name)s %(name)s = %(name)sLazy;" % {
+                    'name': fn.name})
+                continue
             loadfn = '    %(name)s = (PFN_%(name)s) loadcb(context, "%(name)s");' % {
                 'name': fn.name }
             if fn.type == 'instance':
@@ -398,9 +713,23 @@ def produceCpp(function_groups, enum_vals, flag_vals, output_dir):
         if has_loader:
             loader_functions.append('#endif // ' + preproc_expr)
 
+    dispatch_def = ''
+    if dispatch:
+        loads = []
+        for (preproc_expr, functions) in deviceFunctionGroups(function_groups):
+            loads.append('#if ' + preproc_expr)
+            for fn in functions:
+                loads.append('    dispatch->%(name)s = (PFN_%(name)s) vkGetDeviceProcAddr(device, '
+                        '"%(name)s");' % {'name': fn.name})
+            loads.append('#endif // ' + preproc_expr)
+        dispatch_def = DEVICE_DISPATCH_DEF_TEMPLATE % {'DEVICE_FUNCTIONS': '\n'.join(loads)}
+
     with open(fullpath, 'w') as file:
         file.write(CPP_FILE_TEMPLATE % {
-            'ENUM_DEFS': '\n'.join(enum_defs),
+            'DEVICE_DISPATCH_DEF': dispatch_def,
+            'LAZY_STUBS': LAZY_RESOLVER + '\n'.join(lazy_stubs) + '\n' if lazy_stubs else '',
+            'LAZY_FUNCTIONS': '\n'.join(lazy_functions),
+            'ENUM_DEFS': produceEnumDefs(enum_vals, flag_vals),
             'LOADER_FUNCTIONS': '\n'.join(loader_functions),
             'INSTANCE_FUNCTIONS': '\n'.join(instance_functions),
             'DEVICE_FUNCTIONS': '\n'.join(device_functions),
@@ -412,14 +741,22 @@ if __name__ == '__main__':
     parser.add_argument('-I', '--include', help='Parent location for bluevk/BlueVK.h')
     parser.add_argument('-o', '--output', help='Output directory for BlueVK.cpp')
     parser.add_argument('-s', '--specpath', help='Vulkan XML specification')
+    parser.add_argument('-d', '--dispatch', action='store_true',
+            help='Also emit bluevk::DeviceDispatch, a per-device table of device functions')
+    parser.add_argument('-p', '--profile',
+            help='File listing the features and extensions whose functions are emitted')
+    parser.add_argument('-l', '--lazy', action='store_true',
+            help='Emit the functions left out by the profile too, bound on their first call')
     args = parser.parse_args()
 
     spec = open(args.specpath, 'r') if args.specpath else urllib2.urlopen(VK_XML_URL)
     spec_tree = etree.parse(spec)
     function_groups, enum_vals, flag_vals = consumeXML(spec_tree)
+    if args.profile:
+        function_groups = applyProfile(function_groups, readProfile(args.profile), args.lazy)
 
     include_dir = args.include if args.include else os.path.join(os.getcwd(), 'include')
-    produceHeader(function_groups, enum_vals, flag_vals, include_dir)
+    produceHeader(function_groups, enum_vals, flag_vals, include_dir, args.dispatch)
 
     output_dir  = args.output if args.output else os.path.join(os.getcwd(), 'src')
-    produceCpp(function_groups, enum_vals, flag_vals, output_dir)
+    produceCpp(function_groups, enum_vals, flag_vals, output_dir, args.dispatch)
@@ -45,6 +45,11 @@ namespace bluevk {
 
     void bindInstance(VkInstance instance);
 
+    // Reloads the device functions through vkGetDeviceProcAddr, which bypasses the dispatch
+    // trampolines of the loader. Must be called after bindInstance, with the device that all
+    // subsequent device function calls refer to.
+    void bindDevice(VkDevice device);
+
 } // namespace bluevk
 
 #if defined(VK_VERSION_1_0)
@@ -596,4 +601,131 @@ utils::io::ostream& operator<<(utils::io::ostream& out, const VkDebugUtilsMessag
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkDescriptorBindingFlagBitsEXT& value);
 #endif
 
+namespace bluevk {
+
+    // Looks up an enumerant by name, such as "VK_FORMAT_R8G8B8A8_UNORM". Flags can also be given as
+    // several names separated by '|'. Returns false if a name is unknown. Unlike the operator<< of
+    // the enums, these are available in release builds too, to parse configuration.
+    bool parseEnum(const char* name, VkImageLayout* value);
+    bool parseEnum(const char* name, VkAttachmentLoadOp* value);
+    bool parseEnum(const char* name, VkAttachmentStoreOp* value);
+    bool parseEnum(const char* name, VkImageType* value);
+    bool parseEnum(const char* name, VkImageTiling* value);
+    bool parseEnum(const char* name, VkImageViewType* value);
+    bool parseEnum(const char* name, VkCommandBufferLevel* value);
+    bool parseEnum(const char* name, VkComponentSwizzle* value);
+    bool parseEnum(const char* name, VkDescriptorType* value);
+    bool parseEnum(const char* name, VkQueryType* value);
+    bool parseEnum(const char* name, VkBorderColor* value);
+    bool parseEnum(const char* name, VkPipelineBindPoint* value);
+    bool parseEnum(const char* name, VkPipelineCacheHeaderVersion* value);
+    bool parseEnum(const char* name, VkPrimitiveTopology* value);
+    bool parseEnum(const char* name, VkSharingMode* value);
+    bool parseEnum(const char* name, VkIndexType* value);
+    bool parseEnum(const char* name, VkFilter* value);
+    bool parseEnum(const char* name, VkSamplerMipmapMode* value);
+    bool parseEnum(const char* name, VkSamplerAddressMode* value);
+    bool parseEnum(const char* name, VkCompareOp* value);
+    bool parseEnum(const char* name, VkPolygonMode* value);
+    bool parseEnum(const char* name, VkFrontFace* value);
+    bool parseEnum(const char* name, VkBlendFactor* value);
+    bool parseEnum(const char* name, VkBlendOp* value);
+    bool parseEnum(const char* name, VkStencilOp* value);
+    bool parseEnum(const char* name, VkLogicOp* value);
+    bool parseEnum(const char* name, VkInternalAllocationType* value);
+    bool parseEnum(const char* name, VkSystemAllocationScope* value);
+    bool parseEnum(const char* name, VkPhysicalDeviceType* value);
+    bool parseEnum(const char* name, VkVertexInputRate* value);
+    bool parseEnum(const char* name, VkFormat* value);
+    bool parseEnum(const char* name, VkStructureType* value);
+    bool parseEnum(const char* name, VkSubpassContents* value);
+    bool parseEnum(const char* name, VkResult* value);
+    bool parseEnum(const char* name, VkDynamicState* value);
+    bool parseEnum(const char* name, VkDescriptorUpdateTemplateType* value);
+    bool parseEnum(const char* name, VkObjectType* value);
+    bool parseEnum(const char* name, VkPresentModeKHR* value);
+    bool parseEnum(const char* name, VkColorSpaceKHR* value);
+    bool parseEnum(const char* name, VkDebugReportObjectTypeEXT* value);
+    bool parseEnum(const char* name, VkRasterizationOrderAMD* value);
+    bool parseEnum(const char* name, VkValidationCheckEXT* value);
+    bool parseEnum(const char* name, VkIndirectCommandsTokenTypeNVX* value);
+    bool parseEnum(const char* name, VkObjectEntryTypeNVX* value);
+    bool parseEnum(const char* name, VkDisplayPowerStateEXT* value);
+    bool parseEnum(const char* name, VkDeviceEventTypeEXT* value);
+    bool parseEnum(const char* name, VkDisplayEventTypeEXT* value);
+    bool parseEnum(const char* name, VkViewportCoordinateSwizzleNV* value);
+    bool parseEnum(const char* name, VkDiscardRectangleModeEXT* value);
+    bool parseEnum(const char* name, VkPointClippingBehavior* value);
+    bool parseEnum(const char* name, VkSamplerReductionModeEXT* value);
+    bool parseEnum(const char* name, VkTessellationDomainOrigin* value);
+    bool parseEnum(const char* name, VkSamplerYcbcrModelConversion* value);
+    bool parseEnum(const char* name, VkSamplerYcbcrRange* value);
+    bool parseEnum(const char* name, VkChromaLocation* value);
+    bool parseEnum(const char* name, VkBlendOverlapEXT* value);
+    bool parseEnum(const char* name, VkCoverageModulationModeNV* value);
+    bool parseEnum(const char* name, VkValidationCacheHeaderVersionEXT* value);
+    bool parseEnum(const char* name, VkShaderInfoTypeAMD* value);
+    bool parseEnum(const char* name, VkQueueGlobalPriorityEXT* value);
+    bool parseEnum(const char* name, VkConservativeRasterizationModeEXT* value);
+    bool parseEnum(const char* name, VkCullModeFlagBits* value);
+    bool parseEnum(const char* name, VkQueueFlagBits* value);
+    bool parseEnum(const char* name, VkDeviceQueueCreateFlagBits* value);
+    bool parseEnum(const char* name, VkMemoryPropertyFlagBits* value);
+    bool parseEnum(const char* name, VkMemoryHeapFlagBits* value);
+    bool parseEnum(const char* name, VkAccessFlagBits* value);
+    bool parseEnum(const char* name, VkBufferUsageFlagBits* value);
+    bool parseEnum(const char* name, VkBufferCreateFlagBits* value);
+    bool parseEnum(const char* name, VkShaderStageFlagBits* value);
+    bool parseEnum(const char* name, VkImageUsageFlagBits* value);
+    bool parseEnum(const char* name, VkImageCreateFlagBits* value);
+    bool parseEnum(const char* name, VkPipelineCreateFlagBits* value);
+    bool parseEnum(const char* name, VkColorComponentFlagBits* value);
+    bool parseEnum(const char* name, VkFenceCreateFlagBits* value);
+    bool parseEnum(const char* name, VkFormatFeatureFlagBits* value);
+    bool parseEnum(const char* name, VkQueryControlFlagBits* value);
+    bool parseEnum(const char* name, VkQueryResultFlagBits* value);
+    bool parseEnum(const char* name, VkCommandBufferUsageFlagBits* value);
+    bool parseEnum(const char* name, VkQueryPipelineStatisticFlagBits* value);
+    bool parseEnum(const char* name, VkImageAspectFlagBits* value);
+    bool parseEnum(const char* name, VkSparseImageFormatFlagBits* value);
+    bool parseEnum(const char* name, VkSparseMemoryBindFlagBits* value);
+    bool parseEnum(const char* name, VkPipelineStageFlagBits* value);
+    bool parseEnum(const char* name, VkCommandPoolCreateFlagBits* value);
+    bool parseEnum(const char* name, VkCommandPoolResetFlagBits* value);
+    bool parseEnum(const char* name, VkCommandBufferResetFlagBits* value);
+    bool parseEnum(const char* name, VkSampleCountFlagBits* value);
+    bool parseEnum(const char* name, VkAttachmentDescriptionFlagBits* value);
+    bool parseEnum(const char* name, VkStencilFaceFlagBits* value);
+    bool parseEnum(const char* name, VkDescriptorPoolCreateFlagBits* value);
+    bool parseEnum(const char* name, VkDependencyFlagBits* value);
+    bool parseEnum(const char* name, VkDisplayPlaneAlphaFlagBitsKHR* value);
+    bool parseEnum(const char* name, VkCompositeAlphaFlagBitsKHR* value);
+    bool parseEnum(const char* name, VkSurfaceTransformFlagBitsKHR* value);
+    bool parseEnum(const char* name, VkDebugReportFlagBitsEXT* value);
+    bool parseEnum(const char* name, VkExternalMemoryHandleTypeFlagBitsNV* value);
+    bool parseEnum(const char* name, VkExternalMemoryFeatureFlagBitsNV* value);
+    bool parseEnum(const char* name, VkSubgroupFeatureFlagBits* value);
+    bool parseEnum(const char* name, VkIndirectCommandsLayoutUsageFlagBitsNVX* value);
+    bool parseEnum(const char* name, VkObjectEntryUsageFlagBitsNVX* value);
+    bool parseEnum(const char* name, VkDescriptorSetLayoutCreateFlagBits* value);
+    bool parseEnum(const char* name, VkExternalMemoryHandleTypeFlagBits* value);
+    bool parseEnum(const char* name, VkExternalMemoryFeatureFlagBits* value);
+    bool parseEnum(const char* name, VkExternalSemaphoreHandleTypeFlagBits* value);
+    bool parseEnum(const char* name, VkExternalSemaphoreFeatureFlagBits* value);
+    bool parseEnum(const char* name, VkSemaphoreImportFlagBits* value);
+    bool parseEnum(const char* name, VkExternalFenceHandleTypeFlagBits* value);
+    bool parseEnum(const char* name, VkExternalFenceFeatureFlagBits* value);
+    bool parseEnum(const char* name, VkFenceImportFlagBits* value);
+    bool parseEnum(const char* name, VkSurfaceCounterFlagBitsEXT* value);
+    bool parseEnum(const char* name, VkPeerMemoryFeatureFlagBits* value);
+    bool parseEnum(const char* name, VkMemoryAllocateFlagBits* value);
+    bool parseEnum(const char* name, VkDeviceGroupPresentModeFlagBitsKHR* value);
+    bool parseEnum(const char* name, VkSwapchainCreateFlagBitsKHR* value);
+    bool parseEnum(const char* name, VkSubpassDescriptionFlagBits* value);
+    bool parseEnum(const char* name, VkDebugUtilsMessageSeverityFlagBitsEXT* value);
+    bool parseEnum(const char* name, VkDebugUtilsMessageTypeFlagBitsEXT* value);
+    bool parseEnum(const char* name, VkDescriptorBindingFlagBitsEXT* value);
+
+} // namespace bluevk
+
 #endif // TNT_FILAMENT_BLUEVK_H
@@ -29,6 +29,7 @@ static void loadInstanceFunctions(void* context, PFN_vkVoidFunction (*loadcb)(vo
 static void loadDeviceFunctions(void* context, PFN_vkVoidFunction (*loadcb)(void*, const char*));
 static PFN_vkVoidFunction vkGetInstanceProcAddrWrapper(void* context, const char* name);
 static PFN_vkVoidFunction vkGetDeviceProcAddrWrapper(void* context, const char* name);
+static void resetLazyFunctions();
 
 using std::string;
 
@@ -50,9 +51,22 @@ bool bluevk::initialize() {
     return true;
 }
 
+// The handles that lazily bound functions are resolved with.
+static VkInstance sInstance = VK_NULL_HANDLE;
+static VkDevice sDevice = VK_NULL_HANDLE;
+
 void bluevk::bindInstance(VkInstance instance) {
+    sInstance = instance;
+    sDevice = VK_NULL_HANDLE;
     loadInstanceFunctions(instance, vkGetInstanceProcAddrWrapper);
     loadDeviceFunctions(instance, vkGetInstanceProcAddrWrapper);
+    resetLazyFunctions();
+}
+
+void bluevk::bindDevice(VkDevice device) {
+    sDevice = device;
+    loadDeviceFunctions(device, vkGetDeviceProcAddrWrapper);
+    resetLazyFunctions();
 }
 
 static PFN_vkVoidFunction vkGetInstanceProcAddrWrapper(void* context, const char* name) {
@@ -314,7 +328,6 @@ static void loadDeviceFunctions(void* context, PFN_vkVoidFunction (*loadcb)(void
     vkGetImageMemoryRequirements = (PFN_vkGetImageMemoryRequirements) loadcb(context, "vkGetImageMemoryRequirements");
     vkGetImageSparseMemoryRequirements = (PFN_vkGetImageSparseMemoryRequirements) loadcb(context, "vkGetImageSparseMemoryRequirements");
     vkGetImageSubresourceLayout = (PFN_vkGetImageSubresourceLayout) loadcb(context, "vkGetImageSubresourceLayout");
-    vkGetInstanceProcAddr = (PFN_vkGetInstanceProcAddr) loadcb(context, "vkGetInstanceProcAddr");
     vkGetPipelineCacheData = (PFN_vkGetPipelineCacheData) loadcb(context, "vkGetPipelineCacheData");
     vkGetQueryPoolResults = (PFN_vkGetQueryPoolResults) loadcb(context, "vkGetQueryPoolResults");
     vkGetRenderAreaGranularity = (PFN_vkGetRenderAreaGranularity) loadcb(context, "vkGetRenderAreaGranularity");
@@ -513,6 +526,12 @@ static void loadDeviceFunctions(void* context, PFN_vkVoidFunction (*loadcb)(void
 #endif // (defined(VK_KHR_device_group) && defined(VK_KHR_swapchain)) || (defined(VK_KHR_swapchain) && defined(VK_VERSION_1_1))
 }
 
+// Points the lazily bound functions back to their stubs, so that they are resolved again with the
+// newly bound handles.
+static void resetLazyFunctions() {
+
+}
+
 #if defined(VK_VERSION_1_0)
 PFN_vkAllocateCommandBuffers vkAllocateCommandBuffers;
 PFN_vkAllocateDescriptorSets vkAllocateDescriptorSets;
@@ -939,1505 +958,3587 @@ PFN_vkGetPhysicalDevicePresentRectanglesKHR vkGetPhysicalDevicePresentRectangles
 PFN_vkAcquireNextImage2KHR vkAcquireNextImage2KHR;
 #endif // (defined(VK_KHR_device_group) && defined(VK_KHR_swapchain)) || (defined(VK_KHR_swapchain) && defined(VK_VERSION_1_1))
 
+#include <algorithm>
+
+#include <stdlib.h>
+#include <string.h>
+
 #if !defined(NDEBUG)
 #include <utils/Log.h>
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkImageLayout& value) {
-    switch (value) {
-        case VK_IMAGE_LAYOUT_UNDEFINED: out << "VK_IMAGE_LAYOUT_UNDEFINED"; break;
-        case VK_IMAGE_LAYOUT_GENERAL: out << "VK_IMAGE_LAYOUT_GENERAL"; break;
-        case VK_IMAGE_LAYOUT_COLOR_ATTACHMENT_OPTIMAL: out << "VK_IMAGE_LAYOUT_COLOR_ATTACHMENT_OPTIMAL"; break;
-        case VK_IMAGE_LAYOUT_DEPTH_STENCIL_ATTACHMENT_OPTIMAL: out << "VK_IMAGE_LAYOUT_DEPTH_STENCIL_ATTACHMENT_OPTIMAL"; break;
-        case VK_IMAGE_LAYOUT_DEPTH_STENCIL_READ_ONLY_OPTIMAL: out << "VK_IMAGE_LAYOUT_DEPTH_STENCIL_READ_ONLY_OPTIMAL"; break;
-        case VK_IMAGE_LAYOUT_SHADER_READ_ONLY_OPTIMAL: out << "VK_IMAGE_LAYOUT_SHADER_READ_ONLY_OPTIMAL"; break;
-        case VK_IMAGE_LAYOUT_TRANSFER_SRC_OPTIMAL: out << "VK_IMAGE_LAYOUT_TRANSFER_SRC_OPTIMAL"; break;
-        case VK_IMAGE_LAYOUT_TRANSFER_DST_OPTIMAL: out << "VK_IMAGE_LAYOUT_TRANSFER_DST_OPTIMAL"; break;
-        case VK_IMAGE_LAYOUT_PREINITIALIZED: out << "VK_IMAGE_LAYOUT_PREINITIALIZED"; break;
-        default: out << "UNKNOWN"; break;
-    }
-    return out;
+#endif
+
+namespace {
+
+// The names of all the enumerants, pooled in a single string.
+const char sEnumNames[] =
+    "VK_IMAGE_LAYOUT_UNDEFINED\0"
+    "VK_IMAGE_LAYOUT_GENERAL\0"
+    "VK_IMAGE_LAYOUT_COLOR_ATTACHMENT_OPTIMAL\0"
+    "VK_IMAGE_LAYOUT_DEPTH_STENCIL_ATTACHMENT_OPTIMAL\0"
+    "VK_IMAGE_LAYOUT_DEPTH_STENCIL_READ_ONLY_OPTIMAL\0"
+    "VK_IMAGE_LAYOUT_SHADER_READ_ONLY_OPTIMAL\0"
+    "VK_IMAGE_LAYOUT_TRANSFER_SRC_OPTIMAL\0"
+    "VK_IMAGE_LAYOUT_TRANSFER_DST_OPTIMAL\0"
+    "VK_IMAGE_LAYOUT_PREINITIALIZED\0"
+    "VK_ATTACHMENT_LOAD_OP_LOAD\0"
+    "VK_ATTACHMENT_LOAD_OP_CLEAR\0"
+    "VK_ATTACHMENT_LOAD_OP_DONT_CARE\0"
+    "VK_ATTACHMENT_STORE_OP_STORE\0"
+    "VK_ATTACHMENT_STORE_OP_DONT_CARE\0"
+    "VK_IMAGE_TYPE_1D\0"
+    "VK_IMAGE_TYPE_2D\0"
+    "VK_IMAGE_TYPE_3D\0"
+    "VK_IMAGE_TILING_OPTIMAL\0"
+    "VK_IMAGE_TILING_LINEAR\0"
+    "VK_IMAGE_VIEW_TYPE_1D\0"
+    "VK_IMAGE_VIEW_TYPE_2D\0"
+    "VK_IMAGE_VIEW_TYPE_3D\0"
+    "VK_IMAGE_VIEW_TYPE_CUBE\0"
+    "VK_IMAGE_VIEW_TYPE_1D_ARRAY\0"
+    "VK_IMAGE_VIEW_TYPE_2D_ARRAY\0"
+    "VK_IMAGE_VIEW_TYPE_CUBE_ARRAY\0"
+    "VK_COMMAND_BUFFER_LEVEL_PRIMARY\0"
+    "VK_COMMAND_BUFFER_LEVEL_SECONDARY\0"
+    "VK_COMPONENT_SWIZZLE_IDENTITY\0"
+    "VK_COMPONENT_SWIZZLE_ZERO\0"
+    "VK_COMPONENT_SWIZZLE_ONE\0"
+    "VK_COMPONENT_SWIZZLE_R\0"
+    "VK_COMPONENT_SWIZZLE_G\0"
+    "VK_COMPONENT_SWIZZLE_B\0"
+    "VK_COMPONENT_SWIZZLE_A\0"
+    "VK_DESCRIPTOR_TYPE_SAMPLER\0"
+    "VK_DESCRIPTOR_TYPE_COMBINED_IMAGE_SAMPLER\0"
+    "VK_DESCRIPTOR_TYPE_SAMPLED_IMAGE\0"
+    "VK_DESCRIPTOR_TYPE_STORAGE_IMAGE\0"
+    "VK_DESCRIPTOR_TYPE_UNIFORM_TEXEL_BUFFER\0"
+    "VK_DESCRIPTOR_TYPE_STORAGE_TEXEL_BUFFER\0"
+    "VK_DESCRIPTOR_TYPE_UNIFORM_BUFFER\0"
+    "VK_DESCRIPTOR_TYPE_STORAGE_BUFFER\0"
+    "VK_DESCRIPTOR_TYPE_UNIFORM_BUFFER_DYNAMIC\0"
+    "VK_DESCRIPTOR_TYPE_STORAGE_BUFFER_DYNAMIC\0"
+    "VK_DESCRIPTOR_TYPE_INPUT_ATTACHMENT\0"
+    "VK_QUERY_TYPE_OCCLUSION\0"
+    "VK_QUERY_TYPE_PIPELINE_STATISTICS\0"
+    "VK_QUERY_TYPE_TIMESTAMP\0"
+    "VK_BORDER_COLOR_FLOAT_TRANSPARENT_BLACK\0"
+    "VK_BORDER_COLOR_INT_TRANSPARENT_BLACK\0"
+    "VK_BORDER_COLOR_FLOAT_OPAQUE_BLACK\0"
+    "VK_BORDER_COLOR_INT_OPAQUE_BLACK\0"
+    "VK_BORDER_COLOR_FLOAT_OPAQUE_WHITE\0"
+    "VK_BORDER_COLOR_INT_OPAQUE_WHITE\0"
+    "VK_PIPELINE_BIND_POINT_GRAPHICS\0"
+    "VK_PIPELINE_BIND_POINT_COMPUTE\0"
+    "VK_PIPELINE_CACHE_HEADER_VERSION_ONE\0"
+    "VK_PRIMITIVE_TOPOLOGY_POINT_LIST\0"
+    "VK_PRIMITIVE_TOPOLOGY_LINE_LIST\0"
+    "VK_PRIMITIVE_TOPOLOGY_LINE_STRIP\0"
+    "VK_PRIMITIVE_TOPOLOGY_TRIANGLE_LIST\0"
+    "VK_PRIMITIVE_TOPOLOGY_TRIANGLE_STRIP\0"
+    "VK_PRIMITIVE_TOPOLOGY_TRIANGLE_FAN\0"
+    "VK_PRIMITIVE_TOPOLOGY_LINE_LIST_WITH_ADJACENCY\0"
+    "VK_PRIMITIVE_TOPOLOGY_LINE_STRIP_WITH_ADJACENCY\0"
+    "VK_PRIMITIVE_TOPOLOGY_TRIANGLE_LIST_WITH_ADJACENCY\0"
+    "VK_PRIMITIVE_TOPOLOGY_TRIANGLE_STRIP_WITH_ADJACENCY\0"
+    "VK_PRIMITIVE_TOPOLOGY_PATCH_LIST\0"
+    "VK_SHARING_MODE_EXCLUSIVE\0"
+    "VK_SHARING_MODE_CONCURRENT\0"
+    "VK_INDEX_TYPE_UINT16\0"
+    "VK_INDEX_TYPE_UINT32\0"
+    "VK_FILTER_NEAREST\0"
+    "VK_FILTER_LINEAR\0"
+    "VK_SAMPLER_MIPMAP_MODE_NEAREST\0"
+    "VK_SAMPLER_MIPMAP_MODE_LINEAR\0"
+    "VK_SAMPLER_ADDRESS_MODE_REPEAT\0"
+    "VK_SAMPLER_ADDRESS_MODE_MIRRORED_REPEAT\0"
+    "VK_SAMPLER_ADDRESS_MODE_CLAMP_TO_EDGE\0"
+    "VK_SAMPLER_ADDRESS_MODE_CLAMP_TO_BORDER\0"
+    "VK_COMPARE_OP_NEVER\0"
+    "VK_COMPARE_OP_LESS\0"
+    "VK_COMPARE_OP_EQUAL\0"
+    "VK_COMPARE_OP_LESS_OR_EQUAL\0"
+    "VK_COMPARE_OP_GREATER\0"
+    "VK_COMPARE_OP_NOT_EQUAL\0"
+    "VK_COMPARE_OP_GREATER_OR_EQUAL\0"
+    "VK_COMPARE_OP_ALWAYS\0"
+    "VK_POLYGON_MODE_FILL\0"
+    "VK_POLYGON_MODE_LINE\0"
+    "VK_POLYGON_MODE_POINT\0"
+    "VK_FRONT_FACE_COUNTER_CLOCKWISE\0"
+    "VK_FRONT_FACE_CLOCKWISE\0"
+    "VK_BLEND_FACTOR_ZERO\0"
+    "VK_BLEND_FACTOR_ONE\0"
+    "VK_BLEND_FACTOR_SRC_COLOR\0"
+    "VK_BLEND_FACTOR_ONE_MINUS_SRC_COLOR\0"
+    "VK_BLEND_FACTOR_DST_COLOR\0"
+    "VK_BLEND_FACTOR_ONE_MINUS_DST_COLOR\0"
+    "VK_BLEND_FACTOR_SRC_ALPHA\0"
+    "VK_BLEND_FACTOR_ONE_MINUS_SRC_ALPHA\0"
+    "VK_BLEND_FACTOR_DST_ALPHA\0"
+    "VK_BLEND_FACTOR_ONE_MINUS_DST_ALPHA\0"
+    "VK_BLEND_FACTOR_CONSTANT_COLOR\0"
+    "VK_BLEND_FACTOR_ONE_MINUS_CONSTANT_COLOR\0"
+    "VK_BLEND_FACTOR_CONSTANT_ALPHA\0"
+    "VK_BLEND_FACTOR_ONE_MINUS_CONSTANT_ALPHA\0"
+    "VK_BLEND_FACTOR_SRC_ALPHA_SATURATE\0"
+    "VK_BLEND_FACTOR_SRC1_COLOR\0"
+    "VK_BLEND_FACTOR_ONE_MINUS_SRC1_COLOR\0"
+    "VK_BLEND_FACTOR_SRC1_ALPHA\0"
+    "VK_BLEND_FACTOR_ONE_MINUS_SRC1_ALPHA\0"
+    "VK_BLEND_OP_ADD\0"
+    "VK_BLEND_OP_SUBTRACT\0"
+    "VK_BLEND_OP_REVERSE_SUBTRACT\0"
+    "VK_BLEND_OP_MIN\0"
+    "VK_BLEND_OP_MAX\0"
+    "VK_STENCIL_OP_KEEP\0"
+    "VK_STENCIL_OP_ZERO\0"
+    "VK_STENCIL_OP_REPLACE\0"
+    "VK_STENCIL_OP_INCREMENT_AND_CLAMP\0"
+    "VK_STENCIL_OP_DECREMENT_AND_CLAMP\0"
+    "VK_STENCIL_OP_INVERT\0"
+    "VK_STENCIL_OP_INCREMENT_AND_WRAP\0"
+    "VK_STENCIL_OP_DECREMENT_AND_WRAP\0"
+    "VK_LOGIC_OP_CLEAR\0"
+    "VK_LOGIC_OP_AND\0"
+    "VK_LOGIC_OP_AND_REVERSE\0"
+    "VK_LOGIC_OP_COPY\0"
+    "VK_LOGIC_OP_AND_INVERTED\0"
+    "VK_LOGIC_OP_NO_OP\0"
+    "VK_LOGIC_OP_XOR\0"
+    "VK_LOGIC_OP_OR\0"
+    "VK_LOGIC_OP_NOR\0"
+    "VK_LOGIC_OP_EQUIVALENT\0"
+    "VK_LOGIC_OP_INVERT\0"
+    "VK_LOGIC_OP_OR_REVERSE\0"
+    "VK_LOGIC_OP_COPY_INVERTED\0"
+    "VK_LOGIC_OP_OR_INVERTED\0"
+    "VK_LOGIC_OP_NAND\0"
+    "VK_LOGIC_OP_SET\0"
+    "VK_INTERNAL_ALLOCATION_TYPE_EXECUTABLE\0"
+    "VK_SYSTEM_ALLOCATION_SCOPE_COMMAND\0"
+    "VK_SYSTEM_ALLOCATION_SCOPE_OBJECT\0"
+    "VK_SYSTEM_ALLOCATION_SCOPE_CACHE\0"
+    "VK_SYSTEM_ALLOCATION_SCOPE_DEVICE\0"
+    "VK_SYSTEM_ALLOCATION_SCOPE_INSTANCE\0"
+    "VK_PHYSICAL_DEVICE_TYPE_OTHER\0"
+    "VK_PHYSICAL_DEVICE_TYPE_INTEGRATED_GPU\0"
+    "VK_PHYSICAL_DEVICE_TYPE_DISCRETE_GPU\0"
+    "VK_PHYSICAL_DEVICE_TYPE_VIRTUAL_GPU\0"
+    "VK_PHYSICAL_DEVICE_TYPE_CPU\0"
+    "VK_VERTEX_INPUT_RATE_VERTEX\0"
+    "VK_VERTEX_INPUT_RATE_INSTANCE\0"
+    "VK_FORMAT_UNDEFINED\0"
+    "VK_FORMAT_R4G4_UNORM_PACK8\0"
+    "VK_FORMAT_R4G4B4A4_UNORM_PACK16\0"
+    "VK_FORMAT_B4G4R4A4_UNORM_PACK16\0"
+    "VK_FORMAT_R5G6B5_UNORM_PACK16\0"
+    "VK_FORMAT_B5G6R5_UNORM_PACK16\0"
+    "VK_FORMAT_R5G5B5A1_UNORM_PACK16\0"
+    "VK_FORMAT_B5G5R5A1_UNORM_PACK16\0"
+    "VK_FORMAT_A1R5G5B5_UNORM_PACK16\0"
+    "VK_FORMAT_R8_UNORM\0"
+    "VK_FORMAT_R8_SNORM\0"
+    "VK_FORMAT_R8_USCALED\0"
+    "VK_FORMAT_R8_SSCALED\0"
+    "VK_FORMAT_R8_UINT\0"
+    "VK_FORMAT_R8_SINT\0"
+    "VK_FORMAT_R8_SRGB\0"
+    "VK_FORMAT_R8G8_UNORM\0"
+    "VK_FORMAT_R8G8_SNORM\0"
+    "VK_FORMAT_R8G8_USCALED\0"
+    "VK_FORMAT_R8G8_SSCALED\0"
+    "VK_FORMAT_R8G8_UINT\0"
+    "VK_FORMAT_R8G8_SINT\0"
+    "VK_FORMAT_R8G8_SRGB\0"
+    "VK_FORMAT_R8G8B8_UNORM\0"
+    "VK_FORMAT_R8G8B8_SNORM\0"
+    "VK_FORMAT_R8G8B8_USCALED\0"
+    "VK_FORMAT_R8G8B8_SSCALED\0"
+    "VK_FORMAT_R8G8B8_UINT\0"
+    "VK_FORMAT_R8G8B8_SINT\0"
+    "VK_FORMAT_R8G8B8_SRGB\0"
+    "VK_FORMAT_B8G8R8_UNORM\0"
+    "VK_FORMAT_B8G8R8_SNORM\0"
+    "VK_FORMAT_B8G8R8_USCALED\0"
+    "VK_FORMAT_B8G8R8_SSCALED\0"
+    "VK_FORMAT_B8G8R8_UINT\0"
+    "VK_FORMAT_B8G8R8_SINT\0"
+    "VK_FORMAT_B8G8R8_SRGB\0"
+    "VK_FORMAT_R8G8B8A8_UNORM\0"
+    "VK_FORMAT_R8G8B8A8_SNORM\0"
+    "VK_FORMAT_R8G8B8A8_USCALED\0"
+    "VK_FORMAT_R8G8B8A8_SSCALED\0"
+    "VK_FORMAT_R8G8B8A8_UINT\0"
+    "VK_FORMAT_R8G8B8A8_SINT\0"
+    "VK_FORMAT_R8G8B8A8_SRGB\0"
+    "VK_FORMAT_B8G8R8A8_UNORM\0"
+    "VK_FORMAT_B8G8R8A8_SNORM\0"
+    "VK_FORMAT_B8G8R8A8_USCALED\0"
+    "VK_FORMAT_B8G8R8A8_SSCALED\0"
+    "VK_FORMAT_B8G8R8A8_UINT\0"
+    "VK_FORMAT_B8G8R8A8_SINT\0"
+    "VK_FORMAT_B8G8R8A8_SRGB\0"
+    "VK_FORMAT_A8B8G8R8_UNORM_PACK32\0"
+    "VK_FORMAT_A8B8G8R8_SNORM_PACK32\0"
+    "VK_FORMAT_A8B8G8R8_USCALED_PACK32\0"
+    "VK_FORMAT_A8B8G8R8_SSCALED_PACK32\0"
+    "VK_FORMAT_A8B8G8R8_UINT_PACK32\0"
+    "VK_FORMAT_A8B8G8R8_SINT_PACK32\0"
+    "VK_FORMAT_A8B8G8R8_SRGB_PACK32\0"
+    "VK_FORMAT_A2R10G10B10_UNORM_PACK32\0"
+    "VK_FORMAT_A2R10G10B10_SNORM_PACK32\0"
+    "VK_FORMAT_A2R10G10B10_USCALED_PACK32\0"
+    "VK_FORMAT_A2R10G10B10_SSCALED_PACK32\0"
+    "VK_FORMAT_A2R10G10B10_UINT_PACK32\0"
+    "VK_FORMAT_A2R10G10B10_SINT_PACK32\0"
+    "VK_FORMAT_A2B10G10R10_UNORM_PACK32\0"
+    "VK_FORMAT_A2B10G10R10_SNORM_PACK32\0"
+    "VK_FORMAT_A2B10G10R10_USCALED_PACK32\0"
+    "VK_FORMAT_A2B10G10R10_SSCALED_PACK32\0"
+    "VK_FORMAT_A2B10G10R10_UINT_PACK32\0"
+    "VK_FORMAT_A2B10G10R10_SINT_PACK32\0"
+    "VK_FORMAT_R16_UNORM\0"
+    "VK_FORMAT_R16_SNORM\0"
+    "VK_FORMAT_R16_USCALED\0"
+    "VK_FORMAT_R16_SSCALED\0"
+    "VK_FORMAT_R16_UINT\0"
+    "VK_FORMAT_R16_SINT\0"
+    "VK_FORMAT_R16_SFLOAT\0"
+    "VK_FORMAT_R16G16_UNORM\0"
+    "VK_FORMAT_R16G16_SNORM\0"
+    "VK_FORMAT_R16G16_USCALED\0"
+    "VK_FORMAT_R16G16_SSCALED\0"
+    "VK_FORMAT_R16G16_UINT\0"
+    "VK_FORMAT_R16G16_SINT\0"
+    "VK_FORMAT_R16G16_SFLOAT\0"
+    "VK_FORMAT_R16G16B16_UNORM\0"
+    "VK_FORMAT_R16G16B16_SNORM\0"
+    "VK_FORMAT_R16G16B16_USCALED\0"
+    "VK_FORMAT_R16G16B16_SSCALED\0"
+    "VK_FORMAT_R16G16B16_UINT\0"
+    "VK_FORMAT_R16G16B16_SINT\0"
+    "VK_FORMAT_R16G16B16_SFLOAT\0"
+    "VK_FORMAT_R16G16B16A16_UNORM\0"
+    "VK_FORMAT_R16G16B16A16_SNORM\0"
+    "VK_FORMAT_R16G16B16A16_USCALED\0"
+    "VK_FORMAT_R16G16B16A16_SSCALED\0"
+    "VK_FORMAT_R16G16B16A16_UINT\0"
+    "VK_FORMAT_R16G16B16A16_SINT\0"
+    "VK_FORMAT_R16G16B16A16_SFLOAT\0"
+    "VK_FORMAT_R32_UINT\0"
+    "VK_FORMAT_R32_SINT\0"
+    "VK_FORMAT_R32_SFLOAT\0"
+    "VK_FORMAT_R32G32_UINT\0"
+    "VK_FORMAT_R32G32_SINT\0"
+    "VK_FORMAT_R32G32_SFLOAT\0"
+    "VK_FORMAT_R32G32B32_UINT\0"
+    "VK_FORMAT_R32G32B32_SINT\0"
+    "VK_FORMAT_R32G32B32_SFLOAT\0"
+    "VK_FORMAT_R32G32B32A32_UINT\0"
+    "VK_FORMAT_R32G32B32A32_SINT\0"
+    "VK_FORMAT_R32G32B32A32_SFLOAT\0"
+    "VK_FORMAT_R64_UINT\0"
+    "VK_FORMAT_R64_SINT\0"
+    "VK_FORMAT_R64_SFLOAT\0"
+    "VK_FORMAT_R64G64_UINT\0"
+    "VK_FORMAT_R64G64_SINT\0"
+    "VK_FORMAT_R64G64_SFLOAT\0"
+    "VK_FORMAT_R64G64B64_UINT\0"
+    "VK_FORMAT_R64G64B64_SINT\0"
+    "VK_FORMAT_R64G64B64_SFLOAT\0"
+    "VK_FORMAT_R64G64B64A64_UINT\0"
+    "VK_FORMAT_R64G64B64A64_SINT\0"
+    "VK_FORMAT_R64G64B64A64_SFLOAT\0"
+    "VK_FORMAT_B10G11R11_UFLOAT_PACK32\0"
+    "VK_FORMAT_E5B9G9R9_UFLOAT_PACK32\0"
+    "VK_FORMAT_D16_UNORM\0"
+    "VK_FORMAT_X8_D24_UNORM_PACK32\0"
+    "VK_FORMAT_D32_SFLOAT\0"
+    "VK_FORMAT_S8_UINT\0"
+    "VK_FORMAT_D16_UNORM_S8_UINT\0"
+    "VK_FORMAT_D24_UNORM_S8_UINT\0"
+    "VK_FORMAT_D32_SFLOAT_S8_UINT\0"
+    "VK_FORMAT_BC1_RGB_UNORM_BLOCK\0"
+    "VK_FORMAT_BC1_RGB_SRGB_BLOCK\0"
+    "VK_FORMAT_BC1_RGBA_UNORM_BLOCK\0"
+    "VK_FORMAT_BC1_RGBA_SRGB_BLOCK\0"
+    "VK_FORMAT_BC2_UNORM_BLOCK\0"
+    "VK_FORMAT_BC2_SRGB_BLOCK\0"
+    "VK_FORMAT_BC3_UNORM_BLOCK\0"
+    "VK_FORMAT_BC3_SRGB_BLOCK\0"
+    "VK_FORMAT_BC4_UNORM_BLOCK\0"
+    "VK_FORMAT_BC4_SNORM_BLOCK\0"
+    "VK_FORMAT_BC5_UNORM_BLOCK\0"
+    "VK_FORMAT_BC5_SNORM_BLOCK\0"
+    "VK_FORMAT_BC6H_UFLOAT_BLOCK\0"
+    "VK_FORMAT_BC6H_SFLOAT_BLOCK\0"
+    "VK_FORMAT_BC7_UNORM_BLOCK\0"
+    "VK_FORMAT_BC7_SRGB_BLOCK\0"
+    "VK_FORMAT_ETC2_R8G8B8_UNORM_BLOCK\0"
+    "VK_FORMAT_ETC2_R8G8B8_SRGB_BLOCK\0"
+    "VK_FORMAT_ETC2_R8G8B8A1_UNORM_BLOCK\0"
+    "VK_FORMAT_ETC2_R8G8B8A1_SRGB_BLOCK\0"
+    "VK_FORMAT_ETC2_R8G8B8A8_UNORM_BLOCK\0"
+    "VK_FORMAT_ETC2_R8G8B8A8_SRGB_BLOCK\0"
+    "VK_FORMAT_EAC_R11_UNORM_BLOCK\0"
+    "VK_FORMAT_EAC_R11_SNORM_BLOCK\0"
+    "VK_FORMAT_EAC_R11G11_UNORM_BLOCK\0"
+    "VK_FORMAT_EAC_R11G11_SNORM_BLOCK\0"
+    "VK_FORMAT_ASTC_4x4_UNORM_BLOCK\0"
+    "VK_FORMAT_ASTC_4x4_SRGB_BLOCK\0"
+    "VK_FORMAT_ASTC_5x4_UNORM_BLOCK\0"
+    "VK_FORMAT_ASTC_5x4_SRGB_BLOCK\0"
+    "VK_FORMAT_ASTC_5x5_UNORM_BLOCK\0"
+    "VK_FORMAT_ASTC_5x5_SRGB_BLOCK\0"
+    "VK_FORMAT_ASTC_6x5_UNORM_BLOCK\0"
+    "VK_FORMAT_ASTC_6x5_SRGB_BLOCK\0"
+    "VK_FORMAT_ASTC_6x6_UNORM_BLOCK\0"
+    "VK_FORMAT_ASTC_6x6_SRGB_BLOCK\0"
+    "VK_FORMAT_ASTC_8x5_UNORM_BLOCK\0"
+    "VK_FORMAT_ASTC_8x5_SRGB_BLOCK\0"
+    "VK_FORMAT_ASTC_8x6_UNORM_BLOCK\0"
+    "VK_FORMAT_ASTC_8x6_SRGB_BLOCK\0"
+    "VK_FORMAT_ASTC_8x8_UNORM_BLOCK\0"
+    "VK_FORMAT_ASTC_8x8_SRGB_BLOCK\0"
+    "VK_FORMAT_ASTC_10x5_UNORM_BLOCK\0"
+    "VK_FORMAT_ASTC_10x5_SRGB_BLOCK\0"
+    "VK_FORMAT_ASTC_10x6_UNORM_BLOCK\0"
+    "VK_FORMAT_ASTC_10x6_SRGB_BLOCK\0"
+    "VK_FORMAT_ASTC_10x8_UNORM_BLOCK\0"
+    "VK_FORMAT_ASTC_10x8_SRGB_BLOCK\0"
+    "VK_FORMAT_ASTC_10x10_UNORM_BLOCK\0"
+    "VK_FORMAT_ASTC_10x10_SRGB_BLOCK\0"
+    "VK_FORMAT_ASTC_12x10_UNORM_BLOCK\0"
+    "VK_FORMAT_ASTC_12x10_SRGB_BLOCK\0"
+    "VK_FORMAT_ASTC_12x12_UNORM_BLOCK\0"
+    "VK_FORMAT_ASTC_12x12_SRGB_BLOCK\0"
+    "VK_STRUCTURE_TYPE_APPLICATION_INFO\0"
+    "VK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_DEVICE_QUEUE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_SUBMIT_INFO\0"
+    "VK_STRUCTURE_TYPE_MEMORY_ALLOCATE_INFO\0"
+    "VK_STRUCTURE_TYPE_MAPPED_MEMORY_RANGE\0"
+    "VK_STRUCTURE_TYPE_BIND_SPARSE_INFO\0"
+    "VK_STRUCTURE_TYPE_FENCE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_SEMAPHORE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_EVENT_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_QUERY_POOL_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_BUFFER_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_BUFFER_VIEW_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_IMAGE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_IMAGE_VIEW_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_SHADER_MODULE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_PIPELINE_CACHE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_PIPELINE_VERTEX_INPUT_STATE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_PIPELINE_INPUT_ASSEMBLY_STATE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_PIPELINE_TESSELLATION_STATE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_STATE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_PIPELINE_MULTISAMPLE_STATE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_PIPELINE_DEPTH_STENCIL_STATE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_PIPELINE_COLOR_BLEND_STATE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_PIPELINE_DYNAMIC_STATE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_COMPUTE_PIPELINE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_PIPELINE_LAYOUT_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_SAMPLER_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_DESCRIPTOR_POOL_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_DESCRIPTOR_SET_ALLOCATE_INFO\0"
+    "VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET\0"
+    "VK_STRUCTURE_TYPE_COPY_DESCRIPTOR_SET\0"
+    "VK_STRUCTURE_TYPE_FRAMEBUFFER_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_RENDER_PASS_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_COMMAND_POOL_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_COMMAND_BUFFER_ALLOCATE_INFO\0"
+    "VK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_INFO\0"
+    "VK_STRUCTURE_TYPE_COMMAND_BUFFER_BEGIN_INFO\0"
+    "VK_STRUCTURE_TYPE_RENDER_PASS_BEGIN_INFO\0"
+    "VK_STRUCTURE_TYPE_BUFFER_MEMORY_BARRIER\0"
+    "VK_STRUCTURE_TYPE_IMAGE_MEMORY_BARRIER\0"
+    "VK_STRUCTURE_TYPE_MEMORY_BARRIER\0"
+    "VK_STRUCTURE_TYPE_LOADER_INSTANCE_CREATE_INFO\0"
+    "VK_STRUCTURE_TYPE_LOADER_DEVICE_CREATE_INFO\0"
+    "VK_SUBPASS_CONTENTS_INLINE\0"
+    "VK_SUBPASS_CONTENTS_SECONDARY_COMMAND_BUFFERS\0"
+    "VK_SUCCESS\0"
+    "VK_NOT_READY\0"
+    "VK_TIMEOUT\0"
+    "VK_EVENT_SET\0"
+    "VK_EVENT_RESET\0"
+    "VK_INCOMPLETE\0"
+    "VK_ERROR_OUT_OF_HOST_MEMORY\0"
+    "VK_ERROR_OUT_OF_DEVICE_MEMORY\0"
+    "VK_ERROR_INITIALIZATION_FAILED\0"
+    "VK_ERROR_DEVICE_LOST\0"
+    "VK_ERROR_MEMORY_MAP_FAILED\0"
+    "VK_ERROR_LAYER_NOT_PRESENT\0"
+    "VK_ERROR_EXTENSION_NOT_PRESENT\0"
+    "VK_ERROR_FEATURE_NOT_PRESENT\0"
+    "VK_ERROR_INCOMPATIBLE_DRIVER\0"
+    "VK_ERROR_TOO_MANY_OBJECTS\0"
+    "VK_ERROR_FORMAT_NOT_SUPPORTED\0"
+    "VK_ERROR_FRAGMENTED_POOL\0"
+    "VK_DYNAMIC_STATE_VIEWPORT\0"
+    "VK_DYNAMIC_STATE_SCISSOR\0"
+    "VK_DYNAMIC_STATE_LINE_WIDTH\0"
+    "VK_DYNAMIC_STATE_DEPTH_BIAS\0"
+    "VK_DYNAMIC_STATE_BLEND_CONSTANTS\0"
+    "VK_DYNAMIC_STATE_DEPTH_BOUNDS\0"
+    "VK_DYNAMIC_STATE_STENCIL_COMPARE_MASK\0"
+    "VK_DYNAMIC_STATE_STENCIL_WRITE_MASK\0"
+    "VK_DYNAMIC_STATE_STENCIL_REFERENCE\0"
+    "VK_DESCRIPTOR_UPDATE_TEMPLATE_TYPE_DESCRIPTOR_SET\0"
+    "VK_OBJECT_TYPE_UNKNOWN\0"
+    "VK_OBJECT_TYPE_INSTANCE\0"
+    "VK_OBJECT_TYPE_PHYSICAL_DEVICE\0"
+    "VK_OBJECT_TYPE_DEVICE\0"
+    "VK_OBJECT_TYPE_QUEUE\0"
+    "VK_OBJECT_TYPE_SEMAPHORE\0"
+    "VK_OBJECT_TYPE_COMMAND_BUFFER\0"
+    "VK_OBJECT_TYPE_FENCE\0"
+    "VK_OBJECT_TYPE_DEVICE_MEMORY\0"
+    "VK_OBJECT_TYPE_BUFFER\0"
+    "VK_OBJECT_TYPE_IMAGE\0"
+    "VK_OBJECT_TYPE_EVENT\0"
+    "VK_OBJECT_TYPE_QUERY_POOL\0"
+    "VK_OBJECT_TYPE_BUFFER_VIEW\0"
+    "VK_OBJECT_TYPE_IMAGE_VIEW\0"
+    "VK_OBJECT_TYPE_SHADER_MODULE\0"
+    "VK_OBJECT_TYPE_PIPELINE_CACHE\0"
+    "VK_OBJECT_TYPE_PIPELINE_LAYOUT\0"
+    "VK_OBJECT_TYPE_RENDER_PASS\0"
+    "VK_OBJECT_TYPE_PIPELINE\0"
+    "VK_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT\0"
+    "VK_OBJECT_TYPE_SAMPLER\0"
+    "VK_OBJECT_TYPE_DESCRIPTOR_POOL\0"
+    "VK_OBJECT_TYPE_DESCRIPTOR_SET\0"
+    "VK_OBJECT_TYPE_FRAMEBUFFER\0"
+    "VK_OBJECT_TYPE_COMMAND_POOL\0"
+    "VK_PRESENT_MODE_IMMEDIATE_KHR\0"
+    "VK_PRESENT_MODE_MAILBOX_KHR\0"
+    "VK_PRESENT_MODE_FIFO_KHR\0"
+    "VK_PRESENT_MODE_FIFO_RELAXED_KHR\0"
+    "VK_COLOR_SPACE_SRGB_NONLINEAR_KHR\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_INSTANCE_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_PHYSICAL_DEVICE_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_QUEUE_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_SEMAPHORE_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_BUFFER_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_FENCE_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_MEMORY_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_EVENT_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_QUERY_POOL_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_VIEW_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_VIEW_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_SHADER_MODULE_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_CACHE_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_LAYOUT_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_RENDER_PASS_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_POOL_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_FRAMEBUFFER_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_POOL_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_SURFACE_KHR_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_SWAPCHAIN_KHR_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_KHR_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_MODE_KHR_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_OBJECT_TABLE_NVX_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_INDIRECT_COMMANDS_LAYOUT_NVX_EXT\0"
+    "VK_DEBUG_REPORT_OBJECT_TYPE_VALIDATION_CACHE_EXT_EXT\0"
+    "VK_RASTERIZATION_ORDER_STRICT_AMD\0"
+    "VK_RASTERIZATION_ORDER_RELAXED_AMD\0"
+    "VK_VALIDATION_CHECK_ALL_EXT\0"
+    "VK_VALIDATION_CHECK_SHADERS_EXT\0"
+    "VK_INDIRECT_COMMANDS_TOKEN_TYPE_PIPELINE_NVX\0"
+    "VK_INDIRECT_COMMANDS_TOKEN_TYPE_DESCRIPTOR_SET_NVX\0"
+    "VK_INDIRECT_COMMANDS_TOKEN_TYPE_INDEX_BUFFER_NVX\0"
+    "VK_INDIRECT_COMMANDS_TOKEN_TYPE_VERTEX_BUFFER_NVX\0"
+    "VK_INDIRECT_COMMANDS_TOKEN_TYPE_PUSH_CONSTANT_NVX\0"
+    "VK_INDIRECT_COMMANDS_TOKEN_TYPE_DRAW_INDEXED_NVX\0"
+    "VK_INDIRECT_COMMANDS_TOKEN_TYPE_DRAW_NVX\0"
+    "VK_INDIRECT_COMMANDS_TOKEN_TYPE_DISPATCH_NVX\0"
+    "VK_OBJECT_ENTRY_TYPE_DESCRIPTOR_SET_NVX\0"
+    "VK_OBJECT_ENTRY_TYPE_PIPELINE_NVX\0"
+    "VK_OBJECT_ENTRY_TYPE_INDEX_BUFFER_NVX\0"
+    "VK_OBJECT_ENTRY_TYPE_VERTEX_BUFFER_NVX\0"
+    "VK_OBJECT_ENTRY_TYPE_PUSH_CONSTANT_NVX\0"
+    "VK_DISPLAY_POWER_STATE_OFF_EXT\0"
+    "VK_DISPLAY_POWER_STATE_SUSPEND_EXT\0"
+    "VK_DISPLAY_POWER_STATE_ON_EXT\0"
+    "VK_DEVICE_EVENT_TYPE_DISPLAY_HOTPLUG_EXT\0"
+    "VK_DISPLAY_EVENT_TYPE_FIRST_PIXEL_OUT_EXT\0"
+    "VK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_X_NV\0"
+    "VK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_X_NV\0"
+    "VK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_Y_NV\0"
+    "VK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_Y_NV\0"
+    "VK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_Z_NV\0"
+    "VK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_Z_NV\0"
+    "VK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_W_NV\0"
+    "VK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_W_NV\0"
+    "VK_DISCARD_RECTANGLE_MODE_INCLUSIVE_EXT\0"
+    "VK_DISCARD_RECTANGLE_MODE_EXCLUSIVE_EXT\0"
+    "VK_POINT_CLIPPING_BEHAVIOR_ALL_CLIP_PLANES\0"
+    "VK_POINT_CLIPPING_BEHAVIOR_USER_CLIP_PLANES_ONLY\0"
+    "VK_SAMPLER_REDUCTION_MODE_WEIGHTED_AVERAGE_EXT\0"
+    "VK_SAMPLER_REDUCTION_MODE_MIN_EXT\0"
+    "VK_SAMPLER_REDUCTION_MODE_MAX_EXT\0"
+    "VK_TESSELLATION_DOMAIN_ORIGIN_UPPER_LEFT\0"
+    "VK_TESSELLATION_DOMAIN_ORIGIN_LOWER_LEFT\0"
+    "VK_SAMPLER_YCBCR_MODEL_CONVERSION_RGB_IDENTITY\0"
+    "VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_IDENTITY\0"
+    "VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_709\0"
+    "VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_601\0"
+    "VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_2020\0"
+    "VK_SAMPLER_YCBCR_RANGE_ITU_FULL\0"
+    "VK_SAMPLER_YCBCR_RANGE_ITU_NARROW\0"
+    "VK_CHROMA_LOCATION_COSITED_EVEN\0"
+    "VK_CHROMA_LOCATION_MIDPOINT\0"
+    "VK_BLEND_OVERLAP_UNCORRELATED_EXT\0"
+    "VK_BLEND_OVERLAP_DISJOINT_EXT\0"
+    "VK_BLEND_OVERLAP_CONJOINT_EXT\0"
+    "VK_COVERAGE_MODULATION_MODE_NONE_NV\0"
+    "VK_COVERAGE_MODULATION_MODE_RGB_NV\0"
+    "VK_COVERAGE_MODULATION_MODE_ALPHA_NV\0"
+    "VK_COVERAGE_MODULATION_MODE_RGBA_NV\0"
+    "VK_VALIDATION_CACHE_HEADER_VERSION_ONE_EXT\0"
+    "VK_SHADER_INFO_TYPE_STATISTICS_AMD\0"
+    "VK_SHADER_INFO_TYPE_BINARY_AMD\0"
+    "VK_SHADER_INFO_TYPE_DISASSEMBLY_AMD\0"
+    "VK_QUEUE_GLOBAL_PRIORITY_LOW_EXT\0"
+    "VK_QUEUE_GLOBAL_PRIORITY_MEDIUM_EXT\0"
+    "VK_QUEUE_GLOBAL_PRIORITY_HIGH_EXT\0"
+    "VK_QUEUE_GLOBAL_PRIORITY_REALTIME_EXT\0"
+    "VK_CONSERVATIVE_RASTERIZATION_MODE_DISABLED_EXT\0"
+    "VK_CONSERVATIVE_RASTERIZATION_MODE_OVERESTIMATE_EXT\0"
+    "VK_CONSERVATIVE_RASTERIZATION_MODE_UNDERESTIMATE_EXT\0"
+    "VK_CULL_MODE_NONE\0"
+    "VK_CULL_MODE_FRONT_BIT\0"
+    "VK_CULL_MODE_BACK_BIT\0"
+    "VK_CULL_MODE_FRONT_AND_BACK\0"
+    "VK_QUEUE_GRAPHICS_BIT\0"
+    "VK_QUEUE_COMPUTE_BIT\0"
+    "VK_QUEUE_TRANSFER_BIT\0"
+    "VK_QUEUE_SPARSE_BINDING_BIT\0"
+    "VK_MEMORY_PROPERTY_DEVICE_LOCAL_BIT\0"
+    "VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT\0"
+    "VK_MEMORY_PROPERTY_HOST_COHERENT_BIT\0"
+    "VK_MEMORY_PROPERTY_HOST_CACHED_BIT\0"
+    "VK_MEMORY_PROPERTY_LAZILY_ALLOCATED_BIT\0"
+    "VK_MEMORY_HEAP_DEVICE_LOCAL_BIT\0"
+    "VK_ACCESS_INDIRECT_COMMAND_READ_BIT\0"
+    "VK_ACCESS_INDEX_READ_BIT\0"
+    "VK_ACCESS_VERTEX_ATTRIBUTE_READ_BIT\0"
+    "VK_ACCESS_UNIFORM_READ_BIT\0"
+    "VK_ACCESS_INPUT_ATTACHMENT_READ_BIT\0"
+    "VK_ACCESS_SHADER_READ_BIT\0"
+    "VK_ACCESS_SHADER_WRITE_BIT\0"
+    "VK_ACCESS_COLOR_ATTACHMENT_READ_BIT\0"
+    "VK_ACCESS_COLOR_ATTACHMENT_WRITE_BIT\0"
+    "VK_ACCESS_DEPTH_STENCIL_ATTACHMENT_READ_BIT\0"
+    "VK_ACCESS_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT\0"
+    "VK_ACCESS_TRANSFER_READ_BIT\0"
+    "VK_ACCESS_TRANSFER_WRITE_BIT\0"
+    "VK_ACCESS_HOST_READ_BIT\0"
+    "VK_ACCESS_HOST_WRITE_BIT\0"
+    "VK_ACCESS_MEMORY_READ_BIT\0"
+    "VK_ACCESS_MEMORY_WRITE_BIT\0"
+    "VK_BUFFER_USAGE_TRANSFER_SRC_BIT\0"
+    "VK_BUFFER_USAGE_TRANSFER_DST_BIT\0"
+    "VK_BUFFER_USAGE_UNIFORM_TEXEL_BUFFER_BIT\0"
+    "VK_BUFFER_USAGE_STORAGE_TEXEL_BUFFER_BIT\0"
+    "VK_BUFFER_USAGE_UNIFORM_BUFFER_BIT\0"
+    "VK_BUFFER_USAGE_STORAGE_BUFFER_BIT\0"
+    "VK_BUFFER_USAGE_INDEX_BUFFER_BIT\0"
+    "VK_BUFFER_USAGE_VERTEX_BUFFER_BIT\0"
+    "VK_BUFFER_USAGE_INDIRECT_BUFFER_BIT\0"
+    "VK_BUFFER_CREATE_SPARSE_BINDING_BIT\0"
+    "VK_BUFFER_CREATE_SPARSE_RESIDENCY_BIT\0"
+    "VK_BUFFER_CREATE_SPARSE_ALIASED_BIT\0"
+    "VK_SHADER_STAGE_VERTEX_BIT\0"
+    "VK_SHADER_STAGE_TESSELLATION_CONTROL_BIT\0"
+    "VK_SHADER_STAGE_TESSELLATION_EVALUATION_BIT\0"
+    "VK_SHADER_STAGE_GEOMETRY_BIT\0"
+    "VK_SHADER_STAGE_FRAGMENT_BIT\0"
+    "VK_SHADER_STAGE_COMPUTE_BIT\0"
+    "VK_SHADER_STAGE_ALL_GRAPHICS\0"
+    "VK_SHADER_STAGE_ALL\0"
+    "VK_IMAGE_USAGE_TRANSFER_SRC_BIT\0"
+    "VK_IMAGE_USAGE_TRANSFER_DST_BIT\0"
+    "VK_IMAGE_USAGE_SAMPLED_BIT\0"
+    "VK_IMAGE_USAGE_STORAGE_BIT\0"
+    "VK_IMAGE_USAGE_COLOR_ATTACHMENT_BIT\0"
+    "VK_IMAGE_USAGE_DEPTH_STENCIL_ATTACHMENT_BIT\0"
+    "VK_IMAGE_USAGE_TRANSIENT_ATTACHMENT_BIT\0"
+    "VK_IMAGE_USAGE_INPUT_ATTACHMENT_BIT\0"
+    "VK_IMAGE_CREATE_SPARSE_BINDING_BIT\0"
+    "VK_IMAGE_CREATE_SPARSE_RESIDENCY_BIT\0"
+    "VK_IMAGE_CREATE_SPARSE_ALIASED_BIT\0"
+    "VK_IMAGE_CREATE_MUTABLE_FORMAT_BIT\0"
+    "VK_IMAGE_CREATE_CUBE_COMPATIBLE_BIT\0"
+    "VK_PIPELINE_CREATE_DISABLE_OPTIMIZATION_BIT\0"
+    "VK_PIPELINE_CREATE_ALLOW_DERIVATIVES_BIT\0"
+    "VK_PIPELINE_CREATE_DERIVATIVE_BIT\0"
+    "VK_COLOR_COMPONENT_R_BIT\0"
+    "VK_COLOR_COMPONENT_G_BIT\0"
+    "VK_COLOR_COMPONENT_B_BIT\0"
+    "VK_COLOR_COMPONENT_A_BIT\0"
+    "VK_FENCE_CREATE_SIGNALED_BIT\0"
+    "VK_FORMAT_FEATURE_SAMPLED_IMAGE_BIT\0"
+    "VK_FORMAT_FEATURE_STORAGE_IMAGE_BIT\0"
+    "VK_FORMAT_FEATURE_STORAGE_IMAGE_ATOMIC_BIT\0"
+    "VK_FORMAT_FEATURE_UNIFORM_TEXEL_BUFFER_BIT\0"
+    "VK_FORMAT_FEATURE_STORAGE_TEXEL_BUFFER_BIT\0"
+    "VK_FORMAT_FEATURE_STORAGE_TEXEL_BUFFER_ATOMIC_BIT\0"
+    "VK_FORMAT_FEATURE_VERTEX_BUFFER_BIT\0"
+    "VK_FORMAT_FEATURE_COLOR_ATTACHMENT_BIT\0"
+    "VK_FORMAT_FEATURE_COLOR_ATTACHMENT_BLEND_BIT\0"
+    "VK_FORMAT_FEATURE_DEPTH_STENCIL_ATTACHMENT_BIT\0"
+    "VK_FORMAT_FEATURE_BLIT_SRC_BIT\0"
+    "VK_FORMAT_FEATURE_BLIT_DST_BIT\0"
+    "VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_LINEAR_BIT\0"
+    "VK_QUERY_CONTROL_PRECISE_BIT\0"
+    "VK_QUERY_RESULT_64_BIT\0"
+    "VK_QUERY_RESULT_WAIT_BIT\0"
+    "VK_QUERY_RESULT_WITH_AVAILABILITY_BIT\0"
+    "VK_QUERY_RESULT_PARTIAL_BIT\0"
+    "VK_COMMAND_BUFFER_USAGE_ONE_TIME_SUBMIT_BIT\0"
+    "VK_COMMAND_BUFFER_USAGE_RENDER_PASS_CONTINUE_BIT\0"
+    "VK_COMMAND_BUFFER_USAGE_SIMULTANEOUS_USE_BIT\0"
+    "VK_QUERY_PIPELINE_STATISTIC_INPUT_ASSEMBLY_VERTICES_BIT\0"
+    "VK_QUERY_PIPELINE_STATISTIC_INPUT_ASSEMBLY_PRIMITIVES_BIT\0"
+    "VK_QUERY_PIPELINE_STATISTIC_VERTEX_SHADER_INVOCATIONS_BIT\0"
+    "VK_QUERY_PIPELINE_STATISTIC_GEOMETRY_SHADER_INVOCATIONS_BIT\0"
+    "VK_QUERY_PIPELINE_STATISTIC_GEOMETRY_SHADER_PRIMITIVES_BIT\0"
+    "VK_QUERY_PIPELINE_STATISTIC_CLIPPING_INVOCATIONS_BIT\0"
+    "VK_QUERY_PIPELINE_STATISTIC_CLIPPING_PRIMITIVES_BIT\0"
+    "VK_QUERY_PIPELINE_STATISTIC_FRAGMENT_SHADER_INVOCATIONS_BIT\0"
+    "VK_QUERY_PIPELINE_STATISTIC_TESSELLATION_CONTROL_SHADER_PATCHES_BIT\0"
+    "VK_QUERY_PIPELINE_STATISTIC_TESSELLATION_EVALUATION_SHADER_INVOCATIONS_BIT\0"
+    "VK_QUERY_PIPELINE_STATISTIC_COMPUTE_SHADER_INVOCATIONS_BIT\0"
+    "VK_IMAGE_ASPECT_COLOR_BIT\0"
+    "VK_IMAGE_ASPECT_DEPTH_BIT\0"
+    "VK_IMAGE_ASPECT_STENCIL_BIT\0"
+    "VK_IMAGE_ASPECT_METADATA_BIT\0"
+    "VK_SPARSE_IMAGE_FORMAT_SINGLE_MIPTAIL_BIT\0"
+    "VK_SPARSE_IMAGE_FORMAT_ALIGNED_MIP_SIZE_BIT\0"
+    "VK_SPARSE_IMAGE_FORMAT_NONSTANDARD_BLOCK_SIZE_BIT\0"
+    "VK_SPARSE_MEMORY_BIND_METADATA_BIT\0"
+    "VK_PIPELINE_STAGE_TOP_OF_PIPE_BIT\0"
+    "VK_PIPELINE_STAGE_DRAW_INDIRECT_BIT\0"
+    "VK_PIPELINE_STAGE_VERTEX_INPUT_BIT\0"
+    "VK_PIPELINE_STAGE_VERTEX_SHADER_BIT\0"
+    "VK_PIPELINE_STAGE_TESSELLATION_CONTROL_SHADER_BIT\0"
+    "VK_PIPELINE_STAGE_TESSELLATION_EVALUATION_SHADER_BIT\0"
+    "VK_PIPELINE_STAGE_GEOMETRY_SHADER_BIT\0"
+    "VK_PIPELINE_STAGE_FRAGMENT_SHADER_BIT\0"
+    "VK_PIPELINE_STAGE_EARLY_FRAGMENT_TESTS_BIT\0"
+    "VK_PIPELINE_STAGE_LATE_FRAGMENT_TESTS_BIT\0"
+    "VK_PIPELINE_STAGE_COLOR_ATTACHMENT_OUTPUT_BIT\0"
+    "VK_PIPELINE_STAGE_COMPUTE_SHADER_BIT\0"
+    "VK_PIPELINE_STAGE_TRANSFER_BIT\0"
+    "VK_PIPELINE_STAGE_BOTTOM_OF_PIPE_BIT\0"
+    "VK_PIPELINE_STAGE_HOST_BIT\0"
+    "VK_PIPELINE_STAGE_ALL_GRAPHICS_BIT\0"
+    "VK_PIPELINE_STAGE_ALL_COMMANDS_BIT\0"
+    "VK_COMMAND_POOL_CREATE_TRANSIENT_BIT\0"
+    "VK_COMMAND_POOL_CREATE_RESET_COMMAND_BUFFER_BIT\0"
+    "VK_COMMAND_POOL_RESET_RELEASE_RESOURCES_BIT\0"
+    "VK_COMMAND_BUFFER_RESET_RELEASE_RESOURCES_BIT\0"
+    "VK_SAMPLE_COUNT_1_BIT\0"
+    "VK_SAMPLE_COUNT_2_BIT\0"
+    "VK_SAMPLE_COUNT_4_BIT\0"
+    "VK_SAMPLE_COUNT_8_BIT\0"
+    "VK_SAMPLE_COUNT_16_BIT\0"
+    "VK_SAMPLE_COUNT_32_BIT\0"
+    "VK_SAMPLE_COUNT_64_BIT\0"
+    "VK_ATTACHMENT_DESCRIPTION_MAY_ALIAS_BIT\0"
+    "VK_STENCIL_FACE_FRONT_BIT\0"
+    "VK_STENCIL_FACE_BACK_BIT\0"
+    "VK_STENCIL_FRONT_AND_BACK\0"
+    "VK_DESCRIPTOR_POOL_CREATE_FREE_DESCRIPTOR_SET_BIT\0"
+    "VK_DEPENDENCY_BY_REGION_BIT\0"
+    "VK_DISPLAY_PLANE_ALPHA_OPAQUE_BIT_KHR\0"
+    "VK_DISPLAY_PLANE_ALPHA_GLOBAL_BIT_KHR\0"
+    "VK_DISPLAY_PLANE_ALPHA_PER_PIXEL_BIT_KHR\0"
+    "VK_DISPLAY_PLANE_ALPHA_PER_PIXEL_PREMULTIPLIED_BIT_KHR\0"
+    "VK_COMPOSITE_ALPHA_OPAQUE_BIT_KHR\0"
+    "VK_COMPOSITE_ALPHA_PRE_MULTIPLIED_BIT_KHR\0"
+    "VK_COMPOSITE_ALPHA_POST_MULTIPLIED_BIT_KHR\0"
+    "VK_COMPOSITE_ALPHA_INHERIT_BIT_KHR\0"
+    "VK_SURFACE_TRANSFORM_IDENTITY_BIT_KHR\0"
+    "VK_SURFACE_TRANSFORM_ROTATE_90_BIT_KHR\0"
+    "VK_SURFACE_TRANSFORM_ROTATE_180_BIT_KHR\0"
+    "VK_SURFACE_TRANSFORM_ROTATE_270_BIT_KHR\0"
+    "VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_BIT_KHR\0"
+    "VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_90_BIT_KHR\0"
+    "VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_180_BIT_KHR\0"
+    "VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_270_BIT_KHR\0"
+    "VK_SURFACE_TRANSFORM_INHERIT_BIT_KHR\0"
+    "VK_DEBUG_REPORT_INFORMATION_BIT_EXT\0"
+    "VK_DEBUG_REPORT_WARNING_BIT_EXT\0"
+    "VK_DEBUG_REPORT_PERFORMANCE_WARNING_BIT_EXT\0"
+    "VK_DEBUG_REPORT_ERROR_BIT_EXT\0"
+    "VK_DEBUG_REPORT_DEBUG_BIT_EXT\0"
+    "VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_BIT_NV\0"
+    "VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT_NV\0"
+    "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_IMAGE_BIT_NV\0"
+    "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_IMAGE_KMT_BIT_NV\0"
+    "VK_EXTERNAL_MEMORY_FEATURE_DEDICATED_ONLY_BIT_NV\0"
+    "VK_EXTERNAL_MEMORY_FEATURE_EXPORTABLE_BIT_NV\0"
+    "VK_EXTERNAL_MEMORY_FEATURE_IMPORTABLE_BIT_NV\0"
+    "VK_SUBGROUP_FEATURE_BASIC_BIT\0"
+    "VK_SUBGROUP_FEATURE_VOTE_BIT\0"
+    "VK_SUBGROUP_FEATURE_ARITHMETIC_BIT\0"
+    "VK_SUBGROUP_FEATURE_BALLOT_BIT\0"
+    "VK_SUBGROUP_FEATURE_SHUFFLE_BIT\0"
+    "VK_SUBGROUP_FEATURE_SHUFFLE_RELATIVE_BIT\0"
+    "VK_SUBGROUP_FEATURE_CLUSTERED_BIT\0"
+    "VK_SUBGROUP_FEATURE_QUAD_BIT\0"
+    "VK_INDIRECT_COMMANDS_LAYOUT_USAGE_UNORDERED_SEQUENCES_BIT_NVX\0"
+    "VK_INDIRECT_COMMANDS_LAYOUT_USAGE_SPARSE_SEQUENCES_BIT_NVX\0"
+    "VK_INDIRECT_COMMANDS_LAYOUT_USAGE_EMPTY_EXECUTIONS_BIT_NVX\0"
+    "VK_INDIRECT_COMMANDS_LAYOUT_USAGE_INDEXED_SEQUENCES_BIT_NVX\0"
+    "VK_OBJECT_ENTRY_USAGE_GRAPHICS_BIT_NVX\0"
+    "VK_OBJECT_ENTRY_USAGE_COMPUTE_BIT_NVX\0"
+    "VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_FD_BIT\0"
+    "VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_BIT\0"
+    "VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT\0"
+    "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_TEXTURE_BIT\0"
+    "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_TEXTURE_KMT_BIT\0"
+    "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D12_HEAP_BIT\0"
+    "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D12_RESOURCE_BIT\0"
+    "VK_EXTERNAL_MEMORY_FEATURE_DEDICATED_ONLY_BIT\0"
+    "VK_EXTERNAL_MEMORY_FEATURE_EXPORTABLE_BIT\0"
+    "VK_EXTERNAL_MEMORY_FEATURE_IMPORTABLE_BIT\0"
+    "VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_FD_BIT\0"
+    "VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_WIN32_BIT\0"
+    "VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT\0"
+    "VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_D3D12_FENCE_BIT\0"
+    "VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_SYNC_FD_BIT\0"
+    "VK_EXTERNAL_SEMAPHORE_FEATURE_EXPORTABLE_BIT\0"
+    "VK_EXTERNAL_SEMAPHORE_FEATURE_IMPORTABLE_BIT\0"
+    "VK_SEMAPHORE_IMPORT_TEMPORARY_BIT\0"
+    "VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_FD_BIT\0"
+    "VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_WIN32_BIT\0"
+    "VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT\0"
+    "VK_EXTERNAL_FENCE_HANDLE_TYPE_SYNC_FD_BIT\0"
+    "VK_EXTERNAL_FENCE_FEATURE_EXPORTABLE_BIT\0"
+    "VK_EXTERNAL_FENCE_FEATURE_IMPORTABLE_BIT\0"
+    "VK_FENCE_IMPORT_TEMPORARY_BIT\0"
+    "VK_SURFACE_COUNTER_VBLANK_EXT\0"
+    "VK_PEER_MEMORY_FEATURE_COPY_SRC_BIT\0"
+    "VK_PEER_MEMORY_FEATURE_COPY_DST_BIT\0"
+    "VK_PEER_MEMORY_FEATURE_GENERIC_SRC_BIT\0"
+    "VK_PEER_MEMORY_FEATURE_GENERIC_DST_BIT\0"
+    "VK_MEMORY_ALLOCATE_DEVICE_MASK_BIT\0"
+    "VK_DEVICE_GROUP_PRESENT_MODE_LOCAL_BIT_KHR\0"
+    "VK_DEVICE_GROUP_PRESENT_MODE_REMOTE_BIT_KHR\0"
+    "VK_DEVICE_GROUP_PRESENT_MODE_SUM_BIT_KHR\0"
+    "VK_DEVICE_GROUP_PRESENT_MODE_LOCAL_MULTI_DEVICE_BIT_KHR\0"
+    "VK_DEBUG_UTILS_MESSAGE_SEVERITY_VERBOSE_BIT_EXT\0"
+    "VK_DEBUG_UTILS_MESSAGE_SEVERITY_INFO_BIT_EXT\0"
+    "VK_DEBUG_UTILS_MESSAGE_SEVERITY_WARNING_BIT_EXT\0"
+    "VK_DEBUG_UTILS_MESSAGE_SEVERITY_ERROR_BIT_EXT\0"
+    "VK_DEBUG_UTILS_MESSAGE_TYPE_GENERAL_BIT_EXT\0"
+    "VK_DEBUG_UTILS_MESSAGE_TYPE_VALIDATION_BIT_EXT\0"
+    "VK_DEBUG_UTILS_MESSAGE_TYPE_PERFORMANCE_BIT_EXT\0"
+    "VK_DESCRIPTOR_BINDING_UPDATE_AFTER_BIND_BIT_EXT\0"
+    "VK_DESCRIPTOR_BINDING_UPDATE_UNUSED_WHILE_PENDING_BIT_EXT\0"
+    "VK_DESCRIPTOR_BINDING_PARTIALLY_BOUND_BIT_EXT\0"
+    "VK_DESCRIPTOR_BINDING_VARIABLE_DESCRIPTOR_COUNT_BIT_EXT\0";
+
+struct EnumEntry {
+    uint32_t value;
+    uint32_t name; // offset in sEnumNames
+};
+
+// The enumerants of a type, sorted by value, and their indices sorted by name.
+struct EnumTable {
+    const EnumEntry* entries;
+    const uint16_t* names;
+    uint32_t count;
+};
+
+// Compares a null-terminated name with a name of the given length.
+int compareName(const char* name, const char* other, size_t length) {
+    int result = strncmp(name, other, length);
+    return result ? result : (unsigned char) name[length];
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkAttachmentLoadOp& value) {
-    switch (value) {
-        case VK_ATTACHMENT_LOAD_OP_LOAD: out << "VK_ATTACHMENT_LOAD_OP_LOAD"; break;
-        case VK_ATTACHMENT_LOAD_OP_CLEAR: out << "VK_ATTACHMENT_LOAD_OP_CLEAR"; break;
-        case VK_ATTACHMENT_LOAD_OP_DONT_CARE: out << "VK_ATTACHMENT_LOAD_OP_DONT_CARE"; break;
-        default: out << "UNKNOWN"; break;
+
+const EnumEntry* findName(const EnumTable& table, const char* name, size_t length) {
+    const uint16_t* end = table.names + table.count;
+    const uint16_t* index = std::lower_bound(table.names, end, name,
+            [&](uint16_t index, const char* name) {
+                return compareName(sEnumNames + table.entries[index].name, name, length) < 0;
+            });
+    if (index == end || compareName(sEnumNames + table.entries[*index].name, name, length)) {
+        return nullptr;
     }
-    return out;
+    return table.entries + *index;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkAttachmentStoreOp& value) {
-    switch (value) {
-        case VK_ATTACHMENT_STORE_OP_STORE: out << "VK_ATTACHMENT_STORE_OP_STORE"; break;
-        case VK_ATTACHMENT_STORE_OP_DONT_CARE: out << "VK_ATTACHMENT_STORE_OP_DONT_CARE"; break;
-        default: out << "UNKNOWN"; break;
-    }
-    return out;
+
+#if !defined(NDEBUG)
+const EnumEntry* findValue(const EnumTable& table, uint32_t value) {
+    const EnumEntry* end = table.entries + table.count;
+    const EnumEntry* entry = std::lower_bound(table.entries, end, value,
+            [](const EnumEntry& entry, uint32_t value) { return entry.value < value; });
+    return entry != end && entry->value == value ? entry : nullptr;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkImageType& value) {
-    switch (value) {
-        case VK_IMAGE_TYPE_1D: out << "VK_IMAGE_TYPE_1D"; break;
-        case VK_IMAGE_TYPE_2D: out << "VK_IMAGE_TYPE_2D"; break;
-        case VK_IMAGE_TYPE_3D: out << "VK_IMAGE_TYPE_3D"; break;
-        default: out << "UNKNOWN"; break;
-    }
-    return out;
+
+void printEnum(utils::io::ostream& out, const EnumTable& table, uint32_t value) {
+    const EnumEntry* entry = findValue(table, value);
+    out << (entry ? sEnumNames + entry->name : "UNKNOWN");
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkImageTiling& value) {
-    switch (value) {
-        case VK_IMAGE_TILING_OPTIMAL: out << "VK_IMAGE_TILING_OPTIMAL"; break;
-        case VK_IMAGE_TILING_LINEAR: out << "VK_IMAGE_TILING_LINEAR"; break;
-        default: out << "UNKNOWN"; break;
+
+// Prints the names of the bits of the flags, separated by " | ", unless the flags have a name.
+void printFlags(utils::io::ostream& out, const EnumTable& table, uint32_t value) {
+    const EnumEntry* entry = findValue(table, value);
+    if (entry || !value) {
+        out << (entry ? sEnumNames + entry->name : "0");
+        return;
     }
-    return out;
-}
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkImageViewType& value) {
-    switch (value) {
-        case VK_IMAGE_VIEW_TYPE_1D: out << "VK_IMAGE_VIEW_TYPE_1D"; break;
-        case VK_IMAGE_VIEW_TYPE_2D: out << "VK_IMAGE_VIEW_TYPE_2D"; break;
-        case VK_IMAGE_VIEW_TYPE_3D: out << "VK_IMAGE_VIEW_TYPE_3D"; break;
-        case VK_IMAGE_VIEW_TYPE_CUBE: out << "VK_IMAGE_VIEW_TYPE_CUBE"; break;
-        case VK_IMAGE_VIEW_TYPE_1D_ARRAY: out << "VK_IMAGE_VIEW_TYPE_1D_ARRAY"; break;
-        case VK_IMAGE_VIEW_TYPE_2D_ARRAY: out << "VK_IMAGE_VIEW_TYPE_2D_ARRAY"; break;
-        case VK_IMAGE_VIEW_TYPE_CUBE_ARRAY: out << "VK_IMAGE_VIEW_TYPE_CUBE_ARRAY"; break;
-        default: out << "UNKNOWN"; break;
+    const char* separator = "";
+    for (uint32_t bits = value; bits; bits &= bits - 1) {
+        const uint32_t bit = bits & (~bits + 1);
+        out << separator;
+        entry = findValue(table, bit);
+        if (entry) {
+            out << sEnumNames + entry->name;
+        } else {
+            out << "0x" << utils::io::hex << bit << utils::io::dec;
+        }
+        separator = " | ";
     }
-    return out;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkCommandBufferLevel& value) {
-    switch (value) {
-        case VK_COMMAND_BUFFER_LEVEL_PRIMARY: out << "VK_COMMAND_BUFFER_LEVEL_PRIMARY"; break;
-        case VK_COMMAND_BUFFER_LEVEL_SECONDARY: out << "VK_COMMAND_BUFFER_LEVEL_SECONDARY"; break;
-        default: out << "UNKNOWN"; break;
+#endif
+
+bool parseValue(const EnumTable& table, const char* name, uint32_t* value) {
+    const EnumEntry* entry = findName(table, name, strlen(name));
+    if (entry) {
+        *value = entry->value;
     }
-    return out;
+    return entry != nullptr;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkComponentSwizzle& value) {
-    switch (value) {
-        case VK_COMPONENT_SWIZZLE_IDENTITY: out << "VK_COMPONENT_SWIZZLE_IDENTITY"; break;
-        case VK_COMPONENT_SWIZZLE_ZERO: out << "VK_COMPONENT_SWIZZLE_ZERO"; break;
-        case VK_COMPONENT_SWIZZLE_ONE: out << "VK_COMPONENT_SWIZZLE_ONE"; break;
-        case VK_COMPONENT_SWIZZLE_R: out << "VK_COMPONENT_SWIZZLE_R"; break;
-        case VK_COMPONENT_SWIZZLE_G: out << "VK_COMPONENT_SWIZZLE_G"; break;
-        case VK_COMPONENT_SWIZZLE_B: out << "VK_COMPONENT_SWIZZLE_B"; break;
-        case VK_COMPONENT_SWIZZLE_A: out << "VK_COMPONENT_SWIZZLE_A"; break;
-        default: out << "UNKNOWN"; break;
+
+// Parses names or numbers separated by '|', as printed by printFlags.
+bool parseFlags(const EnumTable& table, const char* name, uint32_t* value) {
+    uint32_t result = 0;
+    for (const char* token = name; ; ++token) {
+        token += strspn(token, " ");
+        size_t length = strcspn(token, "|");
+        while (length && token[length - 1] == ' ') {
+            --length;
+        }
+        const EnumEntry* entry = findName(table, token, length);
+        if (entry) {
+            result |= entry->value;
+        } else {
+            char* end;
+            const unsigned long bits = length ? strtoul(token, &end, 0) : 0;
+            if (!length || end != token + length) {
+                return false;
+            }
+            result |= (uint32_t) bits;
+        }
+        token += strcspn(token, "|");
+        if (!*token) {
+            break;
+        }
     }
-    return out;
+    *value = result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkDescriptorType& value) {
-    switch (value) {
-        case VK_DESCRIPTOR_TYPE_SAMPLER: out << "VK_DESCRIPTOR_TYPE_SAMPLER"; break;
-        case VK_DESCRIPTOR_TYPE_COMBINED_IMAGE_SAMPLER: out << "VK_DESCRIPTOR_TYPE_COMBINED_IMAGE_SAMPLER"; break;
-        case VK_DESCRIPTOR_TYPE_SAMPLED_IMAGE: out << "VK_DESCRIPTOR_TYPE_SAMPLED_IMAGE"; break;
-        case VK_DESCRIPTOR_TYPE_STORAGE_IMAGE: out << "VK_DESCRIPTOR_TYPE_STORAGE_IMAGE"; break;
-        case VK_DESCRIPTOR_TYPE_UNIFORM_TEXEL_BUFFER: out << "VK_DESCRIPTOR_TYPE_UNIFORM_TEXEL_BUFFER"; break;
-        case VK_DESCRIPTOR_TYPE_STORAGE_TEXEL_BUFFER: out << "VK_DESCRIPTOR_TYPE_STORAGE_TEXEL_BUFFER"; break;
-        case VK_DESCRIPTOR_TYPE_UNIFORM_BUFFER: out << "VK_DESCRIPTOR_TYPE_UNIFORM_BUFFER"; break;
-        case VK_DESCRIPTOR_TYPE_STORAGE_BUFFER: out << "VK_DESCRIPTOR_TYPE_STORAGE_BUFFER"; break;
-        case VK_DESCRIPTOR_TYPE_UNIFORM_BUFFER_DYNAMIC: out << "VK_DESCRIPTOR_TYPE_UNIFORM_BUFFER_DYNAMIC"; break;
-        case VK_DESCRIPTOR_TYPE_STORAGE_BUFFER_DYNAMIC: out << "VK_DESCRIPTOR_TYPE_STORAGE_BUFFER_DYNAMIC"; break;
-        case VK_DESCRIPTOR_TYPE_INPUT_ATTACHMENT: out << "VK_DESCRIPTOR_TYPE_INPUT_ATTACHMENT"; break;
-        default: out << "UNKNOWN"; break;
+
+const EnumEntry sVkImageLayoutEntries[] = {
+    { 0x00000000, 0 },
+    { 0x00000001, 26 },
+    { 0x00000002, 50 },
+    { 0x00000003, 91 },
+    { 0x00000004, 140 },
+    { 0x00000005, 188 },
+    { 0x00000006, 229 },
+    { 0x00000007, 266 },
+    { 0x00000008, 303 },
+};
+const uint16_t sVkImageLayoutNames[] = { 2, 3, 4, 1, 8, 5, 7, 6, 0 };
+const EnumTable sVkImageLayout = { sVkImageLayoutEntries, sVkImageLayoutNames, 9 };
+const EnumEntry sVkAttachmentLoadOpEntries[] = {
+    { 0x00000000, 334 },
+    { 0x00000001, 361 },
+    { 0x00000002, 389 },
+};
+const uint16_t sVkAttachmentLoadOpNames[] = { 1, 2, 0 };
+const EnumTable sVkAttachmentLoadOp = { sVkAttachmentLoadOpEntries, sVkAttachmentLoadOpNames, 3 };
+const EnumEntry sVkAttachmentStoreOpEntries[] = {
+    { 0x00000000, 421 },
+    { 0x00000001, 450 },
+};
+const uint16_t sVkAttachmentStoreOpNames[] = { 1, 0 };
+const EnumTable sVkAttachmentStoreOp = { sVkAttachmentStoreOpEntries, sVkAttachmentStoreOpNames, 2 };
+const EnumEntry sVkImageTypeEntries[] = {
+    { 0x00000000, 483 },
+    { 0x00000001, 500 },
+    { 0x00000002, 517 },
+};
+const uint16_t sVkImageTypeNames[] = { 0, 1, 2 };
+const EnumTable sVkImageType = { sVkImageTypeEntries, sVkImageTypeNames, 3 };
+const EnumEntry sVkImageTilingEntries[] = {
+    { 0x00000000, 534 },
+    { 0x00000001, 558 },
+};
+const uint16_t sVkImageTilingNames[] = { 1, 0 };
+const EnumTable sVkImageTiling = { sVkImageTilingEntries, sVkImageTilingNames, 2 };
+const EnumEntry sVkImageViewTypeEntries[] = {
+    { 0x00000000, 581 },
+    { 0x00000001, 603 },
+    { 0x00000002, 625 },
+    { 0x00000003, 647 },
+    { 0x00000004, 671 },
+    { 0x00000005, 699 },
+    { 0x00000006, 727 },
+};
+const uint16_t sVkImageViewTypeNames[] = { 0, 4, 1, 5, 2, 3, 6 };
+const EnumTable sVkImageViewType = { sVkImageViewTypeEntries, sVkImageViewTypeNames, 7 };
+const EnumEntry sVkCommandBufferLevelEntries[] = {
+    { 0x00000000, 757 },
+    { 0x00000001, 789 },
+};
+const uint16_t sVkCommandBufferLevelNames[] = { 0, 1 };
+const EnumTable sVkCommandBufferLevel = { sVkCommandBufferLevelEntries, sVkCommandBufferLevelNames, 2 };
+const EnumEntry sVkComponentSwizzleEntries[] = {
+    { 0x00000000, 823 },
+    { 0x00000001, 853 },
+    { 0x00000002, 879 },
+    { 0x00000003, 904 },
+    { 0x00000004, 927 },
+    { 0x00000005, 950 },
+    { 0x00000006, 973 },
+};
+const uint16_t sVkComponentSwizzleNames[] = { 6, 5, 4, 0, 2, 3, 1 };
+const EnumTable sVkComponentSwizzle = { sVkComponentSwizzleEntries, sVkComponentSwizzleNames, 7 };
+const EnumEntry sVkDescriptorTypeEntries[] = {
+    { 0x00000000, 996 },
+    { 0x00000001, 1023 },
+    { 0x00000002, 1065 },
+    { 0x00000003, 1098 },
+    { 0x00000004, 1131 },
+    { 0x00000005, 1171 },
+    { 0x00000006, 1211 },
+    { 0x00000007, 1245 },
+    { 0x00000008, 1279 },
+    { 0x00000009, 1321 },
+    { 0x0000000a, 1363 },
+};
+const uint16_t sVkDescriptorTypeNames[] = { 1, 10, 2, 0, 7, 9, 3, 5, 6, 8, 4 };
+const EnumTable sVkDescriptorType = { sVkDescriptorTypeEntries, sVkDescriptorTypeNames, 11 };
+const EnumEntry sVkQueryTypeEntries[] = {
+    { 0x00000000, 1399 },
+    { 0x00000001, 1423 },
+    { 0x00000002, 1457 },
+};
+const uint16_t sVkQueryTypeNames[] = { 0, 1, 2 };
+const EnumTable sVkQueryType = { sVkQueryTypeEntries, sVkQueryTypeNames, 3 };
+const EnumEntry sVkBorderColorEntries[] = {
+    { 0x00000000, 1481 },
+    { 0x00000001, 1521 },
+    { 0x00000002, 1559 },
+    { 0x00000003, 1594 },
+    { 0x00000004, 1627 },
+    { 0x00000005, 1662 },
+};
+const uint16_t sVkBorderColorNames[] = { 2, 4, 0, 3, 5, 1 };
+const EnumTable sVkBorderColor = { sVkBorderColorEntries, sVkBorderColorNames, 6 };
+const EnumEntry sVkPipelineBindPointEntries[] = {
+    { 0x00000000, 1695 },
+    { 0x00000001, 1727 },
+};
+const uint16_t sVkPipelineBindPointNames[] = { 1, 0 };
+const EnumTable sVkPipelineBindPoint = { sVkPipelineBindPointEntries, sVkPipelineBindPointNames, 2 };
+const EnumEntry sVkPipelineCacheHeaderVersionEntries[] = {
+    { 0x00000001, 1758 },
+};
+const uint16_t sVkPipelineCacheHeaderVersionNames[] = { 0 };
+const EnumTable sVkPipelineCacheHeaderVersion = { sVkPipelineCacheHeaderVersionEntries, sVkPipelineCacheHeaderVersionNames, 1 };
+const EnumEntry sVkPrimitiveTopologyEntries[] = {
+    { 0x00000000, 1795 },
+    { 0x00000001, 1828 },
+    { 0x00000002, 1860 },
+    { 0x00000003, 1893 },
+    { 0x00000004, 1929 },
+    { 0x00000005, 1966 },
+    { 0x00000006, 2001 },
+    { 0x00000007, 2048 },
+    { 0x00000008, 2096 },
+    { 0x00000009, 2147 },
+    { 0x0000000a, 2199 },
+};
+const uint16_t sVkPrimitiveTopologyNames[] = { 1, 6, 2, 7, 10, 0, 5, 3, 8, 4, 9 };
+const EnumTable sVkPrimitiveTopology = { sVkPrimitiveTopologyEntries, sVkPrimitiveTopologyNames, 11 };
+const EnumEntry sVkSharingModeEntries[] = {
+    { 0x00000000, 2232 },
+    { 0x00000001, 2258 },
+};
+const uint16_t sVkSharingModeNames[] = { 1, 0 };
+const EnumTable sVkSharingMode = { sVkSharingModeEntries, sVkSharingModeNames, 2 };
+const EnumEntry sVkIndexTypeEntries[] = {
+    { 0x00000000, 2285 },
+    { 0x00000001, 2306 },
+};
+const uint16_t sVkIndexTypeNames[] = { 0, 1 };
+const EnumTable sVkIndexType = { sVkIndexTypeEntries, sVkIndexTypeNames, 2 };
+const EnumEntry sVkFilterEntries[] = {
+    { 0x00000000, 2327 },
+    { 0x00000001, 2345 },
+};
+const uint16_t sVkFilterNames[] = { 1, 0 };
+const EnumTable sVkFilter = { sVkFilterEntries, sVkFilterNames, 2 };
+const EnumEntry sVkSamplerMipmapModeEntries[] = {
+    { 0x00000000, 2362 },
+    { 0x00000001, 2393 },
+};
+const uint16_t sVkSamplerMipmapModeNames[] = { 1, 0 };
+const EnumTable sVkSamplerMipmapMode = { sVkSamplerMipmapModeEntries, sVkSamplerMipmapModeNames, 2 };
+const EnumEntry sVkSamplerAddressModeEntries[] = {
+    { 0x00000000, 2423 },
+    { 0x00000001, 2454 },
+    { 0x00000002, 2494 },
+    { 0x00000003, 2532 },
+};
+const uint16_t sVkSamplerAddressModeNames[] = { 3, 2, 1, 0 };
+const EnumTable sVkSamplerAddressMode = { sVkSamplerAddressModeEntries, sVkSamplerAddressModeNames, 4 };
+const EnumEntry sVkCompareOpEntries[] = {
+    { 0x00000000, 2572 },
+    { 0x00000001, 2592 },
+    { 0x00000002, 2611 },
+    { 0x00000003, 2631 },
+    { 0x00000004, 2659 },
+    { 0x00000005, 2681 },
+    { 0x00000006, 2705 },
+    { 0x00000007, 2736 },
+};
+const uint16_t sVkCompareOpNames[] = { 7, 2, 4, 6, 1, 3, 0, 5 };
+const EnumTable sVkCompareOp = { sVkCompareOpEntries, sVkCompareOpNames, 8 };
+const EnumEntry sVkPolygonModeEntries[] = {
+    { 0x00000000, 2757 },
+    { 0x00000001, 2778 },
+    { 0x00000002, 2799 },
+};
+const uint16_t sVkPolygonModeNames[] = { 0, 1, 2 };
+const EnumTable sVkPolygonMode = { sVkPolygonModeEntries, sVkPolygonModeNames, 3 };
+const EnumEntry sVkFrontFaceEntries[] = {
+    { 0x00000000, 2821 },
+    { 0x00000001, 2853 },
+};
+const uint16_t sVkFrontFaceNames[] = { 1, 0 };
+const EnumTable sVkFrontFace = { sVkFrontFaceEntries, sVkFrontFaceNames, 2 };
+const EnumEntry sVkBlendFactorEntries[] = {
+    { 0x00000000, 2877 },
+    { 0x00000001, 2898 },
+    { 0x00000002, 2918 },
+    { 0x00000003, 2944 },
+    { 0x00000004, 2980 },
+    { 0x00000005, 3006 },
+    { 0x00000006, 3042 },
+    { 0x00000007, 3068 },
+    { 0x00000008, 3104 },
+    { 0x00000009, 3130 },
+    { 0x0000000a, 3166 },
+    { 0x0000000b, 3197 },
+    { 0x0000000c, 3238 },
+    { 0x0000000d, 3269 },
+    { 0x0000000e, 3310 },
+    { 0x0000000f, 3345 },
+    { 0x00000010, 3372 },
+    { 0x00000011, 3409 },
+    { 0x00000012, 3436 },
+};
+const uint16_t sVkBlendFactorNames[] = { 12, 10, 8, 4, 1, 13, 11, 9, 5, 18, 16, 7, 3, 17, 15, 6, 14, 2, 0 };
+const EnumTable sVkBlendFactor = { sVkBlendFactorEntries, sVkBlendFactorNames, 19 };
+const EnumEntry sVkBlendOpEntries[] = {
+    { 0x00000000, 3473 },
+    { 0x00000001, 3489 },
+    { 0x00000002, 3510 },
+    { 0x00000003, 3539 },
+    { 0x00000004, 3555 },
+};
+const uint16_t sVkBlendOpNames[] = { 0, 4, 3, 2, 1 };
+const EnumTable sVkBlendOp = { sVkBlendOpEntries, sVkBlendOpNames, 5 };
+const EnumEntry sVkStencilOpEntries[] = {
+    { 0x00000000, 3571 },
+    { 0x00000001, 3590 },
+    { 0x00000002, 3609 },
+    { 0x00000003, 3631 },
+    { 0x00000004, 3665 },
+    { 0x00000005, 3699 },
+    { 0x00000006, 3720 },
+    { 0x00000007, 3753 },
+};
+const uint16_t sVkStencilOpNames[] = { 4, 7, 3, 6, 5, 0, 2, 1 };
+const EnumTable sVkStencilOp = { sVkStencilOpEntries, sVkStencilOpNames, 8 };
+const EnumEntry sVkLogicOpEntries[] = {
+    { 0x00000000, 3786 },
+    { 0x00000001, 3804 },
+    { 0x00000002, 3820 },
+    { 0x00000003, 3844 },
+    { 0x00000004, 3861 },
+    { 0x00000005, 3886 },
+    { 0x00000006, 3904 },
+    { 0x00000007, 3920 },
+    { 0x00000008, 3935 },
+    { 0x00000009, 3951 },
+    { 0x0000000a, 3974 },
+    { 0x0000000b, 3993 },
+    { 0x0000000c, 4016 },
+    { 0x0000000d, 4042 },
+    { 0x0000000e, 4066 },
+    { 0x0000000f, 4083 },
+};
+const uint16_t sVkLogicOpNames[] = { 1, 4, 2, 0, 3, 12, 9, 10, 14, 8, 5, 7, 13, 11, 15, 6 };
+const EnumTable sVkLogicOp = { sVkLogicOpEntries, sVkLogicOpNames, 16 };
+const EnumEntry sVkInternalAllocationTypeEntries[] = {
+    { 0x00000000, 4099 },
+};
+const uint16_t sVkInternalAllocationTypeNames[] = { 0 };
+const EnumTable sVkInternalAllocationType = { sVkInternalAllocationTypeEntries, sVkInternalAllocationTypeNames, 1 };
+const EnumEntry sVkSystemAllocationScopeEntries[] = {
+    { 0x00000000, 4138 },
+    { 0x00000001, 4173 },
+    { 0x00000002, 4207 },
+    { 0x00000003, 4240 },
+    { 0x00000004, 4274 },
+};
+const uint16_t sVkSystemAllocationScopeNames[] = { 2, 0, 3, 4, 1 };
+const EnumTable sVkSystemAllocationScope = { sVkSystemAllocationScopeEntries, sVkSystemAllocationScopeNames, 5 };
+const EnumEntry sVkPhysicalDeviceTypeEntries[] = {
+    { 0x00000000, 4310 },
+    { 0x00000001, 4340 },
+    { 0x00000002, 4379 },
+    { 0x00000003, 4416 },
+    { 0x00000004, 4452 },
+};
+const uint16_t sVkPhysicalDeviceTypeNames[] = { 4, 2, 1, 0, 3 };
+const EnumTable sVkPhysicalDeviceType = { sVkPhysicalDeviceTypeEntries, sVkPhysicalDeviceTypeNames, 5 };
+const EnumEntry sVkVertexInputRateEntries[] = {
+    { 0x00000000, 4480 },
+    { 0x00000001, 4508 },
+};
+const uint16_t sVkVertexInputRateNames[] = { 1, 0 };
+const EnumTable sVkVertexInputRate = { sVkVertexInputRateEntries, sVkVertexInputRateNames, 2 };
+const EnumEntry sVkFormatEntries[] = {
+    { 0x00000000, 4538 },
+    { 0x00000001, 4558 },
+    { 0x00000002, 4585 },
+    { 0x00000003, 4617 },
+    { 0x00000004, 4649 },
+    { 0x00000005, 4679 },
+    { 0x00000006, 4709 },
+    { 0x00000007, 4741 },
+    { 0x00000008, 4773 },
+    { 0x00000009, 4805 },
+    { 0x0000000a, 4824 },
+    { 0x0000000b, 4843 },
+    { 0x0000000c, 4864 },
+    { 0x0000000d, 4885 },
+    { 0x0000000e, 4903 },
+    { 0x0000000f, 4921 },
+    { 0x00000010, 4939 },
+    { 0x00000011, 4960 },
+    { 0x00000012, 4981 },
+    { 0x00000013, 5004 },
+    { 0x00000014, 5027 },
+    { 0x00000015, 5047 },
+    { 0x00000016, 5067 },
+    { 0x00000017, 5087 },
+    { 0x00000018, 5110 },
+    { 0x00000019, 5133 },
+    { 0x0000001a, 5158 },
+    { 0x0000001b, 5183 },
+    { 0x0000001c, 5205 },
+    { 0x0000001d, 5227 },
+    { 0x0000001e, 5249 },
+    { 0x0000001f, 5272 },
+    { 0x00000020, 5295 },
+    { 0x00000021, 5320 },
+    { 0x00000022, 5345 },
+    { 0x00000023, 5367 },
+    { 0x00000024, 5389 },
+    { 0x00000025, 5411 },
+    { 0x00000026, 5436 },
+    { 0x00000027, 5461 },
+    { 0x00000028, 5488 },
+    { 0x00000029, 5515 },
+    { 0x0000002a, 5539 },
+    { 0x0000002b, 5563 },
+    { 0x0000002c, 5587 },
+    { 0x0000002d, 5612 },
+    { 0x0000002e, 5637 },
+    { 0x0000002f, 5664 },
+    { 0x00000030, 5691 },
+    { 0x00000031, 5715 },
+    { 0x00000032, 5739 },
+    { 0x00000033, 5763 },
+    { 0x00000034, 5795 },
+    { 0x00000035, 5827 },
+    { 0x00000036, 5861 },
+    { 0x00000037, 5895 },
+    { 0x00000038, 5926 },
+    { 0x00000039, 5957 },
+    { 0x0000003a, 5988 },
+    { 0x0000003b, 6023 },
+    { 0x0000003c, 6058 },
+    { 0x0000003d, 6095 },
+    { 0x0000003e, 6132 },
+    { 0x0000003f, 6166 },
+    { 0x00000040, 6200 },
+    { 0x00000041, 6235 },
+    { 0x00000042, 6270 },
+    { 0x00000043, 6307 },
+    { 0x00000044, 6344 },
+    { 0x00000045, 6378 },
+    { 0x00000046, 6412 },
+    { 0x00000047, 6432 },
+    { 0x00000048, 6452 },
+    { 0x00000049, 6474 },
+    { 0x0000004a, 6496 },
+    { 0x0000004b, 6515 },
+    { 0x0000004c, 6534 },
+    { 0x0000004d, 6555 },
+    { 0x0000004e, 6578 },
+    { 0x0000004f, 6601 },
+    { 0x00000050, 6626 },
+    { 0x00000051, 6651 },
+    { 0x00000052, 6673 },
+    { 0x00000053, 6695 },
+    { 0x00000054, 6719 },
+    { 0x00000055, 6745 },
+    { 0x00000056, 6771 },
+    { 0x00000057, 6799 },
+    { 0x00000058, 6827 },
+    { 0x00000059, 6852 },
+    { 0x0000005a, 6877 },
+    { 0x0000005b, 6904 },
+    { 0x0000005c, 6933 },
+    { 0x0000005d, 6962 },
+    { 0x0000005e, 6993 },
+    { 0x0000005f, 7024 },
+    { 0x00000060, 7052 },
+    { 0x00000061, 7080 },
+    { 0x00000062, 7110 },
+    { 0x00000063, 7129 },
+    { 0x00000064, 7148 },
+    { 0x00000065, 7169 },
+    { 0x00000066, 7191 },
+    { 0x00000067, 7213 },
+    { 0x00000068, 7237 },
+    { 0x00000069, 7262 },
+    { 0x0000006a, 7287 },
+    { 0x0000006b, 7314 },
+    { 0x0000006c, 7342 },
+    { 0x0000006d, 7370 },
+    { 0x0000006e, 7400 },
+    { 0x0000006f, 7419 },
+    { 0x00000070, 7438 },
+    { 0x00000071, 7459 },
+    { 0x00000072, 7481 },
+    { 0x00000073, 7503 },
+    { 0x00000074, 7527 },
+    { 0x00000075, 7552 },
+    { 0x00000076, 7577 },
+    { 0x00000077, 7604 },
+    { 0x00000078, 7632 },
+    { 0x00000079, 7660 },
+    { 0x0000007a, 7690 },
+    { 0x0000007b, 7724 },
+    { 0x0000007c, 7757 },
+    { 0x0000007d, 7777 },
+    { 0x0000007e, 7807 },
+    { 0x0000007f, 7828 },
+    { 0x00000080, 7846 },
+    { 0x00000081, 7874 },
+    { 0x00000082, 7902 },
+    { 0x00000083, 7931 },
+    { 0x00000084, 7961 },
+    { 0x00000085, 7990 },
+    { 0x00000086, 8021 },
+    { 0x00000087, 8051 },
+    { 0x00000088, 8077 },
+    { 0x00000089, 8102 },
+    { 0x0000008a, 8128 },
+    { 0x0000008b, 8153 },
+    { 0x0000008c, 8179 },
+    { 0x0000008d, 8205 },
+    { 0x0000008e, 8231 },
+    { 0x0000008f, 8257 },
+    { 0x00000090, 8285 },
+    { 0x00000091, 8313 },
+    { 0x00000092, 8339 },
+    { 0x00000093, 8364 },
+    { 0x00000094, 8398 },
+    { 0x00000095, 8431 },
+    { 0x00000096, 8467 },
+    { 0x00000097, 8502 },
+    { 0x00000098, 8538 },
+    { 0x00000099, 8573 },
+    { 0x0000009a, 8603 },
+    { 0x0000009b, 8633 },
+    { 0x0000009c, 8666 },
+    { 0x0000009d, 8699 },
+    { 0x0000009e, 8730 },
+    { 0x0000009f, 8760 },
+    { 0x000000a0, 8791 },
+    { 0x000000a1, 8821 },
+    { 0x000000a2, 8852 },
+    { 0x000000a3, 8882 },
+    { 0x000000a4, 8913 },
+    { 0x000000a5, 8943 },
+    { 0x000000a6, 8974 },
+    { 0x000000a7, 9004 },
+    { 0x000000a8, 9035 },
+    { 0x000000a9, 9065 },
+    { 0x000000aa, 9096 },
+    { 0x000000ab, 9126 },
+    { 0x000000ac, 9157 },
+    { 0x000000ad, 9187 },
+    { 0x000000ae, 9219 },
+    { 0x000000af, 9250 },
+    { 0x000000b0, 9282 },
+    { 0x000000b1, 9313 },
+    { 0x000000b2, 9345 },
+    { 0x000000b3, 9376 },
+    { 0x000000b4, 9409 },
+    { 0x000000b5, 9441 },
+    { 0x000000b6, 9474 },
+    { 0x000000b7, 9506 },
+    { 0x000000b8, 9539 },
+};
+const uint16_t sVkFormatNames[] = { 8, 69, 65, 67, 68, 64, 66, 63, 59, 61, 62, 58, 60, 56, 52, 57, 54, 55, 51, 53, 180, 179, 174, 173, 176, 175, 178, 177, 182, 181, 184, 183, 158, 157, 160, 159, 162, 161, 164, 163, 166, 165, 168, 167, 170, 169, 172, 171, 122, 3, 7, 5, 49, 45, 50, 47, 48, 44, 46, 35, 31, 36, 33, 34, 30, 32, 134, 133, 132, 131, 136, 135, 138, 137, 140, 139, 142, 141, 144, 143, 146, 145, 124, 128, 129, 126, 130, 123, 156, 155, 154, 153, 150, 149, 152, 151, 148, 147, 97, 96, 92, 94, 95, 91, 93, 90, 89, 85, 87, 88, 84, 86, 83, 82, 78, 80, 81, 77, 79, 76, 75, 71, 73, 74, 70, 72, 109, 108, 107, 106, 105, 104, 103, 102, 101, 100, 99, 98, 2, 1, 6, 4, 121, 120, 119, 118, 117, 116, 115, 114, 113, 112, 111, 110, 42, 38, 43, 40, 41, 37, 39, 28, 24, 29, 26, 27, 23, 25, 21, 17, 22, 19, 20, 16, 18, 14, 10, 15, 12, 13, 9, 11, 127, 0, 125 };
+const EnumTable sVkFormat = { sVkFormatEntries, sVkFormatNames, 185 };
+const EnumEntry sVkStructureTypeEntries[] = {
+    { 0x00000000, 9571 },
+    { 0x00000001, 9606 },
+    { 0x00000002, 9645 },
+    { 0x00000003, 9688 },
+    { 0x00000004, 9725 },
+    { 0x00000005, 9755 },
+    { 0x00000006, 9794 },
+    { 0x00000007, 9832 },
+    { 0x00000008, 9867 },
+    { 0x00000009, 9903 },
+    { 0x0000000a, 9943 },
+    { 0x0000000b, 9979 },
+    { 0x0000000c, 10020 },
+    { 0x0000000d, 10057 },
+    { 0x0000000e, 10099 },
+    { 0x0000000f, 10135 },
+    { 0x00000010, 10176 },
+    { 0x00000011, 10220 },
+    { 0x00000012, 10265 },
+    { 0x00000013, 10317 },
+    { 0x00000014, 10375 },
+    { 0x00000015, 10435 },
+    { 0x00000016, 10493 },
+    { 0x00000017, 10547 },
+    { 0x00000018, 10606 },
+    { 0x00000019, 10663 },
+    { 0x0000001a, 10722 },
+    { 0x0000001b, 10779 },
+    { 0x0000001c, 10832 },
+    { 0x0000001d, 10880 },
+    { 0x0000001e, 10927 },
+    { 0x0000001f, 10973 },
+    { 0x00000020, 11011 },
+    { 0x00000021, 11063 },
+    { 0x00000022, 11109 },
+    { 0x00000023, 11156 },
+    { 0x00000024, 11195 },
+    { 0x00000025, 11233 },
+    { 0x00000026, 11275 },
+    { 0x00000027, 11317 },
+    { 0x00000028, 11360 },
+    { 0x00000029, 11407 },
+    { 0x0000002a, 11457 },
+    { 0x0000002b, 11501 },
+    { 0x0000002c, 11542 },
+    { 0x0000002d, 11582 },
+    { 0x0000002e, 11621 },
+    { 0x0000002f, 11654 },
+    { 0x00000030, 11700 },
+};
+const uint16_t sVkStructureTypeNames[] = { 0, 7, 12, 44, 13, 40, 42, 41, 39, 29, 36, 33, 34, 32, 3, 2, 10, 8, 37, 28, 14, 45, 15, 1, 48, 47, 6, 5, 46, 17, 26, 25, 27, 20, 30, 24, 23, 18, 21, 19, 22, 11, 43, 38, 31, 9, 16, 4, 35 };
+const EnumTable sVkStructureType = { sVkStructureTypeEntries, sVkStructureTypeNames, 49 };
+const EnumEntry sVkSubpassContentsEntries[] = {
+    { 0x00000000, 11744 },
+    { 0x00000001, 11771 },
+};
+const uint16_t sVkSubpassContentsNames[] = { 0, 1 };
+const EnumTable sVkSubpassContents = { sVkSubpassContentsEntries, sVkSubpassContentsNames, 2 };
+const EnumEntry sVkResultEntries[] = {
+    { 0x00000000, 11817 },
+    { 0x00000001, 11828 },
+    { 0x00000002, 11841 },
+    { 0x00000003, 11852 },
+    { 0x00000004, 11865 },
+    { 0x00000005, 11880 },
+    { 0xfffffff4, 12203 },
+    { 0xfffffff5, 12173 },
+    { 0xfffffff6, 12147 },
+    { 0xfffffff7, 12118 },
+    { 0xfffffff8, 12089 },
+    { 0xfffffff9, 12058 },
+    { 0xfffffffa, 12031 },
+    { 0xfffffffb, 12004 },
+    { 0xfffffffc, 11983 },
+    { 0xfffffffd, 11952 },
+    { 0xfffffffe, 11922 },
+    { 0xffffffff, 11894 },
+};
+const uint16_t sVkResultNames[] = { 14, 11, 10, 7, 6, 9, 15, 12, 13, 16, 17, 8, 4, 3, 5, 1, 0, 2 };
+const EnumTable sVkResult = { sVkResultEntries, sVkResultNames, 18 };
+const EnumEntry sVkDynamicStateEntries[] = {
+    { 0x00000000, 12228 },
+    { 0x00000001, 12254 },
+    { 0x00000002, 12279 },
+    { 0x00000003, 12307 },
+    { 0x00000004, 12335 },
+    { 0x00000005, 12368 },
+    { 0x00000006, 12398 },
+    { 0x00000007, 12436 },
+    { 0x00000008, 12472 },
+};
+const uint16_t sVkDynamicStateNames[] = { 4, 3, 5, 2, 1, 6, 8, 7, 0 };
+const EnumTable sVkDynamicState = { sVkDynamicStateEntries, sVkDynamicStateNames, 9 };
+const EnumEntry sVkDescriptorUpdateTemplateTypeEntries[] = {
+    { 0x00000000, 12507 },
+};
+const uint16_t sVkDescriptorUpdateTemplateTypeNames[] = { 0 };
+const EnumTable sVkDescriptorUpdateTemplateType = { sVkDescriptorUpdateTemplateTypeEntries, sVkDescriptorUpdateTemplateTypeNames, 1 };
+const EnumEntry sVkObjectTypeEntries[] = {
+    { 0x00000000, 12557 },
+    { 0x00000001, 12580 },
+    { 0x00000002, 12604 },
+    { 0x00000003, 12635 },
+    { 0x00000004, 12657 },
+    { 0x00000005, 12678 },
+    { 0x00000006, 12703 },
+    { 0x00000007, 12733 },
+    { 0x00000008, 12754 },
+    { 0x00000009, 12783 },
+    { 0x0000000a, 12805 },
+    { 0x0000000b, 12826 },
+    { 0x0000000c, 12847 },
+    { 0x0000000d, 12873 },
+    { 0x0000000e, 12900 },
+    { 0x0000000f, 12926 },
+    { 0x00000010, 12955 },
+    { 0x00000011, 12985 },
+    { 0x00000012, 13016 },
+    { 0x00000013, 13043 },
+    { 0x00000014, 13067 },
+    { 0x00000015, 13104 },
+    { 0x00000016, 13127 },
+    { 0x00000017, 13158 },
+    { 0x00000018, 13188 },
+    { 0x00000019, 13215 },
+};
+const uint16_t sVkObjectTypeNames[] = { 9, 13, 6, 25, 22, 23, 20, 3, 8, 11, 7, 24, 10, 14, 1, 2, 19, 16, 17, 12, 4, 18, 21, 5, 15, 0 };
+const EnumTable sVkObjectType = { sVkObjectTypeEntries, sVkObjectTypeNames, 26 };
+const EnumEntry sVkPresentModeKHREntries[] = {
+    { 0x00000000, 13243 },
+    { 0x00000001, 13273 },
+    { 0x00000002, 13301 },
+    { 0x00000003, 13326 },
+};
+const uint16_t sVkPresentModeKHRNames[] = { 2, 3, 0, 1 };
+const EnumTable sVkPresentModeKHR = { sVkPresentModeKHREntries, sVkPresentModeKHRNames, 4 };
+const EnumEntry sVkColorSpaceKHREntries[] = {
+    { 0x00000000, 13359 },
+};
+const uint16_t sVkColorSpaceKHRNames[] = { 0 };
+const EnumTable sVkColorSpaceKHR = { sVkColorSpaceKHREntries, sVkColorSpaceKHRNames, 1 };
+const EnumEntry sVkDebugReportObjectTypeEXTEntries[] = {
+    { 0x00000000, 13393 },
+    { 0x00000001, 13433 },
+    { 0x00000002, 13474 },
+    { 0x00000003, 13522 },
+    { 0x00000004, 13561 },
+    { 0x00000005, 13599 },
+    { 0x00000006, 13641 },
+    { 0x00000007, 13688 },
+    { 0x00000008, 13726 },
+    { 0x00000009, 13772 },
+    { 0x0000000a, 13811 },
+    { 0x0000000b, 13849 },
+    { 0x0000000c, 13887 },
+    { 0x0000000d, 13930 },
+    { 0x0000000e, 13974 },
+    { 0x0000000f, 14017 },
+    { 0x00000010, 14063 },
+    { 0x00000011, 14110 },
+    { 0x00000012, 14158 },
+    { 0x00000013, 14202 },
+    { 0x00000014, 14243 },
+    { 0x00000015, 14297 },
+    { 0x00000016, 14337 },
+    { 0x00000017, 14385 },
+    { 0x00000018, 14432 },
+    { 0x00000019, 14476 },
+    { 0x0000001a, 14521 },
+    { 0x0000001b, 14565 },
+    { 0x0000001c, 14611 },
+    { 0x0000001d, 14669 },
+    { 0x0000001e, 14713 },
+    { 0x0000001f, 14762 },
+    { 0x00000020, 14811 },
+    { 0x00000021, 14872 },
+};
+const uint16_t sVkDebugReportObjectTypeEXTNames[] = { 9, 13, 6, 25, 28, 22, 23, 20, 3, 8, 29, 30, 11, 7, 24, 10, 14, 32, 1, 31, 2, 16, 19, 17, 12, 4, 18, 21, 5, 15, 26, 27, 0, 33 };
+const EnumTable sVkDebugReportObjectTypeEXT = { sVkDebugReportObjectTypeEXTEntries, sVkDebugReportObjectTypeEXTNames, 34 };
+const EnumEntry sVkRasterizationOrderAMDEntries[] = {
+    { 0x00000000, 14925 },
+    { 0x00000001, 14959 },
+};
+const uint16_t sVkRasterizationOrderAMDNames[] = { 1, 0 };
+const EnumTable sVkRasterizationOrderAMD = { sVkRasterizationOrderAMDEntries, sVkRasterizationOrderAMDNames, 2 };
+const EnumEntry sVkValidationCheckEXTEntries[] = {
+    { 0x00000000, 14994 },
+    { 0x00000001, 15022 },
+};
+const uint16_t sVkValidationCheckEXTNames[] = { 0, 1 };
+const EnumTable sVkValidationCheckEXT = { sVkValidationCheckEXTEntries, sVkValidationCheckEXTNames, 2 };
+const EnumEntry sVkIndirectCommandsTokenTypeNVXEntries[] = {
+    { 0x00000000, 15054 },
+    { 0x00000001, 15099 },
+    { 0x00000002, 15150 },
+    { 0x00000003, 15199 },
+    { 0x00000004, 15249 },
+    { 0x00000005, 15299 },
+    { 0x00000006, 15348 },
+    { 0x00000007, 15389 },
+};
+const uint16_t sVkIndirectCommandsTokenTypeNVXNames[] = { 1, 7, 5, 6, 2, 0, 4, 3 };
+const EnumTable sVkIndirectCommandsTokenTypeNVX = { sVkIndirectCommandsTokenTypeNVXEntries, sVkIndirectCommandsTokenTypeNVXNames, 8 };
+const EnumEntry sVkObjectEntryTypeNVXEntries[] = {
+    { 0x00000000, 15434 },
+    { 0x00000001, 15474 },
+    { 0x00000002, 15508 },
+    { 0x00000003, 15546 },
+    { 0x00000004, 15585 },
+};
+const uint16_t sVkObjectEntryTypeNVXNames[] = { 0, 2, 1, 4, 3 };
+const EnumTable sVkObjectEntryTypeNVX = { sVkObjectEntryTypeNVXEntries, sVkObjectEntryTypeNVXNames, 5 };
+const EnumEntry sVkDisplayPowerStateEXTEntries[] = {
+    { 0x00000000, 15624 },
+    { 0x00000001, 15655 },
+    { 0x00000002, 15690 },
+};
+const uint16_t sVkDisplayPowerStateEXTNames[] = { 0, 2, 1 };
+const EnumTable sVkDisplayPowerStateEXT = { sVkDisplayPowerStateEXTEntries, sVkDisplayPowerStateEXTNames, 3 };
+const EnumEntry sVkDeviceEventTypeEXTEntries[] = {
+    { 0x00000000, 15720 },
+};
+const uint16_t sVkDeviceEventTypeEXTNames[] = { 0 };
+const EnumTable sVkDeviceEventTypeEXT = { sVkDeviceEventTypeEXTEntries, sVkDeviceEventTypeEXTNames, 1 };
+const EnumEntry sVkDisplayEventTypeEXTEntries[] = {
+    { 0x00000000, 15761 },
+};
+const uint16_t sVkDisplayEventTypeEXTNames[] = { 0 };
+const EnumTable sVkDisplayEventTypeEXT = { sVkDisplayEventTypeEXTEntries, sVkDisplayEventTypeEXTNames, 1 };
+const EnumEntry sVkViewportCoordinateSwizzleNVEntries[] = {
+    { 0x00000000, 15803 },
+    { 0x00000001, 15848 },
+    { 0x00000002, 15893 },
+    { 0x00000003, 15938 },
+    { 0x00000004, 15983 },
+    { 0x00000005, 16028 },
+    { 0x00000006, 16073 },
+    { 0x00000007, 16118 },
+};
+const uint16_t sVkViewportCoordinateSwizzleNVNames[] = { 7, 1, 3, 5, 6, 0, 2, 4 };
+const EnumTable sVkViewportCoordinateSwizzleNV = { sVkViewportCoordinateSwizzleNVEntries, sVkViewportCoordinateSwizzleNVNames, 8 };
+const EnumEntry sVkDiscardRectangleModeEXTEntries[] = {
+    { 0x00000000, 16163 },
+    { 0x00000001, 16203 },
+};
+const uint16_t sVkDiscardRectangleModeEXTNames[] = { 1, 0 };
+const EnumTable sVkDiscardRectangleModeEXT = { sVkDiscardRectangleModeEXTEntries, sVkDiscardRectangleModeEXTNames, 2 };
+const EnumEntry sVkPointClippingBehaviorEntries[] = {
+    { 0x00000000, 16243 },
+    { 0x00000001, 16286 },
+};
+const uint16_t sVkPointClippingBehaviorNames[] = { 0, 1 };
+const EnumTable sVkPointClippingBehavior = { sVkPointClippingBehaviorEntries, sVkPointClippingBehaviorNames, 2 };
+const EnumEntry sVkSamplerReductionModeEXTEntries[] = {
+    { 0x00000000, 16335 },
+    { 0x00000001, 16382 },
+    { 0x00000002, 16416 },
+};
+const uint16_t sVkSamplerReductionModeEXTNames[] = { 2, 1, 0 };
+const EnumTable sVkSamplerReductionModeEXT = { sVkSamplerReductionModeEXTEntries, sVkSamplerReductionModeEXTNames, 3 };
+const EnumEntry sVkTessellationDomainOriginEntries[] = {
+    { 0x00000000, 16450 },
+    { 0x00000001, 16491 },
+};
+const uint16_t sVkTessellationDomainOriginNames[] = { 1, 0 };
+const EnumTable sVkTessellationDomainOrigin = { sVkTessellationDomainOriginEntries, sVkTessellationDomainOriginNames, 2 };
+const EnumEntry sVkSamplerYcbcrModelConversionEntries[] = {
+    { 0x00000000, 16532 },
+    { 0x00000001, 16579 },
+    { 0x00000002, 16628 },
+    { 0x00000003, 16672 },
+    { 0x00000004, 16716 },
+};
+const uint16_t sVkSamplerYcbcrModelConversionNames[] = { 0, 4, 3, 2, 1 };
+const EnumTable sVkSamplerYcbcrModelConversion = { sVkSamplerYcbcrModelConversionEntries, sVkSamplerYcbcrModelConversionNames, 5 };
+const EnumEntry sVkSamplerYcbcrRangeEntries[] = {
+    { 0x00000000, 16761 },
+    { 0x00000001, 16793 },
+};
+const uint16_t sVkSamplerYcbcrRangeNames[] = { 0, 1 };
+const EnumTable sVkSamplerYcbcrRange = { sVkSamplerYcbcrRangeEntries, sVkSamplerYcbcrRangeNames, 2 };
+const EnumEntry sVkChromaLocationEntries[] = {
+    { 0x00000000, 16827 },
+    { 0x00000001, 16859 },
+};
+const uint16_t sVkChromaLocationNames[] = { 0, 1 };
+const EnumTable sVkChromaLocation = { sVkChromaLocationEntries, sVkChromaLocationNames, 2 };
+const EnumEntry sVkBlendOverlapEXTEntries[] = {
+    { 0x00000000, 16887 },
+    { 0x00000001, 16921 },
+    { 0x00000002, 16951 },
+};
+const uint16_t sVkBlendOverlapEXTNames[] = { 2, 1, 0 };
+const EnumTable sVkBlendOverlapEXT = { sVkBlendOverlapEXTEntries, sVkBlendOverlapEXTNames, 3 };
+const EnumEntry sVkCoverageModulationModeNVEntries[] = {
+    { 0x00000000, 16981 },
+    { 0x00000001, 17017 },
+    { 0x00000002, 17052 },
+    { 0x00000003, 17089 },
+};
+const uint16_t sVkCoverageModulationModeNVNames[] = { 2, 0, 3, 1 };
+const EnumTable sVkCoverageModulationModeNV = { sVkCoverageModulationModeNVEntries, sVkCoverageModulationModeNVNames, 4 };
+const EnumEntry sVkValidationCacheHeaderVersionEXTEntries[] = {
+    { 0x00000001, 17125 },
+};
+const uint16_t sVkValidationCacheHeaderVersionEXTNames[] = { 0 };
+const EnumTable sVkValidationCacheHeaderVersionEXT = { sVkValidationCacheHeaderVersionEXTEntries, sVkValidationCacheHeaderVersionEXTNames, 1 };
+const EnumEntry sVkShaderInfoTypeAMDEntries[] = {
+    { 0x00000000, 17168 },
+    { 0x00000001, 17203 },
+    { 0x00000002, 17234 },
+};
+const uint16_t sVkShaderInfoTypeAMDNames[] = { 1, 2, 0 };
+const EnumTable sVkShaderInfoTypeAMD = { sVkShaderInfoTypeAMDEntries, sVkShaderInfoTypeAMDNames, 3 };
+const EnumEntry sVkQueueGlobalPriorityEXTEntries[] = {
+    { 0x00000080, 17270 },
+    { 0x00000100, 17303 },
+    { 0x00000200, 17339 },
+    { 0x00000400, 17373 },
+};
+const uint16_t sVkQueueGlobalPriorityEXTNames[] = { 2, 0, 1, 3 };
+const EnumTable sVkQueueGlobalPriorityEXT = { sVkQueueGlobalPriorityEXTEntries, sVkQueueGlobalPriorityEXTNames, 4 };
+const EnumEntry sVkConservativeRasterizationModeEXTEntries[] = {
+    { 0x00000000, 17411 },
+    { 0x00000001, 17459 },
+    { 0x00000002, 17511 },
+};
+const uint16_t sVkConservativeRasterizationModeEXTNames[] = { 0, 1, 2 };
+const EnumTable sVkConservativeRasterizationModeEXT = { sVkConservativeRasterizationModeEXTEntries, sVkConservativeRasterizationModeEXTNames, 3 };
+const EnumEntry sVkCullModeFlagBitsEntries[] = {
+    { 0x00000000, 17564 },
+    { 0x00000001, 17582 },
+    { 0x00000002, 17605 },
+    { 0x00000003, 17627 },
+};
+const uint16_t sVkCullModeFlagBitsNames[] = { 2, 3, 1, 0 };
+const EnumTable sVkCullModeFlagBits = { sVkCullModeFlagBitsEntries, sVkCullModeFlagBitsNames, 4 };
+const EnumEntry sVkQueueFlagBitsEntries[] = {
+    { 0x00000001, 17655 },
+    { 0x00000002, 17677 },
+    { 0x00000004, 17698 },
+    { 0x00000008, 17720 },
+};
+const uint16_t sVkQueueFlagBitsNames[] = { 1, 0, 3, 2 };
+const EnumTable sVkQueueFlagBits = { sVkQueueFlagBitsEntries, sVkQueueFlagBitsNames, 4 };
+const EnumTable sVkDeviceQueueCreateFlagBits = { nullptr, nullptr, 0 };
+const EnumEntry sVkMemoryPropertyFlagBitsEntries[] = {
+    { 0x00000001, 17748 },
+    { 0x00000002, 17784 },
+    { 0x00000004, 17820 },
+    { 0x00000008, 17857 },
+    { 0x00000010, 17892 },
+};
+const uint16_t sVkMemoryPropertyFlagBitsNames[] = { 0, 3, 2, 1, 4 };
+const EnumTable sVkMemoryPropertyFlagBits = { sVkMemoryPropertyFlagBitsEntries, sVkMemoryPropertyFlagBitsNames, 5 };
+const EnumEntry sVkMemoryHeapFlagBitsEntries[] = {
+    { 0x00000001, 17932 },
+};
+const uint16_t sVkMemoryHeapFlagBitsNames[] = { 0 };
+const EnumTable sVkMemoryHeapFlagBits = { sVkMemoryHeapFlagBitsEntries, sVkMemoryHeapFlagBitsNames, 1 };
+const EnumEntry sVkAccessFlagBitsEntries[] = {
+    { 0x00000001, 17964 },
+    { 0x00000002, 18000 },
+    { 0x00000004, 18025 },
+    { 0x00000008, 18061 },
+    { 0x00000010, 18088 },
+    { 0x00000020, 18124 },
+    { 0x00000040, 18150 },
+    { 0x00000080, 18177 },
+    { 0x00000100, 18213 },
+    { 0x00000200, 18250 },
+    { 0x00000400, 18294 },
+    { 0x00000800, 18339 },
+    { 0x00001000, 18367 },
+    { 0x00002000, 18396 },
+    { 0x00004000, 18420 },
+    { 0x00008000, 18445 },
+    { 0x00010000, 18471 },
+};
+const uint16_t sVkAccessFlagBitsNames[] = { 7, 8, 9, 10, 13, 14, 1, 0, 4, 15, 16, 5, 6, 11, 12, 3, 2 };
+const EnumTable sVkAccessFlagBits = { sVkAccessFlagBitsEntries, sVkAccessFlagBitsNames, 17 };
+const EnumEntry sVkBufferUsageFlagBitsEntries[] = {
+    { 0x00000001, 18498 },
+    { 0x00000002, 18531 },
+    { 0x00000004, 18564 },
+    { 0x00000008, 18605 },
+    { 0x00000010, 18646 },
+    { 0x00000020, 18681 },
+    { 0x00000040, 18716 },
+    { 0x00000080, 18749 },
+    { 0x00000100, 18783 },
+};
+const uint16_t sVkBufferUsageFlagBitsNames[] = { 6, 8, 5, 3, 1, 0, 4, 2, 7 };
+const EnumTable sVkBufferUsageFlagBits = { sVkBufferUsageFlagBitsEntries, sVkBufferUsageFlagBitsNames, 9 };
+const EnumEntry sVkBufferCreateFlagBitsEntries[] = {
+    { 0x00000001, 18819 },
+    { 0x00000002, 18855 },
+    { 0x00000004, 18893 },
+};
+const uint16_t sVkBufferCreateFlagBitsNames[] = { 2, 0, 1 };
+const EnumTable sVkBufferCreateFlagBits = { sVkBufferCreateFlagBitsEntries, sVkBufferCreateFlagBitsNames, 3 };
+const EnumEntry sVkShaderStageFlagBitsEntries[] = {
+    { 0x00000001, 18929 },
+    { 0x00000002, 18956 },
+    { 0x00000004, 18997 },
+    { 0x00000008, 19041 },
+    { 0x00000010, 19070 },
+    { 0x0000001f, 19127 },
+    { 0x00000020, 19099 },
+    { 0x7fffffff, 19156 },
+};
+const uint16_t sVkShaderStageFlagBitsNames[] = { 7, 5, 6, 4, 3, 1, 2, 0 };
+const EnumTable sVkShaderStageFlagBits = { sVkShaderStageFlagBitsEntries, sVkShaderStageFlagBitsNames, 8 };
+const EnumEntry sVkImageUsageFlagBitsEntries[] = {
+    { 0x00000001, 19176 },
+    { 0x00000002, 19208 },
+    { 0x00000004, 19240 },
+    { 0x00000008, 19267 },
+    { 0x00000010, 19294 },
+    { 0x00000020, 19330 },
+    { 0x00000040, 19374 },
+    { 0x00000080, 19414 },
+};
+const uint16_t sVkImageUsageFlagBitsNames[] = { 4, 5, 7, 2, 3, 1, 0, 6 };
+const EnumTable sVkImageUsageFlagBits = { sVkImageUsageFlagBitsEntries, sVkImageUsageFlagBitsNames, 8 };
+const EnumEntry sVkImageCreateFlagBitsEntries[] = {
+    { 0x00000001, 19450 },
+    { 0x00000002, 19485 },
+    { 0x00000004, 19522 },
+    { 0x00000008, 19557 },
+    { 0x00000010, 19592 },
+};
+const uint16_t sVkImageCreateFlagBitsNames[] = { 4, 3, 2, 0, 1 };
+const EnumTable sVkImageCreateFlagBits = { sVkImageCreateFlagBitsEntries, sVkImageCreateFlagBitsNames, 5 };
+const EnumEntry sVkPipelineCreateFlagBitsEntries[] = {
+    { 0x00000001, 19628 },
+    { 0x00000002, 19672 },
+    { 0x00000004, 19713 },
+};
+const uint16_t sVkPipelineCreateFlagBitsNames[] = { 1, 2, 0 };
+const EnumTable sVkPipelineCreateFlagBits = { sVkPipelineCreateFlagBitsEntries, sVkPipelineCreateFlagBitsNames, 3 };
+const EnumEntry sVkColorComponentFlagBitsEntries[] = {
+    { 0x00000001, 19747 },
+    { 0x00000002, 19772 },
+    { 0x00000004, 19797 },
+    { 0x00000008, 19822 },
+};
+const uint16_t sVkColorComponentFlagBitsNames[] = { 3, 2, 1, 0 };
+const EnumTable sVkColorComponentFlagBits = { sVkColorComponentFlagBitsEntries, sVkColorComponentFlagBitsNames, 4 };
+const EnumEntry sVkFenceCreateFlagBitsEntries[] = {
+    { 0x00000001, 19847 },
+};
+const uint16_t sVkFenceCreateFlagBitsNames[] = { 0 };
+const EnumTable sVkFenceCreateFlagBits = { sVkFenceCreateFlagBitsEntries, sVkFenceCreateFlagBitsNames, 1 };
+const EnumEntry sVkFormatFeatureFlagBitsEntries[] = {
+    { 0x00000001, 19876 },
+    { 0x00000002, 19912 },
+    { 0x00000004, 19948 },
+    { 0x00000008, 19991 },
+    { 0x00000010, 20034 },
+    { 0x00000020, 20077 },
+    { 0x00000040, 20127 },
+    { 0x00000080, 20163 },
+    { 0x00000100, 20202 },
+    { 0x00000200, 20247 },
+    { 0x00000400, 20294 },
+    { 0x00000800, 20325 },
+    { 0x00001000, 20356 },
+};
+const uint16_t sVkFormatFeatureFlagBitsNames[] = { 11, 10, 7, 8, 9, 0, 12, 2, 1, 5, 4, 3, 6 };
+const EnumTable sVkFormatFeatureFlagBits = { sVkFormatFeatureFlagBitsEntries, sVkFormatFeatureFlagBitsNames, 13 };
+const EnumEntry sVkQueryControlFlagBitsEntries[] = {
+    { 0x00000001, 20406 },
+};
+const uint16_t sVkQueryControlFlagBitsNames[] = { 0 };
+const EnumTable sVkQueryControlFlagBits = { sVkQueryControlFlagBitsEntries, sVkQueryControlFlagBitsNames, 1 };
+const EnumEntry sVkQueryResultFlagBitsEntries[] = {
+    { 0x00000001, 20435 },
+    { 0x00000002, 20458 },
+    { 0x00000004, 20483 },
+    { 0x00000008, 20521 },
+};
+const uint16_t sVkQueryResultFlagBitsNames[] = { 0, 3, 1, 2 };
+const EnumTable sVkQueryResultFlagBits = { sVkQueryResultFlagBitsEntries, sVkQueryResultFlagBitsNames, 4 };
+const EnumEntry sVkCommandBufferUsageFlagBitsEntries[] = {
+    { 0x00000001, 20549 },
+    { 0x00000002, 20593 },
+    { 0x00000004, 20642 },
+};
+const uint16_t sVkCommandBufferUsageFlagBitsNames[] = { 0, 1, 2 };
+const EnumTable sVkCommandBufferUsageFlagBits = { sVkCommandBufferUsageFlagBitsEntries, sVkCommandBufferUsageFlagBitsNames, 3 };
+const EnumEntry sVkQueryPipelineStatisticFlagBitsEntries[] = {
+    { 0x00000001, 20687 },
+    { 0x00000002, 20743 },
+    { 0x00000004, 20801 },
+    { 0x00000008, 20859 },
+    { 0x00000010, 20919 },
+    { 0x00000020, 20978 },
+    { 0x00000040, 21031 },
+    { 0x00000080, 21083 },
+    { 0x00000100, 21143 },
+    { 0x00000200, 21211 },
+    { 0x00000400, 21286 },
+};
+const uint16_t sVkQueryPipelineStatisticFlagBitsNames[] = { 5, 6, 10, 7, 3, 4, 1, 0, 8, 9, 2 };
+const EnumTable sVkQueryPipelineStatisticFlagBits = { sVkQueryPipelineStatisticFlagBitsEntries, sVkQueryPipelineStatisticFlagBitsNames, 11 };
+const EnumEntry sVkImageAspectFlagBitsEntries[] = {
+    { 0x00000001, 21345 },
+    { 0x00000002, 21371 },
+    { 0x00000004, 21397 },
+    { 0x00000008, 21425 },
+};
+const uint16_t sVkImageAspectFlagBitsNames[] = { 0, 1, 3, 2 };
+const EnumTable sVkImageAspectFlagBits = { sVkImageAspectFlagBitsEntries, sVkImageAspectFlagBitsNames, 4 };
+const EnumEntry sVkSparseImageFormatFlagBitsEntries[] = {
+    { 0x00000001, 21454 },
+    { 0x00000002, 21496 },
+    { 0x00000004, 21540 },
+};
+const uint16_t sVkSparseImageFormatFlagBitsNames[] = { 1, 2, 0 };
+const EnumTable sVkSparseImageFormatFlagBits = { sVkSparseImageFormatFlagBitsEntries, sVkSparseImageFormatFlagBitsNames, 3 };
+const EnumEntry sVkSparseMemoryBindFlagBitsEntries[] = {
+    { 0x00000001, 21590 },
+};
+const uint16_t sVkSparseMemoryBindFlagBitsNames[] = { 0 };
+const EnumTable sVkSparseMemoryBindFlagBits = { sVkSparseMemoryBindFlagBitsEntries, sVkSparseMemoryBindFlagBitsNames, 1 };
+const EnumEntry sVkPipelineStageFlagBitsEntries[] = {
+    { 0x00000001, 21625 },
+    { 0x00000002, 21659 },
+    { 0x00000004, 21695 },
+    { 0x00000008, 21730 },
+    { 0x00000010, 21766 },
+    { 0x00000020, 21816 },
+    { 0x00000040, 21869 },
+    { 0x00000080, 21907 },
+    { 0x00000100, 21945 },
+    { 0x00000200, 21988 },
+    { 0x00000400, 22030 },
+    { 0x00000800, 22076 },
+    { 0x00001000, 22113 },
+    { 0x00002000, 22144 },
+    { 0x00004000, 22181 },
+    { 0x00008000, 22208 },
+    { 0x00010000, 22243 },
+};
+const uint16_t sVkPipelineStageFlagBitsNames[] = { 16, 15, 13, 10, 11, 1, 8, 7, 6, 14, 9, 4, 5, 0, 12, 2, 3 };
+const EnumTable sVkPipelineStageFlagBits = { sVkPipelineStageFlagBitsEntries, sVkPipelineStageFlagBitsNames, 17 };
+const EnumEntry sVkCommandPoolCreateFlagBitsEntries[] = {
+    { 0x00000001, 22278 },
+    { 0x00000002, 22315 },
+};
+const uint16_t sVkCommandPoolCreateFlagBitsNames[] = { 1, 0 };
+const EnumTable sVkCommandPoolCreateFlagBits = { sVkCommandPoolCreateFlagBitsEntries, sVkCommandPoolCreateFlagBitsNames, 2 };
+const EnumEntry sVkCommandPoolResetFlagBitsEntries[] = {
+    { 0x00000001, 22363 },
+};
+const uint16_t sVkCommandPoolResetFlagBitsNames[] = { 0 };
+const EnumTable sVkCommandPoolResetFlagBits = { sVkCommandPoolResetFlagBitsEntries, sVkCommandPoolResetFlagBitsNames, 1 };
+const EnumEntry sVkCommandBufferResetFlagBitsEntries[] = {
+    { 0x00000001, 22407 },
+};
+const uint16_t sVkCommandBufferResetFlagBitsNames[] = { 0 };
+const EnumTable sVkCommandBufferResetFlagBits = { sVkCommandBufferResetFlagBitsEntries, sVkCommandBufferResetFlagBitsNames, 1 };
+const EnumEntry sVkSampleCountFlagBitsEntries[] = {
+    { 0x00000001, 22453 },
+    { 0x00000002, 22475 },
+    { 0x00000004, 22497 },
+    { 0x00000008, 22519 },
+    { 0x00000010, 22541 },
+    { 0x00000020, 22564 },
+    { 0x00000040, 22587 },
+};
+const uint16_t sVkSampleCountFlagBitsNames[] = { 4, 0, 1, 5, 2, 6, 3 };
+const EnumTable sVkSampleCountFlagBits = { sVkSampleCountFlagBitsEntries, sVkSampleCountFlagBitsNames, 7 };
+const EnumEntry sVkAttachmentDescriptionFlagBitsEntries[] = {
+    { 0x00000001, 22610 },
+};
+const uint16_t sVkAttachmentDescriptionFlagBitsNames[] = { 0 };
+const EnumTable sVkAttachmentDescriptionFlagBits = { sVkAttachmentDescriptionFlagBitsEntries, sVkAttachmentDescriptionFlagBitsNames, 1 };
+const EnumEntry sVkStencilFaceFlagBitsEntries[] = {
+    { 0x00000001, 22650 },
+    { 0x00000002, 22676 },
+    { 0x00000003, 22701 },
+};
+const uint16_t sVkStencilFaceFlagBitsNames[] = { 1, 0, 2 };
+const EnumTable sVkStencilFaceFlagBits = { sVkStencilFaceFlagBitsEntries, sVkStencilFaceFlagBitsNames, 3 };
+const EnumEntry sVkDescriptorPoolCreateFlagBitsEntries[] = {
+    { 0x00000001, 22727 },
+};
+const uint16_t sVkDescriptorPoolCreateFlagBitsNames[] = { 0 };
+const EnumTable sVkDescriptorPoolCreateFlagBits = { sVkDescriptorPoolCreateFlagBitsEntries, sVkDescriptorPoolCreateFlagBitsNames, 1 };
+const EnumEntry sVkDependencyFlagBitsEntries[] = {
+    { 0x00000001, 22777 },
+};
+const uint16_t sVkDependencyFlagBitsNames[] = { 0 };
+const EnumTable sVkDependencyFlagBits = { sVkDependencyFlagBitsEntries, sVkDependencyFlagBitsNames, 1 };
+const EnumEntry sVkDisplayPlaneAlphaFlagBitsKHREntries[] = {
+    { 0x00000001, 22805 },
+    { 0x00000002, 22843 },
+    { 0x00000004, 22881 },
+    { 0x00000008, 22922 },
+};
+const uint16_t sVkDisplayPlaneAlphaFlagBitsKHRNames[] = { 1, 0, 2, 3 };
+const EnumTable sVkDisplayPlaneAlphaFlagBitsKHR = { sVkDisplayPlaneAlphaFlagBitsKHREntries, sVkDisplayPlaneAlphaFlagBitsKHRNames, 4 };
+const EnumEntry sVkCompositeAlphaFlagBitsKHREntries[] = {
+    { 0x00000001, 22977 },
+    { 0x00000002, 23011 },
+    { 0x00000004, 23053 },
+    { 0x00000008, 23096 },
+};
+const uint16_t sVkCompositeAlphaFlagBitsKHRNames[] = { 3, 0, 2, 1 };
+const EnumTable sVkCompositeAlphaFlagBitsKHR = { sVkCompositeAlphaFlagBitsKHREntries, sVkCompositeAlphaFlagBitsKHRNames, 4 };
+const EnumEntry sVkSurfaceTransformFlagBitsKHREntries[] = {
+    { 0x00000001, 23131 },
+    { 0x00000002, 23169 },
+    { 0x00000004, 23208 },
+    { 0x00000008, 23248 },
+    { 0x00000010, 23288 },
+    { 0x00000020, 23335 },
+    { 0x00000040, 23392 },
+    { 0x00000080, 23450 },
+    { 0x00000100, 23508 },
+};
+const uint16_t sVkSurfaceTransformFlagBitsKHRNames[] = { 4, 6, 7, 5, 0, 8, 2, 3, 1 };
+const EnumTable sVkSurfaceTransformFlagBitsKHR = { sVkSurfaceTransformFlagBitsKHREntries, sVkSurfaceTransformFlagBitsKHRNames, 9 };
+const EnumEntry sVkDebugReportFlagBitsEXTEntries[] = {
+    { 0x00000001, 23545 },
+    { 0x00000002, 23581 },
+    { 0x00000004, 23613 },
+    { 0x00000008, 23657 },
+    { 0x00000010, 23687 },
+};
+const uint16_t sVkDebugReportFlagBitsEXTNames[] = { 4, 3, 0, 2, 1 };
+const EnumTable sVkDebugReportFlagBitsEXT = { sVkDebugReportFlagBitsEXTEntries, sVkDebugReportFlagBitsEXTNames, 5 };
+const EnumEntry sVkExternalMemoryHandleTypeFlagBitsNVEntries[] = {
+    { 0x00000001, 23717 },
+    { 0x00000002, 23768 },
+    { 0x00000004, 23823 },
+    { 0x00000008, 23873 },
+};
+const uint16_t sVkExternalMemoryHandleTypeFlagBitsNVNames[] = { 2, 3, 0, 1 };
+const EnumTable sVkExternalMemoryHandleTypeFlagBitsNV = { sVkExternalMemoryHandleTypeFlagBitsNVEntries, sVkExternalMemoryHandleTypeFlagBitsNVNames, 4 };
+const EnumEntry sVkExternalMemoryFeatureFlagBitsNVEntries[] = {
+    { 0x00000001, 23927 },
+    { 0x00000002, 23976 },
+    { 0x00000004, 24021 },
+};
+const uint16_t sVkExternalMemoryFeatureFlagBitsNVNames[] = { 0, 1, 2 };
+const EnumTable sVkExternalMemoryFeatureFlagBitsNV = { sVkExternalMemoryFeatureFlagBitsNVEntries, sVkExternalMemoryFeatureFlagBitsNVNames, 3 };
+const EnumEntry sVkSubgroupFeatureFlagBitsEntries[] = {
+    { 0x00000001, 24066 },
+    { 0x00000002, 24096 },
+    { 0x00000004, 24125 },
+    { 0x00000008, 24160 },
+    { 0x00000010, 24191 },
+    { 0x00000020, 24223 },
+    { 0x00000040, 24264 },
+    { 0x00000080, 24298 },
+};
+const uint16_t sVkSubgroupFeatureFlagBitsNames[] = { 2, 3, 0, 6, 7, 4, 5, 1 };
+const EnumTable sVkSubgroupFeatureFlagBits = { sVkSubgroupFeatureFlagBitsEntries, sVkSubgroupFeatureFlagBitsNames, 8 };
+const EnumEntry sVkIndirectCommandsLayoutUsageFlagBitsNVXEntries[] = {
+    { 0x00000001, 24327 },
+    { 0x00000002, 24389 },
+    { 0x00000004, 24448 },
+    { 0x00000008, 24507 },
+};
+const uint16_t sVkIndirectCommandsLayoutUsageFlagBitsNVXNames[] = { 2, 3, 1, 0 };
+const EnumTable sVkIndirectCommandsLayoutUsageFlagBitsNVX = { sVkIndirectCommandsLayoutUsageFlagBitsNVXEntries, sVkIndirectCommandsLayoutUsageFlagBitsNVXNames, 4 };
+const EnumEntry sVkObjectEntryUsageFlagBitsNVXEntries[] = {
+    { 0x00000001, 24567 },
+    { 0x00000002, 24606 },
+};
+const uint16_t sVkObjectEntryUsageFlagBitsNVXNames[] = { 1, 0 };
+const EnumTable sVkObjectEntryUsageFlagBitsNVX = { sVkObjectEntryUsageFlagBitsNVXEntries, sVkObjectEntryUsageFlagBitsNVXNames, 2 };
+const EnumTable sVkDescriptorSetLayoutCreateFlagBits = { nullptr, nullptr, 0 };
+const EnumEntry sVkExternalMemoryHandleTypeFlagBitsEntries[] = {
+    { 0x00000001, 24644 },
+    { 0x00000002, 24689 },
+    { 0x00000004, 24737 },
+    { 0x00000008, 24789 },
+    { 0x00000010, 24838 },
+    { 0x00000020, 24891 },
+    { 0x00000040, 24937 },
+};
+const uint16_t sVkExternalMemoryHandleTypeFlagBitsNames[] = { 3, 4, 5, 6, 0, 1, 2 };
+const EnumTable sVkExternalMemoryHandleTypeFlagBits = { sVkExternalMemoryHandleTypeFlagBitsEntries, sVkExternalMemoryHandleTypeFlagBitsNames, 7 };
+const EnumEntry sVkExternalMemoryFeatureFlagBitsEntries[] = {
+    { 0x00000001, 24987 },
+    { 0x00000002, 25033 },
+    { 0x00000004, 25075 },
+};
+const uint16_t sVkExternalMemoryFeatureFlagBitsNames[] = { 0, 1, 2 };
+const EnumTable sVkExternalMemoryFeatureFlagBits = { sVkExternalMemoryFeatureFlagBitsEntries, sVkExternalMemoryFeatureFlagBitsNames, 3 };
+const EnumEntry sVkExternalSemaphoreHandleTypeFlagBitsEntries[] = {
+    { 0x00000001, 25117 },
+    { 0x00000002, 25165 },
+    { 0x00000004, 25216 },
+    { 0x00000008, 25271 },
+    { 0x00000010, 25321 },
+};
+const uint16_t sVkExternalSemaphoreHandleTypeFlagBitsNames[] = { 3, 0, 1, 2, 4 };
+const EnumTable sVkExternalSemaphoreHandleTypeFlagBits = { sVkExternalSemaphoreHandleTypeFlagBitsEntries, sVkExternalSemaphoreHandleTypeFlagBitsNames, 5 };
+const EnumEntry sVkExternalSemaphoreFeatureFlagBitsEntries[] = {
+    { 0x00000001, 25367 },
+    { 0x00000002, 25412 },
+};
+const uint16_t sVkExternalSemaphoreFeatureFlagBitsNames[] = { 0, 1 };
+const EnumTable sVkExternalSemaphoreFeatureFlagBits = { sVkExternalSemaphoreFeatureFlagBitsEntries, sVkExternalSemaphoreFeatureFlagBitsNames, 2 };
+const EnumEntry sVkSemaphoreImportFlagBitsEntries[] = {
+    { 0x00000001, 25457 },
+};
+const uint16_t sVkSemaphoreImportFlagBitsNames[] = { 0 };
+const EnumTable sVkSemaphoreImportFlagBits = { sVkSemaphoreImportFlagBitsEntries, sVkSemaphoreImportFlagBitsNames, 1 };
+const EnumEntry sVkExternalFenceHandleTypeFlagBitsEntries[] = {
+    { 0x00000001, 25491 },
+    { 0x00000002, 25535 },
+    { 0x00000004, 25582 },
+    { 0x00000008, 25633 },
+};
+const uint16_t sVkExternalFenceHandleTypeFlagBitsNames[] = { 0, 1, 2, 3 };
+const EnumTable sVkExternalFenceHandleTypeFlagBits = { sVkExternalFenceHandleTypeFlagBitsEntries, sVkExternalFenceHandleTypeFlagBitsNames, 4 };
+const EnumEntry sVkExternalFenceFeatureFlagBitsEntries[] = {
+    { 0x00000001, 25675 },
+    { 0x00000002, 25716 },
+};
+const uint16_t sVkExternalFenceFeatureFlagBitsNames[] = { 0, 1 };
+const EnumTable sVkExternalFenceFeatureFlagBits = { sVkExternalFenceFeatureFlagBitsEntries, sVkExternalFenceFeatureFlagBitsNames, 2 };
+const EnumEntry sVkFenceImportFlagBitsEntries[] = {
+    { 0x00000001, 25757 },
+};
+const uint16_t sVkFenceImportFlagBitsNames[] = { 0 };
+const EnumTable sVkFenceImportFlagBits = { sVkFenceImportFlagBitsEntries, sVkFenceImportFlagBitsNames, 1 };
+const EnumEntry sVkSurfaceCounterFlagBitsEXTEntries[] = {
+    { 0x00000001, 25787 },
+};
+const uint16_t sVkSurfaceCounterFlagBitsEXTNames[] = { 0 };
+const EnumTable sVkSurfaceCounterFlagBitsEXT = { sVkSurfaceCounterFlagBitsEXTEntries, sVkSurfaceCounterFlagBitsEXTNames, 1 };
+const EnumEntry sVkPeerMemoryFeatureFlagBitsEntries[] = {
+    { 0x00000001, 25817 },
+    { 0x00000002, 25853 },
+    { 0x00000004, 25889 },
+    { 0x00000008, 25928 },
+};
+const uint16_t sVkPeerMemoryFeatureFlagBitsNames[] = { 1, 0, 3, 2 };
+const EnumTable sVkPeerMemoryFeatureFlagBits = { sVkPeerMemoryFeatureFlagBitsEntries, sVkPeerMemoryFeatureFlagBitsNames, 4 };
+const EnumEntry sVkMemoryAllocateFlagBitsEntries[] = {
+    { 0x00000001, 25967 },
+};
+const uint16_t sVkMemoryAllocateFlagBitsNames[] = { 0 };
+const EnumTable sVkMemoryAllocateFlagBits = { sVkMemoryAllocateFlagBitsEntries, sVkMemoryAllocateFlagBitsNames, 1 };
+const EnumEntry sVkDeviceGroupPresentModeFlagBitsKHREntries[] = {
+    { 0x00000001, 26002 },
+    { 0x00000002, 26045 },
+    { 0x00000004, 26089 },
+    { 0x00000008, 26130 },
+};
+const uint16_t sVkDeviceGroupPresentModeFlagBitsKHRNames[] = { 0, 3, 1, 2 };
+const EnumTable sVkDeviceGroupPresentModeFlagBitsKHR = { sVkDeviceGroupPresentModeFlagBitsKHREntries, sVkDeviceGroupPresentModeFlagBitsKHRNames, 4 };
+const EnumTable sVkSwapchainCreateFlagBitsKHR = { nullptr, nullptr, 0 };
+const EnumTable sVkSubpassDescriptionFlagBits = { nullptr, nullptr, 0 };
+const EnumEntry sVkDebugUtilsMessageSeverityFlagBitsEXTEntries[] = {
+    { 0x00000001, 26186 },
+    { 0x00000010, 26234 },
+    { 0x00000100, 26279 },
+    { 0x00001000, 26327 },
+};
+const uint16_t sVkDebugUtilsMessageSeverityFlagBitsEXTNames[] = { 3, 1, 0, 2 };
+const EnumTable sVkDebugUtilsMessageSeverityFlagBitsEXT = { sVkDebugUtilsMessageSeverityFlagBitsEXTEntries, sVkDebugUtilsMessageSeverityFlagBitsEXTNames, 4 };
+const EnumEntry sVkDebugUtilsMessageTypeFlagBitsEXTEntries[] = {
+    { 0x00000001, 26373 },
+    { 0x00000002, 26417 },
+    { 0x00000004, 26464 },
+};
+const uint16_t sVkDebugUtilsMessageTypeFlagBitsEXTNames[] = { 0, 2, 1 };
+const EnumTable sVkDebugUtilsMessageTypeFlagBitsEXT = { sVkDebugUtilsMessageTypeFlagBitsEXTEntries, sVkDebugUtilsMessageTypeFlagBitsEXTNames, 3 };
+const EnumEntry sVkDescriptorBindingFlagBitsEXTEntries[] = {
+    { 0x00000001, 26512 },
+    { 0x00000002, 26560 },
+    { 0x00000004, 26618 },
+    { 0x00000008, 26664 },
+};
+const uint16_t sVkDescriptorBindingFlagBitsEXTNames[] = { 2, 0, 1, 3 };
+const EnumTable sVkDescriptorBindingFlagBitsEXT = { sVkDescriptorBindingFlagBitsEXTEntries, sVkDescriptorBindingFlagBitsEXTNames, 4 };
+
+} // anonymous namespace
+
+bool bluevk::parseEnum(const char* name, VkImageLayout* value) {
+    uint32_t result;
+    if (!parseValue(sVkImageLayout, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkImageLayout) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkQueryType& value) {
-    switch (value) {
-        case VK_QUERY_TYPE_OCCLUSION: out << "VK_QUERY_TYPE_OCCLUSION"; break;
-        case VK_QUERY_TYPE_PIPELINE_STATISTICS: out << "VK_QUERY_TYPE_PIPELINE_STATISTICS"; break;
-        case VK_QUERY_TYPE_TIMESTAMP: out << "VK_QUERY_TYPE_TIMESTAMP"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkAttachmentLoadOp* value) {
+    uint32_t result;
+    if (!parseValue(sVkAttachmentLoadOp, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkAttachmentLoadOp) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkBorderColor& value) {
-    switch (value) {
-        case VK_BORDER_COLOR_FLOAT_TRANSPARENT_BLACK: out << "VK_BORDER_COLOR_FLOAT_TRANSPARENT_BLACK"; break;
-        case VK_BORDER_COLOR_INT_TRANSPARENT_BLACK: out << "VK_BORDER_COLOR_INT_TRANSPARENT_BLACK"; break;
-        case VK_BORDER_COLOR_FLOAT_OPAQUE_BLACK: out << "VK_BORDER_COLOR_FLOAT_OPAQUE_BLACK"; break;
-        case VK_BORDER_COLOR_INT_OPAQUE_BLACK: out << "VK_BORDER_COLOR_INT_OPAQUE_BLACK"; break;
-        case VK_BORDER_COLOR_FLOAT_OPAQUE_WHITE: out << "VK_BORDER_COLOR_FLOAT_OPAQUE_WHITE"; break;
-        case VK_BORDER_COLOR_INT_OPAQUE_WHITE: out << "VK_BORDER_COLOR_INT_OPAQUE_WHITE"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkAttachmentStoreOp* value) {
+    uint32_t result;
+    if (!parseValue(sVkAttachmentStoreOp, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkAttachmentStoreOp) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkPipelineBindPoint& value) {
-    switch (value) {
-        case VK_PIPELINE_BIND_POINT_GRAPHICS: out << "VK_PIPELINE_BIND_POINT_GRAPHICS"; break;
-        case VK_PIPELINE_BIND_POINT_COMPUTE: out << "VK_PIPELINE_BIND_POINT_COMPUTE"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkImageType* value) {
+    uint32_t result;
+    if (!parseValue(sVkImageType, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkImageType) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkPipelineCacheHeaderVersion& value) {
-    switch (value) {
-        case VK_PIPELINE_CACHE_HEADER_VERSION_ONE: out << "VK_PIPELINE_CACHE_HEADER_VERSION_ONE"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkImageTiling* value) {
+    uint32_t result;
+    if (!parseValue(sVkImageTiling, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkImageTiling) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkPrimitiveTopology& value) {
-    switch (value) {
-        case VK_PRIMITIVE_TOPOLOGY_POINT_LIST: out << "VK_PRIMITIVE_TOPOLOGY_POINT_LIST"; break;
-        case VK_PRIMITIVE_TOPOLOGY_LINE_LIST: out << "VK_PRIMITIVE_TOPOLOGY_LINE_LIST"; break;
-        case VK_PRIMITIVE_TOPOLOGY_LINE_STRIP: out << "VK_PRIMITIVE_TOPOLOGY_LINE_STRIP"; break;
-        case VK_PRIMITIVE_TOPOLOGY_TRIANGLE_LIST: out << "VK_PRIMITIVE_TOPOLOGY_TRIANGLE_LIST"; break;
-        case VK_PRIMITIVE_TOPOLOGY_TRIANGLE_STRIP: out << "VK_PRIMITIVE_TOPOLOGY_TRIANGLE_STRIP"; break;
-        case VK_PRIMITIVE_TOPOLOGY_TRIANGLE_FAN: out << "VK_PRIMITIVE_TOPOLOGY_TRIANGLE_FAN"; break;
-        case VK_PRIMITIVE_TOPOLOGY_LINE_LIST_WITH_ADJACENCY: out << "VK_PRIMITIVE_TOPOLOGY_LINE_LIST_WITH_ADJACENCY"; break;
-        case VK_PRIMITIVE_TOPOLOGY_LINE_STRIP_WITH_ADJACENCY: out << "VK_PRIMITIVE_TOPOLOGY_LINE_STRIP_WITH_ADJACENCY"; break;
-        case VK_PRIMITIVE_TOPOLOGY_TRIANGLE_LIST_WITH_ADJACENCY: out << "VK_PRIMITIVE_TOPOLOGY_TRIANGLE_LIST_WITH_ADJACENCY"; break;
-        case VK_PRIMITIVE_TOPOLOGY_TRIANGLE_STRIP_WITH_ADJACENCY: out << "VK_PRIMITIVE_TOPOLOGY_TRIANGLE_STRIP_WITH_ADJACENCY"; break;
-        case VK_PRIMITIVE_TOPOLOGY_PATCH_LIST: out << "VK_PRIMITIVE_TOPOLOGY_PATCH_LIST"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkImageViewType* value) {
+    uint32_t result;
+    if (!parseValue(sVkImageViewType, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkImageViewType) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkSharingMode& value) {
-    switch (value) {
-        case VK_SHARING_MODE_EXCLUSIVE: out << "VK_SHARING_MODE_EXCLUSIVE"; break;
-        case VK_SHARING_MODE_CONCURRENT: out << "VK_SHARING_MODE_CONCURRENT"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkCommandBufferLevel* value) {
+    uint32_t result;
+    if (!parseValue(sVkCommandBufferLevel, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkCommandBufferLevel) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkIndexType& value) {
-    switch (value) {
-        case VK_INDEX_TYPE_UINT16: out << "VK_INDEX_TYPE_UINT16"; break;
-        case VK_INDEX_TYPE_UINT32: out << "VK_INDEX_TYPE_UINT32"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkComponentSwizzle* value) {
+    uint32_t result;
+    if (!parseValue(sVkComponentSwizzle, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkComponentSwizzle) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkFilter& value) {
-    switch (value) {
-        case VK_FILTER_NEAREST: out << "VK_FILTER_NEAREST"; break;
-        case VK_FILTER_LINEAR: out << "VK_FILTER_LINEAR"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkDescriptorType* value) {
+    uint32_t result;
+    if (!parseValue(sVkDescriptorType, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkDescriptorType) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkSamplerMipmapMode& value) {
-    switch (value) {
-        case VK_SAMPLER_MIPMAP_MODE_NEAREST: out << "VK_SAMPLER_MIPMAP_MODE_NEAREST"; break;
-        case VK_SAMPLER_MIPMAP_MODE_LINEAR: out << "VK_SAMPLER_MIPMAP_MODE_LINEAR"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkQueryType* value) {
+    uint32_t result;
+    if (!parseValue(sVkQueryType, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkQueryType) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkSamplerAddressMode& value) {
-    switch (value) {
-        case VK_SAMPLER_ADDRESS_MODE_REPEAT: out << "VK_SAMPLER_ADDRESS_MODE_REPEAT"; break;
-        case VK_SAMPLER_ADDRESS_MODE_MIRRORED_REPEAT: out << "VK_SAMPLER_ADDRESS_MODE_MIRRORED_REPEAT"; break;
-        case VK_SAMPLER_ADDRESS_MODE_CLAMP_TO_EDGE: out << "VK_SAMPLER_ADDRESS_MODE_CLAMP_TO_EDGE"; break;
-        case VK_SAMPLER_ADDRESS_MODE_CLAMP_TO_BORDER: out << "VK_SAMPLER_ADDRESS_MODE_CLAMP_TO_BORDER"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkBorderColor* value) {
+    uint32_t result;
+    if (!parseValue(sVkBorderColor, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkBorderColor) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkCompareOp& value) {
-    switch (value) {
-        case VK_COMPARE_OP_NEVER: out << "VK_COMPARE_OP_NEVER"; break;
-        case VK_COMPARE_OP_LESS: out << "VK_COMPARE_OP_LESS"; break;
-        case VK_COMPARE_OP_EQUAL: out << "VK_COMPARE_OP_EQUAL"; break;
-        case VK_COMPARE_OP_LESS_OR_EQUAL: out << "VK_COMPARE_OP_LESS_OR_EQUAL"; break;
-        case VK_COMPARE_OP_GREATER: out << "VK_COMPARE_OP_GREATER"; break;
-        case VK_COMPARE_OP_NOT_EQUAL: out << "VK_COMPARE_OP_NOT_EQUAL"; break;
-        case VK_COMPARE_OP_GREATER_OR_EQUAL: out << "VK_COMPARE_OP_GREATER_OR_EQUAL"; break;
-        case VK_COMPARE_OP_ALWAYS: out << "VK_COMPARE_OP_ALWAYS"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkPipelineBindPoint* value) {
+    uint32_t result;
+    if (!parseValue(sVkPipelineBindPoint, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkPipelineBindPoint) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkPolygonMode& value) {
-    switch (value) {
-        case VK_POLYGON_MODE_FILL: out << "VK_POLYGON_MODE_FILL"; break;
-        case VK_POLYGON_MODE_LINE: out << "VK_POLYGON_MODE_LINE"; break;
-        case VK_POLYGON_MODE_POINT: out << "VK_POLYGON_MODE_POINT"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkPipelineCacheHeaderVersion* value) {
+    uint32_t result;
+    if (!parseValue(sVkPipelineCacheHeaderVersion, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkPipelineCacheHeaderVersion) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkFrontFace& value) {
-    switch (value) {
-        case VK_FRONT_FACE_COUNTER_CLOCKWISE: out << "VK_FRONT_FACE_COUNTER_CLOCKWISE"; break;
-        case VK_FRONT_FACE_CLOCKWISE: out << "VK_FRONT_FACE_CLOCKWISE"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkPrimitiveTopology* value) {
+    uint32_t result;
+    if (!parseValue(sVkPrimitiveTopology, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkPrimitiveTopology) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkBlendFactor& value) {
-    switch (value) {
-        case VK_BLEND_FACTOR_ZERO: out << "VK_BLEND_FACTOR_ZERO"; break;
-        case VK_BLEND_FACTOR_ONE: out << "VK_BLEND_FACTOR_ONE"; break;
-        case VK_BLEND_FACTOR_SRC_COLOR: out << "VK_BLEND_FACTOR_SRC_COLOR"; break;
-        case VK_BLEND_FACTOR_ONE_MINUS_SRC_COLOR: out << "VK_BLEND_FACTOR_ONE_MINUS_SRC_COLOR"; break;
-        case VK_BLEND_FACTOR_DST_COLOR: out << "VK_BLEND_FACTOR_DST_COLOR"; break;
-        case VK_BLEND_FACTOR_ONE_MINUS_DST_COLOR: out << "VK_BLEND_FACTOR_ONE_MINUS_DST_COLOR"; break;
-        case VK_BLEND_FACTOR_SRC_ALPHA: out << "VK_BLEND_FACTOR_SRC_ALPHA"; break;
-        case VK_BLEND_FACTOR_ONE_MINUS_SRC_ALPHA: out << "VK_BLEND_FACTOR_ONE_MINUS_SRC_ALPHA"; break;
-        case VK_BLEND_FACTOR_DST_ALPHA: out << "VK_BLEND_FACTOR_DST_ALPHA"; break;
-        case VK_BLEND_FACTOR_ONE_MINUS_DST_ALPHA: out << "VK_BLEND_FACTOR_ONE_MINUS_DST_ALPHA"; break;
-        case VK_BLEND_FACTOR_CONSTANT_COLOR: out << "VK_BLEND_FACTOR_CONSTANT_COLOR"; break;
-        case VK_BLEND_FACTOR_ONE_MINUS_CONSTANT_COLOR: out << "VK_BLEND_FACTOR_ONE_MINUS_CONSTANT_COLOR"; break;
-        case VK_BLEND_FACTOR_CONSTANT_ALPHA: out << "VK_BLEND_FACTOR_CONSTANT_ALPHA"; break;
-        case VK_BLEND_FACTOR_ONE_MINUS_CONSTANT_ALPHA: out << "VK_BLEND_FACTOR_ONE_MINUS_CONSTANT_ALPHA"; break;
-        case VK_BLEND_FACTOR_SRC_ALPHA_SATURATE: out << "VK_BLEND_FACTOR_SRC_ALPHA_SATURATE"; break;
-        case VK_BLEND_FACTOR_SRC1_COLOR: out << "VK_BLEND_FACTOR_SRC1_COLOR"; break;
-        case VK_BLEND_FACTOR_ONE_MINUS_SRC1_COLOR: out << "VK_BLEND_FACTOR_ONE_MINUS_SRC1_COLOR"; break;
-        case VK_BLEND_FACTOR_SRC1_ALPHA: out << "VK_BLEND_FACTOR_SRC1_ALPHA"; break;
-        case VK_BLEND_FACTOR_ONE_MINUS_SRC1_ALPHA: out << "VK_BLEND_FACTOR_ONE_MINUS_SRC1_ALPHA"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkSharingMode* value) {
+    uint32_t result;
+    if (!parseValue(sVkSharingMode, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkSharingMode) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkBlendOp& value) {
-    switch (value) {
-        case VK_BLEND_OP_ADD: out << "VK_BLEND_OP_ADD"; break;
-        case VK_BLEND_OP_SUBTRACT: out << "VK_BLEND_OP_SUBTRACT"; break;
-        case VK_BLEND_OP_REVERSE_SUBTRACT: out << "VK_BLEND_OP_REVERSE_SUBTRACT"; break;
-        case VK_BLEND_OP_MIN: out << "VK_BLEND_OP_MIN"; break;
-        case VK_BLEND_OP_MAX: out << "VK_BLEND_OP_MAX"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkIndexType* value) {
+    uint32_t result;
+    if (!parseValue(sVkIndexType, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkIndexType) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkStencilOp& value) {
-    switch (value) {
-        case VK_STENCIL_OP_KEEP: out << "VK_STENCIL_OP_KEEP"; break;
-        case VK_STENCIL_OP_ZERO: out << "VK_STENCIL_OP_ZERO"; break;
-        case VK_STENCIL_OP_REPLACE: out << "VK_STENCIL_OP_REPLACE"; break;
-        case VK_STENCIL_OP_INCREMENT_AND_CLAMP: out << "VK_STENCIL_OP_INCREMENT_AND_CLAMP"; break;
-        case VK_STENCIL_OP_DECREMENT_AND_CLAMP: out << "VK_STENCIL_OP_DECREMENT_AND_CLAMP"; break;
-        case VK_STENCIL_OP_INVERT: out << "VK_STENCIL_OP_INVERT"; break;
-        case VK_STENCIL_OP_INCREMENT_AND_WRAP: out << "VK_STENCIL_OP_INCREMENT_AND_WRAP"; break;
-        case VK_STENCIL_OP_DECREMENT_AND_WRAP: out << "VK_STENCIL_OP_DECREMENT_AND_WRAP"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkFilter* value) {
+    uint32_t result;
+    if (!parseValue(sVkFilter, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkFilter) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkLogicOp& value) {
-    switch (value) {
-        case VK_LOGIC_OP_CLEAR: out << "VK_LOGIC_OP_CLEAR"; break;
-        case VK_LOGIC_OP_AND: out << "VK_LOGIC_OP_AND"; break;
-        case VK_LOGIC_OP_AND_REVERSE: out << "VK_LOGIC_OP_AND_REVERSE"; break;
-        case VK_LOGIC_OP_COPY: out << "VK_LOGIC_OP_COPY"; break;
-        case VK_LOGIC_OP_AND_INVERTED: out << "VK_LOGIC_OP_AND_INVERTED"; break;
-        case VK_LOGIC_OP_NO_OP: out << "VK_LOGIC_OP_NO_OP"; break;
-        case VK_LOGIC_OP_XOR: out << "VK_LOGIC_OP_XOR"; break;
-        case VK_LOGIC_OP_OR: out << "VK_LOGIC_OP_OR"; break;
-        case VK_LOGIC_OP_NOR: out << "VK_LOGIC_OP_NOR"; break;
-        case VK_LOGIC_OP_EQUIVALENT: out << "VK_LOGIC_OP_EQUIVALENT"; break;
-        case VK_LOGIC_OP_INVERT: out << "VK_LOGIC_OP_INVERT"; break;
-        case VK_LOGIC_OP_OR_REVERSE: out << "VK_LOGIC_OP_OR_REVERSE"; break;
-        case VK_LOGIC_OP_COPY_INVERTED: out << "VK_LOGIC_OP_COPY_INVERTED"; break;
-        case VK_LOGIC_OP_OR_INVERTED: out << "VK_LOGIC_OP_OR_INVERTED"; break;
-        case VK_LOGIC_OP_NAND: out << "VK_LOGIC_OP_NAND"; break;
-        case VK_LOGIC_OP_SET: out << "VK_LOGIC_OP_SET"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkSamplerMipmapMode* value) {
+    uint32_t result;
+    if (!parseValue(sVkSamplerMipmapMode, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkSamplerMipmapMode) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkInternalAllocationType& value) {
-    switch (value) {
-        case VK_INTERNAL_ALLOCATION_TYPE_EXECUTABLE: out << "VK_INTERNAL_ALLOCATION_TYPE_EXECUTABLE"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkSamplerAddressMode* value) {
+    uint32_t result;
+    if (!parseValue(sVkSamplerAddressMode, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkSamplerAddressMode) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkSystemAllocationScope& value) {
-    switch (value) {
-        case VK_SYSTEM_ALLOCATION_SCOPE_COMMAND: out << "VK_SYSTEM_ALLOCATION_SCOPE_COMMAND"; break;
-        case VK_SYSTEM_ALLOCATION_SCOPE_OBJECT: out << "VK_SYSTEM_ALLOCATION_SCOPE_OBJECT"; break;
-        case VK_SYSTEM_ALLOCATION_SCOPE_CACHE: out << "VK_SYSTEM_ALLOCATION_SCOPE_CACHE"; break;
-        case VK_SYSTEM_ALLOCATION_SCOPE_DEVICE: out << "VK_SYSTEM_ALLOCATION_SCOPE_DEVICE"; break;
-        case VK_SYSTEM_ALLOCATION_SCOPE_INSTANCE: out << "VK_SYSTEM_ALLOCATION_SCOPE_INSTANCE"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkCompareOp* value) {
+    uint32_t result;
+    if (!parseValue(sVkCompareOp, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkCompareOp) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkPhysicalDeviceType& value) {
-    switch (value) {
-        case VK_PHYSICAL_DEVICE_TYPE_OTHER: out << "VK_PHYSICAL_DEVICE_TYPE_OTHER"; break;
-        case VK_PHYSICAL_DEVICE_TYPE_INTEGRATED_GPU: out << "VK_PHYSICAL_DEVICE_TYPE_INTEGRATED_GPU"; break;
-        case VK_PHYSICAL_DEVICE_TYPE_DISCRETE_GPU: out << "VK_PHYSICAL_DEVICE_TYPE_DISCRETE_GPU"; break;
-        case VK_PHYSICAL_DEVICE_TYPE_VIRTUAL_GPU: out << "VK_PHYSICAL_DEVICE_TYPE_VIRTUAL_GPU"; break;
-        case VK_PHYSICAL_DEVICE_TYPE_CPU: out << "VK_PHYSICAL_DEVICE_TYPE_CPU"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkPolygonMode* value) {
+    uint32_t result;
+    if (!parseValue(sVkPolygonMode, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkPolygonMode) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkVertexInputRate& value) {
-    switch (value) {
-        case VK_VERTEX_INPUT_RATE_VERTEX: out << "VK_VERTEX_INPUT_RATE_VERTEX"; break;
-        case VK_VERTEX_INPUT_RATE_INSTANCE: out << "VK_VERTEX_INPUT_RATE_INSTANCE"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkFrontFace* value) {
+    uint32_t result;
+    if (!parseValue(sVkFrontFace, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkFrontFace) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkFormat& value) {
-    switch (value) {
-        case VK_FORMAT_UNDEFINED: out << "VK_FORMAT_UNDEFINED"; break;
-        case VK_FORMAT_R4G4_UNORM_PACK8: out << "VK_FORMAT_R4G4_UNORM_PACK8"; break;
-        case VK_FORMAT_R4G4B4A4_UNORM_PACK16: out << "VK_FORMAT_R4G4B4A4_UNORM_PACK16"; break;
-        case VK_FORMAT_B4G4R4A4_UNORM_PACK16: out << "VK_FORMAT_B4G4R4A4_UNORM_PACK16"; break;
-        case VK_FORMAT_R5G6B5_UNORM_PACK16: out << "VK_FORMAT_R5G6B5_UNORM_PACK16"; break;
-        case VK_FORMAT_B5G6R5_UNORM_PACK16: out << "VK_FORMAT_B5G6R5_UNORM_PACK16"; break;
-        case VK_FORMAT_R5G5B5A1_UNORM_PACK16: out << "VK_FORMAT_R5G5B5A1_UNORM_PACK16"; break;
-        case VK_FORMAT_B5G5R5A1_UNORM_PACK16: out << "VK_FORMAT_B5G5R5A1_UNORM_PACK16"; break;
-        case VK_FORMAT_A1R5G5B5_UNORM_PACK16: out << "VK_FORMAT_A1R5G5B5_UNORM_PACK16"; break;
-        case VK_FORMAT_R8_UNORM: out << "VK_FORMAT_R8_UNORM"; break;
-        case VK_FORMAT_R8_SNORM: out << "VK_FORMAT_R8_SNORM"; break;
-        case VK_FORMAT_R8_USCALED: out << "VK_FORMAT_R8_USCALED"; break;
-        case VK_FORMAT_R8_SSCALED: out << "VK_FORMAT_R8_SSCALED"; break;
-        case VK_FORMAT_R8_UINT: out << "VK_FORMAT_R8_UINT"; break;
-        case VK_FORMAT_R8_SINT: out << "VK_FORMAT_R8_SINT"; break;
-        case VK_FORMAT_R8_SRGB: out << "VK_FORMAT_R8_SRGB"; break;
-        case VK_FORMAT_R8G8_UNORM: out << "VK_FORMAT_R8G8_UNORM"; break;
-        case VK_FORMAT_R8G8_SNORM: out << "VK_FORMAT_R8G8_SNORM"; break;
-        case VK_FORMAT_R8G8_USCALED: out << "VK_FORMAT_R8G8_USCALED"; break;
-        case VK_FORMAT_R8G8_SSCALED: out << "VK_FORMAT_R8G8_SSCALED"; break;
-        case VK_FORMAT_R8G8_UINT: out << "VK_FORMAT_R8G8_UINT"; break;
-        case VK_FORMAT_R8G8_SINT: out << "VK_FORMAT_R8G8_SINT"; break;
-        case VK_FORMAT_R8G8_SRGB: out << "VK_FORMAT_R8G8_SRGB"; break;
-        case VK_FORMAT_R8G8B8_UNORM: out << "VK_FORMAT_R8G8B8_UNORM"; break;
-        case VK_FORMAT_R8G8B8_SNORM: out << "VK_FORMAT_R8G8B8_SNORM"; break;
-        case VK_FORMAT_R8G8B8_USCALED: out << "VK_FORMAT_R8G8B8_USCALED"; break;
-        case VK_FORMAT_R8G8B8_SSCALED: out << "VK_FORMAT_R8G8B8_SSCALED"; break;
-        case VK_FORMAT_R8G8B8_UINT: out << "VK_FORMAT_R8G8B8_UINT"; break;
-        case VK_FORMAT_R8G8B8_SINT: out << "VK_FORMAT_R8G8B8_SINT"; break;
-        case VK_FORMAT_R8G8B8_SRGB: out << "VK_FORMAT_R8G8B8_SRGB"; break;
-        case VK_FORMAT_B8G8R8_UNORM: out << "VK_FORMAT_B8G8R8_UNORM"; break;
-        case VK_FORMAT_B8G8R8_SNORM: out << "VK_FORMAT_B8G8R8_SNORM"; break;
-        case VK_FORMAT_B8G8R8_USCALED: out << "VK_FORMAT_B8G8R8_USCALED"; break;
-        case VK_FORMAT_B8G8R8_SSCALED: out << "VK_FORMAT_B8G8R8_SSCALED"; break;
-        case VK_FORMAT_B8G8R8_UINT: out << "VK_FORMAT_B8G8R8_UINT"; break;
-        case VK_FORMAT_B8G8R8_SINT: out << "VK_FORMAT_B8G8R8_SINT"; break;
-        case VK_FORMAT_B8G8R8_SRGB: out << "VK_FORMAT_B8G8R8_SRGB"; break;
-        case VK_FORMAT_R8G8B8A8_UNORM: out << "VK_FORMAT_R8G8B8A8_UNORM"; break;
-        case VK_FORMAT_R8G8B8A8_SNORM: out << "VK_FORMAT_R8G8B8A8_SNORM"; break;
-        case VK_FORMAT_R8G8B8A8_USCALED: out << "VK_FORMAT_R8G8B8A8_USCALED"; break;
-        case VK_FORMAT_R8G8B8A8_SSCALED: out << "VK_FORMAT_R8G8B8A8_SSCALED"; break;
-        case VK_FORMAT_R8G8B8A8_UINT: out << "VK_FORMAT_R8G8B8A8_UINT"; break;
-        case VK_FORMAT_R8G8B8A8_SINT: out << "VK_FORMAT_R8G8B8A8_SINT"; break;
-        case VK_FORMAT_R8G8B8A8_SRGB: out << "VK_FORMAT_R8G8B8A8_SRGB"; break;
-        case VK_FORMAT_B8G8R8A8_UNORM: out << "VK_FORMAT_B8G8R8A8_UNORM"; break;
-        case VK_FORMAT_B8G8R8A8_SNORM: out << "VK_FORMAT_B8G8R8A8_SNORM"; break;
-        case VK_FORMAT_B8G8R8A8_USCALED: out << "VK_FORMAT_B8G8R8A8_USCALED"; break;
-        case VK_FORMAT_B8G8R8A8_SSCALED: out << "VK_FORMAT_B8G8R8A8_SSCALED"; break;
-        case VK_FORMAT_B8G8R8A8_UINT: out << "VK_FORMAT_B8G8R8A8_UINT"; break;
-        case VK_FORMAT_B8G8R8A8_SINT: out << "VK_FORMAT_B8G8R8A8_SINT"; break;
-        case VK_FORMAT_B8G8R8A8_SRGB: out << "VK_FORMAT_B8G8R8A8_SRGB"; break;
-        case VK_FORMAT_A8B8G8R8_UNORM_PACK32: out << "VK_FORMAT_A8B8G8R8_UNORM_PACK32"; break;
-        case VK_FORMAT_A8B8G8R8_SNORM_PACK32: out << "VK_FORMAT_A8B8G8R8_SNORM_PACK32"; break;
-        case VK_FORMAT_A8B8G8R8_USCALED_PACK32: out << "VK_FORMAT_A8B8G8R8_USCALED_PACK32"; break;
-        case VK_FORMAT_A8B8G8R8_SSCALED_PACK32: out << "VK_FORMAT_A8B8G8R8_SSCALED_PACK32"; break;
-        case VK_FORMAT_A8B8G8R8_UINT_PACK32: out << "VK_FORMAT_A8B8G8R8_UINT_PACK32"; break;
-        case VK_FORMAT_A8B8G8R8_SINT_PACK32: out << "VK_FORMAT_A8B8G8R8_SINT_PACK32"; break;
-        case VK_FORMAT_A8B8G8R8_SRGB_PACK32: out << "VK_FORMAT_A8B8G8R8_SRGB_PACK32"; break;
-        case VK_FORMAT_A2R10G10B10_UNORM_PACK32: out << "VK_FORMAT_A2R10G10B10_UNORM_PACK32"; break;
-        case VK_FORMAT_A2R10G10B10_SNORM_PACK32: out << "VK_FORMAT_A2R10G10B10_SNORM_PACK32"; break;
-        case VK_FORMAT_A2R10G10B10_USCALED_PACK32: out << "VK_FORMAT_A2R10G10B10_USCALED_PACK32"; break;
-        case VK_FORMAT_A2R10G10B10_SSCALED_PACK32: out << "VK_FORMAT_A2R10G10B10_SSCALED_PACK32"; break;
-        case VK_FORMAT_A2R10G10B10_UINT_PACK32: out << "VK_FORMAT_A2R10G10B10_UINT_PACK32"; break;
-        case VK_FORMAT_A2R10G10B10_SINT_PACK32: out << "VK_FORMAT_A2R10G10B10_SINT_PACK32"; break;
-        case VK_FORMAT_A2B10G10R10_UNORM_PACK32: out << "VK_FORMAT_A2B10G10R10_UNORM_PACK32"; break;
-        case VK_FORMAT_A2B10G10R10_SNORM_PACK32: out << "VK_FORMAT_A2B10G10R10_SNORM_PACK32"; break;
-        case VK_FORMAT_A2B10G10R10_USCALED_PACK32: out << "VK_FORMAT_A2B10G10R10_USCALED_PACK32"; break;
-        case VK_FORMAT_A2B10G10R10_SSCALED_PACK32: out << "VK_FORMAT_A2B10G10R10_SSCALED_PACK32"; break;
-        case VK_FORMAT_A2B10G10R10_UINT_PACK32: out << "VK_FORMAT_A2B10G10R10_UINT_PACK32"; break;
-        case VK_FORMAT_A2B10G10R10_SINT_PACK32: out << "VK_FORMAT_A2B10G10R10_SINT_PACK32"; break;
-        case VK_FORMAT_R16_UNORM: out << "VK_FORMAT_R16_UNORM"; break;
-        case VK_FORMAT_R16_SNORM: out << "VK_FORMAT_R16_SNORM"; break;
-        case VK_FORMAT_R16_USCALED: out << "VK_FORMAT_R16_USCALED"; break;
-        case VK_FORMAT_R16_SSCALED: out << "VK_FORMAT_R16_SSCALED"; break;
-        case VK_FORMAT_R16_UINT: out << "VK_FORMAT_R16_UINT"; break;
-        case VK_FORMAT_R16_SINT: out << "VK_FORMAT_R16_SINT"; break;
-        case VK_FORMAT_R16_SFLOAT: out << "VK_FORMAT_R16_SFLOAT"; break;
-        case VK_FORMAT_R16G16_UNORM: out << "VK_FORMAT_R16G16_UNORM"; break;
-        case VK_FORMAT_R16G16_SNORM: out << "VK_FORMAT_R16G16_SNORM"; break;
-        case VK_FORMAT_R16G16_USCALED: out << "VK_FORMAT_R16G16_USCALED"; break;
-        case VK_FORMAT_R16G16_SSCALED: out << "VK_FORMAT_R16G16_SSCALED"; break;
-        case VK_FORMAT_R16G16_UINT: out << "VK_FORMAT_R16G16_UINT"; break;
-        case VK_FORMAT_R16G16_SINT: out << "VK_FORMAT_R16G16_SINT"; break;
-        case VK_FORMAT_R16G16_SFLOAT: out << "VK_FORMAT_R16G16_SFLOAT"; break;
-        case VK_FORMAT_R16G16B16_UNORM: out << "VK_FORMAT_R16G16B16_UNORM"; break;
-        case VK_FORMAT_R16G16B16_SNORM: out << "VK_FORMAT_R16G16B16_SNORM"; break;
-        case VK_FORMAT_R16G16B16_USCALED: out << "VK_FORMAT_R16G16B16_USCALED"; break;
-        case VK_FORMAT_R16G16B16_SSCALED: out << "VK_FORMAT_R16G16B16_SSCALED"; break;
-        case VK_FORMAT_R16G16B16_UINT: out << "VK_FORMAT_R16G16B16_UINT"; break;
-        case VK_FORMAT_R16G16B16_SINT: out << "VK_FORMAT_R16G16B16_SINT"; break;
-        case VK_FORMAT_R16G16B16_SFLOAT: out << "VK_FORMAT_R16G16B16_SFLOAT"; break;
-        case VK_FORMAT_R16G16B16A16_UNORM: out << "VK_FORMAT_R16G16B16A16_UNORM"; break;
-        case VK_FORMAT_R16G16B16A16_SNORM: out << "VK_FORMAT_R16G16B16A16_SNORM"; break;
-        case VK_FORMAT_R16G16B16A16_USCALED: out << "VK_FORMAT_R16G16B16A16_USCALED"; break;
-        case VK_FORMAT_R16G16B16A16_SSCALED: out << "VK_FORMAT_R16G16B16A16_SSCALED"; break;
-        case VK_FORMAT_R16G16B16A16_UINT: out << "VK_FORMAT_R16G16B16A16_UINT"; break;
-        case VK_FORMAT_R16G16B16A16_SINT: out << "VK_FORMAT_R16G16B16A16_SINT"; break;
-        case VK_FORMAT_R16G16B16A16_SFLOAT: out << "VK_FORMAT_R16G16B16A16_SFLOAT"; break;
-        case VK_FORMAT_R32_UINT: out << "VK_FORMAT_R32_UINT"; break;
-        case VK_FORMAT_R32_SINT: out << "VK_FORMAT_R32_SINT"; break;
-        case VK_FORMAT_R32_SFLOAT: out << "VK_FORMAT_R32_SFLOAT"; break;
-        case VK_FORMAT_R32G32_UINT: out << "VK_FORMAT_R32G32_UINT"; break;
-        case VK_FORMAT_R32G32_SINT: out << "VK_FORMAT_R32G32_SINT"; break;
-        case VK_FORMAT_R32G32_SFLOAT: out << "VK_FORMAT_R32G32_SFLOAT"; break;
-        case VK_FORMAT_R32G32B32_UINT: out << "VK_FORMAT_R32G32B32_UINT"; break;
-        case VK_FORMAT_R32G32B32_SINT: out << "VK_FORMAT_R32G32B32_SINT"; break;
-        case VK_FORMAT_R32G32B32_SFLOAT: out << "VK_FORMAT_R32G32B32_SFLOAT"; break;
-        case VK_FORMAT_R32G32B32A32_UINT: out << "VK_FORMAT_R32G32B32A32_UINT"; break;
-        case VK_FORMAT_R32G32B32A32_SINT: out << "VK_FORMAT_R32G32B32A32_SINT"; break;
-        case VK_FORMAT_R32G32B32A32_SFLOAT: out << "VK_FORMAT_R32G32B32A32_SFLOAT"; break;
-        case VK_FORMAT_R64_UINT: out << "VK_FORMAT_R64_UINT"; break;
-        case VK_FORMAT_R64_SINT: out << "VK_FORMAT_R64_SINT"; break;
-        case VK_FORMAT_R64_SFLOAT: out << "VK_FORMAT_R64_SFLOAT"; break;
-        case VK_FORMAT_R64G64_UINT: out << "VK_FORMAT_R64G64_UINT"; break;
-        case VK_FORMAT_R64G64_SINT: out << "VK_FORMAT_R64G64_SINT"; break;
-        case VK_FORMAT_R64G64_SFLOAT: out << "VK_FORMAT_R64G64_SFLOAT"; break;
-        case VK_FORMAT_R64G64B64_UINT: out << "VK_FORMAT_R64G64B64_UINT"; break;
-        case VK_FORMAT_R64G64B64_SINT: out << "VK_FORMAT_R64G64B64_SINT"; break;
-        case VK_FORMAT_R64G64B64_SFLOAT: out << "VK_FORMAT_R64G64B64_SFLOAT"; break;
-        case VK_FORMAT_R64G64B64A64_UINT: out << "VK_FORMAT_R64G64B64A64_UINT"; break;
-        case VK_FORMAT_R64G64B64A64_SINT: out << "VK_FORMAT_R64G64B64A64_SINT"; break;
-        case VK_FORMAT_R64G64B64A64_SFLOAT: out << "VK_FORMAT_R64G64B64A64_SFLOAT"; break;
-        case VK_FORMAT_B10G11R11_UFLOAT_PACK32: out << "VK_FORMAT_B10G11R11_UFLOAT_PACK32"; break;
-        case VK_FORMAT_E5B9G9R9_UFLOAT_PACK32: out << "VK_FORMAT_E5B9G9R9_UFLOAT_PACK32"; break;
-        case VK_FORMAT_D16_UNORM: out << "VK_FORMAT_D16_UNORM"; break;
-        case VK_FORMAT_X8_D24_UNORM_PACK32: out << "VK_FORMAT_X8_D24_UNORM_PACK32"; break;
-        case VK_FORMAT_D32_SFLOAT: out << "VK_FORMAT_D32_SFLOAT"; break;
-        case VK_FORMAT_S8_UINT: out << "VK_FORMAT_S8_UINT"; break;
-        case VK_FORMAT_D16_UNORM_S8_UINT: out << "VK_FORMAT_D16_UNORM_S8_UINT"; break;
-        case VK_FORMAT_D24_UNORM_S8_UINT: out << "VK_FORMAT_D24_UNORM_S8_UINT"; break;
-        case VK_FORMAT_D32_SFLOAT_S8_UINT: out << "VK_FORMAT_D32_SFLOAT_S8_UINT"; break;
-        case VK_FORMAT_BC1_RGB_UNORM_BLOCK: out << "VK_FORMAT_BC1_RGB_UNORM_BLOCK"; break;
-        case VK_FORMAT_BC1_RGB_SRGB_BLOCK: out << "VK_FORMAT_BC1_RGB_SRGB_BLOCK"; break;
-        case VK_FORMAT_BC1_RGBA_UNORM_BLOCK: out << "VK_FORMAT_BC1_RGBA_UNORM_BLOCK"; break;
-        case VK_FORMAT_BC1_RGBA_SRGB_BLOCK: out << "VK_FORMAT_BC1_RGBA_SRGB_BLOCK"; break;
-        case VK_FORMAT_BC2_UNORM_BLOCK: out << "VK_FORMAT_BC2_UNORM_BLOCK"; break;
-        case VK_FORMAT_BC2_SRGB_BLOCK: out << "VK_FORMAT_BC2_SRGB_BLOCK"; break;
-        case VK_FORMAT_BC3_UNORM_BLOCK: out << "VK_FORMAT_BC3_UNORM_BLOCK"; break;
-        case VK_FORMAT_BC3_SRGB_BLOCK: out << "VK_FORMAT_BC3_SRGB_BLOCK"; break;
-        case VK_FORMAT_BC4_UNORM_BLOCK: out << "VK_FORMAT_BC4_UNORM_BLOCK"; break;
-        case VK_FORMAT_BC4_SNORM_BLOCK: out << "VK_FORMAT_BC4_SNORM_BLOCK"; break;
-        case VK_FORMAT_BC5_UNORM_BLOCK: out << "VK_FORMAT_BC5_UNORM_BLOCK"; break;
-        case VK_FORMAT_BC5_SNORM_BLOCK: out << "VK_FORMAT_BC5_SNORM_BLOCK"; break;
-        case VK_FORMAT_BC6H_UFLOAT_BLOCK: out << "VK_FORMAT_BC6H_UFLOAT_BLOCK"; break;
-        case VK_FORMAT_BC6H_SFLOAT_BLOCK: out << "VK_FORMAT_BC6H_SFLOAT_BLOCK"; break;
-        case VK_FORMAT_BC7_UNORM_BLOCK: out << "VK_FORMAT_BC7_UNORM_BLOCK"; break;
-        case VK_FORMAT_BC7_SRGB_BLOCK: out << "VK_FORMAT_BC7_SRGB_BLOCK"; break;
-        case VK_FORMAT_ETC2_R8G8B8_UNORM_BLOCK: out << "VK_FORMAT_ETC2_R8G8B8_UNORM_BLOCK"; break;
-        case VK_FORMAT_ETC2_R8G8B8_SRGB_BLOCK: out << "VK_FORMAT_ETC2_R8G8B8_SRGB_BLOCK"; break;
-        case VK_FORMAT_ETC2_R8G8B8A1_UNORM_BLOCK: out << "VK_FORMAT_ETC2_R8G8B8A1_UNORM_BLOCK"; break;
-        case VK_FORMAT_ETC2_R8G8B8A1_SRGB_BLOCK: out << "VK_FORMAT_ETC2_R8G8B8A1_SRGB_BLOCK"; break;
-        case VK_FORMAT_ETC2_R8G8B8A8_UNORM_BLOCK: out << "VK_FORMAT_ETC2_R8G8B8A8_UNORM_BLOCK"; break;
-        case VK_FORMAT_ETC2_R8G8B8A8_SRGB_BLOCK: out << "VK_FORMAT_ETC2_R8G8B8A8_SRGB_BLOCK"; break;
-        case VK_FORMAT_EAC_R11_UNORM_BLOCK: out << "VK_FORMAT_EAC_R11_UNORM_BLOCK"; break;
-        case VK_FORMAT_EAC_R11_SNORM_BLOCK: out << "VK_FORMAT_EAC_R11_SNORM_BLOCK"; break;
-        case VK_FORMAT_EAC_R11G11_UNORM_BLOCK: out << "VK_FORMAT_EAC_R11G11_UNORM_BLOCK"; break;
-        case VK_FORMAT_EAC_R11G11_SNORM_BLOCK: out << "VK_FORMAT_EAC_R11G11_SNORM_BLOCK"; break;
-        case VK_FORMAT_ASTC_4x4_UNORM_BLOCK: out << "VK_FORMAT_ASTC_4x4_UNORM_BLOCK"; break;
-        case VK_FORMAT_ASTC_4x4_SRGB_BLOCK: out << "VK_FORMAT_ASTC_4x4_SRGB_BLOCK"; break;
-        case VK_FORMAT_ASTC_5x4_UNORM_BLOCK: out << "VK_FORMAT_ASTC_5x4_UNORM_BLOCK"; break;
-        case VK_FORMAT_ASTC_5x4_SRGB_BLOCK: out << "VK_FORMAT_ASTC_5x4_SRGB_BLOCK"; break;
-        case VK_FORMAT_ASTC_5x5_UNORM_BLOCK: out << "VK_FORMAT_ASTC_5x5_UNORM_BLOCK"; break;
-        case VK_FORMAT_ASTC_5x5_SRGB_BLOCK: out << "VK_FORMAT_ASTC_5x5_SRGB_BLOCK"; break;
-        case VK_FORMAT_ASTC_6x5_UNORM_BLOCK: out << "VK_FORMAT_ASTC_6x5_UNORM_BLOCK"; break;
-        case VK_FORMAT_ASTC_6x5_SRGB_BLOCK: out << "VK_FORMAT_ASTC_6x5_SRGB_BLOCK"; break;
-        case VK_FORMAT_ASTC_6x6_UNORM_BLOCK: out << "VK_FORMAT_ASTC_6x6_UNORM_BLOCK"; break;
-        case VK_FORMAT_ASTC_6x6_SRGB_BLOCK: out << "VK_FORMAT_ASTC_6x6_SRGB_BLOCK"; break;
-        case VK_FORMAT_ASTC_8x5_UNORM_BLOCK: out << "VK_FORMAT_ASTC_8x5_UNORM_BLOCK"; break;
-        case VK_FORMAT_ASTC_8x5_SRGB_BLOCK: out << "VK_FORMAT_ASTC_8x5_SRGB_BLOCK"; break;
-        case VK_FORMAT_ASTC_8x6_UNORM_BLOCK: out << "VK_FORMAT_ASTC_8x6_UNORM_BLOCK"; break;
-        case VK_FORMAT_ASTC_8x6_SRGB_BLOCK: out << "VK_FORMAT_ASTC_8x6_SRGB_BLOCK"; break;
-        case VK_FORMAT_ASTC_8x8_UNORM_BLOCK: out << "VK_FORMAT_ASTC_8x8_UNORM_BLOCK"; break;
-        case VK_FORMAT_ASTC_8x8_SRGB_BLOCK: out << "VK_FORMAT_ASTC_8x8_SRGB_BLOCK"; break;
-        case VK_FORMAT_ASTC_10x5_UNORM_BLOCK: out << "VK_FORMAT_ASTC_10x5_UNORM_BLOCK"; break;
-        case VK_FORMAT_ASTC_10x5_SRGB_BLOCK: out << "VK_FORMAT_ASTC_10x5_SRGB_BLOCK"; break;
-        case VK_FORMAT_ASTC_10x6_UNORM_BLOCK: out << "VK_FORMAT_ASTC_10x6_UNORM_BLOCK"; break;
-        case VK_FORMAT_ASTC_10x6_SRGB_BLOCK: out << "VK_FORMAT_ASTC_10x6_SRGB_BLOCK"; break;
-        case VK_FORMAT_ASTC_10x8_UNORM_BLOCK: out << "VK_FORMAT_ASTC_10x8_UNORM_BLOCK"; break;
-        case VK_FORMAT_ASTC_10x8_SRGB_BLOCK: out << "VK_FORMAT_ASTC_10x8_SRGB_BLOCK"; break;
-        case VK_FORMAT_ASTC_10x10_UNORM_BLOCK: out << "VK_FORMAT_ASTC_10x10_UNORM_BLOCK"; break;
-        case VK_FORMAT_ASTC_10x10_SRGB_BLOCK: out << "VK_FORMAT_ASTC_10x10_SRGB_BLOCK"; break;
-        case VK_FORMAT_ASTC_12x10_UNORM_BLOCK: out << "VK_FORMAT_ASTC_12x10_UNORM_BLOCK"; break;
-        case VK_FORMAT_ASTC_12x10_SRGB_BLOCK: out << "VK_FORMAT_ASTC_12x10_SRGB_BLOCK"; break;
-        case VK_FORMAT_ASTC_12x12_UNORM_BLOCK: out << "VK_FORMAT_ASTC_12x12_UNORM_BLOCK"; break;
-        case VK_FORMAT_ASTC_12x12_SRGB_BLOCK: out << "VK_FORMAT_ASTC_12x12_SRGB_BLOCK"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkBlendFactor* value) {
+    uint32_t result;
+    if (!parseValue(sVkBlendFactor, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkBlendFactor) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkStructureType& value) {
-    switch (value) {
-        case VK_STRUCTURE_TYPE_APPLICATION_INFO: out << "VK_STRUCTURE_TYPE_APPLICATION_INFO"; break;
-        case VK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_DEVICE_QUEUE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_DEVICE_QUEUE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_SUBMIT_INFO: out << "VK_STRUCTURE_TYPE_SUBMIT_INFO"; break;
-        case VK_STRUCTURE_TYPE_MEMORY_ALLOCATE_INFO: out << "VK_STRUCTURE_TYPE_MEMORY_ALLOCATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_MAPPED_MEMORY_RANGE: out << "VK_STRUCTURE_TYPE_MAPPED_MEMORY_RANGE"; break;
-        case VK_STRUCTURE_TYPE_BIND_SPARSE_INFO: out << "VK_STRUCTURE_TYPE_BIND_SPARSE_INFO"; break;
-        case VK_STRUCTURE_TYPE_FENCE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_FENCE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_SEMAPHORE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_SEMAPHORE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_EVENT_CREATE_INFO: out << "VK_STRUCTURE_TYPE_EVENT_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_QUERY_POOL_CREATE_INFO: out << "VK_STRUCTURE_TYPE_QUERY_POOL_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_BUFFER_CREATE_INFO: out << "VK_STRUCTURE_TYPE_BUFFER_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_BUFFER_VIEW_CREATE_INFO: out << "VK_STRUCTURE_TYPE_BUFFER_VIEW_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_IMAGE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_IMAGE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_IMAGE_VIEW_CREATE_INFO: out << "VK_STRUCTURE_TYPE_IMAGE_VIEW_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_SHADER_MODULE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_SHADER_MODULE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_PIPELINE_CACHE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_PIPELINE_CACHE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_PIPELINE_VERTEX_INPUT_STATE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_PIPELINE_VERTEX_INPUT_STATE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_PIPELINE_INPUT_ASSEMBLY_STATE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_PIPELINE_INPUT_ASSEMBLY_STATE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_PIPELINE_TESSELLATION_STATE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_PIPELINE_TESSELLATION_STATE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_STATE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_STATE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_PIPELINE_MULTISAMPLE_STATE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_PIPELINE_MULTISAMPLE_STATE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_PIPELINE_DEPTH_STENCIL_STATE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_PIPELINE_DEPTH_STENCIL_STATE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_PIPELINE_COLOR_BLEND_STATE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_PIPELINE_COLOR_BLEND_STATE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_PIPELINE_DYNAMIC_STATE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_PIPELINE_DYNAMIC_STATE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_COMPUTE_PIPELINE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_COMPUTE_PIPELINE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_PIPELINE_LAYOUT_CREATE_INFO: out << "VK_STRUCTURE_TYPE_PIPELINE_LAYOUT_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_SAMPLER_CREATE_INFO: out << "VK_STRUCTURE_TYPE_SAMPLER_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_CREATE_INFO: out << "VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_DESCRIPTOR_POOL_CREATE_INFO: out << "VK_STRUCTURE_TYPE_DESCRIPTOR_POOL_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_DESCRIPTOR_SET_ALLOCATE_INFO: out << "VK_STRUCTURE_TYPE_DESCRIPTOR_SET_ALLOCATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET: out << "VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET"; break;
-        case VK_STRUCTURE_TYPE_COPY_DESCRIPTOR_SET: out << "VK_STRUCTURE_TYPE_COPY_DESCRIPTOR_SET"; break;
-        case VK_STRUCTURE_TYPE_FRAMEBUFFER_CREATE_INFO: out << "VK_STRUCTURE_TYPE_FRAMEBUFFER_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_RENDER_PASS_CREATE_INFO: out << "VK_STRUCTURE_TYPE_RENDER_PASS_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_COMMAND_POOL_CREATE_INFO: out << "VK_STRUCTURE_TYPE_COMMAND_POOL_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_COMMAND_BUFFER_ALLOCATE_INFO: out << "VK_STRUCTURE_TYPE_COMMAND_BUFFER_ALLOCATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_INFO: out << "VK_STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_INFO"; break;
-        case VK_STRUCTURE_TYPE_COMMAND_BUFFER_BEGIN_INFO: out << "VK_STRUCTURE_TYPE_COMMAND_BUFFER_BEGIN_INFO"; break;
-        case VK_STRUCTURE_TYPE_RENDER_PASS_BEGIN_INFO: out << "VK_STRUCTURE_TYPE_RENDER_PASS_BEGIN_INFO"; break;
-        case VK_STRUCTURE_TYPE_BUFFER_MEMORY_BARRIER: out << "VK_STRUCTURE_TYPE_BUFFER_MEMORY_BARRIER"; break;
-        case VK_STRUCTURE_TYPE_IMAGE_MEMORY_BARRIER: out << "VK_STRUCTURE_TYPE_IMAGE_MEMORY_BARRIER"; break;
-        case VK_STRUCTURE_TYPE_MEMORY_BARRIER: out << "VK_STRUCTURE_TYPE_MEMORY_BARRIER"; break;
-        case VK_STRUCTURE_TYPE_LOADER_INSTANCE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_LOADER_INSTANCE_CREATE_INFO"; break;
-        case VK_STRUCTURE_TYPE_LOADER_DEVICE_CREATE_INFO: out << "VK_STRUCTURE_TYPE_LOADER_DEVICE_CREATE_INFO"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkBlendOp* value) {
+    uint32_t result;
+    if (!parseValue(sVkBlendOp, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkBlendOp) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkSubpassContents& value) {
-    switch (value) {
-        case VK_SUBPASS_CONTENTS_INLINE: out << "VK_SUBPASS_CONTENTS_INLINE"; break;
-        case VK_SUBPASS_CONTENTS_SECONDARY_COMMAND_BUFFERS: out << "VK_SUBPASS_CONTENTS_SECONDARY_COMMAND_BUFFERS"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkStencilOp* value) {
+    uint32_t result;
+    if (!parseValue(sVkStencilOp, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkStencilOp) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkResult& value) {
-    switch (value) {
-        case VK_SUCCESS: out << "VK_SUCCESS"; break;
-        case VK_NOT_READY: out << "VK_NOT_READY"; break;
-        case VK_TIMEOUT: out << "VK_TIMEOUT"; break;
-        case VK_EVENT_SET: out << "VK_EVENT_SET"; break;
-        case VK_EVENT_RESET: out << "VK_EVENT_RESET"; break;
-        case VK_INCOMPLETE: out << "VK_INCOMPLETE"; break;
-        case VK_ERROR_OUT_OF_HOST_MEMORY: out << "VK_ERROR_OUT_OF_HOST_MEMORY"; break;
-        case VK_ERROR_OUT_OF_DEVICE_MEMORY: out << "VK_ERROR_OUT_OF_DEVICE_MEMORY"; break;
-        case VK_ERROR_INITIALIZATION_FAILED: out << "VK_ERROR_INITIALIZATION_FAILED"; break;
-        case VK_ERROR_DEVICE_LOST: out << "VK_ERROR_DEVICE_LOST"; break;
-        case VK_ERROR_MEMORY_MAP_FAILED: out << "VK_ERROR_MEMORY_MAP_FAILED"; break;
-        case VK_ERROR_LAYER_NOT_PRESENT: out << "VK_ERROR_LAYER_NOT_PRESENT"; break;
-        case VK_ERROR_EXTENSION_NOT_PRESENT: out << "VK_ERROR_EXTENSION_NOT_PRESENT"; break;
-        case VK_ERROR_FEATURE_NOT_PRESENT: out << "VK_ERROR_FEATURE_NOT_PRESENT"; break;
-        case VK_ERROR_INCOMPATIBLE_DRIVER: out << "VK_ERROR_INCOMPATIBLE_DRIVER"; break;
-        case VK_ERROR_TOO_MANY_OBJECTS: out << "VK_ERROR_TOO_MANY_OBJECTS"; break;
-        case VK_ERROR_FORMAT_NOT_SUPPORTED: out << "VK_ERROR_FORMAT_NOT_SUPPORTED"; break;
-        case VK_ERROR_FRAGMENTED_POOL: out << "VK_ERROR_FRAGMENTED_POOL"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkLogicOp* value) {
+    uint32_t result;
+    if (!parseValue(sVkLogicOp, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkLogicOp) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkDynamicState& value) {
-    switch (value) {
-        case VK_DYNAMIC_STATE_VIEWPORT: out << "VK_DYNAMIC_STATE_VIEWPORT"; break;
-        case VK_DYNAMIC_STATE_SCISSOR: out << "VK_DYNAMIC_STATE_SCISSOR"; break;
-        case VK_DYNAMIC_STATE_LINE_WIDTH: out << "VK_DYNAMIC_STATE_LINE_WIDTH"; break;
-        case VK_DYNAMIC_STATE_DEPTH_BIAS: out << "VK_DYNAMIC_STATE_DEPTH_BIAS"; break;
-        case VK_DYNAMIC_STATE_BLEND_CONSTANTS: out << "VK_DYNAMIC_STATE_BLEND_CONSTANTS"; break;
-        case VK_DYNAMIC_STATE_DEPTH_BOUNDS: out << "VK_DYNAMIC_STATE_DEPTH_BOUNDS"; break;
-        case VK_DYNAMIC_STATE_STENCIL_COMPARE_MASK: out << "VK_DYNAMIC_STATE_STENCIL_COMPARE_MASK"; break;
-        case VK_DYNAMIC_STATE_STENCIL_WRITE_MASK: out << "VK_DYNAMIC_STATE_STENCIL_WRITE_MASK"; break;
-        case VK_DYNAMIC_STATE_STENCIL_REFERENCE: out << "VK_DYNAMIC_STATE_STENCIL_REFERENCE"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkInternalAllocationType* value) {
+    uint32_t result;
+    if (!parseValue(sVkInternalAllocationType, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkInternalAllocationType) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkDescriptorUpdateTemplateType& value) {
-    switch (value) {
-        case VK_DESCRIPTOR_UPDATE_TEMPLATE_TYPE_DESCRIPTOR_SET: out << "VK_DESCRIPTOR_UPDATE_TEMPLATE_TYPE_DESCRIPTOR_SET"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkSystemAllocationScope* value) {
+    uint32_t result;
+    if (!parseValue(sVkSystemAllocationScope, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkSystemAllocationScope) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkObjectType& value) {
-    switch (value) {
-        case VK_OBJECT_TYPE_UNKNOWN: out << "VK_OBJECT_TYPE_UNKNOWN"; break;
-        case VK_OBJECT_TYPE_INSTANCE: out << "VK_OBJECT_TYPE_INSTANCE"; break;
-        case VK_OBJECT_TYPE_PHYSICAL_DEVICE: out << "VK_OBJECT_TYPE_PHYSICAL_DEVICE"; break;
-        case VK_OBJECT_TYPE_DEVICE: out << "VK_OBJECT_TYPE_DEVICE"; break;
-        case VK_OBJECT_TYPE_QUEUE: out << "VK_OBJECT_TYPE_QUEUE"; break;
-        case VK_OBJECT_TYPE_SEMAPHORE: out << "VK_OBJECT_TYPE_SEMAPHORE"; break;
-        case VK_OBJECT_TYPE_COMMAND_BUFFER: out << "VK_OBJECT_TYPE_COMMAND_BUFFER"; break;
-        case VK_OBJECT_TYPE_FENCE: out << "VK_OBJECT_TYPE_FENCE"; break;
-        case VK_OBJECT_TYPE_DEVICE_MEMORY: out << "VK_OBJECT_TYPE_DEVICE_MEMORY"; break;
-        case VK_OBJECT_TYPE_BUFFER: out << "VK_OBJECT_TYPE_BUFFER"; break;
-        case VK_OBJECT_TYPE_IMAGE: out << "VK_OBJECT_TYPE_IMAGE"; break;
-        case VK_OBJECT_TYPE_EVENT: out << "VK_OBJECT_TYPE_EVENT"; break;
-        case VK_OBJECT_TYPE_QUERY_POOL: out << "VK_OBJECT_TYPE_QUERY_POOL"; break;
-        case VK_OBJECT_TYPE_BUFFER_VIEW: out << "VK_OBJECT_TYPE_BUFFER_VIEW"; break;
-        case VK_OBJECT_TYPE_IMAGE_VIEW: out << "VK_OBJECT_TYPE_IMAGE_VIEW"; break;
-        case VK_OBJECT_TYPE_SHADER_MODULE: out << "VK_OBJECT_TYPE_SHADER_MODULE"; break;
-        case VK_OBJECT_TYPE_PIPELINE_CACHE: out << "VK_OBJECT_TYPE_PIPELINE_CACHE"; break;
-        case VK_OBJECT_TYPE_PIPELINE_LAYOUT: out << "VK_OBJECT_TYPE_PIPELINE_LAYOUT"; break;
-        case VK_OBJECT_TYPE_RENDER_PASS: out << "VK_OBJECT_TYPE_RENDER_PASS"; break;
-        case VK_OBJECT_TYPE_PIPELINE: out << "VK_OBJECT_TYPE_PIPELINE"; break;
-        case VK_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT: out << "VK_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT"; break;
-        case VK_OBJECT_TYPE_SAMPLER: out << "VK_OBJECT_TYPE_SAMPLER"; break;
-        case VK_OBJECT_TYPE_DESCRIPTOR_POOL: out << "VK_OBJECT_TYPE_DESCRIPTOR_POOL"; break;
-        case VK_OBJECT_TYPE_DESCRIPTOR_SET: out << "VK_OBJECT_TYPE_DESCRIPTOR_SET"; break;
-        case VK_OBJECT_TYPE_FRAMEBUFFER: out << "VK_OBJECT_TYPE_FRAMEBUFFER"; break;
-        case VK_OBJECT_TYPE_COMMAND_POOL: out << "VK_OBJECT_TYPE_COMMAND_POOL"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkPhysicalDeviceType* value) {
+    uint32_t result;
+    if (!parseValue(sVkPhysicalDeviceType, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkPhysicalDeviceType) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkPresentModeKHR& value) {
-    switch (value) {
-        case VK_PRESENT_MODE_IMMEDIATE_KHR: out << "VK_PRESENT_MODE_IMMEDIATE_KHR"; break;
-        case VK_PRESENT_MODE_MAILBOX_KHR: out << "VK_PRESENT_MODE_MAILBOX_KHR"; break;
-        case VK_PRESENT_MODE_FIFO_KHR: out << "VK_PRESENT_MODE_FIFO_KHR"; break;
-        case VK_PRESENT_MODE_FIFO_RELAXED_KHR: out << "VK_PRESENT_MODE_FIFO_RELAXED_KHR"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkVertexInputRate* value) {
+    uint32_t result;
+    if (!parseValue(sVkVertexInputRate, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkVertexInputRate) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkColorSpaceKHR& value) {
-    switch (value) {
-        case VK_COLOR_SPACE_SRGB_NONLINEAR_KHR: out << "VK_COLOR_SPACE_SRGB_NONLINEAR_KHR"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkFormat* value) {
+    uint32_t result;
+    if (!parseValue(sVkFormat, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkFormat) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkDebugReportObjectTypeEXT& value) {
-    switch (value) {
-        case VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_INSTANCE_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_INSTANCE_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_PHYSICAL_DEVICE_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_PHYSICAL_DEVICE_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_QUEUE_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_QUEUE_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_SEMAPHORE_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_SEMAPHORE_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_BUFFER_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_BUFFER_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_FENCE_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_FENCE_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_MEMORY_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_MEMORY_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_EVENT_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_EVENT_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_QUERY_POOL_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_QUERY_POOL_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_VIEW_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_BUFFER_VIEW_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_VIEW_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_IMAGE_VIEW_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_SHADER_MODULE_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_SHADER_MODULE_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_CACHE_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_CACHE_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_LAYOUT_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_LAYOUT_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_RENDER_PASS_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_RENDER_PASS_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_LAYOUT_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_SAMPLER_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_POOL_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_POOL_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_FRAMEBUFFER_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_FRAMEBUFFER_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_POOL_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_POOL_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_SURFACE_KHR_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_SURFACE_KHR_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_SWAPCHAIN_KHR_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_SWAPCHAIN_KHR_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_DEBUG_REPORT_CALLBACK_EXT_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_KHR_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_KHR_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_MODE_KHR_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_DISPLAY_MODE_KHR_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_OBJECT_TABLE_NVX_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_OBJECT_TABLE_NVX_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_INDIRECT_COMMANDS_LAYOUT_NVX_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_INDIRECT_COMMANDS_LAYOUT_NVX_EXT"; break;
-        case VK_DEBUG_REPORT_OBJECT_TYPE_VALIDATION_CACHE_EXT_EXT: out << "VK_DEBUG_REPORT_OBJECT_TYPE_VALIDATION_CACHE_EXT_EXT"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkStructureType* value) {
+    uint32_t result;
+    if (!parseValue(sVkStructureType, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkStructureType) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkRasterizationOrderAMD& value) {
-    switch (value) {
-        case VK_RASTERIZATION_ORDER_STRICT_AMD: out << "VK_RASTERIZATION_ORDER_STRICT_AMD"; break;
-        case VK_RASTERIZATION_ORDER_RELAXED_AMD: out << "VK_RASTERIZATION_ORDER_RELAXED_AMD"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkSubpassContents* value) {
+    uint32_t result;
+    if (!parseValue(sVkSubpassContents, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkSubpassContents) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkValidationCheckEXT& value) {
-    switch (value) {
-        case VK_VALIDATION_CHECK_ALL_EXT: out << "VK_VALIDATION_CHECK_ALL_EXT"; break;
-        case VK_VALIDATION_CHECK_SHADERS_EXT: out << "VK_VALIDATION_CHECK_SHADERS_EXT"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkResult* value) {
+    uint32_t result;
+    if (!parseValue(sVkResult, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkResult) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkIndirectCommandsTokenTypeNVX& value) {
-    switch (value) {
-        case VK_INDIRECT_COMMANDS_TOKEN_TYPE_PIPELINE_NVX: out << "VK_INDIRECT_COMMANDS_TOKEN_TYPE_PIPELINE_NVX"; break;
-        case VK_INDIRECT_COMMANDS_TOKEN_TYPE_DESCRIPTOR_SET_NVX: out << "VK_INDIRECT_COMMANDS_TOKEN_TYPE_DESCRIPTOR_SET_NVX"; break;
-        case VK_INDIRECT_COMMANDS_TOKEN_TYPE_INDEX_BUFFER_NVX: out << "VK_INDIRECT_COMMANDS_TOKEN_TYPE_INDEX_BUFFER_NVX"; break;
-        case VK_INDIRECT_COMMANDS_TOKEN_TYPE_VERTEX_BUFFER_NVX: out << "VK_INDIRECT_COMMANDS_TOKEN_TYPE_VERTEX_BUFFER_NVX"; break;
-        case VK_INDIRECT_COMMANDS_TOKEN_TYPE_PUSH_CONSTANT_NVX: out << "VK_INDIRECT_COMMANDS_TOKEN_TYPE_PUSH_CONSTANT_NVX"; break;
-        case VK_INDIRECT_COMMANDS_TOKEN_TYPE_DRAW_INDEXED_NVX: out << "VK_INDIRECT_COMMANDS_TOKEN_TYPE_DRAW_INDEXED_NVX"; break;
-        case VK_INDIRECT_COMMANDS_TOKEN_TYPE_DRAW_NVX: out << "VK_INDIRECT_COMMANDS_TOKEN_TYPE_DRAW_NVX"; break;
-        case VK_INDIRECT_COMMANDS_TOKEN_TYPE_DISPATCH_NVX: out << "VK_INDIRECT_COMMANDS_TOKEN_TYPE_DISPATCH_NVX"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkDynamicState* value) {
+    uint32_t result;
+    if (!parseValue(sVkDynamicState, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkDynamicState) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkObjectEntryTypeNVX& value) {
-    switch (value) {
-        case VK_OBJECT_ENTRY_TYPE_DESCRIPTOR_SET_NVX: out << "VK_OBJECT_ENTRY_TYPE_DESCRIPTOR_SET_NVX"; break;
-        case VK_OBJECT_ENTRY_TYPE_PIPELINE_NVX: out << "VK_OBJECT_ENTRY_TYPE_PIPELINE_NVX"; break;
-        case VK_OBJECT_ENTRY_TYPE_INDEX_BUFFER_NVX: out << "VK_OBJECT_ENTRY_TYPE_INDEX_BUFFER_NVX"; break;
-        case VK_OBJECT_ENTRY_TYPE_VERTEX_BUFFER_NVX: out << "VK_OBJECT_ENTRY_TYPE_VERTEX_BUFFER_NVX"; break;
-        case VK_OBJECT_ENTRY_TYPE_PUSH_CONSTANT_NVX: out << "VK_OBJECT_ENTRY_TYPE_PUSH_CONSTANT_NVX"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkDescriptorUpdateTemplateType* value) {
+    uint32_t result;
+    if (!parseValue(sVkDescriptorUpdateTemplateType, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkDescriptorUpdateTemplateType) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkDisplayPowerStateEXT& value) {
-    switch (value) {
-        case VK_DISPLAY_POWER_STATE_OFF_EXT: out << "VK_DISPLAY_POWER_STATE_OFF_EXT"; break;
-        case VK_DISPLAY_POWER_STATE_SUSPEND_EXT: out << "VK_DISPLAY_POWER_STATE_SUSPEND_EXT"; break;
-        case VK_DISPLAY_POWER_STATE_ON_EXT: out << "VK_DISPLAY_POWER_STATE_ON_EXT"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkObjectType* value) {
+    uint32_t result;
+    if (!parseValue(sVkObjectType, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkObjectType) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkDeviceEventTypeEXT& value) {
-    switch (value) {
-        case VK_DEVICE_EVENT_TYPE_DISPLAY_HOTPLUG_EXT: out << "VK_DEVICE_EVENT_TYPE_DISPLAY_HOTPLUG_EXT"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkPresentModeKHR* value) {
+    uint32_t result;
+    if (!parseValue(sVkPresentModeKHR, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkPresentModeKHR) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkDisplayEventTypeEXT& value) {
-    switch (value) {
-        case VK_DISPLAY_EVENT_TYPE_FIRST_PIXEL_OUT_EXT: out << "VK_DISPLAY_EVENT_TYPE_FIRST_PIXEL_OUT_EXT"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkColorSpaceKHR* value) {
+    uint32_t result;
+    if (!parseValue(sVkColorSpaceKHR, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkColorSpaceKHR) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkViewportCoordinateSwizzleNV& value) {
-    switch (value) {
-        case VK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_X_NV: out << "VK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_X_NV"; break;
-        case VK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_X_NV: out << "VK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_X_NV"; break;
-        case VK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_Y_NV: out << "VK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_Y_NV"; break;
-        case VK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_Y_NV: out << "VK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_Y_NV"; break;
-        case VK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_Z_NV: out << "VK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_Z_NV"; break;
-        case VK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_Z_NV: out << "VK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_Z_NV"; break;
-        case VK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_W_NV: out << "VK_VIEWPORT_COORDINATE_SWIZZLE_POSITIVE_W_NV"; break;
-        case VK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_W_NV: out << "VK_VIEWPORT_COORDINATE_SWIZZLE_NEGATIVE_W_NV"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkDebugReportObjectTypeEXT* value) {
+    uint32_t result;
+    if (!parseValue(sVkDebugReportObjectTypeEXT, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkDebugReportObjectTypeEXT) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkDiscardRectangleModeEXT& value) {
-    switch (value) {
-        case VK_DISCARD_RECTANGLE_MODE_INCLUSIVE_EXT: out << "VK_DISCARD_RECTANGLE_MODE_INCLUSIVE_EXT"; break;
-        case VK_DISCARD_RECTANGLE_MODE_EXCLUSIVE_EXT: out << "VK_DISCARD_RECTANGLE_MODE_EXCLUSIVE_EXT"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkRasterizationOrderAMD* value) {
+    uint32_t result;
+    if (!parseValue(sVkRasterizationOrderAMD, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkRasterizationOrderAMD) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkPointClippingBehavior& value) {
-    switch (value) {
-        case VK_POINT_CLIPPING_BEHAVIOR_ALL_CLIP_PLANES: out << "VK_POINT_CLIPPING_BEHAVIOR_ALL_CLIP_PLANES"; break;
-        case VK_POINT_CLIPPING_BEHAVIOR_USER_CLIP_PLANES_ONLY: out << "VK_POINT_CLIPPING_BEHAVIOR_USER_CLIP_PLANES_ONLY"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkValidationCheckEXT* value) {
+    uint32_t result;
+    if (!parseValue(sVkValidationCheckEXT, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkValidationCheckEXT) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkSamplerReductionModeEXT& value) {
-    switch (value) {
-        case VK_SAMPLER_REDUCTION_MODE_WEIGHTED_AVERAGE_EXT: out << "VK_SAMPLER_REDUCTION_MODE_WEIGHTED_AVERAGE_EXT"; break;
-        case VK_SAMPLER_REDUCTION_MODE_MIN_EXT: out << "VK_SAMPLER_REDUCTION_MODE_MIN_EXT"; break;
-        case VK_SAMPLER_REDUCTION_MODE_MAX_EXT: out << "VK_SAMPLER_REDUCTION_MODE_MAX_EXT"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkIndirectCommandsTokenTypeNVX* value) {
+    uint32_t result;
+    if (!parseValue(sVkIndirectCommandsTokenTypeNVX, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkIndirectCommandsTokenTypeNVX) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkTessellationDomainOrigin& value) {
-    switch (value) {
-        case VK_TESSELLATION_DOMAIN_ORIGIN_UPPER_LEFT: out << "VK_TESSELLATION_DOMAIN_ORIGIN_UPPER_LEFT"; break;
-        case VK_TESSELLATION_DOMAIN_ORIGIN_LOWER_LEFT: out << "VK_TESSELLATION_DOMAIN_ORIGIN_LOWER_LEFT"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkObjectEntryTypeNVX* value) {
+    uint32_t result;
+    if (!parseValue(sVkObjectEntryTypeNVX, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkObjectEntryTypeNVX) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkSamplerYcbcrModelConversion& value) {
-    switch (value) {
-        case VK_SAMPLER_YCBCR_MODEL_CONVERSION_RGB_IDENTITY: out << "VK_SAMPLER_YCBCR_MODEL_CONVERSION_RGB_IDENTITY"; break;
-        case VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_IDENTITY: out << "VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_IDENTITY"; break;
-        case VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_709: out << "VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_709"; break;
-        case VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_601: out << "VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_601"; break;
-        case VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_2020: out << "VK_SAMPLER_YCBCR_MODEL_CONVERSION_YCBCR_2020"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkDisplayPowerStateEXT* value) {
+    uint32_t result;
+    if (!parseValue(sVkDisplayPowerStateEXT, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkDisplayPowerStateEXT) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkSamplerYcbcrRange& value) {
-    switch (value) {
-        case VK_SAMPLER_YCBCR_RANGE_ITU_FULL: out << "VK_SAMPLER_YCBCR_RANGE_ITU_FULL"; break;
-        case VK_SAMPLER_YCBCR_RANGE_ITU_NARROW: out << "VK_SAMPLER_YCBCR_RANGE_ITU_NARROW"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkDeviceEventTypeEXT* value) {
+    uint32_t result;
+    if (!parseValue(sVkDeviceEventTypeEXT, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkDeviceEventTypeEXT) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkChromaLocation& value) {
-    switch (value) {
-        case VK_CHROMA_LOCATION_COSITED_EVEN: out << "VK_CHROMA_LOCATION_COSITED_EVEN"; break;
-        case VK_CHROMA_LOCATION_MIDPOINT: out << "VK_CHROMA_LOCATION_MIDPOINT"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkDisplayEventTypeEXT* value) {
+    uint32_t result;
+    if (!parseValue(sVkDisplayEventTypeEXT, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkDisplayEventTypeEXT) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkBlendOverlapEXT& value) {
-    switch (value) {
-        case VK_BLEND_OVERLAP_UNCORRELATED_EXT: out << "VK_BLEND_OVERLAP_UNCORRELATED_EXT"; break;
-        case VK_BLEND_OVERLAP_DISJOINT_EXT: out << "VK_BLEND_OVERLAP_DISJOINT_EXT"; break;
-        case VK_BLEND_OVERLAP_CONJOINT_EXT: out << "VK_BLEND_OVERLAP_CONJOINT_EXT"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkViewportCoordinateSwizzleNV* value) {
+    uint32_t result;
+    if (!parseValue(sVkViewportCoordinateSwizzleNV, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkViewportCoordinateSwizzleNV) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkCoverageModulationModeNV& value) {
-    switch (value) {
-        case VK_COVERAGE_MODULATION_MODE_NONE_NV: out << "VK_COVERAGE_MODULATION_MODE_NONE_NV"; break;
-        case VK_COVERAGE_MODULATION_MODE_RGB_NV: out << "VK_COVERAGE_MODULATION_MODE_RGB_NV"; break;
-        case VK_COVERAGE_MODULATION_MODE_ALPHA_NV: out << "VK_COVERAGE_MODULATION_MODE_ALPHA_NV"; break;
-        case VK_COVERAGE_MODULATION_MODE_RGBA_NV: out << "VK_COVERAGE_MODULATION_MODE_RGBA_NV"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkDiscardRectangleModeEXT* value) {
+    uint32_t result;
+    if (!parseValue(sVkDiscardRectangleModeEXT, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkDiscardRectangleModeEXT) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkValidationCacheHeaderVersionEXT& value) {
-    switch (value) {
-        case VK_VALIDATION_CACHE_HEADER_VERSION_ONE_EXT: out << "VK_VALIDATION_CACHE_HEADER_VERSION_ONE_EXT"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkPointClippingBehavior* value) {
+    uint32_t result;
+    if (!parseValue(sVkPointClippingBehavior, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkPointClippingBehavior) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkShaderInfoTypeAMD& value) {
-    switch (value) {
-        case VK_SHADER_INFO_TYPE_STATISTICS_AMD: out << "VK_SHADER_INFO_TYPE_STATISTICS_AMD"; break;
-        case VK_SHADER_INFO_TYPE_BINARY_AMD: out << "VK_SHADER_INFO_TYPE_BINARY_AMD"; break;
-        case VK_SHADER_INFO_TYPE_DISASSEMBLY_AMD: out << "VK_SHADER_INFO_TYPE_DISASSEMBLY_AMD"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkSamplerReductionModeEXT* value) {
+    uint32_t result;
+    if (!parseValue(sVkSamplerReductionModeEXT, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkSamplerReductionModeEXT) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkQueueGlobalPriorityEXT& value) {
-    switch (value) {
-        case VK_QUEUE_GLOBAL_PRIORITY_LOW_EXT: out << "VK_QUEUE_GLOBAL_PRIORITY_LOW_EXT"; break;
-        case VK_QUEUE_GLOBAL_PRIORITY_MEDIUM_EXT: out << "VK_QUEUE_GLOBAL_PRIORITY_MEDIUM_EXT"; break;
-        case VK_QUEUE_GLOBAL_PRIORITY_HIGH_EXT: out << "VK_QUEUE_GLOBAL_PRIORITY_HIGH_EXT"; break;
-        case VK_QUEUE_GLOBAL_PRIORITY_REALTIME_EXT: out << "VK_QUEUE_GLOBAL_PRIORITY_REALTIME_EXT"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkTessellationDomainOrigin* value) {
+    uint32_t result;
+    if (!parseValue(sVkTessellationDomainOrigin, name, &result)) {
+        return false;
     }
-    return out;
+    *value = (VkTessellationDomainOrigin) result;
+    return true;
 }
-utils::io::ostream& operator<<(utils::io::ostream& out, const VkConservativeRasterizationModeEXT& value) {
-    switch (value) {
-        case VK_CONSERVATIVE_RASTERIZATION_MODE_DISABLED_EXT: out << "VK_CONSERVATIVE_RASTERIZATION_MODE_DISABLED_EXT"; break;
-        case VK_CONSERVATIVE_RASTERIZATION_MODE_OVERESTIMATE_EXT: out << "VK_CONSERVATIVE_RASTERIZATION_MODE_OVERESTIMATE_EXT"; break;
-        case VK_CONSERVATIVE_RASTERIZATION_MODE_UNDERESTIMATE_EXT: out << "VK_CONSERVATIVE_RASTERIZATION_MODE_UNDERESTIMATE_EXT"; break;
-        default: out << "UNKNOWN"; break;
+bool bluevk::parseEnum(const char* name, VkSamplerYcbcrModelConversion* value) {
+    uint32_t result;
+    if (!parseValue(sVkSamplerYcbcrModelConversion, name, &result)) {
+        return false;
     }
+    *value = (VkSamplerYcbcrModelConversion) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkSamplerYcbcrRange* value) {
+    uint32_t result;
+    if (!parseValue(sVkSamplerYcbcrRange, name, &result)) {
+        return false;
+    }
+    *value = (VkSamplerYcbcrRange) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkChromaLocation* value) {
+    uint32_t result;
+    if (!parseValue(sVkChromaLocation, name, &result)) {
+        return false;
+    }
+    *value = (VkChromaLocation) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkBlendOverlapEXT* value) {
+    uint32_t result;
+    if (!parseValue(sVkBlendOverlapEXT, name, &result)) {
+        return false;
+    }
+    *value = (VkBlendOverlapEXT) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkCoverageModulationModeNV* value) {
+    uint32_t result;
+    if (!parseValue(sVkCoverageModulationModeNV, name, &result)) {
+        return false;
+    }
+    *value = (VkCoverageModulationModeNV) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkValidationCacheHeaderVersionEXT* value) {
+    uint32_t result;
+    if (!parseValue(sVkValidationCacheHeaderVersionEXT, name, &result)) {
+        return false;
+    }
+    *value = (VkValidationCacheHeaderVersionEXT) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkShaderInfoTypeAMD* value) {
+    uint32_t result;
+    if (!parseValue(sVkShaderInfoTypeAMD, name, &result)) {
+        return false;
+    }
+    *value = (VkShaderInfoTypeAMD) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkQueueGlobalPriorityEXT* value) {
+    uint32_t result;
+    if (!parseValue(sVkQueueGlobalPriorityEXT, name, &result)) {
+        return false;
+    }
+    *value = (VkQueueGlobalPriorityEXT) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkConservativeRasterizationModeEXT* value) {
+    uint32_t result;
+    if (!parseValue(sVkConservativeRasterizationModeEXT, name, &result)) {
+        return false;
+    }
+    *value = (VkConservativeRasterizationModeEXT) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkCullModeFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkCullModeFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkCullModeFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkQueueFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkQueueFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkQueueFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkDeviceQueueCreateFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkDeviceQueueCreateFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkDeviceQueueCreateFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkMemoryPropertyFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkMemoryPropertyFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkMemoryPropertyFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkMemoryHeapFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkMemoryHeapFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkMemoryHeapFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkAccessFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkAccessFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkAccessFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkBufferUsageFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkBufferUsageFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkBufferUsageFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkBufferCreateFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkBufferCreateFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkBufferCreateFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkShaderStageFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkShaderStageFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkShaderStageFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkImageUsageFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkImageUsageFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkImageUsageFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkImageCreateFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkImageCreateFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkImageCreateFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkPipelineCreateFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkPipelineCreateFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkPipelineCreateFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkColorComponentFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkColorComponentFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkColorComponentFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkFenceCreateFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkFenceCreateFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkFenceCreateFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkFormatFeatureFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkFormatFeatureFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkFormatFeatureFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkQueryControlFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkQueryControlFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkQueryControlFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkQueryResultFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkQueryResultFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkQueryResultFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkCommandBufferUsageFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkCommandBufferUsageFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkCommandBufferUsageFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkQueryPipelineStatisticFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkQueryPipelineStatisticFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkQueryPipelineStatisticFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkImageAspectFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkImageAspectFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkImageAspectFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkSparseImageFormatFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkSparseImageFormatFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkSparseImageFormatFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkSparseMemoryBindFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkSparseMemoryBindFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkSparseMemoryBindFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkPipelineStageFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkPipelineStageFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkPipelineStageFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkCommandPoolCreateFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkCommandPoolCreateFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkCommandPoolCreateFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkCommandPoolResetFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkCommandPoolResetFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkCommandPoolResetFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkCommandBufferResetFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkCommandBufferResetFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkCommandBufferResetFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkSampleCountFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkSampleCountFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkSampleCountFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkAttachmentDescriptionFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkAttachmentDescriptionFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkAttachmentDescriptionFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkStencilFaceFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkStencilFaceFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkStencilFaceFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkDescriptorPoolCreateFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkDescriptorPoolCreateFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkDescriptorPoolCreateFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkDependencyFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkDependencyFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkDependencyFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkDisplayPlaneAlphaFlagBitsKHR* value) {
+    uint32_t result;
+    if (!parseFlags(sVkDisplayPlaneAlphaFlagBitsKHR, name, &result)) {
+        return false;
+    }
+    *value = (VkDisplayPlaneAlphaFlagBitsKHR) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkCompositeAlphaFlagBitsKHR* value) {
+    uint32_t result;
+    if (!parseFlags(sVkCompositeAlphaFlagBitsKHR, name, &result)) {
+        return false;
+    }
+    *value = (VkCompositeAlphaFlagBitsKHR) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkSurfaceTransformFlagBitsKHR* value) {
+    uint32_t result;
+    if (!parseFlags(sVkSurfaceTransformFlagBitsKHR, name, &result)) {
+        return false;
+    }
+    *value = (VkSurfaceTransformFlagBitsKHR) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkDebugReportFlagBitsEXT* value) {
+    uint32_t result;
+    if (!parseFlags(sVkDebugReportFlagBitsEXT, name, &result)) {
+        return false;
+    }
+    *value = (VkDebugReportFlagBitsEXT) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkExternalMemoryHandleTypeFlagBitsNV* value) {
+    uint32_t result;
+    if (!parseFlags(sVkExternalMemoryHandleTypeFlagBitsNV, name, &result)) {
+        return false;
+    }
+    *value = (VkExternalMemoryHandleTypeFlagBitsNV) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkExternalMemoryFeatureFlagBitsNV* value) {
+    uint32_t result;
+    if (!parseFlags(sVkExternalMemoryFeatureFlagBitsNV, name, &result)) {
+        return false;
+    }
+    *value = (VkExternalMemoryFeatureFlagBitsNV) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkSubgroupFeatureFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkSubgroupFeatureFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkSubgroupFeatureFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkIndirectCommandsLayoutUsageFlagBitsNVX* value) {
+    uint32_t result;
+    if (!parseFlags(sVkIndirectCommandsLayoutUsageFlagBitsNVX, name, &result)) {
+        return false;
+    }
+    *value = (VkIndirectCommandsLayoutUsageFlagBitsNVX) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkObjectEntryUsageFlagBitsNVX* value) {
+    uint32_t result;
+    if (!parseFlags(sVkObjectEntryUsageFlagBitsNVX, name, &result)) {
+        return false;
+    }
+    *value = (VkObjectEntryUsageFlagBitsNVX) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkDescriptorSetLayoutCreateFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkDescriptorSetLayoutCreateFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkDescriptorSetLayoutCreateFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkExternalMemoryHandleTypeFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkExternalMemoryHandleTypeFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkExternalMemoryHandleTypeFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkExternalMemoryFeatureFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkExternalMemoryFeatureFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkExternalMemoryFeatureFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkExternalSemaphoreHandleTypeFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkExternalSemaphoreHandleTypeFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkExternalSemaphoreHandleTypeFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkExternalSemaphoreFeatureFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkExternalSemaphoreFeatureFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkExternalSemaphoreFeatureFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkSemaphoreImportFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkSemaphoreImportFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkSemaphoreImportFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkExternalFenceHandleTypeFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkExternalFenceHandleTypeFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkExternalFenceHandleTypeFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkExternalFenceFeatureFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkExternalFenceFeatureFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkExternalFenceFeatureFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkFenceImportFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkFenceImportFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkFenceImportFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkSurfaceCounterFlagBitsEXT* value) {
+    uint32_t result;
+    if (!parseFlags(sVkSurfaceCounterFlagBitsEXT, name, &result)) {
+        return false;
+    }
+    *value = (VkSurfaceCounterFlagBitsEXT) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkPeerMemoryFeatureFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkPeerMemoryFeatureFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkPeerMemoryFeatureFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkMemoryAllocateFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkMemoryAllocateFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkMemoryAllocateFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkDeviceGroupPresentModeFlagBitsKHR* value) {
+    uint32_t result;
+    if (!parseFlags(sVkDeviceGroupPresentModeFlagBitsKHR, name, &result)) {
+        return false;
+    }
+    *value = (VkDeviceGroupPresentModeFlagBitsKHR) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkSwapchainCreateFlagBitsKHR* value) {
+    uint32_t result;
+    if (!parseFlags(sVkSwapchainCreateFlagBitsKHR, name, &result)) {
+        return false;
+    }
+    *value = (VkSwapchainCreateFlagBitsKHR) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkSubpassDescriptionFlagBits* value) {
+    uint32_t result;
+    if (!parseFlags(sVkSubpassDescriptionFlagBits, name, &result)) {
+        return false;
+    }
+    *value = (VkSubpassDescriptionFlagBits) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkDebugUtilsMessageSeverityFlagBitsEXT* value) {
+    uint32_t result;
+    if (!parseFlags(sVkDebugUtilsMessageSeverityFlagBitsEXT, name, &result)) {
+        return false;
+    }
+    *value = (VkDebugUtilsMessageSeverityFlagBitsEXT) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkDebugUtilsMessageTypeFlagBitsEXT* value) {
+    uint32_t result;
+    if (!parseFlags(sVkDebugUtilsMessageTypeFlagBitsEXT, name, &result)) {
+        return false;
+    }
+    *value = (VkDebugUtilsMessageTypeFlagBitsEXT) result;
+    return true;
+}
+bool bluevk::parseEnum(const char* name, VkDescriptorBindingFlagBitsEXT* value) {
+    uint32_t result;
+    if (!parseFlags(sVkDescriptorBindingFlagBitsEXT, name, &result)) {
+        return false;
+    }
+    *value = (VkDescriptorBindingFlagBitsEXT) result;
+    return true;
+}
+
+#if !defined(NDEBUG)
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkImageLayout& value) {
+    printEnum(out, sVkImageLayout, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkAttachmentLoadOp& value) {
+    printEnum(out, sVkAttachmentLoadOp, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkAttachmentStoreOp& value) {
+    printEnum(out, sVkAttachmentStoreOp, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkImageType& value) {
+    printEnum(out, sVkImageType, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkImageTiling& value) {
+    printEnum(out, sVkImageTiling, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkImageViewType& value) {
+    printEnum(out, sVkImageViewType, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkCommandBufferLevel& value) {
+    printEnum(out, sVkCommandBufferLevel, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkComponentSwizzle& value) {
+    printEnum(out, sVkComponentSwizzle, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkDescriptorType& value) {
+    printEnum(out, sVkDescriptorType, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkQueryType& value) {
+    printEnum(out, sVkQueryType, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkBorderColor& value) {
+    printEnum(out, sVkBorderColor, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkPipelineBindPoint& value) {
+    printEnum(out, sVkPipelineBindPoint, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkPipelineCacheHeaderVersion& value) {
+    printEnum(out, sVkPipelineCacheHeaderVersion, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkPrimitiveTopology& value) {
+    printEnum(out, sVkPrimitiveTopology, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkSharingMode& value) {
+    printEnum(out, sVkSharingMode, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkIndexType& value) {
+    printEnum(out, sVkIndexType, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkFilter& value) {
+    printEnum(out, sVkFilter, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkSamplerMipmapMode& value) {
+    printEnum(out, sVkSamplerMipmapMode, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkSamplerAddressMode& value) {
+    printEnum(out, sVkSamplerAddressMode, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkCompareOp& value) {
+    printEnum(out, sVkCompareOp, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkPolygonMode& value) {
+    printEnum(out, sVkPolygonMode, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkFrontFace& value) {
+    printEnum(out, sVkFrontFace, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkBlendFactor& value) {
+    printEnum(out, sVkBlendFactor, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkBlendOp& value) {
+    printEnum(out, sVkBlendOp, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkStencilOp& value) {
+    printEnum(out, sVkStencilOp, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkLogicOp& value) {
+    printEnum(out, sVkLogicOp, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkInternalAllocationType& value) {
+    printEnum(out, sVkInternalAllocationType, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkSystemAllocationScope& value) {
+    printEnum(out, sVkSystemAllocationScope, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkPhysicalDeviceType& value) {
+    printEnum(out, sVkPhysicalDeviceType, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkVertexInputRate& value) {
+    printEnum(out, sVkVertexInputRate, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkFormat& value) {
+    printEnum(out, sVkFormat, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkStructureType& value) {
+    printEnum(out, sVkStructureType, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkSubpassContents& value) {
+    printEnum(out, sVkSubpassContents, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkResult& value) {
+    printEnum(out, sVkResult, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkDynamicState& value) {
+    printEnum(out, sVkDynamicState, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkDescriptorUpdateTemplateType& value) {
+    printEnum(out, sVkDescriptorUpdateTemplateType, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkObjectType& value) {
+    printEnum(out, sVkObjectType, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkPresentModeKHR& value) {
+    printEnum(out, sVkPresentModeKHR, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkColorSpaceKHR& value) {
+    printEnum(out, sVkColorSpaceKHR, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkDebugReportObjectTypeEXT& value) {
+    printEnum(out, sVkDebugReportObjectTypeEXT, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkRasterizationOrderAMD& value) {
+    printEnum(out, sVkRasterizationOrderAMD, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkValidationCheckEXT& value) {
+    printEnum(out, sVkValidationCheckEXT, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkIndirectCommandsTokenTypeNVX& value) {
+    printEnum(out, sVkIndirectCommandsTokenTypeNVX, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkObjectEntryTypeNVX& value) {
+    printEnum(out, sVkObjectEntryTypeNVX, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkDisplayPowerStateEXT& value) {
+    printEnum(out, sVkDisplayPowerStateEXT, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkDeviceEventTypeEXT& value) {
+    printEnum(out, sVkDeviceEventTypeEXT, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkDisplayEventTypeEXT& value) {
+    printEnum(out, sVkDisplayEventTypeEXT, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkViewportCoordinateSwizzleNV& value) {
+    printEnum(out, sVkViewportCoordinateSwizzleNV, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkDiscardRectangleModeEXT& value) {
+    printEnum(out, sVkDiscardRectangleModeEXT, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkPointClippingBehavior& value) {
+    printEnum(out, sVkPointClippingBehavior, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkSamplerReductionModeEXT& value) {
+    printEnum(out, sVkSamplerReductionModeEXT, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkTessellationDomainOrigin& value) {
+    printEnum(out, sVkTessellationDomainOrigin, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkSamplerYcbcrModelConversion& value) {
+    printEnum(out, sVkSamplerYcbcrModelConversion, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkSamplerYcbcrRange& value) {
+    printEnum(out, sVkSamplerYcbcrRange, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkChromaLocation& value) {
+    printEnum(out, sVkChromaLocation, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkBlendOverlapEXT& value) {
+    printEnum(out, sVkBlendOverlapEXT, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkCoverageModulationModeNV& value) {
+    printEnum(out, sVkCoverageModulationModeNV, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkValidationCacheHeaderVersionEXT& value) {
+    printEnum(out, sVkValidationCacheHeaderVersionEXT, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkShaderInfoTypeAMD& value) {
+    printEnum(out, sVkShaderInfoTypeAMD, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkQueueGlobalPriorityEXT& value) {
+    printEnum(out, sVkQueueGlobalPriorityEXT, (uint32_t) value);
+    return out;
+}
+utils::io::ostream& operator<<(utils::io::ostream& out, const VkConservativeRasterizationModeEXT& value) {
+    printEnum(out, sVkConservativeRasterizationModeEXT, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkCullModeFlagBits& value) {
-    switch (value) {
-        case 0x00000000: out << "VK_CULL_MODE_NONE"; break;
-        case 0x00000001: out << "VK_CULL_MODE_FRONT_BIT"; break;
-        case 0x00000002: out << "VK_CULL_MODE_BACK_BIT"; break;
-        case 0x00000003: out << "VK_CULL_MODE_FRONT_AND_BACK"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkCullModeFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkQueueFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_QUEUE_GRAPHICS_BIT"; break;
-        case 0x00000002: out << "VK_QUEUE_COMPUTE_BIT"; break;
-        case 0x00000004: out << "VK_QUEUE_TRANSFER_BIT"; break;
-        case 0x00000008: out << "VK_QUEUE_SPARSE_BINDING_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkQueueFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkDeviceQueueCreateFlagBits& value) {
-    switch (value) {
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkDeviceQueueCreateFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkMemoryPropertyFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_MEMORY_PROPERTY_DEVICE_LOCAL_BIT"; break;
-        case 0x00000002: out << "VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT"; break;
-        case 0x00000004: out << "VK_MEMORY_PROPERTY_HOST_COHERENT_BIT"; break;
-        case 0x00000008: out << "VK_MEMORY_PROPERTY_HOST_CACHED_BIT"; break;
-        case 0x00000010: out << "VK_MEMORY_PROPERTY_LAZILY_ALLOCATED_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkMemoryPropertyFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkMemoryHeapFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_MEMORY_HEAP_DEVICE_LOCAL_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkMemoryHeapFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkAccessFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_ACCESS_INDIRECT_COMMAND_READ_BIT"; break;
-        case 0x00000002: out << "VK_ACCESS_INDEX_READ_BIT"; break;
-        case 0x00000004: out << "VK_ACCESS_VERTEX_ATTRIBUTE_READ_BIT"; break;
-        case 0x00000008: out << "VK_ACCESS_UNIFORM_READ_BIT"; break;
-        case 0x00000010: out << "VK_ACCESS_INPUT_ATTACHMENT_READ_BIT"; break;
-        case 0x00000020: out << "VK_ACCESS_SHADER_READ_BIT"; break;
-        case 0x00000040: out << "VK_ACCESS_SHADER_WRITE_BIT"; break;
-        case 0x00000080: out << "VK_ACCESS_COLOR_ATTACHMENT_READ_BIT"; break;
-        case 0x00000100: out << "VK_ACCESS_COLOR_ATTACHMENT_WRITE_BIT"; break;
-        case 0x00000200: out << "VK_ACCESS_DEPTH_STENCIL_ATTACHMENT_READ_BIT"; break;
-        case 0x00000400: out << "VK_ACCESS_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT"; break;
-        case 0x00000800: out << "VK_ACCESS_TRANSFER_READ_BIT"; break;
-        case 0x00001000: out << "VK_ACCESS_TRANSFER_WRITE_BIT"; break;
-        case 0x00002000: out << "VK_ACCESS_HOST_READ_BIT"; break;
-        case 0x00004000: out << "VK_ACCESS_HOST_WRITE_BIT"; break;
-        case 0x00008000: out << "VK_ACCESS_MEMORY_READ_BIT"; break;
-        case 0x00010000: out << "VK_ACCESS_MEMORY_WRITE_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkAccessFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkBufferUsageFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_BUFFER_USAGE_TRANSFER_SRC_BIT"; break;
-        case 0x00000002: out << "VK_BUFFER_USAGE_TRANSFER_DST_BIT"; break;
-        case 0x00000004: out << "VK_BUFFER_USAGE_UNIFORM_TEXEL_BUFFER_BIT"; break;
-        case 0x00000008: out << "VK_BUFFER_USAGE_STORAGE_TEXEL_BUFFER_BIT"; break;
-        case 0x00000010: out << "VK_BUFFER_USAGE_UNIFORM_BUFFER_BIT"; break;
-        case 0x00000020: out << "VK_BUFFER_USAGE_STORAGE_BUFFER_BIT"; break;
-        case 0x00000040: out << "VK_BUFFER_USAGE_INDEX_BUFFER_BIT"; break;
-        case 0x00000080: out << "VK_BUFFER_USAGE_VERTEX_BUFFER_BIT"; break;
-        case 0x00000100: out << "VK_BUFFER_USAGE_INDIRECT_BUFFER_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkBufferUsageFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkBufferCreateFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_BUFFER_CREATE_SPARSE_BINDING_BIT"; break;
-        case 0x00000002: out << "VK_BUFFER_CREATE_SPARSE_RESIDENCY_BIT"; break;
-        case 0x00000004: out << "VK_BUFFER_CREATE_SPARSE_ALIASED_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkBufferCreateFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkShaderStageFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_SHADER_STAGE_VERTEX_BIT"; break;
-        case 0x00000002: out << "VK_SHADER_STAGE_TESSELLATION_CONTROL_BIT"; break;
-        case 0x00000004: out << "VK_SHADER_STAGE_TESSELLATION_EVALUATION_BIT"; break;
-        case 0x00000008: out << "VK_SHADER_STAGE_GEOMETRY_BIT"; break;
-        case 0x00000010: out << "VK_SHADER_STAGE_FRAGMENT_BIT"; break;
-        case 0x00000020: out << "VK_SHADER_STAGE_COMPUTE_BIT"; break;
-        case 0x0000001f: out << "VK_SHADER_STAGE_ALL_GRAPHICS"; break;
-        case 0x7fffffff: out << "VK_SHADER_STAGE_ALL"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkShaderStageFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkImageUsageFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_IMAGE_USAGE_TRANSFER_SRC_BIT"; break;
-        case 0x00000002: out << "VK_IMAGE_USAGE_TRANSFER_DST_BIT"; break;
-        case 0x00000004: out << "VK_IMAGE_USAGE_SAMPLED_BIT"; break;
-        case 0x00000008: out << "VK_IMAGE_USAGE_STORAGE_BIT"; break;
-        case 0x00000010: out << "VK_IMAGE_USAGE_COLOR_ATTACHMENT_BIT"; break;
-        case 0x00000020: out << "VK_IMAGE_USAGE_DEPTH_STENCIL_ATTACHMENT_BIT"; break;
-        case 0x00000040: out << "VK_IMAGE_USAGE_TRANSIENT_ATTACHMENT_BIT"; break;
-        case 0x00000080: out << "VK_IMAGE_USAGE_INPUT_ATTACHMENT_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkImageUsageFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkImageCreateFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_IMAGE_CREATE_SPARSE_BINDING_BIT"; break;
-        case 0x00000002: out << "VK_IMAGE_CREATE_SPARSE_RESIDENCY_BIT"; break;
-        case 0x00000004: out << "VK_IMAGE_CREATE_SPARSE_ALIASED_BIT"; break;
-        case 0x00000008: out << "VK_IMAGE_CREATE_MUTABLE_FORMAT_BIT"; break;
-        case 0x00000010: out << "VK_IMAGE_CREATE_CUBE_COMPATIBLE_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkImageCreateFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkPipelineCreateFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_PIPELINE_CREATE_DISABLE_OPTIMIZATION_BIT"; break;
-        case 0x00000002: out << "VK_PIPELINE_CREATE_ALLOW_DERIVATIVES_BIT"; break;
-        case 0x00000004: out << "VK_PIPELINE_CREATE_DERIVATIVE_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkPipelineCreateFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkColorComponentFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_COLOR_COMPONENT_R_BIT"; break;
-        case 0x00000002: out << "VK_COLOR_COMPONENT_G_BIT"; break;
-        case 0x00000004: out << "VK_COLOR_COMPONENT_B_BIT"; break;
-        case 0x00000008: out << "VK_COLOR_COMPONENT_A_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkColorComponentFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkFenceCreateFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_FENCE_CREATE_SIGNALED_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkFenceCreateFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkFormatFeatureFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_FORMAT_FEATURE_SAMPLED_IMAGE_BIT"; break;
-        case 0x00000002: out << "VK_FORMAT_FEATURE_STORAGE_IMAGE_BIT"; break;
-        case 0x00000004: out << "VK_FORMAT_FEATURE_STORAGE_IMAGE_ATOMIC_BIT"; break;
-        case 0x00000008: out << "VK_FORMAT_FEATURE_UNIFORM_TEXEL_BUFFER_BIT"; break;
-        case 0x00000010: out << "VK_FORMAT_FEATURE_STORAGE_TEXEL_BUFFER_BIT"; break;
-        case 0x00000020: out << "VK_FORMAT_FEATURE_STORAGE_TEXEL_BUFFER_ATOMIC_BIT"; break;
-        case 0x00000040: out << "VK_FORMAT_FEATURE_VERTEX_BUFFER_BIT"; break;
-        case 0x00000080: out << "VK_FORMAT_FEATURE_COLOR_ATTACHMENT_BIT"; break;
-        case 0x00000100: out << "VK_FORMAT_FEATURE_COLOR_ATTACHMENT_BLEND_BIT"; break;
-        case 0x00000200: out << "VK_FORMAT_FEATURE_DEPTH_STENCIL_ATTACHMENT_BIT"; break;
-        case 0x00000400: out << "VK_FORMAT_FEATURE_BLIT_SRC_BIT"; break;
-        case 0x00000800: out << "VK_FORMAT_FEATURE_BLIT_DST_BIT"; break;
-        case 0x00001000: out << "VK_FORMAT_FEATURE_SAMPLED_IMAGE_FILTER_LINEAR_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkFormatFeatureFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkQueryControlFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_QUERY_CONTROL_PRECISE_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkQueryControlFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkQueryResultFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_QUERY_RESULT_64_BIT"; break;
-        case 0x00000002: out << "VK_QUERY_RESULT_WAIT_BIT"; break;
-        case 0x00000004: out << "VK_QUERY_RESULT_WITH_AVAILABILITY_BIT"; break;
-        case 0x00000008: out << "VK_QUERY_RESULT_PARTIAL_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkQueryResultFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkCommandBufferUsageFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_COMMAND_BUFFER_USAGE_ONE_TIME_SUBMIT_BIT"; break;
-        case 0x00000002: out << "VK_COMMAND_BUFFER_USAGE_RENDER_PASS_CONTINUE_BIT"; break;
-        case 0x00000004: out << "VK_COMMAND_BUFFER_USAGE_SIMULTANEOUS_USE_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkCommandBufferUsageFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkQueryPipelineStatisticFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_QUERY_PIPELINE_STATISTIC_INPUT_ASSEMBLY_VERTICES_BIT"; break;
-        case 0x00000002: out << "VK_QUERY_PIPELINE_STATISTIC_INPUT_ASSEMBLY_PRIMITIVES_BIT"; break;
-        case 0x00000004: out << "VK_QUERY_PIPELINE_STATISTIC_VERTEX_SHADER_INVOCATIONS_BIT"; break;
-        case 0x00000008: out << "VK_QUERY_PIPELINE_STATISTIC_GEOMETRY_SHADER_INVOCATIONS_BIT"; break;
-        case 0x00000010: out << "VK_QUERY_PIPELINE_STATISTIC_GEOMETRY_SHADER_PRIMITIVES_BIT"; break;
-        case 0x00000020: out << "VK_QUERY_PIPELINE_STATISTIC_CLIPPING_INVOCATIONS_BIT"; break;
-        case 0x00000040: out << "VK_QUERY_PIPELINE_STATISTIC_CLIPPING_PRIMITIVES_BIT"; break;
-        case 0x00000080: out << "VK_QUERY_PIPELINE_STATISTIC_FRAGMENT_SHADER_INVOCATIONS_BIT"; break;
-        case 0x00000100: out << "VK_QUERY_PIPELINE_STATISTIC_TESSELLATION_CONTROL_SHADER_PATCHES_BIT"; break;
-        case 0x00000200: out << "VK_QUERY_PIPELINE_STATISTIC_TESSELLATION_EVALUATION_SHADER_INVOCATIONS_BIT"; break;
-        case 0x00000400: out << "VK_QUERY_PIPELINE_STATISTIC_COMPUTE_SHADER_INVOCATIONS_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkQueryPipelineStatisticFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkImageAspectFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_IMAGE_ASPECT_COLOR_BIT"; break;
-        case 0x00000002: out << "VK_IMAGE_ASPECT_DEPTH_BIT"; break;
-        case 0x00000004: out << "VK_IMAGE_ASPECT_STENCIL_BIT"; break;
-        case 0x00000008: out << "VK_IMAGE_ASPECT_METADATA_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkImageAspectFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkSparseImageFormatFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_SPARSE_IMAGE_FORMAT_SINGLE_MIPTAIL_BIT"; break;
-        case 0x00000002: out << "VK_SPARSE_IMAGE_FORMAT_ALIGNED_MIP_SIZE_BIT"; break;
-        case 0x00000004: out << "VK_SPARSE_IMAGE_FORMAT_NONSTANDARD_BLOCK_SIZE_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkSparseImageFormatFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkSparseMemoryBindFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_SPARSE_MEMORY_BIND_METADATA_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkSparseMemoryBindFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkPipelineStageFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_PIPELINE_STAGE_TOP_OF_PIPE_BIT"; break;
-        case 0x00000002: out << "VK_PIPELINE_STAGE_DRAW_INDIRECT_BIT"; break;
-        case 0x00000004: out << "VK_PIPELINE_STAGE_VERTEX_INPUT_BIT"; break;
-        case 0x00000008: out << "VK_PIPELINE_STAGE_VERTEX_SHADER_BIT"; break;
-        case 0x00000010: out << "VK_PIPELINE_STAGE_TESSELLATION_CONTROL_SHADER_BIT"; break;
-        case 0x00000020: out << "VK_PIPELINE_STAGE_TESSELLATION_EVALUATION_SHADER_BIT"; break;
-        case 0x00000040: out << "VK_PIPELINE_STAGE_GEOMETRY_SHADER_BIT"; break;
-        case 0x00000080: out << "VK_PIPELINE_STAGE_FRAGMENT_SHADER_BIT"; break;
-        case 0x00000100: out << "VK_PIPELINE_STAGE_EARLY_FRAGMENT_TESTS_BIT"; break;
-        case 0x00000200: out << "VK_PIPELINE_STAGE_LATE_FRAGMENT_TESTS_BIT"; break;
-        case 0x00000400: out << "VK_PIPELINE_STAGE_COLOR_ATTACHMENT_OUTPUT_BIT"; break;
-        case 0x00000800: out << "VK_PIPELINE_STAGE_COMPUTE_SHADER_BIT"; break;
-        case 0x00001000: out << "VK_PIPELINE_STAGE_TRANSFER_BIT"; break;
-        case 0x00002000: out << "VK_PIPELINE_STAGE_BOTTOM_OF_PIPE_BIT"; break;
-        case 0x00004000: out << "VK_PIPELINE_STAGE_HOST_BIT"; break;
-        case 0x00008000: out << "VK_PIPELINE_STAGE_ALL_GRAPHICS_BIT"; break;
-        case 0x00010000: out << "VK_PIPELINE_STAGE_ALL_COMMANDS_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkPipelineStageFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkCommandPoolCreateFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_COMMAND_POOL_CREATE_TRANSIENT_BIT"; break;
-        case 0x00000002: out << "VK_COMMAND_POOL_CREATE_RESET_COMMAND_BUFFER_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkCommandPoolCreateFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkCommandPoolResetFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_COMMAND_POOL_RESET_RELEASE_RESOURCES_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkCommandPoolResetFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkCommandBufferResetFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_COMMAND_BUFFER_RESET_RELEASE_RESOURCES_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkCommandBufferResetFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkSampleCountFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_SAMPLE_COUNT_1_BIT"; break;
-        case 0x00000002: out << "VK_SAMPLE_COUNT_2_BIT"; break;
-        case 0x00000004: out << "VK_SAMPLE_COUNT_4_BIT"; break;
-        case 0x00000008: out << "VK_SAMPLE_COUNT_8_BIT"; break;
-        case 0x00000010: out << "VK_SAMPLE_COUNT_16_BIT"; break;
-        case 0x00000020: out << "VK_SAMPLE_COUNT_32_BIT"; break;
-        case 0x00000040: out << "VK_SAMPLE_COUNT_64_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkSampleCountFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkAttachmentDescriptionFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_ATTACHMENT_DESCRIPTION_MAY_ALIAS_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkAttachmentDescriptionFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkStencilFaceFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_STENCIL_FACE_FRONT_BIT"; break;
-        case 0x00000002: out << "VK_STENCIL_FACE_BACK_BIT"; break;
-        case 0x00000003: out << "VK_STENCIL_FRONT_AND_BACK"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkStencilFaceFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkDescriptorPoolCreateFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_DESCRIPTOR_POOL_CREATE_FREE_DESCRIPTOR_SET_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkDescriptorPoolCreateFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkDependencyFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_DEPENDENCY_BY_REGION_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkDependencyFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkDisplayPlaneAlphaFlagBitsKHR& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_DISPLAY_PLANE_ALPHA_OPAQUE_BIT_KHR"; break;
-        case 0x00000002: out << "VK_DISPLAY_PLANE_ALPHA_GLOBAL_BIT_KHR"; break;
-        case 0x00000004: out << "VK_DISPLAY_PLANE_ALPHA_PER_PIXEL_BIT_KHR"; break;
-        case 0x00000008: out << "VK_DISPLAY_PLANE_ALPHA_PER_PIXEL_PREMULTIPLIED_BIT_KHR"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkDisplayPlaneAlphaFlagBitsKHR, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkCompositeAlphaFlagBitsKHR& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_COMPOSITE_ALPHA_OPAQUE_BIT_KHR"; break;
-        case 0x00000002: out << "VK_COMPOSITE_ALPHA_PRE_MULTIPLIED_BIT_KHR"; break;
-        case 0x00000004: out << "VK_COMPOSITE_ALPHA_POST_MULTIPLIED_BIT_KHR"; break;
-        case 0x00000008: out << "VK_COMPOSITE_ALPHA_INHERIT_BIT_KHR"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkCompositeAlphaFlagBitsKHR, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkSurfaceTransformFlagBitsKHR& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_SURFACE_TRANSFORM_IDENTITY_BIT_KHR"; break;
-        case 0x00000002: out << "VK_SURFACE_TRANSFORM_ROTATE_90_BIT_KHR"; break;
-        case 0x00000004: out << "VK_SURFACE_TRANSFORM_ROTATE_180_BIT_KHR"; break;
-        case 0x00000008: out << "VK_SURFACE_TRANSFORM_ROTATE_270_BIT_KHR"; break;
-        case 0x00000010: out << "VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_BIT_KHR"; break;
-        case 0x00000020: out << "VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_90_BIT_KHR"; break;
-        case 0x00000040: out << "VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_180_BIT_KHR"; break;
-        case 0x00000080: out << "VK_SURFACE_TRANSFORM_HORIZONTAL_MIRROR_ROTATE_270_BIT_KHR"; break;
-        case 0x00000100: out << "VK_SURFACE_TRANSFORM_INHERIT_BIT_KHR"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkSurfaceTransformFlagBitsKHR, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkDebugReportFlagBitsEXT& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_DEBUG_REPORT_INFORMATION_BIT_EXT"; break;
-        case 0x00000002: out << "VK_DEBUG_REPORT_WARNING_BIT_EXT"; break;
-        case 0x00000004: out << "VK_DEBUG_REPORT_PERFORMANCE_WARNING_BIT_EXT"; break;
-        case 0x00000008: out << "VK_DEBUG_REPORT_ERROR_BIT_EXT"; break;
-        case 0x00000010: out << "VK_DEBUG_REPORT_DEBUG_BIT_EXT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkDebugReportFlagBitsEXT, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkExternalMemoryHandleTypeFlagBitsNV& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_BIT_NV"; break;
-        case 0x00000002: out << "VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT_NV"; break;
-        case 0x00000004: out << "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_IMAGE_BIT_NV"; break;
-        case 0x00000008: out << "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_IMAGE_KMT_BIT_NV"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkExternalMemoryHandleTypeFlagBitsNV, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkExternalMemoryFeatureFlagBitsNV& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_EXTERNAL_MEMORY_FEATURE_DEDICATED_ONLY_BIT_NV"; break;
-        case 0x00000002: out << "VK_EXTERNAL_MEMORY_FEATURE_EXPORTABLE_BIT_NV"; break;
-        case 0x00000004: out << "VK_EXTERNAL_MEMORY_FEATURE_IMPORTABLE_BIT_NV"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkExternalMemoryFeatureFlagBitsNV, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkSubgroupFeatureFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_SUBGROUP_FEATURE_BASIC_BIT"; break;
-        case 0x00000002: out << "VK_SUBGROUP_FEATURE_VOTE_BIT"; break;
-        case 0x00000004: out << "VK_SUBGROUP_FEATURE_ARITHMETIC_BIT"; break;
-        case 0x00000008: out << "VK_SUBGROUP_FEATURE_BALLOT_BIT"; break;
-        case 0x00000010: out << "VK_SUBGROUP_FEATURE_SHUFFLE_BIT"; break;
-        case 0x00000020: out << "VK_SUBGROUP_FEATURE_SHUFFLE_RELATIVE_BIT"; break;
-        case 0x00000040: out << "VK_SUBGROUP_FEATURE_CLUSTERED_BIT"; break;
-        case 0x00000080: out << "VK_SUBGROUP_FEATURE_QUAD_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkSubgroupFeatureFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkIndirectCommandsLayoutUsageFlagBitsNVX& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_INDIRECT_COMMANDS_LAYOUT_USAGE_UNORDERED_SEQUENCES_BIT_NVX"; break;
-        case 0x00000002: out << "VK_INDIRECT_COMMANDS_LAYOUT_USAGE_SPARSE_SEQUENCES_BIT_NVX"; break;
-        case 0x00000004: out << "VK_INDIRECT_COMMANDS_LAYOUT_USAGE_EMPTY_EXECUTIONS_BIT_NVX"; break;
-        case 0x00000008: out << "VK_INDIRECT_COMMANDS_LAYOUT_USAGE_INDEXED_SEQUENCES_BIT_NVX"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkIndirectCommandsLayoutUsageFlagBitsNVX, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkObjectEntryUsageFlagBitsNVX& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_OBJECT_ENTRY_USAGE_GRAPHICS_BIT_NVX"; break;
-        case 0x00000002: out << "VK_OBJECT_ENTRY_USAGE_COMPUTE_BIT_NVX"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkObjectEntryUsageFlagBitsNVX, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkDescriptorSetLayoutCreateFlagBits& value) {
-    switch (value) {
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkDescriptorSetLayoutCreateFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkExternalMemoryHandleTypeFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_FD_BIT"; break;
-        case 0x00000002: out << "VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_BIT"; break;
-        case 0x00000004: out << "VK_EXTERNAL_MEMORY_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT"; break;
-        case 0x00000008: out << "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_TEXTURE_BIT"; break;
-        case 0x00000010: out << "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D11_TEXTURE_KMT_BIT"; break;
-        case 0x00000020: out << "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D12_HEAP_BIT"; break;
-        case 0x00000040: out << "VK_EXTERNAL_MEMORY_HANDLE_TYPE_D3D12_RESOURCE_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkExternalMemoryHandleTypeFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkExternalMemoryFeatureFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_EXTERNAL_MEMORY_FEATURE_DEDICATED_ONLY_BIT"; break;
-        case 0x00000002: out << "VK_EXTERNAL_MEMORY_FEATURE_EXPORTABLE_BIT"; break;
-        case 0x00000004: out << "VK_EXTERNAL_MEMORY_FEATURE_IMPORTABLE_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkExternalMemoryFeatureFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkExternalSemaphoreHandleTypeFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_FD_BIT"; break;
-        case 0x00000002: out << "VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_WIN32_BIT"; break;
-        case 0x00000004: out << "VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT"; break;
-        case 0x00000008: out << "VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_D3D12_FENCE_BIT"; break;
-        case 0x00000010: out << "VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_SYNC_FD_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkExternalSemaphoreHandleTypeFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkExternalSemaphoreFeatureFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_EXTERNAL_SEMAPHORE_FEATURE_EXPORTABLE_BIT"; break;
-        case 0x00000002: out << "VK_EXTERNAL_SEMAPHORE_FEATURE_IMPORTABLE_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkExternalSemaphoreFeatureFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkSemaphoreImportFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_SEMAPHORE_IMPORT_TEMPORARY_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkSemaphoreImportFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkExternalFenceHandleTypeFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_FD_BIT"; break;
-        case 0x00000002: out << "VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_WIN32_BIT"; break;
-        case 0x00000004: out << "VK_EXTERNAL_FENCE_HANDLE_TYPE_OPAQUE_WIN32_KMT_BIT"; break;
-        case 0x00000008: out << "VK_EXTERNAL_FENCE_HANDLE_TYPE_SYNC_FD_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkExternalFenceHandleTypeFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkExternalFenceFeatureFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_EXTERNAL_FENCE_FEATURE_EXPORTABLE_BIT"; break;
-        case 0x00000002: out << "VK_EXTERNAL_FENCE_FEATURE_IMPORTABLE_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkExternalFenceFeatureFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkFenceImportFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_FENCE_IMPORT_TEMPORARY_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkFenceImportFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkSurfaceCounterFlagBitsEXT& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_SURFACE_COUNTER_VBLANK_EXT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkSurfaceCounterFlagBitsEXT, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkPeerMemoryFeatureFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_PEER_MEMORY_FEATURE_COPY_SRC_BIT"; break;
-        case 0x00000002: out << "VK_PEER_MEMORY_FEATURE_COPY_DST_BIT"; break;
-        case 0x00000004: out << "VK_PEER_MEMORY_FEATURE_GENERIC_SRC_BIT"; break;
-        case 0x00000008: out << "VK_PEER_MEMORY_FEATURE_GENERIC_DST_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkPeerMemoryFeatureFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkMemoryAllocateFlagBits& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_MEMORY_ALLOCATE_DEVICE_MASK_BIT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkMemoryAllocateFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkDeviceGroupPresentModeFlagBitsKHR& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_DEVICE_GROUP_PRESENT_MODE_LOCAL_BIT_KHR"; break;
-        case 0x00000002: out << "VK_DEVICE_GROUP_PRESENT_MODE_REMOTE_BIT_KHR"; break;
-        case 0x00000004: out << "VK_DEVICE_GROUP_PRESENT_MODE_SUM_BIT_KHR"; break;
-        case 0x00000008: out << "VK_DEVICE_GROUP_PRESENT_MODE_LOCAL_MULTI_DEVICE_BIT_KHR"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkDeviceGroupPresentModeFlagBitsKHR, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkSwapchainCreateFlagBitsKHR& value) {
-    switch (value) {
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkSwapchainCreateFlagBitsKHR, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkSubpassDescriptionFlagBits& value) {
-    switch (value) {
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkSubpassDescriptionFlagBits, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkDebugUtilsMessageSeverityFlagBitsEXT& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_DEBUG_UTILS_MESSAGE_SEVERITY_VERBOSE_BIT_EXT"; break;
-        case 0x00000010: out << "VK_DEBUG_UTILS_MESSAGE_SEVERITY_INFO_BIT_EXT"; break;
-        case 0x00000100: out << "VK_DEBUG_UTILS_MESSAGE_SEVERITY_WARNING_BIT_EXT"; break;
-        case 0x00001000: out << "VK_DEBUG_UTILS_MESSAGE_SEVERITY_ERROR_BIT_EXT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkDebugUtilsMessageSeverityFlagBitsEXT, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkDebugUtilsMessageTypeFlagBitsEXT& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_DEBUG_UTILS_MESSAGE_TYPE_GENERAL_BIT_EXT"; break;
-        case 0x00000002: out << "VK_DEBUG_UTILS_MESSAGE_TYPE_VALIDATION_BIT_EXT"; break;
-        case 0x00000004: out << "VK_DEBUG_UTILS_MESSAGE_TYPE_PERFORMANCE_BIT_EXT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkDebugUtilsMessageTypeFlagBitsEXT, (uint32_t) value);
     return out;
 }
 utils::io::ostream& operator<<(utils::io::ostream& out, const VkDescriptorBindingFlagBitsEXT& value) {
-    switch (value) {
-        case 0x00000001: out << "VK_DESCRIPTOR_BINDING_UPDATE_AFTER_BIND_BIT_EXT"; break;
-        case 0x00000002: out << "VK_DESCRIPTOR_BINDING_UPDATE_UNUSED_WHILE_PENDING_BIT_EXT"; break;
-        case 0x00000004: out << "VK_DESCRIPTOR_BINDING_PARTIALLY_BOUND_BIT_EXT"; break;
-        case 0x00000008: out << "VK_DESCRIPTOR_BINDING_VARIABLE_DESCRIPTOR_COUNT_BIT_EXT"; break;
-        default: out << "UNKNOWN_FLAGS"; break;
-    }
+    printFlags(out, sVkDescriptorBindingFlagBitsEXT, (uint32_t) value);
     return out;
 }
 #endif
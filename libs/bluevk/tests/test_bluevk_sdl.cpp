@@ -304,6 +304,7 @@ static void createDevice() {
         utils::slog.e << "vkCreateDevice(): " << result << utils::io::endl;
         quit(2);
     }
+    bluevk::bindDevice(gVulkanDriver.device);
 }
 
 static void getQueues() {
@@ -1 +1,2 @@
 from .core import *
+from .batch import load_many
@@ -0,0 +1,190 @@
+#-*- coding: UTF-8 -*-
+
+"""
+Vectorized sampling of node animations.
+
+The keys of each channel (aiNodeAnim) of an animation are read at once into
+contiguous numpy arrays, and sample() evaluates every channel at a whole
+array of timestamps, returning the local transformation of the animated
+nodes.
+
+Quaternions are stored as (w, x, y, z), like assimp's. Times are in ticks,
+like the times of the keys (see Animation.mTicksPerSecond).
+
+This module requires numpy.
+"""
+
+import ctypes
+
+import numpy
+
+from . import core
+from . import structs
+
+# aiAnimBehaviour
+aiAnimBehaviour_DEFAULT  = 0x0
+aiAnimBehaviour_CONSTANT = 0x1
+aiAnimBehaviour_LINEAR   = 0x2
+aiAnimBehaviour_REPEAT   = 0x3
+
+def _key_dtype(key_type, components):
+    """ Layout of aiVectorKey/aiQuatKey, used to read all the keys at once. """
+    return numpy.dtype({'names': ['time', 'value'],
+                        'formats': [numpy.float64, (numpy.float32, components)],
+                        'offsets': [key_type.mTime.offset, key_type.mValue.offset],
+                        'itemsize': ctypes.sizeof(key_type)})
+
+_vector_key_dtype = _key_dtype(structs.VectorKey, 3)
+_quat_key_dtype = _key_dtype(structs.QuatKey, 4)
+
+def _keys(pointer, count, dtype):
+    """ Returns the times and values of `count` keys as numpy arrays. """
+    if not count:
+        return numpy.empty((0,)), numpy.empty((0, dtype['value'].shape[0]))
+    keys = numpy.frombuffer(core._numpy_bytes(pointer, count * dtype.itemsize), dtype)
+    return keys['time'].copy(), keys['value'].astype(numpy.float64)
+
+class Channel(object):
+    """
+    The keys of a node animation channel, as numpy arrays: one array of times
+    (K,) and one of values (K, 3) or (K, 4) per kind of key.
+    """
+    def __init__(self, node_anim):
+        self.nodename = core._convert_assimp_string(node_anim.mNodeName)
+        self.positiontimes, self.positions = _keys(node_anim.mPositionKeys,
+                                                   node_anim.mNumPositionKeys,
+                                                   _vector_key_dtype)
+        self.rotationtimes, self.rotations = _keys(node_anim.mRotationKeys,
+                                                   node_anim.mNumRotationKeys,
+                                                   _quat_key_dtype)
+        self.scalingtimes, self.scalings = _keys(node_anim.mScalingKeys,
+                                                 node_anim.mNumScalingKeys,
+                                                 _vector_key_dtype)
+        self.prestate = node_anim.mPreState
+        self.poststate = node_anim.mPostState
+
+    def __repr__(self):
+        return "Channel(" + self.nodename + ")"
+
+    def time_range(self):
+        """ Returns the times of the first and the last keys. """
+        times = [t for t in (self.positiontimes, self.rotationtimes, self.scalingtimes) if len(t)]
+        if not times:
+            return 0.0, 0.0
+        return min(t[0] for t in times), max(t[-1] for t in times)
+
+def channels(animation):
+    """
+    Returns the Channels of an animation (as loaded by pyassimp.load, lazily
+    or not), in the order of its mChannels.
+
+    The channels are cached on the animation.
+    """
+    try:
+        return animation._channel_arrays
+    except AttributeError:
+        pass
+    anim = animation.contents if isinstance(animation, ctypes._Pointer) else animation
+    result = [Channel(anim.mChannels[i].contents) for i in range(anim.mNumChannels)]
+    animation._channel_arrays = result
+    return result
+
+def _interpolation(key_times, times):
+    """
+    Returns the indices of the keys surrounding each time, and the
+    interpolation factors between them (clamped to the first and last keys).
+    """
+    last = len(key_times) - 1
+    if last < 1:
+        zeros = numpy.zeros(len(times), dtype=numpy.intp)
+        return zeros, zeros, numpy.zeros(len(times))
+    i1 = numpy.clip(numpy.searchsorted(key_times, times, side='right'), 1, last)
+    i0 = i1 - 1
+    dt = key_times[i1] - key_times[i0]
+    factors = (times - key_times[i0]) / numpy.where(dt > 0, dt, 1.0)
+    return i0, i1, numpy.clip(factors, 0.0, 1.0)
+
+def _lerp(key_times, values, times, default):
+    if not len(key_times):
+        return default
+    i0, i1, f = _interpolation(key_times, times)
+    v0 = values[i0]
+    return v0 + (values[i1] - v0) * f[:, None]
+
+def _slerp(key_times, values, times, default):
+    if not len(key_times):
+        return default
+    i0, i1, f = _interpolation(key_times, times)
+    q0 = values[i0]
+    q1 = values[i1]
+    d = numpy.sum(q0 * q1, axis=-1)
+    # take the shortest path
+    q1 = numpy.where((d < 0.0)[:, None], -q1, q1)
+    d = numpy.abs(d)
+    angle = numpy.arccos(numpy.clip(d, -1.0, 1.0))
+    sin = numpy.sin(angle)
+    # fall back to linear interpolation for close rotations
+    close = sin < 1e-6
+    isin = 1.0 / numpy.where(close, 1.0, sin)
+    w0 = numpy.where(close, 1.0 - f, numpy.sin((1.0 - f) * angle) * isin)
+    w1 = numpy.where(close, f, numpy.sin(f * angle) * isin)
+    q = w0[:, None] * q0 + w1[:, None] * q1
+    return q / numpy.linalg.norm(q, axis=-1)[:, None]
+
+def compose(positions, rotations, scalings):
+    """
+    Returns the (..., 4, 4) transformation matrices made of (..., 3)
+    positions, (..., 4) unit quaternions and (..., 3) scalings, like
+    aiMatrix4x4(scaling, rotation, position).
+    """
+    w, x, y, z = numpy.moveaxis(rotations, -1, 0)
+    result = numpy.zeros(numpy.shape(positions)[:-1] + (4, 4))
+    result[..., 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    result[..., 0, 1] = 2.0 * (x * y - w * z)
+    result[..., 0, 2] = 2.0 * (x * z + w * y)
+    result[..., 1, 0] = 2.0 * (x * y + w * z)
+    result[..., 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    result[..., 1, 2] = 2.0 * (y * z - w * x)
+    result[..., 2, 0] = 2.0 * (x * z - w * y)
+    result[..., 2, 1] = 2.0 * (y * z + w * x)
+    result[..., 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    result[..., :3, :3] *= scalings[..., None, :]
+    result[..., :3, 3] = positions
+    result[..., 3, 3] = 1.0
+    return result
+
+def sample(animation, times):
+    """
+    Evaluates every channel of an animation at an array of T times (in
+    ticks), lerping positions and scalings and slerping rotations.
+
+    Returns the (T, channels, 4, 4) local transformations of the animated
+    nodes, in the order of channels(animation).
+
+    Before the first key and after the last one, the channels hold their
+    first and last keys, unless their mPreState/mPostState is
+    aiAnimBehaviour_REPEAT, in which case the times wrap around.
+    """
+    times = numpy.atleast_1d(numpy.asarray(times, dtype=numpy.float64))
+    anims = channels(animation)
+    shape = (len(times), len(anims))
+    positions = numpy.zeros(shape + (3,))
+    rotations = numpy.zeros(shape + (4,))
+    rotations[..., 0] = 1.0
+    scalings = numpy.ones(shape + (3,))
+
+    for c, channel in enumerate(anims):
+        t = times
+        if aiAnimBehaviour_REPEAT in (channel.prestate, channel.poststate):
+            first, last = channel.time_range()
+            if last > first:
+                wrapped = first + numpy.mod(t - first, last - first)
+                if channel.prestate == aiAnimBehaviour_REPEAT:
+                    t = numpy.where(t < first, wrapped, t)
+                if channel.poststate == aiAnimBehaviour_REPEAT:
+                    t = numpy.where(t > last, wrapped, t)
+        positions[:, c] = _lerp(channel.positiontimes, channel.positions, t, 0.0)
+        rotations[:, c] = _slerp(channel.rotationtimes, channel.rotations, t, (1.0, 0.0, 0.0, 0.0))
+        scalings[:, c] = _lerp(channel.scalingtimes, channel.scalings, t, 1.0)
+
+    return compose(positions, rotations, scalings)
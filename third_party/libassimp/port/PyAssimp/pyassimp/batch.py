@@ -0,0 +1,136 @@
+#-*- coding: UTF-8 -*-
+
+"""
+Batch loading of models in a pool of processes.
+
+Each model is imported and converted by a worker process, which sends back
+a compact, picklable SceneBundle (the meshes as numpy arrays, plus the
+materials and the node hierarchy) and releases the assimp scene right away.
+"""
+
+import multiprocessing
+
+import logging;logger = logging.getLogger("pyassimp")
+
+from . import core
+from . import postprocess
+from .errors import AssimpError
+
+class MeshBundle(object):
+    """
+    The geometry of a mesh: vertex attributes and faces as numpy arrays
+    (lists if numpy isn't available), shaped as the attributes of the
+    meshes returned by pyassimp.load. `material` is the MaterialBundle of
+    the mesh.
+    """
+    def __init__(self, mesh):
+        self.name = mesh.name
+        self.materialindex = mesh.mMaterialIndex
+        self.numuvcomponents = list(mesh.mNumUVComponents)
+        for name, build in core._mesh_attributes.items():
+            setattr(self, name, build(mesh))
+
+    def __repr__(self):
+        return "MeshBundle(" + self.name + ")"
+
+class MaterialBundle(object):
+    """
+    A material, with its `properties` as the materials returned by
+    pyassimp.load.
+    """
+    def __init__(self, material):
+        self.properties = material.properties
+
+    def __repr__(self):
+        return "MaterialBundle(" + str(self.properties.get('name', '')) + ")"
+
+def _metadata(metadata):
+    """ The entries of a metadata pointer as a dict (empty if it is NULL). """
+    if not metadata:
+        return {}
+    return dict(zip(metadata.keys, [entry.data for entry in metadata.values]))
+
+class NodeBundle(object):
+    """
+    A node of the scene hierarchy. `meshes` are MeshBundles of the
+    SceneBundle, and `metadata` is a dict.
+    """
+    def __init__(self, node, meshes):
+        self.name = node.name
+        self.transformation = node.transformation
+        self.meshes = [meshes[index] for index in node.mMeshes[:node.mNumMeshes]]
+        self.metadata = _metadata(node.metadata)
+        self.children = [NodeBundle(child, meshes) for child in node.children]
+
+    def __repr__(self):
+        return "NodeBundle(" + self.name + ")"
+
+class SceneBundle(object):
+    """
+    The picklable content of an imported model: its meshes, materials,
+    metadata and node hierarchy, with the same attributes as the scenes
+    returned by pyassimp.load. Cameras, lights, animations and textures are
+    not bundled. The nodes and meshes refer to the same MeshBundle and
+    MaterialBundle objects, which pickling preserves.
+    """
+    def __init__(self, path, scene):
+        self.path = path
+        self.materials = [MaterialBundle(material) for material in scene.materials]
+        self.meshes = [MeshBundle(mesh) for mesh in scene.meshes]
+        for mesh in self.meshes:
+            mesh.material = self.materials[mesh.materialindex]
+        self.metadata = _metadata(scene.metadata)
+        self.rootnode = NodeBundle(scene.rootnode, self.meshes)
+
+    def __repr__(self):
+        return "SceneBundle(" + self.path + ")"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        # not backed by assimp, nothing to release
+        pass
+
+    def memory_info(self):
+        """ See pyassimp.memory_info. """
+        return core.memory_info(self)
+
+def _load_bundle(args):
+    path, processing = args
+    try:
+        scene = core.load(path, processing=processing, lazy=True)
+    except AssimpError as e:
+        logger.error("Could not import " + path + ": " + str(e))
+        return path, None
+    try:
+        return path, SceneBundle(path, scene)
+    finally:
+        core.release(scene)
+
+def load_many(paths,
+              processing = postprocess.aiProcess_Triangulate,
+              workers    = None):
+    '''
+    Load many models in a pool of worker processes.
+
+    Arguments
+    ---------
+    paths:      iterable of model filenames.
+    processing: assimp postprocessing parameters, applied to every model.
+                See load().
+    workers:    number of worker processes. Defaults to the number of CPUs.
+
+    Returns
+    ---------
+    A generator of (path, SceneBundle) pairs, yielded as soon as each import
+    finishes, hence not necessarily in the order of `paths`. The bundle is
+    None if the model could not be imported (the error is logged).
+    '''
+    pool = multiprocessing.Pool(workers)
+    try:
+        for result in pool.imap_unordered(_load_bundle, ((path, processing) for path in paths)):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
@@ -0,0 +1,201 @@
+#-*- coding: UTF-8 -*-
+
+"""
+Content-addressed on-disk cache of converted scenes.
+
+A cache entry is keyed by the hash of the model data, the file type and the
+processing flags. It is a directory holding a pickle of the SceneBundle
+(node hierarchy, materials, metadata and meshes), whose mesh arrays are
+stored apart, one after the other, in a single binary file. The binary file
+is memory-mapped when the entry is read, and the mesh arrays are views of it.
+
+Only the model file itself is hashed: the files it refers to (eg. the .mtl
+of an .obj) are not part of the key.
+
+The cache is bounded in size: when it grows larger than max_size bytes, the
+least recently used entries are evicted.
+"""
+
+import hashlib
+import mmap
+import os
+import pickle
+import shutil
+
+import numpy
+
+import logging;logger = logging.getLogger("pyassimp")
+
+from . import batch
+from . import core
+from . import postprocess
+
+# Bump when the layout of the entries or of the bundles changes.
+FORMAT_VERSION = 3
+
+DEFAULT_MAX_SIZE = 4 << 30 # 4GB
+
+_SCENE_FILE = 'scene.pickle'
+_ARRAYS_FILE = 'arrays.bin'
+
+# alignment of the arrays in the binary file
+_ALIGNMENT = 16
+
+def _key(data, file_type, processing):
+    """ Hash of the model (a filename or a buffer) and of the load arguments. """
+    h = hashlib.sha1()
+    h.update(repr((FORMAT_VERSION, file_type, processing)).encode('ascii'))
+    if isinstance(data, (str, type(u''))):
+        with open(data, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
+    else:
+        h.update(memoryview(data))
+    return h.hexdigest()
+
+class _Pickler(pickle.Pickler):
+    """ Writes the mesh arrays to a binary file rather than to the pickle. """
+    def __init__(self, f, arrays_file, arrays):
+        pickle.Pickler.__init__(self, f, pickle.HIGHEST_PROTOCOL)
+        self.arrays_file = arrays_file
+        self.arrays = arrays
+
+    def persistent_id(self, obj):
+        if id(obj) not in self.arrays:
+            return None
+        offset = self.arrays_file.tell()
+        padding = -offset % _ALIGNMENT
+        self.arrays_file.write(b'\0' * padding)
+        numpy.ascontiguousarray(obj).tofile(self.arrays_file)
+        return (offset + padding, obj.dtype.str, obj.shape, obj.size)
+
+class _Unpickler(pickle.Unpickler):
+    """ Reads the mesh arrays as views of the memory-mapped binary file
+    (copy-on-write, so that they can be modified).
+    """
+    def __init__(self, f, arrays_path):
+        pickle.Unpickler.__init__(self, f)
+        self.arrays_path = arrays_path
+        self.buffer = None
+
+    def persistent_load(self, pid):
+        offset, dtype, shape, count = pid
+        if not count:
+            return numpy.empty(shape, dtype)
+        if self.buffer is None:
+            with open(self.arrays_path, 'rb') as f:
+                self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        return numpy.frombuffer(self.buffer, dtype, count, offset).reshape(shape)
+
+def _write(entry, bundle):
+    """ Writes a bundle to the entry directory, atomically. """
+    arrays = set(id(getattr(mesh, name))
+                 for mesh in bundle.meshes
+                 for name in core._mesh_attributes
+                 if isinstance(getattr(mesh, name), numpy.ndarray))
+    tmp = '%s.%d.tmp' % (entry, os.getpid())
+    try:
+        os.makedirs(tmp)
+        with open(os.path.join(tmp, _SCENE_FILE), 'wb') as f:
+            with open(os.path.join(tmp, _ARRAYS_FILE), 'wb') as arrays_file:
+                _Pickler(f, arrays_file, arrays).dump(bundle)
+        if os.path.isdir(entry):
+            shutil.rmtree(entry, ignore_errors=True)
+        os.rename(tmp, entry)
+    except (IOError, OSError) as e:
+        logger.warning("Could not write cache entry " + entry + ": " + str(e))
+        shutil.rmtree(tmp, ignore_errors=True)
+
+def _read(entry):
+    """ Reads a bundle from the entry directory, or returns None. """
+    try:
+        with open(os.path.join(entry, _SCENE_FILE), 'rb') as f:
+            bundle = _Unpickler(f, os.path.join(entry, _ARRAYS_FILE)).load()
+    except (IOError, OSError):
+        return None
+    except Exception as e:
+        logger.warning("Invalid cache entry " + entry + ": " + str(e))
+        return None
+    # the mtime of the entry tracks its last use
+    try:
+        os.utime(entry, None)
+    except OSError:
+        pass
+    return bundle
+
+def _entry_size(entry):
+    return sum(os.path.getsize(os.path.join(entry, f)) for f in os.listdir(entry))
+
+def evict(directory, max_size = DEFAULT_MAX_SIZE, keep = None):
+    '''
+    Removes the least recently used entries of the cache in `directory`
+    until its size is at most max_size bytes. The entry `keep` is never
+    removed.
+    '''
+    entries = []
+    for name in os.listdir(directory):
+        entry = os.path.join(directory, name)
+        if name.endswith('.tmp') or not os.path.isdir(entry):
+            continue
+        try:
+            entries.append((os.path.getmtime(entry), _entry_size(entry), entry))
+        except OSError:
+            # removed in the meantime
+            continue
+    total = sum(size for mtime, size, entry in entries)
+    for mtime, size, entry in sorted(entries):
+        if total <= max_size:
+            break
+        if entry == keep:
+            continue
+        logger.debug("Evicting cache entry " + entry)
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= size
+
+def load(directory,
+         filename,
+         file_type  = None,
+         processing = postprocess.aiProcess_Triangulate,
+         max_size   = DEFAULT_MAX_SIZE):
+    '''
+    Load a model through the cache in `directory`. On failure throws
+    AssimpError.
+
+    Arguments
+    ---------
+    directory:  cache directory, created if needed.
+    filename:   either a filename, a file object or a buffer (see
+                pyassimp.load).
+    file_type, processing: see pyassimp.load.
+    max_size:   size bound of the cache, in bytes.
+
+    Returns
+    ---------
+    The SceneBundle of the model (see pyassimp.load_many). It is not backed
+    by assimp, so it doesn't need to be released.
+    '''
+    if hasattr(filename, 'read') and not core._is_buffer(filename):
+        filename = filename.read()
+    path = filename if isinstance(filename, (str, type(u''))) else '<memory>'
+
+    entry = os.path.join(directory, _key(filename, file_type, processing))
+    bundle = _read(entry)
+    if bundle is not None:
+        logger.debug("Loaded " + path + " from cache entry " + entry)
+        return bundle
+
+    scene = core.load(filename, file_type, processing, lazy=True)
+    try:
+        bundle = batch.SceneBundle(path, scene)
+    finally:
+        core.release(scene)
+
+    if not os.path.isdir(directory):
+        try:
+            os.makedirs(directory)
+        except OSError:
+            # created in the meantime
+            pass
+    _write(entry, bundle)
+    evict(directory, max_size, keep=entry)
+    return bundle
@@ -14,7 +14,9 @@ if sys.version_info >= (3,0):
     xrange = range
 
 import ctypes
+import mmap
 import os
+import weakref
 
 try: import numpy
 except: numpy = None
@@ -34,8 +36,18 @@ from .formats import available_formats
 class AssimpLib(object):
     """
     Assimp-Singleton
+
+    The library is only searched for (see helper.search_library) when one of
+    its functions is first used.
     """
-    load, load_mem, export, export_blob, release, dll = helper.search_library()
+    _functions = ('load', 'load_mem', 'export', 'export_blob', 'release', 'dll')
+
+    def __getattr__(self, name):
+        if name not in self._functions:
+            raise AttributeError(name)
+        for function, value in zip(self._functions, helper.search_library()):
+            setattr(self, function, value)
+        return getattr(self, name)
 _assimp_lib = AssimpLib()
 
 def make_tuple(ai_obj, type = None):
@@ -78,6 +90,17 @@ def _init_face(aiFace):
     aiFace.indices = [aiFace.mIndices[i] for i in range(aiFace.mNumIndices)]
 assimp_struct_inits =  { structs.Face : _init_face }
 
+# Mesh members that _finalize_mesh builds (in bulk when numpy is
+# available) instead of going through the generic _init path.
+_mesh_bulk_fields = ('mVertices', 'mNormals', 'mTangents', 'mBitangents',
+                     'mColors', 'mTextureCoords', 'mFaces', 'mAnimMeshes')
+
+def _named_repr(x):
+    return str(x.__class__) + "(" + getattr(x, 'name','') + ")"
+
+def _named_str(x):
+    return getattr(x, 'name', '')
+
 def call_init(obj, caller = None):
     if helper.hasattr_silent(obj,'contents'): #pointer
         _init(obj.contents, obj, caller)
@@ -96,7 +119,7 @@ def _is_init_type(obj):
         return False
     tname = obj.__class__.__name__
     return not (tname[:2] == 'c_' or tname == 'Structure' \
-            or tname == 'POINTER') and not isinstance(obj,int)
+            or tname == 'POINTER') and not isinstance(obj, (int, bytes, str))
 
 def _init(self, target = None, parent = None):
     """
@@ -108,125 +131,164 @@ def _init(self, target = None, parent = None):
     if not target:
         target = self
 
-    dirself = dir(self)
-    for m in dirself:
-
-        if m.startswith("_"):
-            continue
-
-        if m.startswith('mNum'):
-            if 'm' + m[4:] in dirself:
-                continue # will be processed later on
-            else:
-                name = m[1:].lower()
-
-                obj = getattr(self, m)
-                setattr(target, name, obj)
-                continue
-
-        if m == 'mName':
-            target.name = str(_convert_assimp_string(self.mName))
-            target.__class__.__repr__ = lambda x: str(x.__class__) + "(" + getattr(x, 'name','') + ")"
-            target.__class__.__str__ = lambda x: getattr(x, 'name', '')
-            continue
-
-        name = m[1:].lower()
-
-        obj = getattr(self, m)
-
-        # Create tuples
-        if isinstance(obj, structs.assimp_structs_as_tuple):
-            setattr(target, name, make_tuple(obj))
-            logger.debug(str(self) + ": Added array " + str(getattr(target, name)) +  " as self." + name.lower())
-            continue
-
-        if m.startswith('m'):
-
-            if name == "parent":
-                setattr(target, name, parent)
-                logger.debug("Added a parent as self." + name)
-                continue
+    for m, name, convert in _init_plan(type(self)):
+        convert(self, target, parent)
 
-            if helper.hasattr_silent(self, 'mNum' + m[1:]):
+    if isinstance(self, structs.Mesh):
+        _finalize_mesh(self, target)
 
-                length =  getattr(self, 'mNum' + m[1:])
+    if isinstance(self, structs.Texture):
+        _finalize_texture(self, target)
 
-                # -> special case: properties are
-                # stored as a dict.
-                if m == 'mProperties':
-                    setattr(target, name, _get_properties(obj, length))
-                    continue
+    if isinstance(self, structs.Metadata):
+        _finalize_metadata(self, target)
 
 
-                if not length: # empty!
-                    setattr(target, name, [])
-                    logger.debug(str(self) + ": " + name + " is an empty list.")
-                    continue
+    return self
 
+# Conversion plans of the assimp structs, by struct class. See _init_plan.
+_init_plans = {}
 
-                try:
-                    if obj._type_ in structs.assimp_structs_as_tuple:
-                        if numpy:
-                            setattr(target, name, numpy.array([make_tuple(obj[i]) for i in range(length)], dtype=numpy.float32))
+def _init_plan(cls):
+    """
+    Returns the conversion plan of a struct class: a list of
+    (member, attribute name, converter) with one converter per member to
+    expose, called as converter(struct, target, parent).
 
-                            logger.debug(str(self) + ": Added an array of numpy arrays (type "+ str(type(obj)) + ") as self." + name)
-                        else:
-                            setattr(target, name, [make_tuple(obj[i]) for i in range(length)])
+    The plan is derived from the class _fields_ the first time the class is
+    seen, and cached.
+    """
+    try:
+        return _init_plans[cls]
+    except KeyError:
+        pass
 
-                            logger.debug(str(self) + ": Added a list of lists (type "+ str(type(obj)) + ") as self." + name)
+    fields = [f[0] for f in cls._fields_]
+    plan = []
+    for m, ctype in cls._fields_:
 
-                    else:
-                        setattr(target, name, [obj[i] for i in range(length)]) #TODO: maybe not necessary to recreate an array?
+        if cls is structs.Mesh and m in _mesh_bulk_fields:
+            continue # built by _finalize_mesh
 
-                        logger.debug(str(self) + ": Added list of " + str(obj) + " " + name + " as self." + name + " (type: " + str(type(obj)) + ")")
+        if m.startswith('mNum'):
+            if 'm' + m[4:] in fields:
+                continue # processed along with its array
+            plan.append((m, m[1:].lower(), _convert_value(m, m[1:].lower(), False)))
+            continue
 
-                        # initialize array elements
-                        try:
-                            init = assimp_struct_inits[type(obj[0])]
-                        except KeyError:
-                            if _is_init_type(obj[0]):
-                                for e in getattr(target, name):
-                                    call_init(e, target)
-                        else:
-                            for e in getattr(target, name):
-                                init(e)
+        if m == 'mName':
+            plan.append((m, 'name', _convert_name))
+            # the name is used for the string representation
+            cls.__repr__ = ctypes.POINTER(cls).__repr__ = _named_repr
+            cls.__str__ = ctypes.POINTER(cls).__str__ = _named_str
+            continue
 
+        name = m[1:].lower()
 
-                except IndexError:
-                    logger.error("in " + str(self) +" : mismatch between mNum" + name + " and the actual amount of data in m" + name + ". This may be due to version mismatch between libassimp and pyassimp. Quitting now.")
-                    sys.exit(1)
+        # Create tuples
+        if issubclass(ctype, structs.assimp_structs_as_tuple):
+            plan.append((m, name, _convert_tuple(m, name)))
+            continue
 
-                except ValueError as e:
+        if not m.startswith('m'):
+            continue
 
-                    logger.error("In " + str(self) +  "->" + name + ": " + str(e) + ". Quitting now.")
-                    if "setting an array element with a sequence" in str(e):
-                        logger.error("Note that pyassimp does not currently "
-                                     "support meshes with mixed triangles "
-                                     "and quads. Try to load your mesh with"
-                                     " a post-processing to triangulate your"
-                                     " faces.")
-                    raise e
+        if name == "parent":
+            plan.append((m, name, _convert_parent))
+        elif 'mNum' + m[1:] in fields:
+            if m == 'mProperties':
+                plan.append((m, name, _convert_properties))
+            else:
+                plan.append((m, name, _convert_array(m, name, 'mNum' + m[1:], ctype._type_)))
+        else:
+            # only pointers and embedded structs may need to be initialized,
+            # arrays (of texture coordinates, colors...) are left as is.
+            may_init = issubclass(ctype, (ctypes._Pointer, ctypes.Structure))
+            plan.append((m, name, _convert_value(m, name, may_init)))
 
+    _init_plans[cls] = plan
+    return plan
 
+def _convert_name(self, target, parent):
+    target.name = str(_convert_assimp_string(self.mName))
 
-            else: # starts with 'm' but not iterable
-                setattr(target, name, obj)
-                logger.debug("Added " + name + " as self." + name + " (type: " + str(type(obj)) + ")")
+def _convert_parent(self, target, parent):
+    target.parent = parent
 
-                if _is_init_type(obj):
-                    call_init(obj, target)
+def _convert_properties(self, target, parent):
+    target.properties = _get_properties(self.mProperties, self.mNumProperties)
 
-    if isinstance(self, structs.Mesh):
-        _finalize_mesh(self, target)
+def _convert_tuple(m, name):
+    def convert(self, target, parent):
+        setattr(target, name, make_tuple(getattr(self, m)))
+        logger.debug("%s: Added array %s as self.%s", self, getattr(target, name), name)
+    return convert
 
-    if isinstance(self, structs.Texture):
-        _finalize_texture(self, target)
-
-    if isinstance(self, structs.Metadata):
-        _finalize_metadata(self, target)
-
-
-    return self
+def _convert_value(m, name, may_init):
+    def convert(self, target, parent):
+        obj = getattr(self, m)
+        setattr(target, name, obj)
+
+        if may_init and _is_init_type(obj):
+            call_init(obj, target)
+    return convert
+
+def _convert_array(m, name, count, element):
+    """ Converter for an array member `m` of `count` elements of type `element`. """
+
+    if element in structs.assimp_structs_as_tuple:
+        if numpy and all(f[1] is ctypes.c_float for f in element._fields_):
+            shape = numpy.shape(make_tuple(element()))
+            components = len(element._fields_)
+            def convert_elements(obj, length, target):
+                return _numpy_array(obj, length, components).reshape((length,) + shape)
+        elif numpy:
+            def convert_elements(obj, length, target):
+                return numpy.array([make_tuple(obj[i]) for i in range(length)], dtype=numpy.float32)
+        else:
+            def convert_elements(obj, length, target):
+                return [make_tuple(obj[i]) for i in range(length)]
+    else:
+        init = assimp_struct_inits.get(element)
+        def convert_elements(obj, length, target):
+            elements = [obj[i] for i in range(length)] #TODO: maybe not necessary to recreate an array?
+
+            # initialize array elements
+            if init:
+                for e in elements:
+                    init(e)
+            elif _is_init_type(obj[0]):
+                for e in elements:
+                    call_init(e, target)
+            return elements
+
+    def convert(self, target, parent):
+        length = getattr(self, count)
+
+        if not length: # empty!
+            setattr(target, name, [])
+            logger.debug("%s: %s is an empty list.", self, name)
+            return
+
+        try:
+            setattr(target, name, convert_elements(getattr(self, m), length, target))
+            logger.debug("%s: Added %s elements as self.%s", self, m, name)
+
+        except IndexError:
+            logger.error("in " + str(self) +" : mismatch between mNum" + name + " and the actual amount of data in m" + name + ". This may be due to version mismatch between libassimp and pyassimp. Quitting now.")
+            sys.exit(1)
+
+        except ValueError as e:
+
+            logger.error("In " + str(self) +  "->" + name + ": " + str(e) + ". Quitting now.")
+            if "setting an array element with a sequence" in str(e):
+                logger.error("Note that pyassimp does not currently "
+                             "support meshes with mixed triangles "
+                             "and quads. Try to load your mesh with"
+                             " a post-processing to triangulate your"
+                             " faces.")
+            raise e
+    return convert
 
 
 def pythonize_assimp(type, obj, scene):
@@ -249,13 +311,7 @@ def pythonize_assimp(type, obj, scene):
         return meshes
 
     if type == "ADDTRANSFORMATION":
-        def getnode(node, name):
-            if node.name == name: return node
-            for child in node.children:
-                n = getnode(child, name)
-                if n: return n
-
-        node = getnode(scene.rootnode, obj.name)
+        node = scene.node_by_name.get(obj.name)
         if not node:
             raise AssimpError("Object " + str(obj) + " has no associated node!")
         setattr(obj, "transformation", node.transformation)
@@ -269,22 +325,114 @@ def recur_pythonize(node, scene):
     node.meshes = pythonize_assimp("MESH", node.meshes, scene)
     for mesh in node.meshes:
         mesh.material = scene.materials[mesh.materialindex]
-    for cam in scene.cameras:
-        pythonize_assimp("ADDTRANSFORMATION", cam, scene)
     for c in node.children:
         recur_pythonize(c, scene)
 
+def _node_index(root):
+    """ Returns a dict of the nodes under root by name. For duplicate names,
+    the first node in depth-first order is kept.
+    """
+    index = {}
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        index.setdefault(node.name, node)
+        stack.extend(reversed(node.children))
+    return index
+
+def _bind_cameras(cameras, scene):
+    for cam in cameras:
+        pythonize_assimp("ADDTRANSFORMATION", cam, scene)
+
+def _bind_lights(lights, scene):
+    for light in lights:
+        node = scene.node_by_name.get(light.name)
+        if node:
+            light.transformation = node.transformation
+
+def _bind_bones(bones, scene):
+    for bone in bones:
+        bone.node = scene.node_by_name.get(bone.name)
+
+def _bind_channels(channels, scene):
+    for channel in channels:
+        channel.node = scene.node_by_name.get(_convert_assimp_string(channel.nodename))
+
+def _bind_animations(animations, scene):
+    for animation in animations:
+        _bind_channels(animation.channels, scene)
+
+def _bind_nodes(scene):
+    '''
+    Links the cameras, lights, bones and animation channels of the scene to
+    their nodes, through the scene.node_by_name index:
+     - cameras and lights get the transformation of their node,
+     - bones and channels get their node as `node` (None if there is none).
+    '''
+    scene.node_by_name = _node_index(scene.rootnode)
+    _bind_cameras(scene.cameras, scene)
+    _bind_lights(scene.lights, scene)
+    for mesh in scene.meshes:
+        _bind_bones(mesh.bones, scene)
+    _bind_animations(scene.animations, scene)
+
+def _is_buffer(obj):
+    """ True if obj is a buffer-protocol object holding the model data. """
+    if isinstance(obj, (str, type(u''))): # a filename
+        return False
+    try:
+        memoryview(obj)
+    except TypeError:
+        return False
+    return True
+
+def _buffer_pointer(data):
+    """
+    Returns a pointer to the contents of the buffer-protocol object `data`,
+    and their size in bytes.
+
+    The contents are only copied if the buffer is neither writable nor
+    contiguous and numpy is not available. The pointer keeps `data` exported
+    until it is deleted.
+    """
+    if isinstance(data, bytes):
+        return data, len(data)
+    view = memoryview(data)
+    length = view.nbytes
+    if not view.contiguous:
+        data = view.tobytes()
+        return data, length
+    try:
+        return (ctypes.c_char * length).from_buffer(view), length
+    except TypeError: # read-only buffer
+        if numpy:
+            return numpy.frombuffer(view, numpy.uint8).ctypes.data_as(ctypes.c_void_p), length
+        data = view.tobytes()
+        return data, length
+
+def _file_hint(file_type):
+    if file_type == None:
+        raise AssimpError('File type must be specified when passing file objects or buffers!')
+    if not isinstance(file_type, bytes):
+        file_type = file_type.encode('ascii')
+    return file_type
+
 def load(filename,
          file_type  = None,
-         processing = postprocess.aiProcess_Triangulate):
+         processing = postprocess.aiProcess_Triangulate,
+         lazy       = False,
+         cache      = None,
+         max_size   = None):
     '''
     Load a model into a scene. On failure throws AssimpError.
 
     Arguments
     ---------
-    filename:   Either a filename or a file object to load model from.
-                If a file object is passed, file_type MUST be specified
-                Otherwise Assimp has no idea which importer to use.
+    filename:   Either a filename, a file object or a buffer-protocol object
+                (bytes, bytearray, memoryview, mmap...) to load model from.
+                If a file object or a buffer is passed, file_type MUST be
+                specified. Otherwise Assimp has no idea which importer to use.
+                Buffers are passed to Assimp without being copied.
                 This is named 'filename' so as to not break legacy code.
     processing: assimp postprocessing parameters. Verbose keywords are imported
                 from postprocessing, and the parameters can be combined bitwise to
@@ -293,38 +441,111 @@ def load(filename,
                 processing = (pyassimp.postprocess.aiProcess_Triangulate |
                               pyassimp.postprocess.aiProcess_OptimizeMeshes)
     file_type:  string of file extension, such as 'stl'
+    lazy:       if True, the members of the scene, its nodes, meshes and
+                materials are only converted when first accessed (and then
+                cached), instead of converting the whole scene upfront.
+                Note that the scene must not be released while it is in use.
+    cache:      directory of an on-disk cache of converted scenes, keyed by
+                the content of the model and the processing flags (see
+                pyassimp.cache). If given, a SceneBundle is returned (see
+                load_many) with memory-mapped mesh arrays, and lazy is
+                ignored.
+    max_size:   size bound of the cache, in bytes (see pyassimp.cache.load).
 
     Returns
     ---------
-    Scene object with model data
+    Scene object with model data. The native scene is released by release(),
+    when leaving a `with` block on the scene, or at the latest when the scene
+    is garbage collected:
+
+        with load('model.fbx') as scene:
+            print(scene.memory_info())
     '''
 
-    if hasattr(filename, 'read'):
+    if cache is not None:
+        from . import cache as scene_cache
+        if max_size is None:
+            max_size = scene_cache.DEFAULT_MAX_SIZE
+        return scene_cache.load(cache, filename, file_type, processing, max_size)
+
+    if _is_buffer(filename) or hasattr(filename, 'read'):
         '''
-        This is the case where a file object has been passed to load.
-        It is calling the following function:
+        This is the case where a buffer or a file object has been passed to
+        load. It is calling the following function:
         const aiScene* aiImportFileFromMemory(const char* pBuffer,
                                               unsigned int pLength,
                                               unsigned int pFlags,
                                               const char* pHint)
         '''
-        if file_type == None:
-            raise AssimpError('File type must be specified when passing file objects!')
-        data  = filename.read()
+        hint = _file_hint(file_type)
+        if _is_buffer(filename):
+            data, length = _buffer_pointer(filename)
+        else:
+            data = filename.read()
+            length = len(data)
+        if length > 0xffffffff:
+            raise AssimpError('Could not import file: models larger than 4GB can not be loaded from memory!')
         model = _assimp_lib.load_mem(data,
-                                     len(data),
+                                     length,
                                      processing,
-                                     file_type)
+                                     hint)
+        # release the buffer before anything else happens to it
+        del data
     else:
         # a filename string has been passed
         model = _assimp_lib.load(filename.encode(sys.getfilesystemencoding()), processing)
 
     if not model:
         raise AssimpError('Could not import file!')
-    scene = _init(model.contents)
+    scene = model.contents
+    # release the native scene at the latest when the scene is collected
+    # (the lazy members of the scene keep a reference to it)
+    scene._release = weakref.finalize(scene, _assimp_lib.release,
+                                      ctypes.cast(ctypes.addressof(scene), ctypes.POINTER(structs.Scene)))
+    if lazy:
+        return _lazy(scene, scene, None)
+    _init(scene)
     recur_pythonize(scene.rootnode, scene)
+    _bind_nodes(scene)
     return scene
 
+def load_mmap(filename,
+              file_type  = None,
+              processing = postprocess.aiProcess_Triangulate,
+              lazy       = False):
+    '''
+    Load a model from a memory-mapped file. On failure throws AssimpError.
+
+    The file is mapped copy-on-write and handed to Assimp without being read
+    into Python memory first, and it is unmapped once the import is done.
+
+    Arguments
+    ---------
+    filename:   Name of the file to load model from.
+    file_type:  string of file extension, such as 'stl'. Defaults to the
+                extension of filename.
+    processing, lazy: see load.
+
+    Returns
+    ---------
+    Scene object with model data
+    '''
+    if file_type == None:
+        file_type = os.path.splitext(filename)[1][1:]
+    with open(filename, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    try:
+        return load(data, file_type, processing, lazy)
+    finally:
+        data.close()
+
+def _check_exportable(scene):
+    if not isinstance(scene, structs.Scene):
+        # eg. a SceneBundle loaded from a cache or by load_many
+        raise AssimpError('Only the scenes imported by assimp can be exported, not ' + repr(scene))
+    if _released(scene):
+        raise AssimpError('The scene has been released!')
+
 def export(scene,
            filename,
            file_type  = None,
@@ -347,6 +568,7 @@ def export(scene,
     '''
 
     from ctypes import pointer
+    _check_exportable(scene)
     exportStatus = _assimp_lib.export(pointer(scene), file_type.encode("ascii"), filename.encode(sys.getfilesystemencoding()), processing)
 
     if exportStatus != 0:
@@ -370,79 +592,389 @@ def export_blob(scene,
                               pyassimp.postprocess.aiProcess_OptimizeMeshes)
     Returns
     ---------
-    Pointer to structs.ExportDataBlob
+    Pointer to structs.ExportDataBlob, to release with
+    ExportBlobs(blob).release() (or use export_blobs instead).
     '''
     from ctypes import pointer
+    _check_exportable(scene)
     exportBlobPtr = _assimp_lib.export_blob(pointer(scene), file_type.encode("ascii"), processing)
 
-    if exportBlobPtr == 0:
+    if not exportBlobPtr:
         raise AssimpError('Could not export scene to blob!')
     return exportBlobPtr
 
+class ExportBlobs(object):
+    '''
+    The chain of blobs of a scene exported to memory (see export_blobs).
+
+    Iterating yields (name, memoryview) pairs straight over the native
+    buffers: first the primary blob, with an empty name, then the auxiliary
+    files, named by their extension (for example 'mtl' or 'bin').
+
+    The blobs are released with aiReleaseExportBlob when leaving the `with`
+    block or calling release(), and the memoryviews must not be used after
+    that. Otherwise, the memoryviews keep the blobs alive: they are only
+    released when both this object and all of its memoryviews are gone, so
+    that list(export_blobs(scene, 'obj')) is safe.
+    '''
+    def __init__(self, blob):
+        self._blob = blob
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def __del__(self):
+        self.release()
+
+    def __iter__(self):
+        if not self._blob:
+            raise AssimpError('The export blobs have been released!')
+        blob = self._blob
+        while blob:
+            blob = blob.contents
+            if blob.size:
+                array = (ctypes.c_char * blob.size).from_address(blob.data)
+                # from_address does not own the memory: keep the blobs alive
+                # as long as a view on them exists.
+                array._blobs = self
+                data = memoryview(array).cast('B')
+            else:
+                data = memoryview(b'')
+            yield _convert_assimp_string(blob.name), data
+            blob = blob.next
+
+    def release(self):
+        if self._blob:
+            _assimp_lib.dll.aiReleaseExportBlob(self._blob)
+            self._blob = None
+
+    def write_to(self, directory, filename):
+        '''
+        Writes the blobs to files in `directory`: the primary blob to
+        `filename`, and the auxiliary ones next to it, with their name as
+        extension. The data is written straight from the native buffers.
+
+        Returns the list of the paths written.
+        '''
+        base = os.path.splitext(filename)[0]
+        paths = []
+        for name, data in self:
+            path = os.path.join(directory, base + '.' + name if name else filename)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+            try:
+                while len(data):
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+            paths.append(path)
+        return paths
+
+def export_blobs(scene,
+                 file_type = None,
+                 processing = postprocess.aiProcess_Triangulate):
+    '''
+    Export a scene to memory. On failure throws AssimpError.
+
+    Arguments: see export_blob.
+
+    Returns
+    ---------
+    ExportBlobs, to use as a context manager:
+
+        with export_blobs(scene, 'obj') as blobs:
+            blobs.write_to('/tmp', 'model.obj')
+    '''
+    return ExportBlobs(export_blob(scene, file_type, processing))
+
 def release(scene):
+    '''
+    Releases the native assimp scene. The members converted to python
+    objects (and numpy arrays) stay valid, but the lazy members that have
+    not been accessed yet and the native m* fields of the structs must not
+    be used anymore.
+
+    Scenes returned by load are also released when leaving their `with`
+    block, or when they are garbage collected. Releasing a scene again does
+    nothing.
+    '''
+    if not isinstance(scene, structs.Scene):
+        # scenes loaded from a cache are not backed by assimp
+        return
+    finalizer = getattr(scene, '_release', None)
+    if finalizer is not None:
+        finalizer() # only calls aiReleaseImport once
+        return
     from ctypes import pointer
     _assimp_lib.release(pointer(scene))
 
+def _released(scene):
+    finalizer = getattr(scene, '_release', None)
+    return finalizer is not None and not finalizer.alive
+
+# base classes of the ctypes objects, which view native memory
+_ctypes_data = (ctypes._SimpleCData, ctypes._Pointer, ctypes.Array, ctypes.Structure, ctypes.Union)
+
+def _array_size(array, seen):
+    """ Bytes of the memory holding a numpy array, if it was not counted
+    yet: the array's own data, or the whole buffer (eg. a memory-mapped
+    cache file) it is a view of. Views of assimp's memory are not counted.
+    """
+    base = array
+    while True:
+        if isinstance(base, numpy.ndarray) and base.base is not None:
+            base = base.base
+        elif isinstance(base, memoryview):
+            # numpy.frombuffer wraps the buffer in a new memoryview each time
+            base = base.obj
+        else:
+            break
+    if id(base) in seen or isinstance(base, _ctypes_data):
+        return 0
+    seen.add(id(base))
+    if isinstance(base, numpy.ndarray):
+        return base.nbytes
+    return memoryview(base).nbytes
+
+def _converted_size(obj, seen):
+    """ Bytes held by the python objects reachable from obj (each counted
+    once), without the native memory of the assimp structs.
+    """
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        if numpy and isinstance(obj, numpy.ndarray):
+            size += _array_size(obj, seen)
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, _ctypes_data):
+            # only the members converted on the struct (or on its pointer),
+            # not the lazy loading context
+            members = dict((k, v) for k, v in getattr(obj, '__dict__', {}).items() if not k.startswith('_'))
+            if members:
+                size += sys.getsizeof(members)
+                stack.extend(members.values())
+            continue
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif hasattr(obj, '__dict__'):
+            stack.append(vars(obj))
+    return size
+
+def memory_info(scene):
+    '''
+    Returns the memory held by a scene, in bytes, as a dict with:
+     - the storage allocated by assimp for the scene, as computed by
+       aiGetMemoryRequirements (see structs.MemoryInfo): 'textures',
+       'materials', 'meshes', 'nodes', 'animations', 'cameras', 'lights'
+       and their 'total',
+     - 'converted': the python objects and numpy arrays the scene has been
+       converted to so far (for lazy scenes, the members accessed so far).
+
+    The storage of assimp is 0 for released scenes and for scenes loaded
+    from a cache.
+    '''
+    info = structs.MemoryInfo()
+    if isinstance(scene, structs.Scene) and not _released(scene):
+        _assimp_lib.dll.aiGetMemoryRequirements(ctypes.pointer(scene), ctypes.byref(info))
+    result = dict((name, getattr(info, name)) for name, ctype in structs.MemoryInfo._fields_)
+    result['converted'] = _converted_size(scene, set())
+    return result
+
+def _scene_enter(scene):
+    return scene
+
+def _scene_exit(scene, *exc_info):
+    release(scene)
+
+structs.Scene.__enter__ = _scene_enter
+structs.Scene.__exit__ = _scene_exit
+structs.Scene.memory_info = memory_info
+
 def _finalize_texture(tex, target):
+    """ Copies the texels of an uncompressed texture at once, as a
+    (height, width, 4) uint8 array of BGRA texels (a list of texel tuples if
+    numpy isn't available), or the payload of a compressed texture (PNG,
+    JPEG... as told by achformathint) as bytes.
+    """
     setattr(target, "achformathint", tex.achFormatHint)
-    if numpy:
-        data = numpy.array([make_tuple(getattr(tex, "pcData")[i]) for i in range(tex.mWidth * tex.mHeight)])
+    if not tex.mHeight:
+        # compressed texture: mWidth is the size of the payload in bytes
+        data = _numpy_bytes(tex.pcData, tex.mWidth).raw if tex.pcData else b''
+    elif numpy:
+        size = tex.mWidth * tex.mHeight * ctypes.sizeof(structs.Texel)
+        data = numpy.frombuffer(_numpy_bytes(tex.pcData, size), dtype=numpy.uint8)
+        data = data.reshape((tex.mHeight, tex.mWidth, 4)).copy()
     else:
         data = [make_tuple(getattr(tex, "pcData")[i]) for i in range(tex.mWidth * tex.mHeight)]
     setattr(target, "data", data)
 
-def _finalize_mesh(mesh, target):
-    """ Building of meshes is a bit specific.
+def _numpy_array(pointer, count, components, ctype = ctypes.c_float, dtype = None):
+    """ Copies `count` native structs of `components` scalars each into a
+    (count, components) numpy array, with a single buffer copy.
 
-    We override here the various datasets that can
-    not be process as regular fields.
+    The data is copied rather than viewed so that the array stays valid
+    after the scene is released.
+    """
+    array_type = ctype * (count * components)
+    data = ctypes.cast(pointer, ctypes.POINTER(array_type)).contents
+    return numpy.frombuffer(data, dtype=dtype or numpy.float32).reshape((count, components)).copy()
+
+def _numpy_bytes(pointer, size):
+    return ctypes.cast(pointer, ctypes.POINTER(ctypes.c_char * size)).contents
+
+# Layout of aiFace, used to read all the face headers at once.
+_face_dtype = numpy and numpy.dtype({'names': ['count', 'indices'],
+                                     'formats': [numpy.uint32, numpy.uintp],
+                                     'offsets': [structs.Face.mNumIndices.offset,
+                                                 structs.Face.mIndices.offset],
+                                     'itemsize': ctypes.sizeof(structs.Face)})
+
+def _faces_array(mesh):
+    """ Gathers the indices of every face of the mesh into one contiguous
+    int32 buffer.
+
+    The buffer is returned with shape (nb_faces, nb_indices) when all the
+    faces have the same number of indices, and flat otherwise.
+    """
+    nb_faces = mesh.mNumFaces
+    if not nb_faces:
+        return numpy.array([], dtype=numpy.int32)
+
+    headers = numpy.frombuffer(_numpy_bytes(mesh.mFaces, nb_faces * _face_dtype.itemsize),
+                               dtype=_face_dtype)
+    counts = headers['count'].astype(numpy.intp)
+    offsets = numpy.cumsum(counts) - counts
+
+    faces = numpy.empty(int(counts.sum()), dtype=numpy.int32)
+    base = faces.ctypes.data
+    itemsize = faces.itemsize
+    memmove = ctypes.memmove
+    for address, count, offset in zip(headers['indices'].tolist(), counts.tolist(), offsets.tolist()):
+        memmove(base + offset * itemsize, address, count * itemsize)
+
+    if (counts == counts[0]).all():
+        faces = faces.reshape((nb_faces, int(counts[0])))
+    return faces
+
+def _vertex_data(mAttr, nb_vertices, components):
+    if numpy:
+        if mAttr:
+            return _numpy_array(mAttr, nb_vertices, components)
+        return numpy.array([], dtype="float32")
+    else:
+        if mAttr:
+            return [make_tuple(mAttr[i]) for i in range(nb_vertices)]
+        return []
 
-    For instance, the length of the normals array is
-    mNumVertices (no mNumNormals is available)
+def _vertex_attribute(mesh, name, components = 3):
+    """ Per-vertex attribute `name` of the mesh (eg. 'mNormals'), or an
+    empty array if the mesh doesn't have it.
     """
-    nb_vertices = getattr(mesh, "mNumVertices")
+    return _vertex_data(getattr(mesh, name), mesh.mNumVertices, components)
 
-    def fill(name):
-        mAttr = getattr(mesh, name)
-        if numpy:
-            if mAttr:
-                data = numpy.array([make_tuple(getattr(mesh, name)[i]) for i in range(nb_vertices)], dtype=numpy.float32)
-                setattr(target, name[1:].lower(), data)
-            else:
-                setattr(target, name[1:].lower(), numpy.array([], dtype="float32"))
-        else:
-            if mAttr:
-                data = [make_tuple(getattr(mesh, name)[i]) for i in range(nb_vertices)]
-                setattr(target, name[1:].lower(), data)
-            else:
-                setattr(target, name[1:].lower(), [])
+def _vertex_attribute_sets(mesh, name, components):
+    """ Like _vertex_attribute, for the attributes that come as several
+    sets (colors and texture coordinates). Missing sets are skipped.
+    """
+    data = [_vertex_data(mSubAttr, mesh.mNumVertices, components) for mSubAttr in getattr(mesh, name) if mSubAttr]
 
-    def fillarray(name):
-        mAttr = getattr(mesh, name)
+    if numpy:
+        return numpy.array(data, dtype=numpy.float32)
+    return data
 
-        data = []
-        for index, mSubAttr in enumerate(mAttr):
-            if mSubAttr:
-                data.append([make_tuple(getattr(mesh, name)[index][i]) for i in range(nb_vertices)])
+def _morph_deltas(mesh, name):
+    """ Differences between the attribute `name` (eg. 'mVertices') of the
+    anim meshes (morph targets) and of the mesh, as one (targets, N, 3)
+    float32 array, with no target if the mesh doesn't have the attribute.
 
-        if numpy:
-            setattr(target, name[1:].lower(), numpy.array(data, dtype=numpy.float32))
+    An anim mesh without the attribute leaves it unchanged (zero deltas).
+    """
+    base = getattr(mesh, name)
+    nb_targets = mesh.mNumAnimMeshes if base else 0
+    nb_vertices = mesh.mNumVertices
+    targets = [getattr(mesh.mAnimMeshes[i].contents, name) for i in range(nb_targets)]
+
+    if not numpy:
+        deltas = []
+        for target in targets:
+            if not target:
+                deltas.append([(0.0, 0.0, 0.0)] * nb_vertices)
+                continue
+            deltas.append([tuple(t - b for t, b in zip(make_tuple(target[v]), make_tuple(base[v])))
+                           for v in range(nb_vertices)])
+        return deltas
+
+    if not targets:
+        return numpy.zeros((nb_targets, nb_vertices, 3), dtype=numpy.float32)
+    size = nb_vertices * ctypes.sizeof(structs.Vector3D)
+    base = numpy.frombuffer(_numpy_bytes(base, size), dtype=numpy.float32).reshape((nb_vertices, 3))
+    deltas = numpy.empty((nb_targets, nb_vertices, 3), dtype=numpy.float32)
+    for delta, target in zip(deltas, targets):
+        if target:
+            target = numpy.frombuffer(_numpy_bytes(target, size), dtype=numpy.float32).reshape((nb_vertices, 3))
+            numpy.subtract(target, base, out=delta)
         else:
-            setattr(target, name[1:].lower(), data)
-
-    fill("mNormals")
-    fill("mTangents")
-    fill("mBitangents")
+            delta.fill(0.0)
+    return deltas
 
-    fillarray("mColors")
-    fillarray("mTextureCoords")
+def _morph_weights(mesh):
+    weights = [mesh.mAnimMeshes[i].contents.mWeight for i in range(mesh.mNumAnimMeshes)]
+    if numpy:
+        return numpy.array(weights, dtype=numpy.float32)
+    return weights
 
-    # prepare faces
+def _mesh_faces(mesh):
     if numpy:
-        faces = numpy.array([f.indices for f in target.faces], dtype=numpy.int32)
-    else:
-        faces = [f.indices for f in target.faces]
-    setattr(target, 'faces', faces)
+        return _faces_array(mesh)
+    faces = [mesh.mFaces[i] for i in range(mesh.mNumFaces)]
+    return [[f.mIndices[i] for i in range(f.mNumIndices)] for f in faces]
+
+# Builders for the mesh attributes that can not be processed as regular
+# fields, by attribute name.
+_mesh_attributes = {
+    'vertices': lambda mesh: _vertex_attribute(mesh, "mVertices"),
+    'normals': lambda mesh: _vertex_attribute(mesh, "mNormals"),
+    'tangents': lambda mesh: _vertex_attribute(mesh, "mTangents"),
+    'bitangents': lambda mesh: _vertex_attribute(mesh, "mBitangents"),
+    'colors': lambda mesh: _vertex_attribute_sets(mesh, "mColors", 4),
+    'texturecoords': lambda mesh: _vertex_attribute_sets(mesh, "mTextureCoords", 3),
+    'faces': _mesh_faces,
+    'morphtargets': lambda mesh: _morph_deltas(mesh, "mVertices"),
+    'morphnormals': lambda mesh: _morph_deltas(mesh, "mNormals"),
+    'morphweights': _morph_weights,
+    # mNumAnimMeshes is paired with mAnimMeshes, which is not converted
+    'numanimmeshes': lambda mesh: mesh.mNumAnimMeshes,
+}
+
+def _finalize_mesh(mesh, target):
+    """ Building of meshes is a bit specific.
+
+    We override here the various datasets that can
+    not be process as regular fields.
+
+    For instance, the length of the normals array is
+    mNumVertices (no mNumNormals is available)
+
+    With numpy, each vertex attribute is copied from the native
+    buffer at once into a float32 array, and the faces into an int32
+    array, without going through per-vertex python objects.
+
+    The anim meshes (morph targets) are exposed as the differences of
+    their positions and normals with the mesh's (morphtargets and
+    morphnormals), and their weights (morphweights).
+    """
+    for name, build in _mesh_attributes.items():
+        setattr(target, name, build(mesh))
 
 def _init_metadata_entry(entry):
     from ctypes import POINTER, c_bool, c_int32, c_uint64, c_float, c_double, cast
@@ -482,6 +1014,84 @@ def _finalize_metadata(metadata, target):
     setattr(target, 'keys', [str(_convert_assimp_string(metadata.mKeys[i])) for i in range(length)])
     setattr(target, 'values', [_init_metadata_entry(metadata.mValues[i]) for i in range(length)])
 
+class _LazyMember(object):
+    """
+    Resolves a member of a lazily loaded struct on first access.
+
+    This is a non-data descriptor: the resolved value is stored in the
+    instance dict, which then takes precedence over the descriptor.
+    """
+    def __init__(self, name, resolve):
+        self.name = name
+        self.resolve = resolve
+
+    def __get__(self, obj, objtype = None):
+        if obj is None:
+            return self
+        value = self.resolve(obj)
+        setattr(obj, self.name, value)
+        return value
+
+def _lazy(struct, scene, parent):
+    """ Attaches to a lazily loaded struct the context its members need. """
+    struct._scene = scene
+    struct._parent = parent
+    return struct
+
+def _lazy_array(obj, m):
+    array = getattr(obj, m)
+    return [_lazy(array[i].contents, obj._scene, obj) for i in range(getattr(obj, 'mNum' + m[1:]))]
+
+def _lazy_generic(name, convert):
+    def resolve(obj):
+        convert(obj, obj, getattr(obj, '_parent', None))
+        return obj.__dict__[name]
+    return resolve
+
+def _lazy_bound(m, bind):
+    """ Resolves the member `m` with the converter of its conversion plan,
+    then links its elements to their nodes with `bind`.
+    """
+    def resolve(obj):
+        for member, name, convert in _init_plan(type(obj)):
+            if member == m:
+                objects = _lazy_generic(name, convert)(obj)
+        bind(objects, obj._scene)
+        return objects
+    return resolve
+
+# Members of lazily loaded structs that are not resolved by the converter
+# of their conversion plan. Every other member of these structs is.
+_lazy_members = {
+    structs.Scene: {
+        'rootnode': lambda scene: _lazy(scene.mRootNode.contents, scene, scene),
+        'meshes': lambda scene: _lazy_array(scene, 'mMeshes'),
+        'materials': lambda scene: _lazy_array(scene, 'mMaterials'),
+        'cameras': _lazy_bound('mCameras', _bind_cameras),
+        'lights': _lazy_bound('mLights', _bind_lights),
+        'animations': _lazy_bound('mAnimations', _bind_animations),
+        'node_by_name': lambda scene: _node_index(scene.rootnode),
+    },
+    structs.Node: {
+        'parent': lambda node: node._parent,
+        'children': lambda node: _lazy_array(node, 'mChildren'),
+        'meshes': lambda node: pythonize_assimp("MESH", node.mMeshes[:node.mNumMeshes], node._scene),
+    },
+    structs.Mesh: dict(_mesh_attributes,
+                       material = lambda mesh: mesh._scene.materials[mesh.mMaterialIndex],
+                       bones = _lazy_bound('mBones', _bind_bones)),
+    structs.Material: {},
+}
+
+def _install_lazy_members():
+    for cls, members in _lazy_members.items():
+        for m, name, convert in _init_plan(cls):
+            if name not in members:
+                setattr(cls, name, _LazyMember(name, _lazy_generic(name, convert)))
+        for name, resolve in members.items():
+            setattr(cls, name, _LazyMember(name, resolve))
+_install_lazy_members()
+
 class PropertyGetter(dict):
     def __getitem__(self, key):
         semantic = 0
@@ -490,6 +1100,12 @@ class PropertyGetter(dict):
 
         return dict.__getitem__(self, (key, semantic))
 
+    def get(self, key, default = None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
     def keys(self):
         for k in dict.keys(self):
             yield k[0]
@@ -501,36 +1117,57 @@ class PropertyGetter(dict):
         for k, v in dict.items(self):
             yield k[0], v
 
+    def __reduce__(self):
+        # items() drops the semantics, pickle the underlying dict instead
+        return (PropertyGetter, (dict(dict.items(self)),))
+
+
+# ctypes of the numeric material property types (aiPTI_Float, aiPTI_Double
+# and aiPTI_Integer)
+_property_ctypes = {1: ctypes.c_float, 2: ctypes.c_double, 4: ctypes.c_int}
+_property_array_types = {}
+_property_data_offset = structs.MaterialProperty.mData.offset
+
+def _property_array_type(ctype, length):
+    """ Returns the (cached) ctypes array type of `length` `ctype`. """
+    try:
+        return _property_array_types[ctype, length]
+    except KeyError:
+        array_type = _property_array_types[ctype, length] = ctype * length
+        return array_type
 
 def _get_properties(properties, length):
     """
     Convenience Function to get the material properties as a dict
     and values in a python format.
+
+    Numeric arrays are copied at once from the property data, as numpy arrays
+    (or lists if numpy is not available).
     """
     result = {}
     #read all properties
-    for p in [properties[i] for i in range(length)]:
+    for p in properties[:length]:
         #the name
         p = p.contents
         key = str(_convert_assimp_string(p.mKey))
         key = (key.split('.')[1], p.mSemantic)
 
         #the data
-        from ctypes import POINTER, cast, c_int, c_float, sizeof
-        if p.mType == 1:
-            arr = cast(p.mData, POINTER(c_float * int(p.mDataLength/sizeof(c_float)) )).contents
-            value = [x for x in arr]
+        address = ctypes.c_void_p.from_buffer(p, _property_data_offset).value
+        ctype = _property_ctypes.get(p.mType)
+        if ctype is not None:
+            count = p.mDataLength // ctypes.sizeof(ctype)
+            if count == 1:
+                value = ctype.from_address(address).value
+            else:
+                arr = _property_array_type(ctype, count).from_address(address)
+                value = numpy.array(arr) if numpy else arr[:]
         elif p.mType == 3: #string can't be an array
-            value = _convert_assimp_string(cast(p.mData, POINTER(structs.MaterialPropertyString)).contents)
-
-        elif p.mType == 4:
-            arr = cast(p.mData, POINTER(c_int * int(p.mDataLength/sizeof(c_int)) )).contents
-            value = [x for x in arr]
+            value = _convert_assimp_string(structs.MaterialPropertyString.from_address(address))
         else:
             value = p.mData[:p.mDataLength]
-
-        if len(value) == 1:
-            [value] = value
+            if len(value) == 1:
+                [value] = value
 
         result[key] = value
 
@@ -7,11 +7,11 @@ Some fancy helper functions.
 import os
 import ctypes
 from ctypes import POINTER
-import operator
+import json
 
-from distutils.sysconfig import get_python_lib
 import re
 import sys
+import sysconfig
 
 try: import numpy
 except: numpy = None
@@ -33,14 +33,6 @@ if os.name=='posix':
     if 'LD_LIBRARY_PATH' in os.environ:
         additional_dirs.extend([item for item in os.environ['LD_LIBRARY_PATH'].split(':') if item])
 
-    # check if running from anaconda.
-    if "conda" or "continuum" in sys.version.lower():
-      cur_path = get_python_lib()
-      pattern = re.compile('.*\/lib\/')
-      conda_lib = pattern.match(cur_path).group()
-      logger.info("Adding Anaconda lib path:"+ conda_lib)
-      additional_dirs.append(conda_lib)
-
     # note - this won't catch libassimp.so.N.n, but
     # currently there's always a symlink called
     # libassimp.so in /usr/local/lib.
@@ -107,54 +99,79 @@ def _inv(matrix4x4):
             ( m0[2]*m1[1]*m3[0] - m0[1]*m1[2]*m3[0] - m0[2]*m1[0]*m3[1] + m0[0]*m1[2]*m3[1] + m0[1]*m1[0]*m3[2] - m0[0]*m1[1]*m3[2]) /det,
             ( m0[1]*m1[2]*m2[0] - m0[2]*m1[1]*m2[0] + m0[2]*m1[0]*m2[1] - m0[0]*m1[2]*m2[1] - m0[1]*m1[0]*m2[2] + m0[0]*m1[1]*m2[2]) /det]]
 
-def get_bounding_box(scene):
+def _dot(a, b):
+    """ Product of two matrices given as lists of rows. """
+    return [[sum(a_ik * b[k][j] for k, a_ik in enumerate(row)) for j in range(len(b[0]))] for row in a]
+
+def get_bounding_box(scene, exact = True):
+    """ Axis-aligned bounding box of the scene, as ([x,y,z] min, [x,y,z] max).
+
+    :param exact: if False, the box is computed from the (cached) local
+    bounding boxes of the meshes, which is faster for repeated queries but
+    may be larger than the exact box when nodes are rotated.
+    """
     bb_min = [1e10, 1e10, 1e10] # x,y,z
     bb_max = [-1e10, -1e10, -1e10] # x,y,z
     inv = numpy.linalg.inv if numpy else _inv
-    return get_bounding_box_for_node(scene.rootnode, bb_min, bb_max, inv(scene.rootnode.transformation))
+    return get_bounding_box_for_node(scene.rootnode, bb_min, bb_max, inv(scene.rootnode.transformation), exact)
+
+def get_mesh_bounding_box(mesh):
+    """ Local axis-aligned bounding box of a mesh, as (min, max) numpy
+    arrays, or None for a mesh without vertices.
+
+    The box is computed once and cached on the mesh.
+    """
+    try:
+        return mesh._bounding_box
+    except AttributeError:
+        pass
+    vertices = numpy.asarray(mesh.vertices, dtype=numpy.float32)
+    bounding_box = (vertices.min(axis=0), vertices.max(axis=0)) if len(vertices) else None
+    mesh._bounding_box = bounding_box
+    return bounding_box
+
+# For each of the 8 corners of a box, whether its x, y and z are the min (0)
+# or the max (1) of the box.
+_box_corners = [[(i >> 2) & 1, (i >> 1) & 1, i & 1] for i in range(8)]
 
-def get_bounding_box_for_node(node, bb_min, bb_max, transformation):
+def _transform_points(points, matrix4x4):
+    """ Applies a transformation matrix to a (N,3) array of points. """
+    return numpy.dot(points, matrix4x4[:3,:3].T) + matrix4x4[:3,3]
+
+def get_bounding_box_for_node(node, bb_min, bb_max, transformation, exact = True):
 
     if numpy:
         transformation = numpy.dot(transformation, node.transformation)
+
+        for mesh in node.meshes:
+            if exact:
+                if not len(mesh.vertices):
+                    continue
+                points = _transform_points(numpy.asarray(mesh.vertices), transformation)
+            else:
+                bounding_box = get_mesh_bounding_box(mesh)
+                if bounding_box is None:
+                    continue
+                corners = numpy.array(bounding_box)[_box_corners, (0, 1, 2)]
+                points = _transform_points(corners, transformation)
+            bb_min[:] = numpy.minimum(bb_min, points.min(axis=0)).tolist()
+            bb_max[:] = numpy.maximum(bb_max, points.max(axis=0)).tolist()
     else:
-        t0,t1,t2,t3 = transformation
-        T0,T1,T2,T3 = node.transformation
-        transformation = [ [
-                t0[0]*T0[0] + t0[1]*T1[0] + t0[2]*T2[0] + t0[3]*T3[0],
-                t0[0]*T0[1] + t0[1]*T1[1] + t0[2]*T2[1] + t0[3]*T3[1],
-                t0[0]*T0[2] + t0[1]*T1[2] + t0[2]*T2[2] + t0[3]*T3[2],
-                t0[0]*T0[3] + t0[1]*T1[3] + t0[2]*T2[3] + t0[3]*T3[3]
-            ],[
-                t1[0]*T0[0] + t1[1]*T1[0] + t1[2]*T2[0] + t1[3]*T3[0],
-                t1[0]*T0[1] + t1[1]*T1[1] + t1[2]*T2[1] + t1[3]*T3[1],
-                t1[0]*T0[2] + t1[1]*T1[2] + t1[2]*T2[2] + t1[3]*T3[2],
-                t1[0]*T0[3] + t1[1]*T1[3] + t1[2]*T2[3] + t1[3]*T3[3]
-            ],[
-                t2[0]*T0[0] + t2[1]*T1[0] + t2[2]*T2[0] + t2[3]*T3[0],
-                t2[0]*T0[1] + t2[1]*T1[1] + t2[2]*T2[1] + t2[3]*T3[1],
-                t2[0]*T0[2] + t2[1]*T1[2] + t2[2]*T2[2] + t2[3]*T3[2],
-                t2[0]*T0[3] + t2[1]*T1[3] + t2[2]*T2[3] + t2[3]*T3[3]
-            ],[
-                t3[0]*T0[0] + t3[1]*T1[0] + t3[2]*T2[0] + t3[3]*T3[0],
-                t3[0]*T0[1] + t3[1]*T1[1] + t3[2]*T2[1] + t3[3]*T3[1],
-                t3[0]*T0[2] + t3[1]*T1[2] + t3[2]*T2[2] + t3[3]*T3[2],
-                t3[0]*T0[3] + t3[1]*T1[3] + t3[2]*T2[3] + t3[3]*T3[3]
-            ] ]
-
-    for mesh in node.meshes:
-        for v in mesh.vertices:
-            v = transform(v, transformation)
-            bb_min[0] = min(bb_min[0], v[0])
-            bb_min[1] = min(bb_min[1], v[1])
-            bb_min[2] = min(bb_min[2], v[2])
-            bb_max[0] = max(bb_max[0], v[0])
-            bb_max[1] = max(bb_max[1], v[1])
-            bb_max[2] = max(bb_max[2], v[2])
+        transformation = _dot(transformation, node.transformation)
+
+        for mesh in node.meshes:
+            for v in mesh.vertices:
+                v = transform(v, transformation)
+                bb_min[0] = min(bb_min[0], v[0])
+                bb_min[1] = min(bb_min[1], v[1])
+                bb_min[2] = min(bb_min[2], v[2])
+                bb_max[0] = max(bb_max[0], v[0])
+                bb_max[1] = max(bb_max[1], v[1])
+                bb_max[2] = max(bb_max[2], v[2])
 
 
     for child in node.children:
-        bb_min, bb_max = get_bounding_box_for_node(child, bb_min, bb_max, transformation)
+        bb_min, bb_max = get_bounding_box_for_node(child, bb_min, bb_max, transformation, exact)
 
     return bb_min, bb_max
 
@@ -198,11 +215,114 @@ def try_load_functions(library_path, dll):
     export2blob.restype = POINTER(ExportDataBlob)
     return (library_path, load, load_mem, export, export2blob, release, dll)
 
+def _search_dirs():
+    """ The directories to search for the library: additional_dirs, and the
+    lib directory of anaconda when running from it. """
+    dirs = list(additional_dirs)
+    version = sys.version.lower()
+    if os.name == 'posix' and ("conda" in version or "continuum" in version):
+        cur_path = sysconfig.get_paths()["purelib"]
+        match = re.match('.*/lib/', cur_path)
+        if match:
+            conda_lib = match.group()
+            logger.info("Adding Anaconda lib path:" + conda_lib)
+            dirs.append(conda_lib)
+    return dirs
+
+def _unload(dll):
+    """ Unloads a library loaded with ctypes (ctypes has no public API for it). """
+    try:
+        import _ctypes
+        if os.name == 'nt':
+            _ctypes.FreeLibrary(dll._handle)
+        else:
+            _ctypes.dlclose(dll._handle)
+    except (ImportError, AttributeError, OSError):
+        pass
+
+def _load_library(library_path):
+    """ Loads the library at library_path, and returns the result of
+    try_load_functions, or None if it isn't a usable assimp library (in which
+    case it is unloaded right away).
+    """
+    logger.debug('Try ' + library_path)
+    try:
+        dll = ctypes.cdll.LoadLibrary(library_path)
+    except Exception as e:
+        logger.warning(str(e))
+        # OK, this except is evil. But different OSs will throw different
+        # errors. So just ignore any errors.
+        return None
+    # see if the functions we need are in the dll
+    loaded = try_load_functions(library_path, dll)
+    if not loaded:
+        _unload(dll)
+    return loaded
+
+def _cache_path():
+    """ Path of the file caching the library found by search_library. """
+    root = os.environ.get('XDG_CACHE_HOME') or os.environ.get('LOCALAPPDATA') \
+           or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(root, 'pyassimp', 'library.json')
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+def _folder_mtimes(folders):
+    return [[curfolder, _mtime(curfolder)] for curfolder in folders]
+
+def _read_cache(folders):
+    """ Returns the cached library path, if it was found in these search
+    folders and neither the library nor any of the folders changed since
+    (so that a library installed in another folder is found).
+    """
+    try:
+        with open(_cache_path()) as f:
+            entry = json.load(f)
+        if entry['folders'] != _folder_mtimes(folders):
+            return None
+        if _mtime(entry['path']) == entry['mtime']:
+            return entry['path']
+    except (IOError, OSError, ValueError, KeyError, TypeError):
+        return None
+
+def _write_cache(folders, library_path):
+    """ Replaces the cache entry. It is written to a temporary file first, so
+    that concurrent processes never read a partial entry.
+    """
+    path = _cache_path()
+    entry = {'folders': _folder_mtimes(folders),
+             'path': library_path,
+             'mtime': _mtime(library_path)}
+    tmp = '%s.%d.tmp' % (path, os.getpid())
+    try:
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(tmp, 'w') as f:
+            json.dump(entry, f)
+        # os.rename on python 2, which also replaces the file on posix
+        getattr(os, 'replace', os.rename)(tmp, path)
+    except (IOError, OSError):
+        logger.debug('Could not write the library cache ' + path)
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
 def search_library():
     '''
     Loads the assimp library.
     Throws exception AssimpError if no library_path is found
 
+    The PYASSIMP_LIBRARY environment variable, if set, gives the path of the
+    library to load. Otherwise the newest library found in the search
+    directories is loaded, and its path is cached on disk (in
+    $XDG_CACHE_HOME/pyassimp) until the search directories, or the content
+    of one of them, change.
+
     Returns: tuple, (load from filename function,
                      load from memory function,
                      export to filename function,
@@ -219,52 +339,52 @@ def search_library():
     except AttributeError:
         pass
 
+    library_path = os.environ.get('PYASSIMP_LIBRARY')
+    if library_path:
+        loaded = _load_library(library_path)
+        if not loaded:
+            raise AssimpError("assimp library not found at PYASSIMP_LIBRARY=" + library_path)
+        return loaded[1:]
+
+    folders = [os.path.abspath(curfolder) for curfolder in [folder]+_search_dirs() if os.path.isdir(curfolder)]
+    library_path = _read_cache(folders)
+    if library_path:
+        loaded = _load_library(library_path)
+        if loaded:
+            logger.debug('Using cached assimp library located at ' + library_path)
+            return loaded[1:]
+
     candidates = []
     # test every file
-    for curfolder in [folder]+additional_dirs:
-        if os.path.isdir(curfolder):
-            for filename in os.listdir(curfolder):
-                # our minimum requirement for candidates is that
-                # they should contain 'assimp' somewhere in
-                # their name                                  
-                if filename.lower().find('assimp')==-1 : 
-                    continue
-                is_out=1
-                for et in ext_whitelist:
-                  if et in filename.lower():
-                    is_out=0
-                    break
-                if is_out:
-                  continue
-                
-                library_path = os.path.join(curfolder, filename)
-                logger.debug('Try ' + library_path)
-                try:
-                    dll = ctypes.cdll.LoadLibrary(library_path)
-                except Exception as e:
-                    logger.warning(str(e))
-                    # OK, this except is evil. But different OSs will throw different
-                    # errors. So just ignore any errors.
-                    continue
-                # see if the functions we need are in the dll
-                loaded = try_load_functions(library_path, dll)
-                if loaded: candidates.append(loaded)
-
-    if not candidates:
-        # no library found
-        raise AssimpError("assimp library not found")
-    else:
-        # get the newest library_path
-        candidates = map(lambda x: (os.lstat(x[0])[-2], x), candidates)
-        res = max(candidates, key=operator.itemgetter(0))[1]
-        logger.debug('Using assimp library located at ' + res[0])
-
-        # XXX: if there are 1000 dll/so files containing 'assimp'
-        # in their name, do we have all of them in our address
-        # space now until gc kicks in?
-
-        # XXX: take version postfix of the .so on linux?
-        return res[1:]
+    for curfolder in folders:
+        for filename in os.listdir(curfolder):
+            # our minimum requirement for candidates is that
+            # they should contain 'assimp' somewhere in
+            # their name
+            if filename.lower().find('assimp')==-1 :
+                continue
+            is_out=1
+            for et in ext_whitelist:
+              if et in filename.lower():
+                is_out=0
+                break
+            if is_out:
+              continue
+
+            library_path = os.path.join(curfolder, filename)
+            candidates.append((os.lstat(library_path).st_mtime, library_path))
+
+    # load the newest library that has the functions we need, one at a time
+    for mtime, library_path in sorted(candidates, reverse=True):
+        loaded = _load_library(library_path)
+        if loaded:
+            logger.debug('Using assimp library located at ' + library_path)
+            _write_cache(folders, library_path)
+            # XXX: take version postfix of the .so on linux?
+            return loaded[1:]
+
+    # no library found
+    raise AssimpError("assimp library not found")
 
 def hasattr_silent(object, name):
     """
@@ -0,0 +1,61 @@
+#-*- coding: UTF-8 -*-
+
+"""
+Sparse encoding of morph targets.
+
+The morph targets of a mesh come as dense (M, N, 3) arrays of deltas
+(mesh.morphtargets and mesh.morphnormals), but the targets of face rigs
+and the like often move a small region of the mesh only. sparse() keeps
+the changed vertices of each target, in a compressed sparse row layout:
+the entries of target i are entries offsets[i]:offsets[i + 1].
+
+This module requires numpy.
+"""
+
+import numpy
+
+class SparseTargets(object):
+    """
+    Morph targets as numpy arrays:
+
+     - offsets: (M + 1,) uint32 index of the first entry of each target,
+     - indices: (K,) uint32 changed vertices of every target,
+     - deltas: (K, 3) float32 deltas of these vertices,
+     - vertexcount: the number N of vertices of the mesh.
+    """
+    def __init__(self, offsets, indices, deltas, vertexcount):
+        self.offsets = offsets
+        self.indices = indices
+        self.deltas = deltas
+        self.vertexcount = vertexcount
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __repr__(self):
+        return "SparseTargets(%d targets, %d entries)" % (len(self), len(self.indices))
+
+    def target(self, i):
+        """ Returns the changed vertices of target i and their deltas. """
+        begin, end = self.offsets[i], self.offsets[i + 1]
+        return self.indices[begin:end], self.deltas[begin:end]
+
+    def dense(self):
+        """ Returns the (M, N, 3) dense deltas. """
+        result = numpy.zeros((len(self), self.vertexcount, 3), dtype=numpy.float32)
+        targets = numpy.repeat(numpy.arange(len(self)), numpy.diff(self.offsets))
+        result[targets, self.indices] = self.deltas
+        return result
+
+def sparse(deltas, tolerance = 0.0):
+    """
+    Returns the SparseTargets of (M, N, 3) morph target deltas, keeping
+    the vertices of which a delta component is larger than `tolerance` in
+    absolute value.
+    """
+    deltas = numpy.asarray(deltas, dtype=numpy.float32)
+    changed = (numpy.abs(deltas) > tolerance).any(axis=2)
+    targets, indices = numpy.nonzero(changed)
+    offsets = numpy.zeros(len(deltas) + 1, numpy.uint32)
+    numpy.cumsum(changed.sum(axis=1), out=offsets[1:])
+    return SparseTargets(offsets, indices.astype(numpy.uint32), deltas[targets, indices], deltas.shape[1])
@@ -0,0 +1,462 @@
+#-*- coding: UTF-8 -*-
+
+"""
+Optimization of the meshes of a scene for the GPU, on their numpy arrays.
+
+Models loaded with aiProcess_Triangulate only often have duplicated
+vertices and triangles in an order that defeats the post-transform vertex
+cache. Since assimp can not post-process a scene it has already imported,
+this module works on the (F, 3) faces and the per-vertex arrays of the
+meshes instead:
+
+ - weld() merges the vertices whose attributes are all equal,
+ - optimize_vertex_cache() reorders the triangles for the vertex cache,
+ - optimize_overdraw() reorders clusters of these triangles so that the
+   outer ones are drawn first,
+ - optimize_vertex_fetch() renumbers the vertices in the order they are
+   used,
+ - build_meshlets() partitions the triangles into small clusters.
+
+optimize() runs all but the last on a mesh. acmr() and atvr() measure the
+efficiency of the vertex cache (see scripts/optimize_benchmark.py).
+
+The algorithms are those of meshoptimizer (optimizeVertexCacheFifo,
+optimizeOverdraw and buildMeshlets), based on: Pedro Sander, Diego Nehab and
+Joshua Barczak. Fast Triangle Reordering for Vertex Locality and Reduced
+Overdraw. 2007.
+
+Only weld(), optimize_vertex_fetch(), the adjacency of
+optimize_vertex_cache() and the sorting of the clusters of
+optimize_overdraw() are vectorized. The rest is sequential by nature: the
+simulation of the vertex cache (acmr(), atvr() and the splitting of the
+clusters of optimize_overdraw()), the triangle walk of
+optimize_vertex_cache() and the greedy build_meshlets() are pure Python
+loops. They process about 0.3 to 1 million triangles per second each, that
+is seconds per stage for meshes of millions of triangles (see the large
+mesh of scripts/optimize_benchmark.py).
+
+This module requires numpy.
+"""
+
+import numpy
+
+DEFAULT_CACHE_SIZE = 16
+
+# Per-vertex arrays of the meshes (as built by pyassimp), with their vertex
+# axis. The arrays of several sets (or morph targets) have the vertices on
+# their second axis.
+_vertex_arrays = {
+    'vertices': 0,
+    'normals': 0,
+    'tangents': 0,
+    'bitangents': 0,
+    'colors': 1,
+    'texturecoords': 1,
+    'morphtargets': 1,
+    'morphnormals': 1,
+}
+
+def _triangles(faces):
+    faces = numpy.asarray(faces)
+    if faces.ndim != 2 or (len(faces) and faces.shape[1] != 3):
+        raise ValueError("the mesh must be made of triangles (triangulate it)")
+    return faces
+
+def _vertex_count(faces, vertex_count):
+    if vertex_count is not None:
+        return vertex_count
+    return int(faces.max()) + 1 if faces.size else 0
+
+def weld(faces, *attributes):
+    """
+    Merges the vertices whose attributes are all bitwise equal (but for the
+    sign of floating point zeros).
+
+    faces are (F, 3) vertex indices, and each attribute an array with one
+    item per vertex (eg. (N, 3) positions, (N, 2) texture coordinates).
+
+    Returns the new faces, and the (U,) indices in the attribute arrays of
+    the U unique vertices, in the order of their first occurrence: the
+    attributes of the welded mesh are attribute[order].
+    """
+    faces = _triangles(faces)
+    count = len(attributes[0]) if attributes else _vertex_count(faces, None)
+    if not attributes or not count:
+        return faces.copy(), numpy.arange(count)
+
+    columns = []
+    for attribute in attributes:
+        attribute = numpy.asarray(attribute).reshape((count, -1))
+        if attribute.dtype.kind == 'f':
+            attribute = attribute + attribute.dtype.type(0) # -0.0 + 0.0 == +0.0
+        columns.append(numpy.ascontiguousarray(attribute).view(numpy.uint8).reshape((count, -1)))
+
+    packed = numpy.ascontiguousarray(numpy.concatenate(columns, axis=1))
+    packed = packed.view(numpy.dtype((numpy.void, packed.shape[1]))).ravel()
+    _, first, inverse = numpy.unique(packed, return_index=True, return_inverse=True)
+
+    # number the unique vertices by first occurrence
+    order = numpy.argsort(first, kind='stable')
+    rank = numpy.empty(len(order), dtype=faces.dtype)
+    rank[order] = numpy.arange(len(order), dtype=faces.dtype)
+    return rank[inverse.reshape(-1)][faces], first[order]
+
+def _cache_misses(faces, vertex_count, cache_size):
+    """ Returns the (F,) number of vertex cache misses of each triangle,
+    with a FIFO cache of cache_size vertices.
+    """
+    misses = [0] * len(faces)
+    timestamps = [0] * vertex_count
+    timestamp = cache_size + 1
+    for i, (a, b, c) in enumerate(faces.tolist()):
+        m = 0
+        if timestamp - timestamps[a] > cache_size:
+            timestamps[a] = timestamp
+            timestamp += 1
+            m += 1
+        if timestamp - timestamps[b] > cache_size:
+            timestamps[b] = timestamp
+            timestamp += 1
+            m += 1
+        if timestamp - timestamps[c] > cache_size:
+            timestamps[c] = timestamp
+            timestamp += 1
+            m += 1
+        misses[i] = m
+    return numpy.array(misses, dtype=numpy.intp)
+
+def acmr(faces, cache_size = DEFAULT_CACHE_SIZE):
+    """
+    Returns the average cache miss ratio of triangles: the number of
+    vertices transformed per triangle, with a FIFO vertex cache. It is
+    between 0.5 (for very large regular meshes) and 3.
+    """
+    faces = _triangles(faces)
+    if not len(faces):
+        return 0.0
+    return _cache_misses(faces, _vertex_count(faces, None), cache_size).sum() / float(len(faces))
+
+def atvr(faces, cache_size = DEFAULT_CACHE_SIZE):
+    """
+    Returns the average transformed vertex ratio: the number of vertices
+    transformed per vertex used by the triangles, with a FIFO vertex cache.
+    It is 1 at best.
+    """
+    faces = _triangles(faces)
+    if not len(faces):
+        return 0.0
+    misses = _cache_misses(faces, _vertex_count(faces, None), cache_size).sum()
+    return misses / float(len(numpy.unique(faces)))
+
+def _adjacency(faces, vertex_count):
+    """ Returns the triangles of each vertex, as offsets into a flat array
+    of triangles.
+    """
+    flat = faces.reshape(-1)
+    counts = numpy.bincount(flat, minlength=vertex_count)
+    offsets = numpy.zeros(vertex_count + 1, dtype=numpy.intp)
+    numpy.cumsum(counts, out=offsets[1:])
+    triangles = numpy.argsort(flat, kind='stable') // 3
+    return counts, offsets, triangles
+
+def optimize_vertex_cache(faces, vertex_count = None, cache_size = DEFAULT_CACHE_SIZE):
+    """
+    Returns the (F, 3) faces reordered for a FIFO vertex cache of cache_size
+    vertices (tipsify). The vertices of the triangles are not changed.
+    """
+    faces = _triangles(faces)
+    vertex_count = _vertex_count(faces, vertex_count)
+    if not len(faces):
+        return faces.copy()
+
+    counts, offsets, adjacency = _adjacency(faces, vertex_count)
+    live = counts.tolist()
+    offsets = offsets.tolist()
+    adjacency = adjacency.tolist()
+    triangles = faces.tolist()
+    timestamps = [0] * vertex_count
+    emitted = [False] * len(triangles)
+    dead_end = []
+    result = []
+
+    current = 0
+    timestamp = cache_size + 1
+    cursor = 1 # vertex to restart from in case of dead-end
+    while current >= 0:
+        candidates = len(dead_end)
+
+        # emit all the triangles of the vertex
+        for triangle in adjacency[offsets[current]:offsets[current + 1]]:
+            if emitted[triangle]:
+                continue
+            emitted[triangle] = True
+            result.append(triangle)
+            for v in triangles[triangle]:
+                dead_end.append(v)
+                live[v] -= 1
+                if timestamp - timestamps[v] > cache_size:
+                    timestamps[v] = timestamp
+                    timestamp += 1
+
+        # next vertex: the one of the emitted vertices that stays in the
+        # cache after fanning and entered it first
+        current = -1
+        best = -1
+        for v in dead_end[candidates:]:
+            if live[v] > 0:
+                priority = 0
+                if 2 * live[v] + timestamp - timestamps[v] <= cache_size:
+                    priority = timestamp - timestamps[v]
+                if priority > best:
+                    current = v
+                    best = priority
+
+        if current < 0:
+            # dead-end: back to the last emitted vertices, then input order
+            while dead_end:
+                v = dead_end.pop()
+                if live[v] > 0:
+                    current = v
+                    break
+            else:
+                while cursor < vertex_count:
+                    if live[cursor] > 0:
+                        current = cursor
+                        break
+                    cursor += 1
+
+    return faces[numpy.array(result, dtype=numpy.intp)]
+
+def _hard_boundaries(misses):
+    # triangles whose three vertices miss the cache usually start a new
+    # patch of the mesh
+    boundaries = numpy.flatnonzero(misses == 3)
+    if not len(boundaries) or boundaries[0] != 0:
+        boundaries = numpy.concatenate(([0], boundaries))
+    return boundaries
+
+def _soft_boundaries(faces, vertex_count, hard, cache_size, threshold):
+    """ Splits the clusters starting at `hard` where they reach their ACMR
+    (times threshold) with the cache flushed at their start.
+    """
+    triangles = faces.tolist()
+    timestamps = [0] * vertex_count
+    timestamp = 0
+    result = []
+    ends = hard[1:].tolist() + [len(triangles)]
+    for start, end in zip(hard.tolist(), ends):
+        # cluster ACMR, from a flushed cache
+        timestamp += cache_size + 1
+        cluster_misses = 0
+        for a, b, c in triangles[start:end]:
+            for v in (a, b, c):
+                if timestamp - timestamps[v] > cache_size:
+                    timestamps[v] = timestamp
+                    timestamp += 1
+                    cluster_misses += 1
+        cluster_threshold = threshold * cluster_misses / float(end - start)
+
+        result.append(start)
+        timestamp += cache_size + 1
+        running_misses = 0
+        running_faces = 0
+        for i in range(start, end):
+            for v in triangles[i]:
+                if timestamp - timestamps[v] > cache_size:
+                    timestamps[v] = timestamp
+                    timestamp += 1
+                    running_misses += 1
+            running_faces += 1
+            if running_misses / float(running_faces) <= cluster_threshold:
+                # the target ACMR is reached, start a new cluster
+                result.append(i + 1)
+                timestamp += cache_size + 1
+                running_misses = 0
+                running_faces = 0
+
+        # the last cluster of the split is usually a bad one, merge it with
+        # the previous one (this also removes the boundary at `end`)
+        if result[-1] != start:
+            result.pop()
+    return numpy.array(result, dtype=numpy.intp)
+
+def _cluster_order(faces, positions, clusters):
+    """ Sorts the clusters by decreasing dot product of their normal and of
+    their centroid relative to the centroid of the mesh, so that the
+    clusters facing outwards come first. The keys are quantized to 11 bits,
+    so that the clusters with close keys keep their vertex cache order.
+    """
+    p = numpy.asarray(positions, dtype=numpy.float64)[faces]
+    mesh_centroid = p.reshape((-1, 3)).mean(axis=0)
+    normals = numpy.cross(p[:, 1] - p[:, 0], p[:, 2] - p[:, 0])
+    areas = numpy.linalg.norm(normals, axis=1)
+
+    cluster_areas = numpy.add.reduceat(areas, clusters)
+    centroids = numpy.add.reduceat(p.sum(axis=1) * (areas / 3.0)[:, None], clusters)
+    centroids *= numpy.where(cluster_areas > 0, 1.0 / numpy.where(cluster_areas > 0, cluster_areas, 1.0), 0.0)[:, None]
+    cluster_normals = numpy.add.reduceat(normals, clusters)
+    lengths = numpy.linalg.norm(cluster_normals, axis=1)
+    cluster_normals *= numpy.where(lengths > 0, 1.0 / numpy.where(lengths > 0, lengths, 1.0), 0.0)[:, None]
+
+    keys = numpy.sum((centroids - mesh_centroid) * cluster_normals, axis=1)
+    keys = 0.5 - 0.5 * keys / max(numpy.abs(keys).max(), 1e-3)
+    keys = (numpy.clip(keys, 0.0, 1.0) * 2047 + 0.5).astype(numpy.intp)
+    return numpy.argsort(keys, kind='stable')
+
+def optimize_overdraw(faces, positions, cache_size = DEFAULT_CACHE_SIZE, threshold = 1.05):
+    """
+    Returns the (F, 3) faces with clusters of triangles reordered to reduce
+    overdraw, the clusters facing outwards first.
+
+    The faces should be optimized for the vertex cache first: the clusters
+    are split from their order, and threshold is the ratio by which the
+    ACMR may degrade (1.05 allows 5% worse).
+    """
+    faces = _triangles(faces)
+    if not len(faces):
+        return faces.copy()
+    vertex_count = len(positions)
+
+    hard = _hard_boundaries(_cache_misses(faces, vertex_count, cache_size))
+    clusters = _soft_boundaries(faces, vertex_count, hard, cache_size, threshold)
+    order = _cluster_order(faces, positions, clusters)
+
+    # concatenate the ranges of triangles of the sorted clusters
+    ends = numpy.append(clusters[1:], len(faces))
+    sizes = (ends - clusters)[order]
+    starts = clusters[order]
+    triangles = numpy.arange(sizes.sum()) - numpy.repeat(numpy.cumsum(sizes) - sizes, sizes)
+    return faces[numpy.repeat(starts, sizes) + triangles]
+
+def optimize_vertex_fetch(faces, vertex_count = None):
+    """
+    Renumbers the vertices in the order the faces use them, for the
+    locality of vertex fetches. The vertices that are not used are dropped.
+
+    Returns the new faces and the (U,) indices of the used vertices in the
+    original vertex arrays, in their new order: the attributes of the mesh
+    are attribute[order].
+    """
+    faces = _triangles(faces)
+    flat = faces.reshape(-1)
+    _, first = numpy.unique(flat, return_index=True)
+    order = flat[numpy.sort(first)]
+    remap = numpy.zeros(_vertex_count(faces, vertex_count), dtype=faces.dtype)
+    remap[order] = numpy.arange(len(order), dtype=faces.dtype)
+    return remap[faces], order.astype(numpy.intp)
+
+class Meshlets(object):
+    """
+    Clusters of triangles (meshlets), as numpy arrays:
+
+     - vertexoffsets: (K + 1,) offset of the first vertex of each meshlet,
+     - vertices: the indices of the vertices of the meshlets,
+     - triangleoffsets: (K + 1,) offset of the first triangle of each meshlet,
+     - triangles: (F, 3) uint8 triangles, indexing the vertices of their
+       meshlet.
+    """
+    def __init__(self, vertexoffsets, vertices, triangleoffsets, triangles):
+        self.vertexoffsets = vertexoffsets
+        self.vertices = vertices
+        self.triangleoffsets = triangleoffsets
+        self.triangles = triangles
+
+    def __len__(self):
+        return len(self.vertexoffsets) - 1
+
+    def __repr__(self):
+        return "Meshlets(%d meshlets, %d vertices)" % (len(self), len(self.vertices))
+
+    def meshlet(self, i):
+        """ Returns the vertices and the local triangles of meshlet i. """
+        return (self.vertices[self.vertexoffsets[i]:self.vertexoffsets[i + 1]],
+                self.triangles[self.triangleoffsets[i]:self.triangleoffsets[i + 1]])
+
+    def bounds(self, positions):
+        """ Returns the (K, 3) centers and (K,) radii of bounding spheres of
+        the meshlets.
+        """
+        p = numpy.asarray(positions, dtype=numpy.float64)[self.vertices]
+        starts = self.vertexoffsets[:-1]
+        counts = numpy.diff(self.vertexoffsets)
+        centers = numpy.add.reduceat(p, starts) / counts[:, None]
+        distances = numpy.linalg.norm(p - numpy.repeat(centers, counts, axis=0), axis=1)
+        return centers, numpy.maximum.reduceat(distances, starts)
+
+def build_meshlets(faces, max_vertices = 64, max_triangles = 126):
+    """
+    Splits the faces, in their order, into meshlets of at most max_vertices
+    vertices and max_triangles triangles. The faces should be optimized for
+    the vertex cache first.
+    """
+    faces = _triangles(faces)
+    if max_vertices < 3 or max_vertices > 256 or max_triangles < 1:
+        raise ValueError("meshlets must have 3 to 256 vertices and at least one triangle")
+
+    local = {}
+    vertices = []
+    vertexoffsets = [0]
+    triangleoffsets = [0]
+    triangles = []
+    triangle_count = 0
+    for triangle in faces.tolist():
+        extra = sum(1 for v in triangle if v not in local)
+        if len(local) + extra > max_vertices or triangle_count >= max_triangles:
+            vertexoffsets.append(len(vertices))
+            triangleoffsets.append(len(triangles))
+            local = {}
+            triangle_count = 0
+        for v in triangle:
+            if v not in local:
+                local[v] = len(local)
+                vertices.append(v)
+        triangles.append([local[v] for v in triangle])
+        triangle_count += 1
+    if triangle_count:
+        vertexoffsets.append(len(vertices))
+        triangleoffsets.append(len(triangles))
+
+    return Meshlets(numpy.array(vertexoffsets, dtype=numpy.intp),
+                    numpy.array(vertices, dtype=numpy.uint32),
+                    numpy.array(triangleoffsets, dtype=numpy.intp),
+                    numpy.array(triangles, dtype=numpy.uint8).reshape((-1, 3)))
+
+def optimize(mesh,
+             weld_vertices      = True,
+             cache_size         = DEFAULT_CACHE_SIZE,
+             overdraw_threshold = 1.05):
+    '''
+    Optimizes a mesh (as loaded by pyassimp.load, or a MeshBundle) in place:
+    welds its vertices, reorders its triangles for the vertex cache and for
+    overdraw, and its vertices for fetch locality.
+
+    The faces and the per-vertex arrays of the mesh (vertices, normals,
+    colors, texturecoords, morphtargets...) are replaced, but the native
+    assimp mesh is not changed.
+
+    Returns
+    ---------
+    The (U,) indices in the original vertex arrays of the vertices of the
+    optimized mesh, to remap other per-vertex data (eg. the arrays of
+    pyassimp.skinning) as array[order].
+    '''
+    faces = _triangles(mesh.faces)
+    arrays = [(name, axis) for name, axis in _vertex_arrays.items()
+              if numpy.ndim(getattr(mesh, name, ())) > axis and numpy.shape(getattr(mesh, name))[axis]]
+
+    if weld_vertices:
+        faces, order = weld(faces, *[numpy.moveaxis(getattr(mesh, name), axis, 0) for name, axis in arrays
+                                     if numpy.size(getattr(mesh, name))])
+    else:
+        order = numpy.arange(len(mesh.vertices))
+
+    faces = optimize_vertex_cache(faces, len(order), cache_size)
+    if overdraw_threshold is not None and len(mesh.vertices):
+        faces = optimize_overdraw(faces, mesh.vertices[order], cache_size, overdraw_threshold)
+    faces, fetch_order = optimize_vertex_fetch(faces, len(order))
+    order = order[fetch_order]
+
+    mesh.faces = faces
+    for name, axis in arrays:
+        setattr(mesh, name, numpy.take(getattr(mesh, name), order, axis=axis))
+    return order
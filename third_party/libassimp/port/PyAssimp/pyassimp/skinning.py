@@ -0,0 +1,117 @@
+#-*- coding: UTF-8 -*-
+
+"""
+Dense skinning arrays of meshes.
+
+The vertex weights of the bones of a mesh (aiBone.mWeights) are read at once
+into numpy arrays and scattered into per-vertex joint indices and weights,
+keeping the strongest influences of each vertex, as expected by the
+skinning of real-time renderers.
+
+Joint indices are indices into the bones of the mesh (mesh.mBones). Matrices
+are in assimp's layout (row-major, the translation in the last column):
+transpose them for a column-major API.
+
+This module requires numpy.
+"""
+
+import ctypes
+
+import numpy
+
+from . import core
+from . import structs
+
+# Layout of aiVertexWeight, used to read all the weights of a bone at once.
+_weight_dtype = numpy.dtype({'names': ['vertex', 'weight'],
+                             'formats': [numpy.uint32, numpy.float32],
+                             'offsets': [structs.VertexWeight.mVertexId.offset,
+                                         structs.VertexWeight.mWeight.offset],
+                             'itemsize': ctypes.sizeof(structs.VertexWeight)})
+
+def _weights(bone):
+    """ Returns the vertex ids and the weights of a bone as numpy arrays. """
+    count = bone.mNumWeights
+    if not count or not bone.mWeights:
+        return numpy.empty((0,), numpy.uint32), numpy.empty((0,), numpy.float32)
+    weights = numpy.frombuffer(core._numpy_bytes(bone.mWeights, count * _weight_dtype.itemsize),
+                               _weight_dtype)
+    return weights['vertex'], weights['weight']
+
+def _matrix(matrix):
+    """ Returns an aiMatrix4x4 as a (4, 4) float32 array. """
+    data = core._numpy_bytes(ctypes.addressof(matrix), ctypes.sizeof(structs.Matrix4x4))
+    return numpy.frombuffer(data, numpy.float32).reshape((4, 4))
+
+class Skin(object):
+    """
+    The skinning data of a mesh, as numpy arrays:
+
+     - joints: (N, influences) uint16 joint indices of each vertex,
+     - weights: (N, influences) float32 weights, which sum to 1 on every
+       influenced vertex (and are all 0 on the others),
+     - inversebindmatrices: (B, 4, 4) float32 aiBone.mOffsetMatrix of
+       each bone, which transforms from mesh space to bone space,
+     - bonenames: the names of the B bones.
+
+    Unused influences have a zero weight and joint index 0.
+    """
+    def __init__(self, joints, weights, inversebindmatrices, bonenames):
+        self.joints = joints
+        self.weights = weights
+        self.inversebindmatrices = inversebindmatrices
+        self.bonenames = bonenames
+
+    def __repr__(self):
+        return "Skin(%d vertices, %d bones)" % (len(self.joints), len(self.bonenames))
+
+def skin(mesh, influences = 4):
+    """
+    Returns the Skin of a mesh (as loaded by pyassimp.load, lazily or not),
+    keeping the `influences` strongest bone weights of each vertex and
+    renormalizing them.
+
+    Raises ValueError if the mesh has more bones than uint16 indices can
+    address.
+    """
+    mesh = mesh.contents if isinstance(mesh, ctypes._Pointer) else mesh
+    nb_vertices = mesh.mNumVertices
+    bones = [mesh.mBones[b].contents for b in range(mesh.mNumBones)]
+    if len(bones) > 0x10000:
+        raise ValueError("%d bones can't be indexed with 16 bits" % len(bones))
+
+    inversebindmatrices = numpy.empty((len(bones), 4, 4), numpy.float32)
+    vertices = []
+    weights = []
+    for b, bone in enumerate(bones):
+        inversebindmatrices[b] = _matrix(bone.mOffsetMatrix)
+        v, w = _weights(bone)
+        vertices.append(v)
+        weights.append(w)
+    counts = [len(v) for v in vertices]
+    vertices = numpy.concatenate(vertices or [numpy.empty((0,), numpy.uint32)]).astype(numpy.intp)
+    weights = numpy.concatenate(weights or [numpy.empty((0,), numpy.float32)])
+    joints = numpy.repeat(numpy.arange(len(bones), dtype=numpy.uint16), counts)
+
+    # ignore the null weights and the out of range vertices
+    valid = (weights > 0.0) & (vertices < nb_vertices)
+    vertices, weights, joints = vertices[valid], weights[valid], joints[valid]
+
+    # sort by vertex, then by decreasing weight, and rank the influences of
+    # each vertex
+    order = numpy.lexsort((-weights, vertices))
+    vertices, weights, joints = vertices[order], weights[order], joints[order]
+    starts = numpy.searchsorted(vertices, vertices, side='left')
+    ranks = numpy.arange(len(vertices)) - starts
+    kept = ranks < influences
+
+    result_joints = numpy.zeros((nb_vertices, influences), numpy.uint16)
+    result_weights = numpy.zeros((nb_vertices, influences), numpy.float32)
+    result_joints[vertices[kept], ranks[kept]] = joints[kept]
+    result_weights[vertices[kept], ranks[kept]] = weights[kept]
+
+    sums = result_weights.sum(axis=1, keepdims=True)
+    result_weights /= numpy.where(sums > 0.0, sums, 1.0)
+
+    bonenames = [core._convert_assimp_string(bone.mName) for bone in bones]
+    return Skin(result_joints, result_weights, inversebindmatrices, bonenames)
@@ -1018,7 +1018,7 @@ class PyAssimp3DViewer:
                         else:
                             diffuse = mesh.material.properties["diffuse"]
                         if len(diffuse) == 3:  # RGB instead of expected RGBA
-                            diffuse.append(1.0)
+                            diffuse = tuple(diffuse) + (1.0,)
                         glUniform4f(shader.u_materialDiffuse, *diffuse)
                         # if ambient:
                         #    glUniform4f( shader.Material_ambient, *mat["ambient"] )
@@ -15,8 +15,6 @@ Authors: Séverin Lemaignan, 2012-2016
 import sys
 import logging
 
-from functools import reduce
-
 logger = logging.getLogger("pyassimp")
 gllogger = logging.getLogger("OpenGL")
 gllogger.setLevel(logging.WARNING)
@@ -36,6 +34,8 @@ import pygame
 import pygame.font
 import pygame.image
 
+import bisect
+import ctypes
 import math, random
 from numpy import linalg
 
@@ -411,26 +411,6 @@ DEFAULT_CLIP_PLANE_NEAR = 0.001
 DEFAULT_CLIP_PLANE_FAR = 1000.0
 
 
-def get_world_transform(scene, node):
-    if node == scene.rootnode:
-        return numpy.identity(4, dtype=numpy.float32)
-
-    parents = reversed(_get_parent_chain(scene, node, []))
-    parent_transform = reduce(numpy.dot, [p.transformation for p in parents])
-    return numpy.dot(parent_transform, node.transformation)
-
-
-def _get_parent_chain(scene, node, parents):
-    parent = node.parent
-
-    parents.append(parent)
-
-    if parent == scene.rootnode:
-        return parents
-
-    return _get_parent_chain(scene, parent, parents)
-
-
 class DefaultCamera:
     def __init__(self, w, h, fov):
         self.name = "default camera"
@@ -453,11 +433,15 @@ class DefaultCamera:
 class PyAssimp3DViewer:
     base_name = "PyASSIMP 3D viewer"
 
-    def __init__(self, model, w=1024, h=768):
+    def __init__(self, model, w=1024, h=768, batched=False):
 
         self.w = w
         self.h = h
 
+        # if batched, all the meshes are packed into shared buffers and
+        # drawn with one draw call per material (see render_batched)
+        self.batched = batched
+
         pygame.init()
         pygame.display.set_caption(self.base_name)
         pygame.display.set_mode((w, h), pygame.OPENGL | pygame.DOUBLEBUF)
@@ -478,6 +462,7 @@ class PyAssimp3DViewer:
 
         self.scene = None
         self.meshes = {}  # stores the OpenGL vertex/faces/normals buffers pointers
+        self.batch_vbo = None
 
         self.node2colorid = {}  # stores a color ID for each node. Useful for mouse picking and visibility checking
         self.colorid2node = {}  # reverse dict of node2colorid
@@ -696,15 +681,203 @@ class PyAssimp3DViewer:
 
         self.scene_center = [(a + b) / 2. for a, b in zip(self.bb_min, self.bb_max)]
 
-        for index, mesh in enumerate(scene.meshes):
-            self.prepare_gl_buffers(mesh)
+        if not self.batched:
+            for index, mesh in enumerate(scene.meshes):
+                self.prepare_gl_buffers(mesh)
 
         self.glize(scene, scene.rootnode)
+        self.build_node_table(scene.rootnode)
+
+        if self.batched:
+            self.prepare_batched_gl_buffers()
 
         # Finally release the model
         pyassimp.release(scene)
         logger.info("Ready for 3D rendering!")
 
+    def build_node_table(self, root):
+        """ Flattens the node hierarchy into a table (in depth-first order)
+        holding, for each node, the index of its parent and its local and
+        world transformations as contiguous (N,4,4) arrays.
+
+        The node transformations become views into the table, and the world
+        transformations are only recomputed by update_world_transforms.
+        """
+        nodes = []
+        parents = []
+        depths = []
+        subtree_ends = []
+
+        def add(node, parent, depth):
+            index = len(nodes)
+            node.table_index = index
+            nodes.append(node)
+            parents.append(parent)
+            depths.append(depth)
+            subtree_ends.append(None)
+            for child in node.children:
+                add(child, index, depth + 1)
+            subtree_ends[index] = len(nodes)
+
+        add(root, -1, 0)
+
+        self.nodes = nodes
+        self.node_parents = numpy.array(parents)
+        self.node_depths = numpy.array(depths)
+        self.node_subtree_ends = subtree_ends
+
+        self.local_transforms = numpy.array([node.transformation for node in nodes], dtype=numpy.float32)
+        for node in nodes:
+            node.transformation = self.local_transforms[node.table_index]
+        self.world_transforms = numpy.empty_like(self.local_transforms)
+        self.update_world_transforms(root)
+
+    def update_world_transforms(self, node):
+        """ Recomputes the world transformations of the node and its
+        descendants, after the transformation of the node changed.
+        """
+        start = node.table_index
+        end = self.node_subtree_ends[start]
+
+        self.local_transforms[start] = node.transformation
+        node.transformation = self.local_transforms[start]
+
+        # process the subtree one depth level at a time, parents first
+        depths = self.node_depths[start:end]
+        for depth in range(depths[0], depths.max() + 1):
+            indices = start + numpy.flatnonzero(depths == depth)
+            if depth == 0:
+                # the root node is rendered at the origin, but its
+                # transformation applies to its children
+                self.world_transforms[indices] = numpy.identity(4, dtype=numpy.float32)
+                continue
+            parents = self.node_parents[indices]
+            parent_transforms = self.world_transforms[parents]
+            parent_transforms[parents == 0] = self.local_transforms[0]
+            self.world_transforms[indices] = numpy.matmul(parent_transforms, self.local_transforms[indices])
+
+        if self.batch_vbo is not None:
+            self.update_batched_vertices(start, end)
+
+    def prepare_batched_gl_buffers(self):
+        """ Packs the meshes of all the nodes into one shared vertex buffer
+        and one shared index buffer, sorted by material, so that the nodes
+        sharing a material are drawn with a single glDrawElements.
+
+        The shaders can not fetch a model matrix per draw, so the vertices
+        are stored in world space (see update_batched_vertices).
+        """
+        items = [(mesh.materialindex, node.table_index, mesh) for node in self.nodes if node.type == MESH
+                                                              for mesh in node.meshes]
+        items.sort(key=lambda item: item[:2])
+
+        # (node table index, mesh, first vertex, first index, nb of indices)
+        self.batch_items = []
+        indices = [numpy.zeros(0, dtype=numpy.uint32)]
+        first_vertex = first_index = 0
+        for materialindex, node_index, mesh in items:
+            faces = numpy.asarray(mesh.faces, dtype=numpy.uint32).reshape(-1)
+            indices.append(faces + first_vertex)
+            self.batch_items.append((node_index, mesh, first_vertex, first_index, len(faces)))
+            first_vertex += len(mesh.vertices)
+            first_index += len(faces)
+
+        # the batch items by node table index, to find the meshes of a
+        # subtree of nodes with a bisection
+        self.batch_items_by_node = sorted(self.batch_items, key=lambda item: item[0])
+        self.batch_item_nodes = [item[0] for item in self.batch_items_by_node]
+
+        # vertex positions and normals, interleaved
+        self.batch_vertices = numpy.zeros((first_vertex, 6), dtype=numpy.float32)
+        self.transform_batched_vertices(self.batch_items)
+
+        self.batch_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.batch_vbo)
+        glBufferData(GL_ARRAY_BUFFER, self.batch_vertices, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        self.batch_ibo = glGenBuffers(1)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.batch_ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, numpy.concatenate(indices), GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+        self.batch_draws = {}
+
+    def transform_batched_vertices(self, items):
+        """ Transforms to world space the vertices of the meshes of the given
+        batch items, in the shared vertex array.
+        """
+        for node_index, mesh, first_vertex, first_index, count in items:
+            m = self.world_transforms[node_index]
+            vertices = self.batch_vertices[first_vertex:first_vertex + len(mesh.vertices)]
+            vertices[:, :3] = numpy.dot(mesh.vertices, m[:3, :3].T) + m[:3, 3]
+            if len(mesh.normals):
+                vertices[:, 3:] = numpy.dot(mesh.normals, linalg.inv(m[:3, :3]))
+
+    def update_batched_vertices(self, start, end):
+        """ Transforms to world space the vertices of the meshes of the nodes
+        with a table index in [start, end), and uploads them to the shared
+        vertex buffer. Only the ranges of these meshes are uploaded, and
+        nothing is done if the nodes have no meshes (eg. a camera).
+        """
+        items = self.batch_items_by_node[bisect.bisect_left(self.batch_item_nodes, start):
+                                         bisect.bisect_left(self.batch_item_nodes, end)]
+        if not items:
+            return
+        self.transform_batched_vertices(items)
+
+        # the meshes are sorted by material in the buffer: merge the ranges
+        # of the meshes that end up adjacent
+        ranges = []
+        for first_vertex, nb_vertices in sorted((item[2], len(item[1].vertices)) for item in items):
+            if ranges and ranges[-1][1] == first_vertex:
+                ranges[-1][1] += nb_vertices
+            else:
+                ranges.append([first_vertex, first_vertex + nb_vertices])
+
+        stride = self.batch_vertices.strides[0]
+        glBindBuffer(GL_ARRAY_BUFFER, self.batch_vbo)
+        for first, last in ranges:
+            if last > first:
+                glBufferSubData(GL_ARRAY_BUFFER, first * stride, (last - first) * stride,
+                                self.batch_vertices[first:last])
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def get_batch_draws(self, mode):
+        """ Returns the draw calls of the batched rendering in the given mode,
+        as (rgba color, byte offset, nb of indices) ranges of the shared index
+        buffer. Consecutive meshes drawn with the same color are merged in a
+        single range.
+
+        The draws are cached until the selection changes.
+        """
+        if mode in self.batch_draws:
+            return self.batch_draws[mode]
+
+        draws = []
+        for node_index, mesh, first_vertex, first_index, count in self.batch_items:
+            node = self.nodes[node_index]
+            if mode == COLORS:
+                r, g, b = self.get_rgb_from_colorid(self.node2colorid[node.name])
+                color = (r / 255.0, g / 255.0, b / 255.0, 1.0)
+            elif node.selected:
+                color = (1.0, 0.0, 0.0, 1.0)  # selected nodes in red
+            elif mode == SILHOUETTE:
+                color = (.0, .0, .0, 1.0)
+            else:
+                color = tuple(mesh.material.properties["diffuse"])
+                if len(color) == 3:  # RGB instead of expected RGBA
+                    color += (1.0,)
+
+            offset = first_index * 4  # GL_UNSIGNED_INT indices
+            if draws and draws[-1][0] == color and draws[-1][1] + draws[-1][2] * 4 == offset:
+                draws[-1][2] += count
+            else:
+                draws.append([color, offset, count])
+
+        self.batch_draws[mode] = draws
+        return draws
+
     def cycle_cameras(self):
 
         self.current_cam_index = (self.current_cam_index + 1) % len(self.cameras)
@@ -761,7 +934,7 @@ class PyAssimp3DViewer:
         glUniformMatrix4fv(self.flatshader.u_viewProjectionMatrix, 1, GL_TRUE,
                            numpy.dot(self.projection_matrix, self.view_matrix))
 
-        self.recursive_render(self.scene.rootnode, self.flatshader, mode=COLORS)
+        self.render_meshes(self.flatshader, mode=COLORS)
 
         glUseProgram(0)
 
@@ -818,7 +991,7 @@ class PyAssimp3DViewer:
             glUniformMatrix4fv(shader.u_viewProjectionMatrix, 1, GL_TRUE,
                                numpy.dot(self.projection_matrix, self.view_matrix))
 
-            self.recursive_render(self.scene.rootnode, shader, mode=SILHOUETTE)
+            self.render_meshes(shader, mode=SILHOUETTE)
 
             glUseProgram(0)
 
@@ -847,7 +1020,7 @@ class PyAssimp3DViewer:
         glUniformMatrix4fv(shader.u_viewProjectionMatrix, 1, GL_TRUE,
                            numpy.dot(self.projection_matrix, self.view_matrix))
 
-        self.recursive_render(self.scene.rootnode, shader)
+        self.render_meshes(shader)
 
         glUseProgram(0)
 
@@ -963,6 +1136,49 @@ class PyAssimp3DViewer:
             glVertex3f(10.0, i, 0.0)
         glEnd()
 
+    def render_meshes(self, shader, mode=BASE):
+        if self.batched:
+            self.render_batched(shader, mode)
+        else:
+            self.recursive_render(self.scene.rootnode, shader, mode)
+
+    def render_batched(self, shader, mode=BASE):
+        """ Renders all the meshes from the shared buffers, with one draw
+        call per range returned by get_batch_draws.
+        """
+
+        normals = mode != COLORS
+        stride = 24  # 6 * 4 bytes
+
+        # the vertices are already in world space
+        glUniformMatrix4fv(shader.u_modelMatrix, 1, GL_TRUE, numpy.identity(4, dtype=numpy.float32))
+        if mode == BASE:
+            normal_matrix = linalg.inv(self.view_matrix[0:3, 0:3]).transpose()
+            glUniformMatrix3fv(shader.u_normalMatrix, 1, GL_TRUE, normal_matrix)
+        elif mode == SILHOUETTE:
+            glUniformMatrix4fv(shader.u_modelViewMatrix, 1, GL_TRUE, self.view_matrix)
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.batch_vbo)
+
+        glEnableVertexAttribArray(shader.a_vertex)
+        glVertexAttribPointer(shader.a_vertex, 3, GL_FLOAT, False, stride, ctypes.c_void_p(0))
+        if normals:
+            glEnableVertexAttribArray(shader.a_normal)
+            glVertexAttribPointer(shader.a_normal, 3, GL_FLOAT, False, stride, ctypes.c_void_p(12))
+
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.batch_ibo)
+
+        for color, offset, count in self.get_batch_draws(mode):
+            glUniform4f(shader.u_materialDiffuse, *color)
+            glDrawElements(GL_TRIANGLES, count, GL_UNSIGNED_INT, ctypes.c_void_p(offset))
+
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glDisableVertexAttribArray(shader.a_vertex)
+        if normals:
+            glDisableVertexAttribArray(shader.a_normal)
+
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
     def recursive_render(self, node, shader, mode=BASE, with_normals=True):
         """ Main recursive rendering method.
         """
@@ -976,7 +1192,7 @@ class PyAssimp3DViewer:
         if not hasattr(node, "selected"):
             node.selected = False
 
-        m = get_world_transform(self.scene, node)
+        m = self.world_transforms[node.table_index]
 
         # HELPERS mode
         ###
@@ -1020,7 +1236,7 @@ class PyAssimp3DViewer:
                         else:
                             diffuse = mesh.material.properties["diffuse"]
                         if len(diffuse) == 3:  # RGB instead of expected RGBA
-                            diffuse.append(1.0)
+                            diffuse = tuple(diffuse) + (1.0,)
                         glUniform4f(shader.u_materialDiffuse, *diffuse)
                         # if ambient:
                         #    glUniform4f( shader.Material_ambient, *mat["ambient"] )
@@ -1075,6 +1291,7 @@ class PyAssimp3DViewer:
     def select_node(self, node):
         self.currently_selected = node
         self.update_node_select(self.scene.rootnode)
+        self.batch_draws = {}
 
     def update_node_select(self, node):
         if node is self.currently_selected:
@@ -1241,6 +1458,9 @@ class PyAssimp3DViewer:
         if zooming_one_shot:
             self.is_zooming = False
 
+        if self.current_cam is not self.default_camera:
+            self.update_world_transforms(self.current_cam)
+
         self.update_view_camera()
 
     def update_view_camera(self):
@@ -1257,6 +1477,7 @@ class PyAssimp3DViewer:
     def move_selected_node(self, up, strafe):
         self.currently_selected.transformation[0][3] += strafe
         self.currently_selected.transformation[2][3] += up
+        self.update_world_transforms(self.currently_selected)
 
     @staticmethod
     def showtext(text, x=0, y=0, z=0, size=20):
@@ -1278,8 +1499,8 @@ class PyAssimp3DViewer:
         # glDisable(GL_BLEND)
 
 
-def main(model, width, height):
-    app = PyAssimp3DViewer(model, w=width, h=height)
+def main(model, width, height, batched=False):
+    app = PyAssimp3DViewer(model, w=width, h=height, batched=batched)
 
     clock = pygame.time.Clock()
 
@@ -1314,7 +1535,7 @@ def main(model, width, height):
 
 if __name__ == '__main__':
     if not len(sys.argv) > 1:
-        print("Usage: " + __file__ + " <model>")
+        print("Usage: " + __file__ + " <model> [--batched]")
         sys.exit(2)
 
-    main(model=sys.argv[1], width=1024, height=768)
+    main(model=sys.argv[1], width=1024, height=768, batched="--batched" in sys.argv[2:])
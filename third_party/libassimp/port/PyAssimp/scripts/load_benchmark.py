@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+#-*- coding: UTF-8 -*-
+
+"""
+This module times the loading of large scenes with PyAssimp.
+
+It writes a Wavefront OBJ file with one object (hence one node and one mesh)
+per triangle, and loads it eagerly, lazily (walking the whole node
+hierarchy in the latter case) and from an on-disk cache.
+
+It also checks that the memory reported for a cached scene counts its
+memory-mapped arrays file once, on a single mesh of many triangles.
+"""
+
+import os, sys
+import shutil
+import tempfile
+import timeit
+
+# Make the development (ie. GIT repo) version of PyAssimp available for import.
+sys.path.insert(0, '..')
+
+import pyassimp
+
+def write_scene(path, nb_nodes):
+    with open(path, 'w') as f:
+        for i in range(nb_nodes):
+            f.write("o node%d\n" % i)
+            f.write("v %d 0 0\nv %d 1 0\nv %d 0 1\n" % (i, i, i))
+            f.write("f %d %d %d\n" % (3 * i + 1, 3 * i + 2, 3 * i + 3))
+
+def write_mesh(path, nb_triangles):
+    with open(path, 'w') as f:
+        for i in range(nb_triangles):
+            f.write("v %d 0 0\nv %d 1 0\nv %d 0 1\n" % (i, i, i))
+        for i in range(nb_triangles):
+            f.write("f %d %d %d\n" % (3 * i + 1, 3 * i + 2, 3 * i + 3))
+
+def walk(node):
+    for child in node.children:
+        walk(child)
+    return node.name, node.transformation, node.meshes
+
+def load(path, lazy, cache=None):
+    scene = pyassimp.load(path, lazy=lazy, cache=cache)
+    walk(scene.rootnode)
+    pyassimp.release(scene)
+
+def arrays_size(cache):
+    for root, dirs, files in os.walk(cache):
+        if 'arrays.bin' in files:
+            return os.path.getsize(os.path.join(root, 'arrays.bin'))
+
+def check_cached_memory(path, nb_triangles=100000):
+    cache = tempfile.mkdtemp()
+    try:
+        write_mesh(path, nb_triangles)
+        load(path, False, cache)
+        with pyassimp.load(path, cache=cache) as scene:
+            converted = scene.memory_info()['converted']
+        size = arrays_size(cache)
+        print("CACHED MESH: %d triangles, %d bytes converted, %d bytes in arrays.bin" % (nb_triangles, converted, size))
+        assert size <= converted < 1.05 * size, "the arrays file is not counted once"
+    finally:
+        shutil.rmtree(cache)
+
+def main(nb_nodes=20000, repeat=3):
+    fd, path = tempfile.mkstemp(suffix=".obj")
+    os.close(fd)
+    cache = tempfile.mkdtemp()
+    try:
+        write_scene(path, nb_nodes)
+        print("SCENE: %d nodes" % nb_nodes)
+        for lazy in (False, True):
+            t = min(timeit.repeat(lambda: load(path, lazy), number=1, repeat=repeat))
+            print("  %s load: %.3fs (%.1fus per node)" % ("lazy" if lazy else "eager", t, 1e6 * t / nb_nodes))
+        load(path, False, cache)
+        t = min(timeit.repeat(lambda: load(path, False, cache), number=1, repeat=repeat))
+        print("  cached load: %.3fs (%.1fus per node)" % (t, 1e6 * t / nb_nodes))
+
+        check_cached_memory(path)
+    finally:
+        shutil.rmtree(cache)
+        os.remove(path)
+
+if __name__ == "__main__":
+
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+#-*- coding: UTF-8 -*-
+
+"""
+This module times the mesh optimizations of pyassimp.optimize, and reports
+the efficiency of the vertex cache (ACMR: vertices transformed per triangle,
+ATVR: vertices transformed per vertex) after each of them.
+
+It loads the model given on the command line with aiProcess_Triangulate
+only. Otherwise it runs on grids whose faces are shuffled and whose vertices
+are duplicated at each face: a small one, written as a Wavefront OBJ file and
+loaded with pyassimp, and a large one of millions of triangles, built
+directly as arrays, which shows the cost of the stages of pyassimp.optimize
+that are pure Python loops.
+"""
+
+import os, sys
+import random
+import tempfile
+import time
+
+import numpy
+
+# Make the development (ie. GIT repo) version of PyAssimp available for import.
+sys.path.insert(0, '..')
+
+import pyassimp
+from pyassimp import optimize
+from pyassimp.postprocess import aiProcess_Triangulate
+
+def write_grid(path, size):
+    quads = [(x, y) for x in range(size) for y in range(size)]
+    random.Random(0).shuffle(quads)
+    with open(path, 'w') as f:
+        for i, (x, y) in enumerate(quads):
+            f.write("v %d %d 0\nv %d %d 0\nv %d %d 0\nv %d %d 0\n" % (x, y, x + 1, y, x + 1, y + 1, x, y + 1))
+            f.write("f %d %d %d %d\n" % (4 * i + 1, 4 * i + 2, 4 * i + 3, 4 * i + 4))
+
+def grid_arrays(size):
+    """ Returns the faces, the positions and the normals of a grid of
+    size * size quads, shuffled and not welded, like write_grid.
+    """
+    x, y = numpy.meshgrid(numpy.arange(size), numpy.arange(size), indexing='ij')
+    quads = numpy.stack([x.ravel(), y.ravel()], axis=1)
+    numpy.random.RandomState(0).shuffle(quads)
+    corners = numpy.array([[0, 0], [1, 0], [1, 1], [0, 1]])
+    positions = numpy.zeros((len(quads), 4, 3), dtype=numpy.float32)
+    positions[:, :, :2] = quads[:, None, :] + corners
+    normals = numpy.zeros_like(positions)
+    normals[:, :, 2] = 1.0
+    first = 4 * numpy.arange(len(quads), dtype=numpy.uint32)[:, None]
+    faces = numpy.concatenate([first + [0, 1, 2], first + [0, 2, 3]], axis=1).reshape((-1, 3))
+    return faces, positions.reshape((-1, 3)), normals.reshape((-1, 3))
+
+def timed(f, *args):
+    t = time.time()
+    result = f(*args)
+    return result, time.time() - t
+
+def report(name, faces, duration = None):
+    print("  %-12s ACMR %.3f ATVR %.3f%s" % (name,
+                                            optimize.acmr(faces),
+                                            optimize.atvr(faces),
+                                            "" if duration is None else " (%.3fs)" % duration))
+
+def benchmark(name, faces, vertices, normals):
+    print("MESH %s: %d vertices, %d triangles" % (name, len(vertices), len(faces)))
+    report("input", faces)
+
+    attributes = [a for a in (vertices, normals) if len(a)]
+    (faces, order), t = timed(optimize.weld, faces, *attributes)
+    print("  weld         %d -> %d vertices (%.3fs)" % (len(vertices), len(order), t))
+    report("weld", faces)
+    positions = vertices[order]
+
+    faces, t = timed(optimize.optimize_vertex_cache, faces, len(order))
+    report("vertex cache", faces, t)
+    faces, t = timed(optimize.optimize_overdraw, faces, positions)
+    report("overdraw", faces, t)
+    (faces, order), t = timed(optimize.optimize_vertex_fetch, faces, len(order))
+    report("fetch", faces, t)
+
+    meshlets, t = timed(optimize.build_meshlets, faces)
+    if len(meshlets):
+        print("  meshlets     %d, %.1f vertices and %.1f triangles on average (%.3fs)" % (
+            len(meshlets), len(meshlets.vertices) / float(len(meshlets)),
+            len(meshlets.triangles) / float(len(meshlets)), t))
+
+def benchmark_scene(path):
+    scene = pyassimp.load(path, processing=aiProcess_Triangulate)
+    try:
+        for mesh in scene.meshes:
+            if len(mesh.faces) and len(mesh.faces[0]) == 3:
+                benchmark(mesh.name, mesh.faces, mesh.vertices, mesh.normals)
+    finally:
+        pyassimp.release(scene)
+
+def main(path = None, size = 200, large_size = 1000):
+    if path is not None:
+        benchmark_scene(path)
+        return
+
+    fd, path = tempfile.mkstemp(suffix=".obj")
+    os.close(fd)
+    try:
+        write_grid(path, size)
+        benchmark_scene(path)
+    finally:
+        os.remove(path)
+
+    benchmark("large grid", *grid_arrays(large_size))
+
+if __name__ == "__main__":
+
+    if len(sys.argv) > 1:
+        main(sys.argv[1])
+    else:
+        main()
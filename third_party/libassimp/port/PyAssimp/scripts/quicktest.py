@@ -15,7 +15,12 @@ import sys
 # Make the development (ie. GIT repo) version of PyAssimp available for import.
 sys.path.insert(0, '..')
 
+import gc
+import shutil
+import tempfile
+
 import sample
+import pyassimp
 from pyassimp import errors
 
 # Paths to model files.
@@ -27,6 +32,47 @@ extensions = ['.3ds', '.x', '.lwo', '.obj', '.md5mesh', '.dxf', '.ply', '.stl',
               '.dae', '.md5anim', '.lws', '.irrmesh', '.nff', '.off', '.blend']
 
 
+def check_export_blobs(filename):
+    """Checks that the memoryviews returned by export_blobs stay valid
+    outside of a `with` block, once the ExportBlobs object is gone."""
+    with pyassimp.load(filename) as scene:
+        with pyassimp.export_blobs(scene, 'obj') as blobs:
+            expected = [(name, data.tobytes()) for name, data in blobs]
+        views = list(pyassimp.export_blobs(scene, 'obj'))
+    gc.collect()
+    # Reuse the memory that would have been freed with the blobs.
+    garbage = [b'X' * len(data) for name, data in expected]
+    assert [(name, data.tobytes()) for name, data in views] == expected, \
+        "the exported blobs were released while still in use"
+    del garbage
+
+
+def check_anim_meshes(filename):
+    """Checks that the meshes, loaded eagerly or lazily, still expose the
+    number of their anim meshes along with the morph target arrays."""
+    for lazy in (False, True):
+        with pyassimp.load(filename, lazy=lazy) as scene:
+            for mesh in scene.meshes:
+                assert mesh.numanimmeshes == len(mesh.morphweights), \
+                    "numanimmeshes is missing or wrong"
+
+
+def check_cached_materials(filename):
+    """Checks that the materials of a scene loaded through the cache keep
+    their names."""
+    cache = tempfile.mkdtemp()
+    try:
+        bundle = pyassimp.load(filename, cache=cache)
+        for material in bundle.materials:
+            name = material.properties.get('name', '')
+            if 'name' in list(material.properties.keys()):
+                assert name == material.properties['name']
+            assert repr(material) == "MaterialBundle(" + str(name) + ")", \
+                "the material name is missing from " + repr(material)
+    finally:
+        shutil.rmtree(cache)
+
+
 def run_tests():
     ok, err = 0, 0
     for path in basepaths:
@@ -37,11 +83,17 @@ def run_tests():
                 if ext in extensions:
                     try:
                         sample.main(os.path.join(root, afile))
+                        check_anim_meshes(os.path.join(root, afile))
+                        check_cached_materials(os.path.join(root, afile))
+                        if ext == '.obj':
+                            check_export_blobs(os.path.join(root, afile))
                         ok += 1
                     except errors.AssimpError as error:
                         # Assimp error is fine; this is a controlled case.
                         print(error)
                         err += 1
+                    except AssertionError:
+                        raise
                     except Exception:
                         print("Error encountered while loading <%s>"
                               % os.path.join(root, afile))
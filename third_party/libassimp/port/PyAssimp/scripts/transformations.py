@@ -1353,6 +1353,267 @@ def random_rotation_matrix(rand=None):
     return quaternion_matrix(random_quaternion(rand))
 
 
+def quaternion_matrix_batch(quaternions):
+    """Return stack of homogeneous rotation matrices from quaternions.
+
+    quaternions : array_like of shape (..., 4)
+
+    This is the array version of quaternion_matrix, returning an array of
+    shape (..., 4, 4).
+
+    >>> q = numpy.array([random_quaternion() for i in range(8)])
+    >>> M = quaternion_matrix_batch(q)
+    >>> M.shape
+    (8, 4, 4)
+    >>> all(numpy.allclose(M[i], quaternion_matrix(q[i])) for i in range(8))
+    True
+    >>> numpy.allclose(quaternion_matrix_batch([[0, 0, 0, 0]]), numpy.identity(4))
+    True
+
+    """
+    q = numpy.array(quaternions, dtype=numpy.float64, copy=True)[..., :4]
+    nq = numpy.sum(q*q, axis=-1)
+    valid = nq >= _EPS
+    q *= numpy.sqrt(2.0 / numpy.where(valid, nq, 1.0))[..., None]
+    q[~valid] = 0.0
+    q = q[..., :, None] * q[..., None, :]
+    M = numpy.zeros(q.shape[:-2] + (4, 4), dtype=numpy.float64)
+    M[..., 0, 0] = 1.0 - q[..., 1, 1] - q[..., 2, 2]
+    M[..., 0, 1] = q[..., 0, 1] - q[..., 2, 3]
+    M[..., 0, 2] = q[..., 0, 2] + q[..., 1, 3]
+    M[..., 1, 0] = q[..., 0, 1] + q[..., 2, 3]
+    M[..., 1, 1] = 1.0 - q[..., 0, 0] - q[..., 2, 2]
+    M[..., 1, 2] = q[..., 1, 2] - q[..., 0, 3]
+    M[..., 2, 0] = q[..., 0, 2] - q[..., 1, 3]
+    M[..., 2, 1] = q[..., 1, 2] + q[..., 0, 3]
+    M[..., 2, 2] = 1.0 - q[..., 0, 0] - q[..., 1, 1]
+    M[..., 3, 3] = 1.0
+    return M
+
+
+def quaternion_from_matrix_batch(matrices):
+    """Return quaternions from stack of rotation matrices.
+
+    matrices : array_like of shape (..., 4, 4)
+
+    This is the array version of quaternion_from_matrix, returning an array
+    of shape (..., 4).
+
+    >>> R = numpy.array([random_rotation_matrix() for i in range(8)])
+    >>> q = quaternion_from_matrix_batch(R)
+    >>> all(numpy.allclose(q[i], quaternion_from_matrix(R[i])) for i in range(8))
+    True
+
+    """
+    M = numpy.asarray(matrices, dtype=numpy.float64)[..., :4, :4]
+    q = numpy.empty(M.shape[:-2] + (4, ), dtype=numpy.float64)
+    t = numpy.trace(M, axis1=-2, axis2=-1)
+    diagonal = numpy.diagonal(M, axis1=-2, axis2=-1)[..., :3]
+    case = numpy.where(t > M[..., 3, 3], 3, numpy.argmax(diagonal, axis=-1))
+
+    c = case == 3
+    m = M[c]
+    q[c] = numpy.stack((m[:, 2, 1] - m[:, 1, 2],
+                        m[:, 0, 2] - m[:, 2, 0],
+                        m[:, 1, 0] - m[:, 0, 1],
+                        t[c]), axis=-1)
+    for i, j, k in ((0, 1, 2), (1, 2, 0), (2, 0, 1)):
+        c = case == i
+        m = M[c]
+        qc = numpy.empty((len(m), 4), dtype=numpy.float64)
+        qc[:, i] = m[:, i, i] - (m[:, j, j] + m[:, k, k]) + m[:, 3, 3]
+        qc[:, j] = m[:, i, j] + m[:, j, i]
+        qc[:, k] = m[:, k, i] + m[:, i, k]
+        qc[:, 3] = m[:, k, j] - m[:, j, k]
+        q[c] = qc
+        t[c] = qc[:, i]
+    q *= (0.5 / numpy.sqrt(t * M[..., 3, 3]))[..., None]
+    return q
+
+
+def quaternion_slerp_batch(quat0, quat1, fraction, spin=0, shortestpath=True):
+    """Return spherical linear interpolation between arrays of quaternions.
+
+    quat0, quat1 : array_like of shape (..., 4)
+    fraction : scalar or array_like broadcastable to shape (...)
+
+    This is the array version of quaternion_slerp. The arguments are
+    broadcast against each other, e.g. one keyframe pair can be sampled at
+    many fractions at once.
+
+    >>> q0 = numpy.array([random_quaternion() for i in range(8)])
+    >>> q1 = numpy.array([random_quaternion() for i in range(8)])
+    >>> f = numpy.random.random(8)
+    >>> q = quaternion_slerp_batch(q0, q1, f)
+    >>> all(numpy.allclose(q[i], quaternion_slerp(q0[i], q1[i], f[i]))
+    ...     for i in range(8))
+    True
+    >>> numpy.allclose(quaternion_slerp_batch(q0[0], q1[0], [0.0, 1.0]),
+    ...                [q0[0], q1[0]])
+    True
+
+    """
+    q0 = unit_vector(numpy.array(quat0, dtype=numpy.float64)[..., :4], axis=-1)
+    q1 = unit_vector(numpy.array(quat1, dtype=numpy.float64)[..., :4], axis=-1)
+    fraction = numpy.asarray(fraction, dtype=numpy.float64)[..., None]
+    d = numpy.sum(q0*q1, axis=-1)[..., None]
+    degenerate = numpy.abs(numpy.abs(d) - 1.0) < _EPS
+    q = q1
+    if shortestpath:
+        # invert rotation
+        q = numpy.where(d < 0.0, -q1, q1)
+        d = numpy.abs(d)
+    angle = numpy.arccos(numpy.clip(d, -1.0, 1.0)) + spin * math.pi
+    degenerate |= numpy.abs(angle) < _EPS
+    isin = 1.0 / numpy.where(degenerate, 1.0, numpy.sin(angle))
+    w0 = numpy.where(degenerate, 1.0, numpy.sin((1.0 - fraction) * angle) * isin)
+    w1 = numpy.where(degenerate, 0.0, numpy.sin(fraction * angle) * isin)
+    result = w0 * q0 + w1 * q
+    result = numpy.where(fraction == 0.0, q0, result)
+    return numpy.where(fraction == 1.0, q1, result)
+
+
+def euler_matrix_batch(ai, aj, ak, axes='sxyz'):
+    """Return stack of homogeneous rotation matrices from Euler angles.
+
+    ai, aj, ak : arrays of Euler's roll, pitch and yaw angles
+    axes : One of 24 axis sequences as string or encoded tuple
+
+    This is the array version of euler_matrix. The angles are broadcast
+    against each other and an array of shape (..., 4, 4) is returned.
+
+    >>> angles = (4.0*math.pi) * (numpy.random.random((3, 8)) - 0.5)
+    >>> for axes in _AXES2TUPLE.keys():
+    ...    R = euler_matrix_batch(axes=axes, *angles)
+    ...    assert all(numpy.allclose(R[i], euler_matrix(axes=axes, *angles[:, i]))
+    ...               for i in range(8))
+
+    """
+    try:
+        firstaxis, parity, repetition, frame = _AXES2TUPLE[axes]
+    except (AttributeError, KeyError):
+        _ = _TUPLE2AXES[axes]
+        firstaxis, parity, repetition, frame = axes
+
+    i = firstaxis
+    j = _NEXT_AXIS[i+parity]
+    k = _NEXT_AXIS[i-parity+1]
+
+    ai, aj, ak = numpy.broadcast_arrays(*[numpy.asarray(a, dtype=numpy.float64)
+                                          for a in (ai, aj, ak)])
+    if frame:
+        ai, ak = ak, ai
+    if parity:
+        ai, aj, ak = -ai, -aj, -ak
+
+    si, sj, sk = numpy.sin(ai), numpy.sin(aj), numpy.sin(ak)
+    ci, cj, ck = numpy.cos(ai), numpy.cos(aj), numpy.cos(ak)
+    cc, cs = ci*ck, ci*sk
+    sc, ss = si*ck, si*sk
+
+    M = numpy.zeros(ai.shape + (4, 4), dtype=numpy.float64)
+    M[..., 3, 3] = 1.0
+    if repetition:
+        M[..., i, i] = cj
+        M[..., i, j] = sj*si
+        M[..., i, k] = sj*ci
+        M[..., j, i] = sj*sk
+        M[..., j, j] = -cj*ss+cc
+        M[..., j, k] = -cj*cs-sc
+        M[..., k, i] = -sj*ck
+        M[..., k, j] = cj*sc+cs
+        M[..., k, k] = cj*cc-ss
+    else:
+        M[..., i, i] = cj*ck
+        M[..., i, j] = sj*sc-cs
+        M[..., i, k] = sj*cc+ss
+        M[..., j, i] = cj*sk
+        M[..., j, j] = sj*ss+cc
+        M[..., j, k] = sj*cs-sc
+        M[..., k, i] = -sj
+        M[..., k, j] = cj*si
+        M[..., k, k] = cj*ci
+    return M
+
+
+def decompose_matrix_batch(matrices):
+    """Return sequence of transformations from stack of matrices.
+
+    matrices : array_like of shape (..., 4, 4)
+        Non-degenerative homogeneous transformation matrices
+
+    This is the array version of decompose_matrix. Return tuple of arrays:
+        scale : (..., 3) scaling factors
+        shear : (..., 3) shear factors for x-y, x-z, y-z axes
+        angles : (..., 3) Euler angles about static x, y, z axes
+        translate : (..., 3) translation vectors along x, y, z axes
+        perspective : (..., 4) perspective partitions of matrices
+
+    Raise ValueError if any matrix is degenerative.
+
+    >>> T = numpy.array([compose_matrix(*decompose_matrix(random_rotation_matrix()))
+    ...                  for i in range(8)])
+    >>> T[:, :3, 3] = numpy.random.random((8, 3))
+    >>> for a, b in zip(decompose_matrix_batch(T), zip(*map(decompose_matrix, T))):
+    ...    assert numpy.allclose(a, b)
+
+    """
+    M = numpy.array(matrices, dtype=numpy.float64, copy=True)
+    M = numpy.swapaxes(M, -1, -2)
+    if numpy.any(abs(M[..., 3, 3]) < _EPS):
+        raise ValueError("M[3, 3] is zero")
+    M /= M[..., 3:, 3:]
+    P = M.copy()
+    P[..., :, 3] = 0, 0, 0, 1
+    if not numpy.all(numpy.linalg.det(P)):
+        raise ValueError("Matrix is singular")
+
+    perspective = numpy.zeros(M.shape[:-2] + (4, ), dtype=numpy.float64)
+    perspective[..., 3] = 1.0
+    projective = numpy.any(abs(M[..., :3, 3]) > _EPS, axis=-1)
+    if numpy.any(projective):
+        Pinv = numpy.linalg.inv(numpy.swapaxes(P[projective], -1, -2))
+        perspective[projective] = numpy.einsum('ni,nij->nj',
+                                               M[projective][:, :, 3], Pinv)
+        M[projective, :, 3] = 0, 0, 0, 1
+
+    translate = M[..., 3, :3].copy()
+
+    row = M[..., :3, :3].copy()
+    scale = numpy.empty(M.shape[:-2] + (3, ), dtype=numpy.float64)
+    shear = numpy.empty(M.shape[:-2] + (3, ), dtype=numpy.float64)
+    row0, row1, row2 = row[..., 0, :], row[..., 1, :], row[..., 2, :]
+    scale[..., 0] = vector_norm(row0, axis=-1)
+    row0 /= scale[..., 0, None]
+    shear[..., 0] = numpy.sum(row0*row1, axis=-1)
+    row1 -= row0 * shear[..., 0, None]
+    scale[..., 1] = vector_norm(row1, axis=-1)
+    row1 /= scale[..., 1, None]
+    shear[..., 0] /= scale[..., 1]
+    shear[..., 1] = numpy.sum(row0*row2, axis=-1)
+    row2 -= row0 * shear[..., 1, None]
+    shear[..., 2] = numpy.sum(row1*row2, axis=-1)
+    row2 -= row1 * shear[..., 2, None]
+    scale[..., 2] = vector_norm(row2, axis=-1)
+    row2 /= scale[..., 2, None]
+    shear[..., 1:] /= scale[..., 2, None]
+
+    flip = numpy.sum(row0*numpy.cross(row1, row2), axis=-1) < 0
+    scale[flip] *= -1
+    row[flip] *= -1
+
+    angles = numpy.empty(M.shape[:-2] + (3, ), dtype=numpy.float64)
+    angles[..., 1] = numpy.arcsin(numpy.clip(-row[..., 0, 2], -1.0, 1.0))
+    gimbal = numpy.cos(angles[..., 1]) == 0.0
+    angles[..., 0] = numpy.where(gimbal,
+                                 numpy.arctan2(-row[..., 2, 1], row[..., 1, 1]),
+                                 numpy.arctan2(row[..., 1, 2], row[..., 2, 2]))
+    angles[..., 2] = numpy.where(gimbal, 0.0,
+                                 numpy.arctan2(row[..., 0, 1], row[..., 0, 0]))
+
+    return scale, shear, angles, translate, perspective
+
+
 class Arcball(object):
     """Virtual Trackball Control.
 
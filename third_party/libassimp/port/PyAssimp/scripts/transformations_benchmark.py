@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+#-*- coding: UTF-8 -*-
+
+"""
+This module compares the scalar functions of transformations.py against
+their array-batched counterparts, on N random transforms at once.
+"""
+
+import sys
+import timeit
+
+import numpy
+
+import transformations as tf
+
+def benchmark(name, scalar, batched, repeat):
+    t_scalar = min(timeit.repeat(scalar, number=1, repeat=repeat))
+    t_batched = min(timeit.repeat(batched, number=1, repeat=repeat))
+    a = numpy.asarray(scalar())
+    b = numpy.asarray(batched())
+    print("  %-22s scalar: %.4fs  batched: %.4fs  (x%.0f)%s" % (
+        name, t_scalar, t_batched, t_scalar / t_batched,
+        "" if numpy.allclose(a, b) else "  MISMATCH"))
+
+def main(n=10000, repeat=3):
+    q0 = numpy.array([tf.random_quaternion() for i in range(n)])
+    q1 = numpy.array([tf.random_quaternion() for i in range(n)])
+    fractions = numpy.random.random(n)
+    angles = (4.0 * numpy.pi) * (numpy.random.random((3, n)) - 0.5)
+    matrices = tf.quaternion_matrix_batch(q0)
+    matrices[:, :3, 3] = numpy.random.random((n, 3))
+    matrices[:, :3, :3] *= numpy.random.random((n, 1, 3)) + 0.5
+
+    print("TRANSFORMS: %d" % n)
+    benchmark("quaternion_matrix",
+              lambda: [tf.quaternion_matrix(q) for q in q0],
+              lambda: tf.quaternion_matrix_batch(q0), repeat)
+    benchmark("quaternion_from_matrix",
+              lambda: [tf.quaternion_from_matrix(m) for m in matrices],
+              lambda: tf.quaternion_from_matrix_batch(matrices), repeat)
+    benchmark("quaternion_slerp",
+              lambda: [tf.quaternion_slerp(a, b, f) for a, b, f in zip(q0, q1, fractions)],
+              lambda: tf.quaternion_slerp_batch(q0, q1, fractions), repeat)
+    benchmark("euler_matrix",
+              lambda: [tf.euler_matrix(*a) for a in angles.T],
+              lambda: tf.euler_matrix_batch(*angles), repeat)
+    benchmark("decompose_matrix",
+              lambda: [numpy.concatenate(tf.decompose_matrix(m)) for m in matrices],
+              lambda: numpy.concatenate(tf.decompose_matrix_batch(matrices), axis=-1), repeat)
+
+if __name__ == "__main__":
+
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main()
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+
+# To run this script, pyassimp and numpy must be importable, and pyassimp must
+# be able to find the assimp library, for example:
+#     export PYTHONPATH=third_party/libassimp/port/PyAssimp
+#     export LD_LIBRARY_PATH=<assimp build directory>/code
+
+"""Converts meshes into the filamesh format, in-process.
+
+This is a Python counterpart of the filamesh tool: it writes pyassimp scenes
+as .filamesh files (see README.md for the format), with the vertex data
+converted, quantized and interleaved by numpy over whole meshes at once.
+Many meshes can be converted by a pool of worker processes, without running
+the tool once per mesh.
+
+Unlike the tool, this script doesn't compress the vertex and index data, and
+it doesn't reorder them with meshoptimizer: the scenes are expected to be
+loaded with aiProcess_ImproveCacheLocality (see PROCESSING).
+
+pyassimp.load can't set importer properties either, so the output also
+differs from the tool's for some models:
+- the up direction of Collada files is not ignored (the tool sets
+  AI_CONFIG_IMPORT_COLLADA_IGNORE_UP_DIRECTION), so they may be rotated,
+- aiProcess_PreTransformVertices doesn't keep the node hierarchy (the tool
+  sets AI_CONFIG_PP_PTV_KEEP_HIERARCHY), so the meshes may be merged into
+  fewer, different parts.
+Lines and points, which the tool removes with AI_CONFIG_PP_SBP_REMOVE, are
+skipped by write().
+"""
+
+import argparse
+import multiprocessing
+import os
+import struct
+import sys
+
+import numpy
+
+import pyassimp
+from pyassimp import postprocess
+from pyassimp.errors import AssimpError
+
+MAGIC = b'FILAMESH'
+VERSION = 1
+
+# IndexType
+UI32 = 0
+UI16 = 1
+
+# Flags
+INTERLEAVED = 1 << 0
+TEXCOORD_SNORM16 = 1 << 1
+COMPRESSION = 1 << 2
+
+# offset and stride of an absent attribute
+NO_ATTRIBUTE = 0xffffffff
+
+# The post-processing steps of the filamesh tool (without its importer
+# properties, see the module docstring).
+PROCESSING = (
+        # normals and tangents
+        postprocess.aiProcess_GenSmoothNormals |
+        postprocess.aiProcess_CalcTangentSpace |
+        # topology optimization
+        postprocess.aiProcess_FindInstances |
+        postprocess.aiProcess_OptimizeMeshes |
+        postprocess.aiProcess_JoinIdenticalVertices |
+        # misc optimization
+        postprocess.aiProcess_ImproveCacheLocality |
+        postprocess.aiProcess_PreTransformVertices |
+        postprocess.aiProcess_SortByPType |
+        # we only support triangles
+        postprocess.aiProcess_Triangulate)
+
+# filamesh::Header, filamesh::Part and filamesh::Vertex
+HEADER = struct.Struct('<2I6f16I')
+PART = struct.Struct('<5I6f')
+VERTEX = numpy.dtype([('position', '<f2', 4),
+                      ('tangents', '<i2', 4),
+                      ('color', 'u1', 4),
+                      ('uv0', '<u2', 2)])
+
+
+def pack_snorm16(values):
+    """Returns the int16 encoding of values in [-1, 1], like packSnorm16."""
+    values = numpy.clip(values, -1.0, 1.0).astype(numpy.float32) * numpy.float32(32767.0)
+    # round half away from zero, like std::round
+    values = values.astype(numpy.float64)
+    return numpy.trunc(values + numpy.copysign(0.5, values)).astype(numpy.int16)
+
+
+def pack_half(values):
+    """Returns the bits of values converted to half-floats, like math::half:
+    unlike numpy.float16, ties are rounded away from zero."""
+    shape = numpy.shape(values)
+    # at least 1-d, so that numpy 1.x keeps the uint32 dtype with scalars
+    bits = numpy.atleast_1d(numpy.asarray(values, dtype=numpy.float32)).view(numpy.uint32)
+    sign = (bits >> 16) & 0x8000
+    bits = bits & 0x7fffffff
+    # rescale the exponent, then round to the nearest 10 bits mantissa
+    magnitude = (bits & ~numpy.uint32(0xfff)).view(numpy.float32) * numpy.float32(2.0 ** -112)
+    rounded = numpy.minimum(magnitude.view(numpy.uint32) + 0x1000, numpy.uint32(31 << 23)) >> 13
+    # infinities and NaNs
+    nan = numpy.where(bits & 0x7fffff, 0x7e00, 0x7c00)
+    result = numpy.where((bits >> 23) == 0xff, nan, rounded)
+    return (result | sign).astype(numpy.uint16).reshape(shape)
+
+
+def _quaternions(m):
+    """Returns the (N, 4) quaternions (x, y, z, w) of (N, 3, 3) rotation
+    matrices, indexed as m[:, column, row], like extractQuat."""
+    n = len(m)
+    rows = numpy.arange(n)
+    q = numpy.empty((n, 4), dtype=numpy.float32)
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        # positive trace
+        trace = m[:, 0, 0] + m[:, 1, 1] + m[:, 2, 2]
+        s = numpy.sqrt(trace + 1.0)
+        r = 0.5 / s
+        positive = numpy.stack(((m[:, 1, 2] - m[:, 2, 1]) * r,
+                                (m[:, 2, 0] - m[:, 0, 2]) * r,
+                                (m[:, 0, 1] - m[:, 1, 0]) * r,
+                                0.5 * s), axis=-1)
+
+        # negative trace: start from the greatest diagonal element
+        i = numpy.where(m[:, 1, 1] > m[:, 0, 0], 1, 0)
+        i = numpy.where(m[:, 2, 2] > m[rows, i, i], 2, i)
+        j = (i + 1) % 3
+        k = (j + 1) % 3
+        s = numpy.sqrt((m[rows, i, i] - (m[rows, j, j] + m[rows, k, k])) + 1.0)
+        r = numpy.where(s != 0.0, 0.5 / s, 0.0)
+        negative = numpy.empty((n, 4), dtype=numpy.float32)
+        negative[rows, i] = 0.5 * s
+        negative[rows, j] = (m[rows, i, j] + m[rows, j, i]) * r
+        negative[rows, k] = (m[rows, i, k] + m[rows, k, i]) * r
+        negative[:, 3] = (m[rows, j, k] - m[rows, k, j]) * r
+
+    q[:] = numpy.where((trace > 0.0)[:, None], positive, negative)
+    return q
+
+
+def pack_tangent_frames(tangents, bitangents, normals, storage_size=2):
+    """Returns the (N, 4) float32 quaternions (x, y, z, w) that encode the
+    tangent frames of N vertices, like mat3f::packTangentFrame: w is never
+    zero, and it is negative when the frame has a reflection."""
+    tangents = numpy.asarray(tangents, dtype=numpy.float32)
+    bitangents = numpy.asarray(bitangents, dtype=numpy.float32)
+    normals = numpy.asarray(normals, dtype=numpy.float32)
+
+    q = _quaternions(numpy.stack((tangents, numpy.cross(normals, tangents), normals), axis=1))
+    q /= numpy.linalg.norm(q, axis=-1)[:, None]
+    q = numpy.where((q[:, 3] < 0.0)[:, None], -q, q)
+
+    # ensure w is never 0.0, the bias is 2^(nb_bits - 1) - 1
+    bias = numpy.float32(1.0 / ((1 << (storage_size * 8 - 1)) - 1))
+    small = q[:, 3] < bias
+    q[small, 3] = bias
+    q[small, :3] *= numpy.float32(numpy.sqrt(1.0 - float(bias) * float(bias)))
+
+    # if there's a reflection ((n x t) . b <= 0), make sure w is negative
+    reflection = numpy.sum(numpy.cross(tangents, normals) * bitangents, axis=-1) < 0.0
+    q[reflection] = -q[reflection]
+    return q
+
+
+def _convert_uvs(uvs, snorm):
+    if snorm:
+        return pack_snorm16(uvs).view(numpy.uint16)
+    return pack_half(uvs)
+
+
+def _box(positions):
+    """Returns the center and half extent of the bounding box of positions."""
+    if not len(positions):
+        return (0.0, 0.0, 0.0), (0.0, 0.0, 0.0)
+    bmin = positions.min(axis=0)
+    bmax = positions.max(axis=0)
+    return tuple((bmax + bmin) * 0.5), tuple((bmax - bmin) * 0.5)
+
+
+def _union(boxes):
+    bmin = numpy.min([numpy.subtract(c, h) for c, h in boxes], axis=0)
+    bmax = numpy.max([numpy.add(c, h) for c, h in boxes], axis=0)
+    return tuple((bmax + bmin) * 0.5), tuple((bmax - bmin) * 0.5)
+
+
+def _scene_meshes(node):
+    """Yields the meshes of the node hierarchy, depth first."""
+    for mesh in node.meshes:
+        yield mesh
+    for child in node.children:
+        for mesh in _scene_meshes(child):
+            yield mesh
+
+
+def _material_name(material):
+    try:
+        return material.properties['name']
+    except KeyError:
+        print('Unnamed material replaced with \'default\'', file=sys.stderr)
+        return 'default'
+
+
+def write(scene, out, interleaved=False):
+    """Writes a pyassimp scene as a filamesh to the binary file object out.
+
+    The meshes of the scene are concatenated in the order of its node
+    hierarchy, each one into a part. They must have normals, tangents,
+    bitangents and texture coordinates: load the scene with PROCESSING.
+    Meshes that are not made of triangles are skipped.
+
+    Raises ValueError if a mesh doesn't have the required attributes, or if
+    interleaved is set and a mesh has a second set of texture coordinates.
+    """
+    meshes = []
+    for mesh in _scene_meshes(scene.rootnode):
+        if not len(mesh.vertices) or not len(mesh.faces) or numpy.ndim(mesh.faces) != 2 \
+                or mesh.faces.shape[1] != 3:
+            continue
+        if not len(mesh.normals) or not len(mesh.texturecoords):
+            raise ValueError('The mesh must have texture coordinates')
+        if not len(mesh.tangents) or not len(mesh.bitangents):
+            raise ValueError('The mesh must have tangents')
+        meshes.append(mesh)
+
+    has_uv1 = any(len(mesh.texturecoords) > 1 for mesh in meshes)
+    if interleaved and has_uv1:
+        raise ValueError('Interleaved vertices can only have 1 UV set.')
+
+    # UVs are stored as snorm16 when they all fit in [-1, 1], and as
+    # half-floats otherwise
+    snorm = all(numpy.all(numpy.abs(mesh.texturecoords[:2, :, :2]) <= 1.0) for mesh in meshes)
+
+    positions, tangents, colors, uv0, uv1, indices, parts = [], [], [], [], [], [], []
+    vertex_count = 0
+    index_count = 0
+    for mesh in meshes:
+        count = len(mesh.vertices)
+        position = numpy.empty((count, 4), dtype=numpy.uint16)
+        position[:, :3] = pack_half(mesh.vertices)
+        position[:, 3] = pack_half(1.0)
+        position = position.view(numpy.float16)
+        positions.append(position)
+
+        frames = pack_tangent_frames(mesh.tangents, mesh.bitangents, mesh.normals)
+        tangents.append(pack_snorm16(frames))
+
+        if len(mesh.colors):
+            color = numpy.clip(mesh.colors[0], 0.0, 1.0) * numpy.float32(255.0)
+            colors.append(color.astype(numpy.uint8))
+        else:
+            colors.append(numpy.full((count, 4), 255, dtype=numpy.uint8))
+
+        uv0.append(_convert_uvs(mesh.texturecoords[0, :, :2], snorm))
+        if has_uv1:
+            if len(mesh.texturecoords) > 1:
+                uv1.append(_convert_uvs(mesh.texturecoords[1, :, :2], snorm))
+            else:
+                uv1.append(numpy.zeros((count, 2), dtype=numpy.uint16))
+
+        part_indices = mesh.faces.reshape(-1).astype(numpy.uint32) + vertex_count
+        indices.append(part_indices)
+        center, half_extent = _box(mesh.vertices[mesh.faces.reshape(-1)])
+        parts.append((index_count, len(part_indices),
+                      int(part_indices.min()), int(part_indices.max()),
+                      mesh.materialindex) + center + half_extent)
+
+        vertex_count += count
+        index_count += len(part_indices)
+
+    if not parts:
+        raise ValueError('The scene has no triangle mesh')
+
+    indices = numpy.concatenate(indices)
+    index16 = vertex_count <= 0x10000
+    indices = indices.astype('<u2' if index16 else '<u4')
+
+    flags = (INTERLEAVED if interleaved else 0) | (TEXCOORD_SNORM16 if snorm else 0)
+    columns = [numpy.concatenate(positions), numpy.concatenate(tangents),
+               numpy.concatenate(colors), numpy.concatenate(uv0)]
+    if has_uv1:
+        columns.append(numpy.concatenate(uv1))
+
+    if interleaved:
+        vertices = numpy.empty(vertex_count, dtype=VERTEX)
+        for name, column in zip(VERTEX.names, columns):
+            vertices[name] = column
+        vertex_data = [vertices]
+        offsets = [VERTEX.fields[name][1] for name in VERTEX.names] + [NO_ATTRIBUTE]
+        strides = [VERTEX.itemsize] * 4 + [NO_ATTRIBUTE]
+    else:
+        vertex_data = columns
+        offsets = []
+        offset = 0
+        for column in columns:
+            offsets.append(offset)
+            offset += column.nbytes
+        offsets += [NO_ATTRIBUTE] * (5 - len(offsets))
+        strides = [0] * len(columns) + [NO_ATTRIBUTE] * (5 - len(columns))
+
+    center, half_extent = _union([(part[5:8], part[8:11]) for part in parts])
+    attributes = [value for pair in zip(offsets, strides) for value in pair]
+    out.write(MAGIC)
+    out.write(HEADER.pack(VERSION, len(parts), *(center + half_extent + (flags,) + tuple(attributes) + (
+            vertex_count, sum(data.nbytes for data in vertex_data),
+            UI16 if index16 else UI32, len(indices), indices.nbytes))))
+    for data in vertex_data:
+        out.write(numpy.ascontiguousarray(data).tobytes())
+    out.write(indices.tobytes())
+    for part in parts:
+        out.write(PART.pack(*part))
+
+    names = [_material_name(material).encode('utf-8') for material in scene.materials]
+    out.write(struct.pack('<I', len(names)))
+    for name in names:
+        out.write(struct.pack('<I', len(name)) + name + b'\0')
+
+
+def convert(source, destination, interleaved=False):
+    """Converts the mesh file source into the filamesh destination."""
+    scene = pyassimp.load(source, processing=PROCESSING)
+    try:
+        directory = os.path.dirname(destination)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        try:
+            with open(destination, 'wb') as out:
+                write(scene, out, interleaved)
+        except ValueError:
+            os.remove(destination)
+            raise
+    finally:
+        pyassimp.release(scene)
+
+
+def _convert_job(args):
+    source, destination, interleaved = args
+    try:
+        convert(source, destination, interleaved)
+    except (AssimpError, ValueError, IOError, OSError) as e:
+        return source, destination, str(e)
+    return source, destination, None
+
+
+def convert_many(jobs, interleaved=False, workers=None):
+    """Converts many meshes in a pool of worker processes.
+
+    jobs is an iterable of (source, destination) filenames, and workers the
+    number of processes (the number of CPUs by default). Yields a (source,
+    destination, error) tuple as soon as each conversion finishes, where
+    error is None on success.
+    """
+    pool = multiprocessing.Pool(workers)
+    try:
+        for result in pool.imap_unordered(_convert_job,
+                ((source, destination, interleaved) for source, destination in jobs)):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+            description='Converts meshes into the filamesh format. With several source meshes, '
+                        'or a directory as destination, each mesh is written into the destination '
+                        'directory as <name>.filamesh.')
+    parser.add_argument('sources', nargs='+', metavar='source', help='source mesh')
+    parser.add_argument('destination', help='destination file or directory')
+    parser.add_argument('-i', '--interleaved', action='store_true',
+                        help='interleaves mesh attributes')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='number of worker processes (the number of CPUs by default)')
+    args = parser.parse_args()
+
+    if len(args.sources) == 1 and not os.path.isdir(args.destination):
+        try:
+            convert(args.sources[0], args.destination, args.interleaved)
+        except (AssimpError, ValueError) as e:
+            print('%s: %s' % (args.sources[0], e), file=sys.stderr)
+            return 1
+        return 0
+
+    jobs = [(source, os.path.join(args.destination,
+                                  os.path.splitext(os.path.basename(source))[0] + '.filamesh'))
+            for source in args.sources]
+    status = 0
+    for source, destination, error in convert_many(jobs, args.interleaved, args.jobs):
+        if error:
+            print('%s: %s' % (source, error), file=sys.stderr)
+            status = 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())